@@ -0,0 +1,152 @@
+"""
+Measures `AsyncWhitebitApi` throughput at 50, 200 and 1000 concurrent requests against a local stub server,
+comparing a plain `httpx.AsyncClient` (httpx's default pool limits) with the SDK's default transport, and with
+that transport keeping all of its connections alive.
+
+The stub is a minimal keep-alive HTTP/1.1 server running in a separate process, answering every request with
+a 100-level orderbook after an artificial delay that stands in for exchange latency. It exits with the
+benchmark, even when the benchmark is killed.
+
+Each configuration and concurrency level gets `--timeout` seconds; one that does not finish in time is reported
+as such rather than holding up the rest.
+
+Run with the package installed (or `PYTHONPATH=src`):
+
+    python benchmarks/bench_concurrency.py [--latency-ms 5] [--requests 5000] [--timeout 60]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import time
+import typing
+
+import httpx
+
+from whitebit import AsyncWhitebitApi, WhitebitApiEnvironment
+from whitebit.core import build_async_httpx_client, build_limits
+
+ORDERBOOK = json.dumps(
+    {
+        "ticker_id": "BTC_USDT",
+        "timestamp": 1594391413,
+        "asks": [[f"{9184.41 + i * 0.01:.2f}", "0.052"] for i in range(100)],
+        "bids": [[f"{9184.40 - i * 0.01:.2f}", "0.132"] for i in range(100)],
+    }
+).encode("utf-8")
+
+RESPONSE = (
+    b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\ncontent-length: "
+    + str(len(ORDERBOOK)).encode("ascii")
+    + b"\r\n\r\n"
+    + ORDERBOOK
+)
+
+
+def _serve(sock: socket.socket, latency: float, parent: int) -> None:
+    # Release the benchmark's stdout and stderr, which a shell pipe would otherwise wait on
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        await reader.readexactly(int(line.split(b":", 1)[1]))
+                if latency:
+                    await asyncio.sleep(latency)
+                writer.write(RESPONSE)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    async def main() -> None:
+        server = await asyncio.start_server(handle, sock=sock, backlog=4096)
+        async with server:
+            # Exits once the benchmark is gone, however it ended
+            while os.getppid() == parent:
+                await asyncio.sleep(0.5)
+
+    asyncio.run(main())
+
+
+def _start_stub(latency: float) -> typing.Tuple[multiprocessing.Process, int]:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen(4096)
+    process = multiprocessing.Process(target=_serve, args=(sock, latency, os.getpid()), daemon=True)
+    process.start()
+    port = sock.getsockname()[1]
+    sock.close()
+    return process, port
+
+
+async def _run(client: AsyncWhitebitApi, concurrency: int, total: int) -> float:
+    remaining = total
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await client.public_api_v4.orderbook("BTC_USDT")
+
+    # Warm up the connection pool before timing
+    await asyncio.gather(*(client.public_api_v4.orderbook("BTC_USDT") for _ in range(concurrency)))
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return total / (time.perf_counter() - started)
+
+
+async def _bench(port: int, total: int, timeout: float) -> None:
+    environment = WhitebitApiEnvironment(base=f"http://127.0.0.1:{port}", production="", eu="")
+    # The httpx clients are built here, as the SDK builds its default one, so that each run can close its own
+    configurations: typing.Dict[str, typing.Callable[[], httpx.AsyncClient]] = {
+        "httpx defaults": lambda: httpx.AsyncClient(timeout=60),
+        "sdk defaults": lambda: build_async_httpx_client(timeout=60, follow_redirects=True),
+        # All 100 connections kept alive, which makes httpcore's pool bookkeeping quadratic
+        "sdk, 100 idle": lambda: build_async_httpx_client(
+            timeout=60, follow_redirects=True, limits=build_limits(max_keepalive_connections=100)
+        ),
+    }
+    print(f"{'configuration':<18}" + "".join(f"{f'{c} concurrent':>18}" for c in (50, 200, 1000)), flush=True)
+    for name, factory in configurations.items():
+        row = f"{name:<18}"
+        for concurrency in (50, 200, 1000):
+            httpx_client = factory()
+            client = AsyncWhitebitApi(
+                environment=environment, txc_apikey="key", token="token", httpx_client=httpx_client
+            )
+            try:
+                rate = await asyncio.wait_for(_run(client, concurrency, total), timeout)
+                row += f"{rate:>14.0f} r/s"
+            except asyncio.TimeoutError:
+                row += f"{'timed out':>18}"
+            finally:
+                await httpx_client.aclose()
+        print(row, flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds allowed per configuration and level")
+    args = parser.parse_args()
+
+    process, port = _start_stub(args.latency_ms / 1000)
+    try:
+        asyncio.run(_bench(port, args.requests, args.timeout))
+    finally:
+        process.terminate()
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmarks the JSON codecs in `whitebit.core.json_codec` on representative payloads: a 100-level
+orderbook, the full `market_activity` ticker map and a bulk order response.
+
+Codecs whose library is not installed are skipped. Run with the package installed (or `PYTHONPATH=src`):
+
+    python benchmarks/bench_json_codec.py
+"""
+
+import json
+import timeit
+import typing
+
+from whitebit.core.json_codec import JsonCodec, MsgspecJsonCodec, OrjsonCodec, msgspec, orjson
+
+
+def orderbook_payload() -> typing.Dict[str, typing.Any]:
+    return {
+        "ticker_id": "BTC_USDT",
+        "timestamp": 1594391413,
+        "asks": [[f"{9184.41 + i * 0.01:.2f}", f"{0.052 + i * 0.001:.6f}"] for i in range(100)],
+        "bids": [[f"{9184.40 - i * 0.01:.2f}", f"{0.132 + i * 0.001:.6f}"] for i in range(100)],
+    }
+
+
+def ticker_map_payload(markets: int = 700) -> typing.Dict[str, typing.Any]:
+    return {
+        f"COIN{i}_USDT": {
+            "base_id": 1000 + i,
+            "quote_id": 825,
+            "last_price": f"{i * 1.37 + 0.01:.8f}",
+            "quote_volume": f"{i * 1000.5:.2f}",
+            "base_volume": f"{i * 13.1:.6f}",
+            "isFrozen": False,
+            "change": f"{(i % 21) - 10:.2f}",
+        }
+        for i in range(markets)
+    }
+
+
+def bulk_order_payload(orders: int = 20) -> typing.List[typing.Dict[str, typing.Any]]:
+    return [
+        {
+            "result": {
+                "orderId": 4180284841 + i,
+                "clientOrderId": f"order-{i}",
+                "market": "BTC_USDT",
+                "side": "buy" if i % 2 else "sell",
+                "type": "limit",
+                "timestamp": 1595792396.165973,
+                "dealMoney": "0",
+                "dealStock": "0",
+                "amount": "0.001",
+                "takerFee": "0.001",
+                "makerFee": "0.001",
+                "left": "0.001",
+                "dealFee": "0",
+                "price": f"{40000 + i}",
+                "postOnly": False,
+                "ioc": False,
+            },
+            "error": None,
+        }
+        for i in range(orders)
+    ]
+
+
+PAYLOADS = {
+    "orderbook_100": orderbook_payload(),
+    "ticker_map": ticker_map_payload(),
+    "bulk_orders_20": bulk_order_payload(),
+}
+
+
+def _codecs() -> typing.List[JsonCodec]:
+    codecs = [JsonCodec()]
+    if orjson is not None:
+        codecs.append(OrjsonCodec())
+    if msgspec is not None:
+        codecs.append(MsgspecJsonCodec())
+    return codecs
+
+
+def _per_call_us(func: typing.Callable[[], typing.Any], number: int = 200) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    print(f"{'payload':<16}{'bytes':>9}  {'codec':<10}{'encode us':>11}{'decode us':>11}")
+    for name, payload in PAYLOADS.items():
+        body = json.dumps(payload).encode("utf-8")
+        # What httpx and `Response.json()` did before the codec was introduced
+        baseline_encode = _per_call_us(lambda: json.dumps(payload).encode("utf-8"))
+        baseline_decode = _per_call_us(lambda: json.loads(body))
+        print(f"{name:<16}{len(body):>9}  {'httpx':<10}{baseline_encode:>11.1f}{baseline_decode:>11.1f}")
+        for codec in _codecs():
+            encode = _per_call_us(lambda: codec.dumps(payload))
+            decode = _per_call_us(lambda: codec.loads(body))
+            print(f"{'':<16}{'':>9}  {codec.name:<10}{encode:>11.1f}{decode:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Measures `NonceGenerator` throughput: in one thread, across threads of one process, and across processes sharing
+one generator through `shared=True`. Every run also checks that no nonce was handed out twice.
+
+Run with the package installed (or `PYTHONPATH=src`):
+
+    python benchmarks/bench_nonce.py [--nonces 200000] [--workers 8]
+"""
+
+import argparse
+import multiprocessing
+import threading
+import time
+import typing
+
+from whitebit.core.nonce import NonceGenerator
+
+
+def _generate(generator: NonceGenerator, count: int, results: typing.Any) -> None:
+    results.put([generator() for _ in range(count)])
+
+
+def _report(name: str, nonces: typing.List[int], elapsed: float) -> None:
+    if len(set(nonces)) != len(nonces):
+        raise AssertionError(f"{name}: duplicate nonces")
+    print(f"{name:<28}{len(nonces) / elapsed:>14.0f} nonces/s", flush=True)
+
+
+def bench_single(total: int) -> None:
+    generator = NonceGenerator()
+    started = time.perf_counter()
+    nonces = [generator() for _ in range(total)]
+    _report("1 thread", nonces, time.perf_counter() - started)
+
+
+def bench_threads(total: int, workers: int) -> None:
+    generator = NonceGenerator()
+    nonces: typing.List[typing.List[int]] = [[] for _ in range(workers)]
+
+    def generate(index: int) -> None:
+        nonces[index].extend(generator() for _ in range(total // workers))
+
+    threads = [threading.Thread(target=generate, args=(index,)) for index in range(workers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    _report(f"{workers} threads", [nonce for chunk in nonces for nonce in chunk], time.perf_counter() - started)
+
+
+def bench_processes(total: int, workers: int) -> None:
+    generator = NonceGenerator(shared=True)
+    results: typing.Any = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=_generate, args=(generator, total // workers, results)) for _ in range(workers)
+    ]
+    started = time.perf_counter()
+    for process in processes:
+        process.start()
+    nonces = [results.get() for _ in processes]
+    elapsed = time.perf_counter() - started
+    for process in processes:
+        process.join()
+    _report(f"{workers} processes, shared", [nonce for chunk in nonces for nonce in chunk], elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nonces", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    bench_single(args.nonces)
+    bench_threads(args.nonces, args.workers)
+    bench_processes(args.nonces, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Microbenchmark for `whitebit.core.parse_obj_as`.
+
+Compares building a fresh `pydantic.TypeAdapter` per call (the previous behaviour) against the
+process-wide adapter registry for a few response types from the order-entry hot path. The payloads
+are dealiased up front so that only the validation step is measured.
+
+Run with the package installed (or `PYTHONPATH=src`):
+
+    python benchmarks/bench_parse_obj_as.py
+"""
+
+import timeit
+import typing
+
+import pydantic
+
+from whitebit.core.pydantic_utilities import IS_PYDANTIC_V2, get_type_adapter
+from whitebit.core.serialization import convert_and_respect_annotation_metadata
+from whitebit.spot_trading.types.get_executed_order_history_response_item import GetExecutedOrderHistoryResponseItem
+from whitebit.types.order_response import OrderResponse
+from whitebit.types.orderbook_response import OrderbookResponse
+
+ORDERBOOK = {
+    "ticker_id": "BTC_USDT",
+    "timestamp": 1594391413,
+    "asks": [[f"{9184.41 + i * 0.01:.2f}", "0.052"] for i in range(100)],
+    "bids": [[f"{9184.40 - i * 0.01:.2f}", "0.132"] for i in range(100)],
+}
+
+ORDER = {
+    "order_id": 4180284841,
+    "client_order_id": "order1987111",
+    "market": "BTC_USDT",
+    "side": "buy",
+    "type": "limit",
+    "timestamp": 1595792396.165973,
+    "deal_money": "0",
+    "deal_stock": "0",
+    "amount": "0.001",
+    "taker_fee": "0.001",
+    "maker_fee": "0.001",
+    "left": "0.001",
+    "deal_fee": "0",
+    "price": "40000",
+    "postOnly": False,
+    "ioc": False,
+}
+
+ACTIVE_ORDERS = [dict(ORDER, order_id=ORDER["order_id"] + i) for i in range(50)]
+
+CASES: typing.List[typing.Tuple[str, typing.Any, typing.Any]] = [
+    ("orderbook", OrderbookResponse, ORDERBOOK),
+    ("create_limit_order", OrderResponse, ORDER),
+    ("get_active_orders", typing.List[OrderResponse], ACTIVE_ORDERS),
+    (
+        "executed_history",
+        typing.Dict[str, typing.List[GetExecutedOrderHistoryResponseItem]],
+        {"BTC_USDT": ACTIVE_ORDERS},
+    ),
+]
+
+
+def _per_call_us(func: typing.Callable[[], typing.Any], number: int) -> float:
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    return best / number * 1e6
+
+
+def main() -> None:
+    if not IS_PYDANTIC_V2:
+        print("Pydantic V1 caches parsing models internally, nothing to compare.")
+        return
+
+    print(f"{'case':<22}{'uncached us/call':>18}{'cached us/call':>16}{'speedup':>10}")
+    for name, type_, payload in CASES:
+        dealiased = convert_and_respect_annotation_metadata(object_=payload, annotation=type_, direction="read")
+        uncached = _per_call_us(
+            lambda: pydantic.TypeAdapter(type_).validate_python(dealiased),  # type: ignore[attr-defined]
+            number=200,
+        )
+        cached = _per_call_us(lambda: get_type_adapter(type_).validate_python(dealiased), number=200)
+        print(f"{name:<22}{uncached:>18.1f}{cached:>16.1f}{uncached / cached:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""
+Benchmarks the REST hot path of `WhitebitApi` and `AsyncWhitebitApi` end to end, from building and signing the
+request to the parsed response, against an in-process `httpx.MockTransport` answering with recorded payloads.
+
+Every scenario is run sync and async and reports:
+
+  - ops/s: operations per second, the best of several rounds. An operation is one call, or all the pages of the
+    history for `executed_history_1000`
+  - parse us / transport us: the time per operation spent decoding and validating responses, and everywhere else
+    (building and signing requests, httpx and the stub transport), from the client's timing records
+  - peak KiB: the peak memory allocated during one operation, from `tracemalloc`
+
+Results are compared against the baselines stored in `bench_rest_baselines.json`, and the script exits with a
+non-zero status when a scenario got slower than its baseline by more than the tolerance. Baselines are only
+comparable on the machine and Python version they were recorded with; record new ones with `--save-baselines`.
+
+Run with the package installed (or `PYTHONPATH=src`):
+
+    python benchmarks/bench_rest.py [--scenario orderbook_100] [--tolerance 0.2] [--save-baselines]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import typing
+
+import httpx
+
+from whitebit import AsyncWhitebitApi, WhitebitApi, WhitebitApiEnvironment
+from whitebit.core.timing import RequestTiming, TimingObserver
+
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_rest_baselines.json")
+
+ENVIRONMENT = WhitebitApiEnvironment(base="https://whitebit.test", production="", eu="")
+
+ORDER = {
+    "order_id": 4180284841,
+    "client_order_id": "order1987111",
+    "market": "BTC_USDT",
+    "side": "buy",
+    "type": "limit",
+    "timestamp": 1595792396.165973,
+    "deal_money": "0",
+    "deal_stock": "0",
+    "amount": "0.001",
+    "taker_fee": "0.001",
+    "maker_fee": "0.001",
+    "left": "0.001",
+    "deal_fee": "0",
+    "price": "40000",
+    "postOnly": False,
+    "ioc": False,
+}
+
+BULK_ORDERS = [
+    {"result": dict(ORDER, order_id=ORDER["order_id"] + i, client_order_id=f"order-{i}"), "error": None}
+    for i in range(20)
+]
+
+ORDERBOOK = {
+    "ticker_id": "BTC_USDT",
+    "timestamp": 1594391413,
+    "asks": [[f"{9184.41 + i * 0.01:.2f}", f"{0.052 + i * 0.001:.6f}"] for i in range(100)],
+    "bids": [[f"{9184.40 - i * 0.01:.2f}", f"{0.132 + i * 0.001:.6f}"] for i in range(100)],
+}
+
+TICKER_MAP = {
+    f"COIN{i}_USDT": {
+        "base_id": 1000 + i,
+        "quote_id": 825,
+        "last_price": f"{i * 1.37 + 0.01:.8f}",
+        "quote_volume": f"{i * 1000.5:.2f}",
+        "base_volume": f"{i * 13.1:.6f}",
+        "isFrozen": False,
+        "change": f"{(i % 21) - 10:.2f}",
+    }
+    for i in range(700)
+}
+
+HISTORY_PAGE_SIZE = 100
+HISTORY = [
+    {
+        "id": 160305483 + i,
+        "clientOrderId": "",
+        "time": 1594667731.724403 + i,
+        "side": "sell" if i % 2 else "buy",
+        "role": 2 if i % 3 else 1,
+        "amount": "0.000076",
+        "price": f"{9264.21 + i * 0.01:.2f}",
+        "deal": "0.70407996",
+        "fee": "0.00070407996",
+        "orderId": 4180284841 + i,
+        "feeAsset": "USDT",
+    }
+    for i in range(1000)
+]
+
+
+def _json_response(body: bytes) -> httpx.Response:
+    return httpx.Response(200, content=body, headers={"content-type": "application/json"})
+
+
+def build_transport() -> httpx.MockTransport:
+    """The stub exchange, answering every call with a pre-encoded payload so that it costs as little as possible."""
+    bodies = {
+        "/api/v4/order/new": json.dumps(ORDER).encode("utf-8"),
+        "/api/v4/order/bulk": json.dumps(BULK_ORDERS).encode("utf-8"),
+        "/api/v4/public/orderbook/BTC_USDT": json.dumps(ORDERBOOK).encode("utf-8"),
+        "/api/v4/public/ticker": json.dumps(TICKER_MAP).encode("utf-8"),
+    }
+    history_pages = {
+        offset: json.dumps(HISTORY[offset : offset + HISTORY_PAGE_SIZE]).encode("utf-8")
+        for offset in range(0, len(HISTORY) + 1, HISTORY_PAGE_SIZE)
+    }
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/v4/trade-account/executed-history":
+            return _json_response(history_pages[json.loads(request.content)["offset"]])
+        return _json_response(bodies[request.url.path])
+
+    return httpx.MockTransport(handle)
+
+
+def _client_options(timing_observers: typing.List[TimingObserver]) -> typing.Dict[str, typing.Any]:
+    return {
+        "environment": ENVIRONMENT,
+        "txc_apikey": "YOUR_TXC_APIKEY",
+        "api_secret": "YOUR_API_SECRET",
+        "timing_observers": timing_observers,
+    }
+
+
+def sync_scenarios(client: WhitebitApi) -> typing.Dict[str, typing.Callable[[], typing.Any]]:
+    bulk_orders = [
+        {"market": "BTC_USDT", "side": "buy", "amount": "0.001", "price": f"{40000 + i}"} for i in range(20)
+    ]
+    return {
+        "create_limit_order": lambda: client.spot_trading.create_limit_order(
+            market="BTC_USDT", side="buy", amount="0.001", price="40000", client_order_id="order1987111"
+        ),
+        "bulk_limit_order_20": lambda: client.spot_trading.create_bulk_limit_order(orders=bulk_orders),  # type: ignore
+        "orderbook_100": lambda: client.public_api_v4.orderbook("BTC_USDT", limit=100),
+        "ticker_map_700": lambda: client.public_api_v4.market_activity(),
+        # Without prefetch, so that the pages are fetched in the calling thread like the other scenarios
+        "executed_history_1000": lambda: sum(
+            1 for _ in client.spot_trading.iter_executed_order_history(market="BTC_USDT", prefetch=False)
+        ),
+    }
+
+
+def async_scenarios(client: AsyncWhitebitApi) -> typing.Dict[str, typing.Callable[[], typing.Awaitable[typing.Any]]]:
+    bulk_orders = [
+        {"market": "BTC_USDT", "side": "buy", "amount": "0.001", "price": f"{40000 + i}"} for i in range(20)
+    ]
+
+    async def executed_history() -> int:
+        count = 0
+        async for _ in client.spot_trading.iter_executed_order_history(market="BTC_USDT", prefetch=False):
+            count += 1
+        return count
+
+    return {
+        "create_limit_order": lambda: client.spot_trading.create_limit_order(
+            market="BTC_USDT", side="buy", amount="0.001", price="40000", client_order_id="order1987111"
+        ),
+        "bulk_limit_order_20": lambda: client.spot_trading.create_bulk_limit_order(orders=bulk_orders),  # type: ignore
+        "orderbook_100": lambda: client.public_api_v4.orderbook("BTC_USDT", limit=100),
+        "ticker_map_700": lambda: client.public_api_v4.market_activity(),
+        "executed_history_1000": executed_history,
+    }
+
+
+class _PhaseTotals:
+    """A timing observer summing the parse and total time of the calls it sees."""
+
+    def __init__(self) -> None:
+        self.parse = 0.0
+        self.total = 0.0
+
+    def __call__(self, timing: RequestTiming) -> None:
+        self.parse += timing.decode + timing.validate
+        self.total += timing.total
+
+    def reset(self) -> None:
+        self.parse = 0.0
+        self.total = 0.0
+
+
+class Result(typing.NamedTuple):
+    ops_per_second: float
+    parse_us: float
+    transport_us: float
+    peak_kib: float
+
+
+def _measure(run: typing.Callable[[int], None], totals: _PhaseTotals, *, number: int, rounds: int) -> Result:
+    """Measures `run(n)`, which runs `n` operations, with `totals` observing the client that makes them."""
+    run(max(number // 10, 1))
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        run(number)
+        best = min(best, time.perf_counter() - started)
+
+    totals.reset()
+    run(number)
+    parse_us = totals.parse / number * 1e6
+    transport_us = (totals.total - totals.parse) / number * 1e6
+
+    tracemalloc.start()
+    try:
+        peak = float("inf")
+        for _ in range(3):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            run(1)
+            peak = min(peak, tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return Result(number / best, parse_us, transport_us, peak / 1024)
+
+
+def run_benchmarks(
+    selected: typing.Optional[typing.Sequence[str]], number: int, rounds: int
+) -> typing.Dict[str, Result]:
+    results: typing.Dict[str, Result] = {}
+    totals = _PhaseTotals()
+
+    sync_client = WhitebitApi(httpx_client=httpx.Client(transport=build_transport()), **_client_options([totals]))
+    for name, call in sync_scenarios(sync_client).items():
+        if selected and name not in selected:
+            continue
+
+        def run_sync(n: int, call: typing.Callable[[], typing.Any] = call) -> None:
+            for _ in range(n):
+                call()
+
+        results[f"sync/{name}"] = _measure(run_sync, totals, number=number, rounds=rounds)
+
+    loop = asyncio.new_event_loop()
+    try:
+        async_client = AsyncWhitebitApi(
+            httpx_client=httpx.AsyncClient(transport=build_transport()), **_client_options([totals])
+        )
+        for name, acall in async_scenarios(async_client).items():
+            if selected and name not in selected:
+                continue
+
+            async def calls(n: int, acall: typing.Callable[[], typing.Awaitable[typing.Any]] = acall) -> None:
+                for _ in range(n):
+                    await acall()
+
+            def run_async(n: int, calls: typing.Callable[[int], typing.Awaitable[None]] = calls) -> None:
+                loop.run_until_complete(calls(n))
+
+            results[f"async/{name}"] = _measure(run_async, totals, number=number, rounds=rounds)
+    finally:
+        loop.close()
+    return results
+
+
+def load_baselines(path: str) -> typing.Dict[str, typing.Any]:
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def save_baselines(path: str, results: typing.Dict[str, Result]) -> None:
+    baselines = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {
+            name: {field: round(value, 1) for field, value in result._asdict().items()}
+            for name, result in sorted(results.items())
+        },
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(baselines, file, indent=2)
+        file.write("\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", action="append", help="Run only this scenario; can be repeated.")
+    parser.add_argument("--number", type=int, default=200, help="Calls per round.")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--baselines", default=BASELINES_PATH)
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="The slowdown against the baseline that counts as a regression."
+    )
+    parser.add_argument("--save-baselines", action="store_true", help="Store the results as the new baselines.")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.scenario, args.number, args.rounds)
+    baselines = load_baselines(args.baselines).get("results", {})
+    regressions = []
+    print(f"{'scenario':<30}{'ops/s':>10}{'parse us':>11}{'transport us':>14}{'peak KiB':>10}{'vs baseline':>13}")
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        change = ""
+        if baseline is not None:
+            ratio = result.ops_per_second / baseline["ops_per_second"] - 1
+            change = f"{ratio:+.1%}"
+            if ratio < -args.tolerance:
+                regressions.append(name)
+                change += " !"
+        print(
+            f"{name:<30}{result.ops_per_second:>10.0f}{result.parse_us:>11.1f}{result.transport_us:>14.1f}"
+            f"{result.peak_kib:>10.1f}{change:>13}"
+        )
+
+    if args.save_baselines:
+        save_baselines(args.baselines, results)
+        print(f"Saved baselines to {args.baselines}")
+    elif regressions:
+        print(f"Slower than the baselines by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
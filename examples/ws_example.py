@@ -28,7 +28,8 @@ class Bot(WhitebitWsClient):
 
 async def main() -> None:
     bot = Bot()
-    await bot.get_deals("BTC_USDT", 0, 100)
+    deals = await bot.get_deals("BTC_USDT", 0, 100)
+    logging.info(deals)
     await bot.subscribe_deals(["BTC_USDT"])
     while not bot.exception_occur:
         await asyncio.sleep(100)
@@ -6,7 +6,6 @@ from json.decoder import JSONDecodeError
 from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
 from ..core.http_response import AsyncHttpResponse, HttpResponse
-from ..core.pydantic_utilities import parse_obj_as
 from ..core.request_options import RequestOptions
 
 # this is used as the default value for optional parameters
@@ -53,13 +52,14 @@ class RawAccountEndpointsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -100,13 +100,14 @@ class RawAccountEndpointsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -147,13 +148,14 @@ class RawAccountEndpointsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -194,13 +196,14 @@ class RawAccountEndpointsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -241,13 +244,14 @@ class RawAccountEndpointsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -288,13 +292,14 @@ class RawAccountEndpointsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -340,13 +345,14 @@ class AsyncRawAccountEndpointsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -387,13 +393,14 @@ class AsyncRawAccountEndpointsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -434,13 +441,14 @@ class AsyncRawAccountEndpointsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -481,13 +489,14 @@ class AsyncRawAccountEndpointsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -528,13 +537,14 @@ class AsyncRawAccountEndpointsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -575,13 +585,14 @@ class AsyncRawAccountEndpointsClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
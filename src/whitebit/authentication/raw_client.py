@@ -72,7 +72,7 @@ class RawAuthenticationClient:
         try:
             if 200 <= _response.status_code < 300:
                 return HttpResponse(response=_response, data=None)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -131,9 +131,10 @@ class RawAuthenticationClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     PostOauth2TokenResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=PostOauth2TokenResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -144,7 +145,7 @@ class RawAuthenticationClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -155,11 +156,11 @@ class RawAuthenticationClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -219,9 +220,10 @@ class RawAuthenticationClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     PostOauth2RefreshTokenResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=PostOauth2RefreshTokenResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -232,11 +234,11 @@ class RawAuthenticationClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -296,7 +298,7 @@ class AsyncRawAuthenticationClient:
         try:
             if 200 <= _response.status_code < 300:
                 return AsyncHttpResponse(response=_response, data=None)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -355,9 +357,10 @@ class AsyncRawAuthenticationClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     PostOauth2TokenResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=PostOauth2TokenResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -368,7 +371,7 @@ class AsyncRawAuthenticationClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -379,11 +382,11 @@ class AsyncRawAuthenticationClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -443,9 +446,10 @@ class AsyncRawAuthenticationClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     PostOauth2RefreshTokenResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=PostOauth2RefreshTokenResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -456,11 +460,11 @@ class AsyncRawAuthenticationClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
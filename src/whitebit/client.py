@@ -7,8 +7,24 @@ from .account_endpoints.client import AccountEndpointsClient, AsyncAccountEndpoi
 from .authentication.client import AsyncAuthenticationClient, AuthenticationClient
 from .codes.client import AsyncCodesClient, CodesClient
 from .collateral_trading.client import AsyncCollateralTradingClient, CollateralTradingClient
+from .core.batch import DEFAULT_BATCH_CONCURRENCY, BatchResult, map_concurrent, run_batch
 from .core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
-from .core.request_options import RequestOptions
+from .core.http_transport import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    build_async_httpx_client,
+    build_httpx_client,
+    build_limits,
+)
+from .core.json_codec import JsonCodec
+from .core.metrics import MetricsCollector
+from .core.pydantic_utilities import warm_type_adapters
+from .core.rate_limit import RateLimiter
+from .core.request_options import RequestOptions, ResponseMode
+from .core.response_cache import ResponseCache
+from .core.retry import RetryBudget
+from .core.timing import TimingObserver
 from .credit_line.client import AsyncCreditLineClient, CreditLineClient
 from .crypto_lending_fixed.client import AsyncCryptoLendingFixedClient, CryptoLendingFixedClient
 from .crypto_lending_flex.client import AsyncCryptoLendingFlexClient, CryptoLendingFlexClient
@@ -34,6 +50,9 @@ from .withdraw.client import AsyncWithdrawClient, WithdrawClient
 # this is used as the default value for optional parameters
 OMIT = typing.cast(typing.Any, ...)
 
+T = typing.TypeVar("T")
+U = typing.TypeVar("U")
+
 
 class WhitebitApi:
     """
@@ -49,7 +68,15 @@ class WhitebitApi:
 
 
     txc_apikey : str
-    token : typing.Union[str, typing.Callable[[], str]]
+    token : typing.Optional[typing.Union[str, typing.Callable[[], str]]]
+        A bearer token, sent as `Authorization`. Not needed when `api_secret` is set.
+
+    api_secret : typing.Optional[str]
+        The secret API key. When set, private API requests are signed: their `request` and `nonce` are filled in automatically and the body is sent along with its `X-TXC-PAYLOAD` and `X-TXC-SIGNATURE` headers.
+
+    nonce_generator : typing.Optional[typing.Callable[[], int]]
+        Returns the nonces of signed requests. Defaults to a process-wide `NonceGenerator`; pass `NonceGenerator(shared=True)` to coordinate nonces across worker processes using the same API key.
+
     timeout : typing.Optional[float]
         The timeout to be used, in seconds, for requests. By default the timeout is 60 seconds, unless a custom httpx client is used, in which case this default is not enforced.
 
@@ -59,6 +86,52 @@ class WhitebitApi:
     httpx_client : typing.Optional[httpx.Client]
         The httpx client to use for making requests, a preconfigured client is used by default, however this is useful should you want to pass in any custom httpx configuration.
 
+    response_mode : ResponseMode
+        How successful responses are returned: "validate" (default) validates them into the typed models, "construct" builds the models without validation, "lazy" validates each list/dict entry or model field on first access and "raw" returns the decoded JSON. Can be overridden per request through `request_options`.
+
+        The return types the methods declare hold for "validate" and "construct" only. Under "lazy" a method declared to return a model returns a `LazyModel` of it, and a list or dict of models a `LazyList` or `LazyDict`. Under "raw" it returns the decoded JSON: dicts, lists and strings keyed by the API's JSON names rather than the models' attribute names. `typing.cast` the result, or read it through `typing.Any`, in those modes.
+
+    json_codec : typing.Optional[JsonCodec]
+        The codec used to encode request bodies and decode responses. Defaults to orjson or msgspec when installed, falling back to the standard library.
+
+    max_connections : typing.Optional[int]
+        The maximum number of concurrent connections of the default httpx client. Defaults to 100, None means no limit.
+
+    max_keepalive_connections : typing.Optional[int]
+        The maximum number of idle connections kept open by the default httpx client. Defaults to 20, as in httpx.
+
+    keepalive_expiry : typing.Optional[float]
+        How long, in seconds, an idle connection is kept open. Defaults to 30 seconds.
+
+    http2 : bool
+        Whether the default httpx client negotiates HTTP/2, multiplexing concurrent requests over a single connection. Requires the `h2` package (`pip install whitebit-python-sdk[http2]`).
+
+    local_address : typing.Optional[str]
+        The local IP address the default httpx client binds outgoing connections to, e.g. "0.0.0.0" to force IPv4.
+
+    The connection options above are irrelevant if a custom httpx client is passed in.
+
+    retry_budget : typing.Optional[RetryBudget]
+        Caps the retries requested through `max_retries` at a fraction of the client's traffic. Defaults to `RetryBudget()`, which allows retrying 10% of requests plus one retry per second.
+
+    rate_limiter : typing.Optional[RateLimiter]
+        Delays requests that would exceed WhiteBIT's per-endpoint rate limits instead of letting them fail with a 429, e.g. `RateLimiter()`. Share the instance between clients using the same API key. Disabled by default.
+
+    coalesce_requests : bool
+        Whether concurrent identical GET requests share a single in-flight request and its parsed result. Callers then receive the same response object, which must not be mutated. Defaults to False.
+
+    response_cache : typing.Optional[ResponseCache]
+        Caches `public_api_v4` responses for as long as the API caches them itself (100 ms for `orderbook`, 1 second for `depth`, `recent_trades` and `market_activity`) and a minute for `market_info`, `asset_status_list` and `fee`, e.g. `ResponseCache()`. Cached results are shared between callers and must not be mutated. Disabled by default.
+
+    timing_observers : typing.Optional[typing.Sequence[TimingObserver]]
+        Callables receiving a `RequestTiming` record for every call once it completes: its path, status, attempts, byte sizes and the duration of each phase, from rate limiting and connection pool waits to time to first byte, JSON decoding and validation. Observers run inline and must be fast; none by default.
+
+    metrics : typing.Optional[MetricsCollector]
+        Aggregates the timing records into per-endpoint counters (requests, retries, 429s, transport and parsing errors, cache hits, bytes) and latency histograms by status class, read with `metrics.snapshot()` or exported with `metrics.prometheus()`, e.g. `MetricsCollector()`. Disabled by default.
+
+    warm_types : typing.Optional[typing.Sequence[typing.Any]]
+        Response types whose validators are built when the client is created rather than by the first call returning them, e.g. `[OrderResponse, typing.List[FeeInfo]]` for the types of a latency-sensitive path. Ignored on Pydantic V1. None by default.
+
     Examples
     --------
     from whitebit import WhitebitApi
@@ -70,10 +143,26 @@ class WhitebitApi:
         *,
         environment: WhitebitApiEnvironment = WhitebitApiEnvironment.DEFAULT,
         txc_apikey: str,
-        token: typing.Union[str, typing.Callable[[], str]],
+        token: typing.Optional[typing.Union[str, typing.Callable[[], str]]] = None,
+        api_secret: typing.Optional[str] = None,
+        nonce_generator: typing.Optional[typing.Callable[[], int]] = None,
         timeout: typing.Optional[float] = None,
         follow_redirects: typing.Optional[bool] = True,
         httpx_client: typing.Optional[httpx.Client] = None,
+        response_mode: ResponseMode = "validate",
+        json_codec: typing.Optional[JsonCodec] = None,
+        max_connections: typing.Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: typing.Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: typing.Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        local_address: typing.Optional[str] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        timing_observers: typing.Optional[typing.Sequence[TimingObserver]] = None,
+        metrics: typing.Optional[MetricsCollector] = None,
+        warm_types: typing.Optional[typing.Sequence[typing.Any]] = None,
     ):
         _defaulted_timeout = (
             timeout if timeout is not None else 60 if httpx_client is None else httpx_client.timeout.read
@@ -84,11 +173,31 @@ class WhitebitApi:
             token=token,
             httpx_client=httpx_client
             if httpx_client is not None
-            else httpx.Client(timeout=_defaulted_timeout, follow_redirects=follow_redirects)
-            if follow_redirects is not None
-            else httpx.Client(timeout=_defaulted_timeout),
+            else build_httpx_client(
+                timeout=_defaulted_timeout,
+                follow_redirects=follow_redirects,
+                limits=build_limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+                http2=http2,
+                local_address=local_address,
+            ),
             timeout=_defaulted_timeout,
+            response_mode=response_mode,
+            json_codec=json_codec,
+            retry_budget=retry_budget,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            api_secret=api_secret,
+            nonce_generator=nonce_generator,
+            timing_observers=timing_observers,
+            metrics=metrics,
         )
+        if warm_types is not None:
+            warm_type_adapters(warm_types)
         self._raw_client = RawWhitebitApi(client_wrapper=self._client_wrapper)
         self.authentication = AuthenticationClient(client_wrapper=self._client_wrapper)
         self.account_endpoints = AccountEndpointsClient(client_wrapper=self._client_wrapper)
@@ -323,7 +432,15 @@ class AsyncWhitebitApi:
 
 
     txc_apikey : str
-    token : typing.Union[str, typing.Callable[[], str]]
+    token : typing.Optional[typing.Union[str, typing.Callable[[], str]]]
+        A bearer token, sent as `Authorization`. Not needed when `api_secret` is set.
+
+    api_secret : typing.Optional[str]
+        The secret API key. When set, private API requests are signed: their `request` and `nonce` are filled in automatically and the body is sent along with its `X-TXC-PAYLOAD` and `X-TXC-SIGNATURE` headers.
+
+    nonce_generator : typing.Optional[typing.Callable[[], int]]
+        Returns the nonces of signed requests. Defaults to a process-wide `NonceGenerator`; pass `NonceGenerator(shared=True)` to coordinate nonces across worker processes using the same API key.
+
     timeout : typing.Optional[float]
         The timeout to be used, in seconds, for requests. By default the timeout is 60 seconds, unless a custom httpx client is used, in which case this default is not enforced.
 
@@ -333,6 +450,52 @@ class AsyncWhitebitApi:
     httpx_client : typing.Optional[httpx.AsyncClient]
         The httpx client to use for making requests, a preconfigured client is used by default, however this is useful should you want to pass in any custom httpx configuration.
 
+    response_mode : ResponseMode
+        How successful responses are returned: "validate" (default) validates them into the typed models, "construct" builds the models without validation, "lazy" validates each list/dict entry or model field on first access and "raw" returns the decoded JSON. Can be overridden per request through `request_options`.
+
+        The return types the methods declare hold for "validate" and "construct" only. Under "lazy" a method declared to return a model returns a `LazyModel` of it, and a list or dict of models a `LazyList` or `LazyDict`. Under "raw" it returns the decoded JSON: dicts, lists and strings keyed by the API's JSON names rather than the models' attribute names. `typing.cast` the result, or read it through `typing.Any`, in those modes.
+
+    json_codec : typing.Optional[JsonCodec]
+        The codec used to encode request bodies and decode responses. Defaults to orjson or msgspec when installed, falling back to the standard library.
+
+    max_connections : typing.Optional[int]
+        The maximum number of concurrent connections of the default httpx client. Defaults to 100, None means no limit.
+
+    max_keepalive_connections : typing.Optional[int]
+        The maximum number of idle connections kept open by the default httpx client. Defaults to 20, as in httpx.
+
+    keepalive_expiry : typing.Optional[float]
+        How long, in seconds, an idle connection is kept open. Defaults to 30 seconds.
+
+    http2 : bool
+        Whether the default httpx client negotiates HTTP/2, multiplexing concurrent requests over a single connection. Requires the `h2` package (`pip install whitebit-python-sdk[http2]`).
+
+    local_address : typing.Optional[str]
+        The local IP address the default httpx client binds outgoing connections to, e.g. "0.0.0.0" to force IPv4.
+
+    The connection options above are irrelevant if a custom httpx client is passed in.
+
+    retry_budget : typing.Optional[RetryBudget]
+        Caps the retries requested through `max_retries` at a fraction of the client's traffic. Defaults to `RetryBudget()`, which allows retrying 10% of requests plus one retry per second.
+
+    rate_limiter : typing.Optional[RateLimiter]
+        Delays requests that would exceed WhiteBIT's per-endpoint rate limits instead of letting them fail with a 429, e.g. `RateLimiter()`. Share the instance between clients using the same API key. Disabled by default.
+
+    coalesce_requests : bool
+        Whether concurrent identical GET requests share a single in-flight request and its parsed result. Callers then receive the same response object, which must not be mutated. Defaults to False.
+
+    response_cache : typing.Optional[ResponseCache]
+        Caches `public_api_v4` responses for as long as the API caches them itself (100 ms for `orderbook`, 1 second for `depth`, `recent_trades` and `market_activity`) and a minute for `market_info`, `asset_status_list` and `fee`, e.g. `ResponseCache()`. Cached results are shared between callers and must not be mutated. Disabled by default.
+
+    timing_observers : typing.Optional[typing.Sequence[TimingObserver]]
+        Callables receiving a `RequestTiming` record for every call once it completes: its path, status, attempts, byte sizes and the duration of each phase, from rate limiting and connection pool waits to time to first byte, JSON decoding and validation. Observers run inline and must be fast; none by default.
+
+    metrics : typing.Optional[MetricsCollector]
+        Aggregates the timing records into per-endpoint counters (requests, retries, 429s, transport and parsing errors, cache hits, bytes) and latency histograms by status class, read with `metrics.snapshot()` or exported with `metrics.prometheus()`, e.g. `MetricsCollector()`. Disabled by default.
+
+    warm_types : typing.Optional[typing.Sequence[typing.Any]]
+        Response types whose validators are built when the client is created rather than by the first call returning them, e.g. `[OrderResponse, typing.List[FeeInfo]]` for the types of a latency-sensitive path. Ignored on Pydantic V1. None by default.
+
     Examples
     --------
     from whitebit import AsyncWhitebitApi
@@ -344,10 +507,26 @@ class AsyncWhitebitApi:
         *,
         environment: WhitebitApiEnvironment = WhitebitApiEnvironment.DEFAULT,
         txc_apikey: str,
-        token: typing.Union[str, typing.Callable[[], str]],
+        token: typing.Optional[typing.Union[str, typing.Callable[[], str]]] = None,
+        api_secret: typing.Optional[str] = None,
+        nonce_generator: typing.Optional[typing.Callable[[], int]] = None,
         timeout: typing.Optional[float] = None,
         follow_redirects: typing.Optional[bool] = True,
         httpx_client: typing.Optional[httpx.AsyncClient] = None,
+        response_mode: ResponseMode = "validate",
+        json_codec: typing.Optional[JsonCodec] = None,
+        max_connections: typing.Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: typing.Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: typing.Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        local_address: typing.Optional[str] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        timing_observers: typing.Optional[typing.Sequence[TimingObserver]] = None,
+        metrics: typing.Optional[MetricsCollector] = None,
+        warm_types: typing.Optional[typing.Sequence[typing.Any]] = None,
     ):
         _defaulted_timeout = (
             timeout if timeout is not None else 60 if httpx_client is None else httpx_client.timeout.read
@@ -358,11 +537,31 @@ class AsyncWhitebitApi:
             token=token,
             httpx_client=httpx_client
             if httpx_client is not None
-            else httpx.AsyncClient(timeout=_defaulted_timeout, follow_redirects=follow_redirects)
-            if follow_redirects is not None
-            else httpx.AsyncClient(timeout=_defaulted_timeout),
+            else build_async_httpx_client(
+                timeout=_defaulted_timeout,
+                follow_redirects=follow_redirects,
+                limits=build_limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+                http2=http2,
+                local_address=local_address,
+            ),
             timeout=_defaulted_timeout,
+            response_mode=response_mode,
+            json_codec=json_codec,
+            retry_budget=retry_budget,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            api_secret=api_secret,
+            nonce_generator=nonce_generator,
+            timing_observers=timing_observers,
+            metrics=metrics,
         )
+        if warm_types is not None:
+            warm_type_adapters(warm_types)
         self._raw_client = AsyncRawWhitebitApi(client_wrapper=self._client_wrapper)
         self.authentication = AsyncAuthenticationClient(client_wrapper=self._client_wrapper)
         self.account_endpoints = AsyncAccountEndpointsClient(client_wrapper=self._client_wrapper)
@@ -395,6 +594,81 @@ class AsyncWhitebitApi:
         """
         return self._raw_client
 
+    def batch(
+        self,
+        calls: typing.Iterable[typing.Callable[[], typing.Awaitable[T]]],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> typing.AsyncIterator[BatchResult]:
+        """
+        Runs independent calls with at most `concurrency` in flight, yielding a `BatchResult` for each as it
+        completes. A failed call yields its error rather than aborting the batch. Requests go through the client's
+        rate limiter and retries like any other.
+
+        Parameters
+        ----------
+        calls : typing.Iterable[typing.Callable[[], typing.Awaitable[T]]]
+            Zero-argument call specs, such as `functools.partial` objects of this client's methods.
+
+        concurrency : int
+            The maximum number of calls in flight. Defaults to 16.
+
+        Returns
+        -------
+        typing.AsyncIterator[BatchResult]
+
+        Examples
+        --------
+        from whitebit import AsyncWhitebitApi
+        import asyncio
+        import functools
+        client = AsyncWhitebitApi(txc_apikey="YOUR_TXC_APIKEY", api_secret="YOUR_API_SECRET", )
+        async def main() -> None:
+            calls = [functools.partial(client.spot_trading.cancel_order, market="BTC_USDT", order_id=order_id) for order_id in [4180284841, 4180284842]]
+            async for outcome in client.batch(calls, concurrency=8):
+                print(outcome.item, outcome.error)
+        asyncio.run(main())
+        """
+        return run_batch(calls, concurrency=concurrency)
+
+    def map_concurrent(
+        self,
+        func: typing.Callable[[U], typing.Awaitable[T]],
+        items: typing.Iterable[U],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> typing.AsyncIterator[BatchResult]:
+        """
+        Calls `func` on every item with at most `concurrency` calls in flight, yielding a `BatchResult` for each as
+        it completes. A failed call yields its error rather than aborting the batch.
+
+        Parameters
+        ----------
+        func : typing.Callable[[U], typing.Awaitable[T]]
+            The coroutine function to call on every item.
+
+        items : typing.Iterable[U]
+            The inputs of the calls, pulled only as calls complete.
+
+        concurrency : int
+            The maximum number of calls in flight. Defaults to 16.
+
+        Returns
+        -------
+        typing.AsyncIterator[BatchResult]
+
+        Examples
+        --------
+        from whitebit import AsyncWhitebitApi
+        import asyncio
+        client = AsyncWhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        async def main() -> None:
+            async for outcome in client.map_concurrent(lambda market: client.market_fee.get_market_fee(market=market), ["BTC_USDT", "ETH_USDT"]):
+                print(outcome.item, outcome.result)
+        asyncio.run(main())
+        """
+        return map_concurrent(func, items, concurrency=concurrency)
+
     async def convert_estimate(
         self,
         *,
@@ -3,7 +3,9 @@
 import typing
 
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.pagination import aiter_offset_pages, iter_offset_pages, page_items
 from ..core.request_options import RequestOptions
+from ..types.code_history import CodeHistory
 from .raw_client import AsyncRawCodesClient, RawCodesClient
 from .types.apply_code_response import ApplyCodeResponse
 from .types.create_code_response import CreateCodeResponse
@@ -34,8 +36,8 @@ class CodesClient:
         *,
         ticker: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         passphrase: typing.Optional[str] = OMIT,
         description: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -59,10 +61,10 @@ class CodesClient:
         amount : str
             Amount to transfer. Max [precision](/glossary#precision) = 8, value must be greater than zero and less than or equal to the [main balance](/glossary#balance-main).
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         passphrase : typing.Optional[str]
@@ -100,8 +102,8 @@ class CodesClient:
         self,
         *,
         code: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         passphrase: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> ApplyCodeResponse:
@@ -121,10 +123,10 @@ class CodesClient:
         code : str
             [Code](/glossary#whitebit-codes) that will be applied.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         passphrase : typing.Optional[str]
@@ -152,8 +154,8 @@ class CodesClient:
     def get_my_codes(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -171,10 +173,10 @@ class CodesClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -205,8 +207,8 @@ class CodesClient:
     def get_codes_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -224,10 +226,10 @@ class CodesClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -255,6 +257,53 @@ class CodesClient:
         )
         return _response.data
 
+    def iter_codes_history(
+        self,
+        *,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[CodeHistory]:
+        """
+        Iterates over the history of created and applied codes, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        CodeHistory
+
+        Examples
+        --------
+        from whitebit import WhitebitApi
+        client = WhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        for code in client.codes.iter_codes_history():
+            print(code)
+        """
+
+        def fetch_page(page_offset: int, page_limit: int) -> typing.Sequence[typing.Any]:
+            page = self.get_codes_history(
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+            return page_items(page, "data")
+
+        return iter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
+
 
 class AsyncCodesClient:
     def __init__(self, *, client_wrapper: AsyncClientWrapper):
@@ -276,8 +325,8 @@ class AsyncCodesClient:
         *,
         ticker: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         passphrase: typing.Optional[str] = OMIT,
         description: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -301,10 +350,10 @@ class AsyncCodesClient:
         amount : str
             Amount to transfer. Max [precision](/glossary#precision) = 8, value must be greater than zero and less than or equal to the [main balance](/glossary#balance-main).
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         passphrase : typing.Optional[str]
@@ -345,8 +394,8 @@ class AsyncCodesClient:
         self,
         *,
         code: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         passphrase: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> ApplyCodeResponse:
@@ -366,10 +415,10 @@ class AsyncCodesClient:
         code : str
             [Code](/glossary#whitebit-codes) that will be applied.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         passphrase : typing.Optional[str]
@@ -400,8 +449,8 @@ class AsyncCodesClient:
     async def get_my_codes(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -419,10 +468,10 @@ class AsyncCodesClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -456,8 +505,8 @@ class AsyncCodesClient:
     async def get_codes_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -475,10 +524,10 @@ class AsyncCodesClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -508,3 +557,53 @@ class AsyncCodesClient:
             request=request, nonce=nonce, limit=limit, offset=offset, request_options=request_options
         )
         return _response.data
+
+    def iter_codes_history(
+        self,
+        *,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[CodeHistory]:
+        """
+        Iterates over the history of created and applied codes, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        CodeHistory
+
+        Examples
+        --------
+        from whitebit import AsyncWhitebitApi
+        import asyncio
+        client = AsyncWhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        async def main() -> None:
+            async for code in client.codes.iter_codes_history():
+                print(code)
+        asyncio.run(main())
+        """
+
+        async def fetch_page(page_offset: int, page_limit: int) -> typing.Sequence[typing.Any]:
+            page = await self.get_codes_history(
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+            return page_items(page, "data")
+
+        return aiter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
@@ -28,8 +28,8 @@ class RawCodesClient:
         *,
         ticker: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         passphrase: typing.Optional[str] = OMIT,
         description: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -53,10 +53,10 @@ class RawCodesClient:
         amount : str
             Amount to transfer. Max [precision](/glossary#precision) = 8, value must be greater than zero and less than or equal to the [main balance](/glossary#balance-main).
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         passphrase : typing.Optional[str]
@@ -95,9 +95,10 @@ class RawCodesClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateCodeResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateCodeResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -108,7 +109,7 @@ class RawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -119,11 +120,11 @@ class RawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -132,8 +133,8 @@ class RawCodesClient:
         self,
         *,
         code: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         passphrase: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[ApplyCodeResponse]:
@@ -153,10 +154,10 @@ class RawCodesClient:
         code : str
             [Code](/glossary#whitebit-codes) that will be applied.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         passphrase : typing.Optional[str]
@@ -190,9 +191,10 @@ class RawCodesClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     ApplyCodeResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=ApplyCodeResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -203,7 +205,7 @@ class RawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -214,11 +216,11 @@ class RawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -226,8 +228,8 @@ class RawCodesClient:
     def get_my_codes(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -245,10 +247,10 @@ class RawCodesClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -285,9 +287,10 @@ class RawCodesClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMyCodesResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMyCodesResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -298,7 +301,7 @@ class RawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -309,11 +312,11 @@ class RawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -321,8 +324,8 @@ class RawCodesClient:
     def get_codes_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -340,10 +343,10 @@ class RawCodesClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -380,9 +383,10 @@ class RawCodesClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetCodesHistoryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetCodesHistoryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -393,7 +397,7 @@ class RawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -404,11 +408,11 @@ class RawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -423,8 +427,8 @@ class AsyncRawCodesClient:
         *,
         ticker: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         passphrase: typing.Optional[str] = OMIT,
         description: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -448,10 +452,10 @@ class AsyncRawCodesClient:
         amount : str
             Amount to transfer. Max [precision](/glossary#precision) = 8, value must be greater than zero and less than or equal to the [main balance](/glossary#balance-main).
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         passphrase : typing.Optional[str]
@@ -490,9 +494,10 @@ class AsyncRawCodesClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateCodeResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateCodeResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -503,7 +508,7 @@ class AsyncRawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -514,11 +519,11 @@ class AsyncRawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -527,8 +532,8 @@ class AsyncRawCodesClient:
         self,
         *,
         code: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         passphrase: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[ApplyCodeResponse]:
@@ -548,10 +553,10 @@ class AsyncRawCodesClient:
         code : str
             [Code](/glossary#whitebit-codes) that will be applied.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         passphrase : typing.Optional[str]
@@ -585,9 +590,10 @@ class AsyncRawCodesClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     ApplyCodeResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=ApplyCodeResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -598,7 +604,7 @@ class AsyncRawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -609,11 +615,11 @@ class AsyncRawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -621,8 +627,8 @@ class AsyncRawCodesClient:
     async def get_my_codes(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -640,10 +646,10 @@ class AsyncRawCodesClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -680,9 +686,10 @@ class AsyncRawCodesClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMyCodesResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMyCodesResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -693,7 +700,7 @@ class AsyncRawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -704,11 +711,11 @@ class AsyncRawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -716,8 +723,8 @@ class AsyncRawCodesClient:
     async def get_codes_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -735,10 +742,10 @@ class AsyncRawCodesClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -775,9 +782,10 @@ class AsyncRawCodesClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetCodesHistoryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetCodesHistoryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -788,7 +796,7 @@ class AsyncRawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -799,11 +807,11 @@ class AsyncRawCodesClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
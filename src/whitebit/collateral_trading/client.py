@@ -189,8 +189,8 @@ class CollateralTradingClient:
         side: CreateCollateralLimitOrderRequestSide,
         amount: str,
         price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
@@ -239,9 +239,9 @@ class CollateralTradingClient:
         price : str
             Price in [money](/glossary#money) currency. Example: '9800'
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores.
@@ -359,8 +359,8 @@ class CollateralTradingClient:
         market: str,
         side: CreateCollateralMarketOrderRequestSide,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
@@ -382,9 +382,9 @@ class CollateralTradingClient:
 
         amount : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
 
@@ -430,8 +430,8 @@ class CollateralTradingClient:
         amount: str,
         price: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
@@ -457,9 +457,9 @@ class CollateralTradingClient:
 
         activation_price : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         stop_loss : typing.Optional[str]
 
@@ -506,8 +506,8 @@ class CollateralTradingClient:
         side: CreateCollateralTriggerMarketOrderRequestSide,
         amount: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
@@ -531,9 +531,9 @@ class CollateralTradingClient:
 
         activation_price : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
 
@@ -663,8 +663,8 @@ class CollateralTradingClient:
         *,
         position_id: int,
         market: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         position_side: typing.Optional[ClosePositionRequestPositionSide] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> None:
@@ -681,9 +681,9 @@ class CollateralTradingClient:
 
         market : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         position_side : typing.Optional[ClosePositionRequestPositionSide]
 
@@ -811,7 +811,12 @@ class CollateralTradingClient:
         return _response.data
 
     def change_collateral_account_leverage(
-        self, *, leverage: int, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        leverage: int,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> ChangeCollateralAccountLeverageResponse:
         """
         The endpoint changes account leverage.
@@ -824,9 +829,9 @@ class CollateralTradingClient:
         ----------
         leverage : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -887,7 +892,12 @@ class CollateralTradingClient:
         return _response.data
 
     def update_hedge_mode(
-        self, *, hedge_mode: bool, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        hedge_mode: bool,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> None:
         """
         The endpoint updates hedge mode.
@@ -900,9 +910,9 @@ class CollateralTradingClient:
         ----------
         hedge_mode : bool
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -1027,8 +1037,8 @@ class CollateralTradingClient:
         price: str,
         activation_price: str,
         stop_limit_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> CreateCollateralOcoOrderResponse:
@@ -1053,9 +1063,9 @@ class CollateralTradingClient:
 
         stop_limit_price : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
 
@@ -1088,7 +1098,13 @@ class CollateralTradingClient:
         return _response.data
 
     def cancel_conditional_order(
-        self, *, market: str, id: int, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        market: str,
+        id: int,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> None:
         """
         The endpoint cancels a conditional order.
@@ -1103,9 +1119,9 @@ class CollateralTradingClient:
 
         id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -1130,8 +1146,8 @@ class CollateralTradingClient:
         *,
         market: str,
         order_id: int,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> CancelOcoOrderResponse:
         """
@@ -1147,9 +1163,9 @@ class CollateralTradingClient:
 
         order_id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -1175,8 +1191,8 @@ class CollateralTradingClient:
         *,
         market: str,
         oto_id: int,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> None:
         """
@@ -1192,9 +1208,9 @@ class CollateralTradingClient:
 
         oto_id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -1369,8 +1385,8 @@ class AsyncCollateralTradingClient:
         side: CreateCollateralLimitOrderRequestSide,
         amount: str,
         price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
@@ -1419,9 +1435,9 @@ class AsyncCollateralTradingClient:
         price : str
             Price in [money](/glossary#money) currency. Example: '9800'
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores.
@@ -1545,8 +1561,8 @@ class AsyncCollateralTradingClient:
         market: str,
         side: CreateCollateralMarketOrderRequestSide,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
@@ -1568,9 +1584,9 @@ class AsyncCollateralTradingClient:
 
         amount : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
 
@@ -1619,8 +1635,8 @@ class AsyncCollateralTradingClient:
         amount: str,
         price: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
@@ -1646,9 +1662,9 @@ class AsyncCollateralTradingClient:
 
         activation_price : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         stop_loss : typing.Optional[str]
 
@@ -1698,8 +1714,8 @@ class AsyncCollateralTradingClient:
         side: CreateCollateralTriggerMarketOrderRequestSide,
         amount: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
@@ -1723,9 +1739,9 @@ class AsyncCollateralTradingClient:
 
         activation_price : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
 
@@ -1864,8 +1880,8 @@ class AsyncCollateralTradingClient:
         *,
         position_id: int,
         market: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         position_side: typing.Optional[ClosePositionRequestPositionSide] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> None:
@@ -1882,9 +1898,9 @@ class AsyncCollateralTradingClient:
 
         market : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         position_side : typing.Optional[ClosePositionRequestPositionSide]
 
@@ -2021,7 +2037,12 @@ class AsyncCollateralTradingClient:
         return _response.data
 
     async def change_collateral_account_leverage(
-        self, *, leverage: int, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        leverage: int,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> ChangeCollateralAccountLeverageResponse:
         """
         The endpoint changes account leverage.
@@ -2034,9 +2055,9 @@ class AsyncCollateralTradingClient:
         ----------
         leverage : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -2103,7 +2124,12 @@ class AsyncCollateralTradingClient:
         return _response.data
 
     async def update_hedge_mode(
-        self, *, hedge_mode: bool, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        hedge_mode: bool,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> None:
         """
         The endpoint updates hedge mode.
@@ -2116,9 +2142,9 @@ class AsyncCollateralTradingClient:
         ----------
         hedge_mode : bool
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -2252,8 +2278,8 @@ class AsyncCollateralTradingClient:
         price: str,
         activation_price: str,
         stop_limit_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> CreateCollateralOcoOrderResponse:
@@ -2278,9 +2304,9 @@ class AsyncCollateralTradingClient:
 
         stop_limit_price : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
 
@@ -2316,7 +2342,13 @@ class AsyncCollateralTradingClient:
         return _response.data
 
     async def cancel_conditional_order(
-        self, *, market: str, id: int, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        market: str,
+        id: int,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> None:
         """
         The endpoint cancels a conditional order.
@@ -2331,9 +2363,9 @@ class AsyncCollateralTradingClient:
 
         id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -2361,8 +2393,8 @@ class AsyncCollateralTradingClient:
         *,
         market: str,
         order_id: int,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> CancelOcoOrderResponse:
         """
@@ -2378,9 +2410,9 @@ class AsyncCollateralTradingClient:
 
         order_id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -2409,8 +2441,8 @@ class AsyncCollateralTradingClient:
         *,
         market: str,
         oto_id: int,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> None:
         """
@@ -2426,9 +2458,9 @@ class AsyncCollateralTradingClient:
 
         oto_id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
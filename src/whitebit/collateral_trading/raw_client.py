@@ -124,9 +124,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, float],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, float],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -137,7 +138,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -148,11 +149,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -228,9 +229,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[CollateralAccountBalanceSummaryResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[CollateralAccountBalanceSummaryResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -241,7 +243,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -252,11 +254,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -268,8 +270,8 @@ class RawCollateralTradingClient:
         side: CreateCollateralLimitOrderRequestSide,
         amount: str,
         price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
@@ -318,9 +320,9 @@ class RawCollateralTradingClient:
         price : str
             Price in [money](/glossary#money) currency. Example: '9800'
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores.
@@ -386,9 +388,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateCollateralLimitOrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateCollateralLimitOrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -399,7 +402,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -410,11 +413,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -482,9 +485,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[CreateCollateralBulkOrderResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[CreateCollateralBulkOrderResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -495,7 +499,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -506,7 +510,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -517,11 +521,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -532,8 +536,8 @@ class RawCollateralTradingClient:
         market: str,
         side: CreateCollateralMarketOrderRequestSide,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
@@ -555,9 +559,9 @@ class RawCollateralTradingClient:
 
         amount : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
 
@@ -600,9 +604,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateCollateralMarketOrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateCollateralMarketOrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -613,7 +618,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -624,11 +629,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -641,8 +646,8 @@ class RawCollateralTradingClient:
         amount: str,
         price: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
@@ -668,9 +673,9 @@ class RawCollateralTradingClient:
 
         activation_price : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         stop_loss : typing.Optional[str]
 
@@ -715,9 +720,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateCollateralStopLimitOrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateCollateralStopLimitOrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -728,7 +734,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -739,7 +745,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -750,11 +756,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -766,8 +772,8 @@ class RawCollateralTradingClient:
         side: CreateCollateralTriggerMarketOrderRequestSide,
         amount: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
@@ -791,9 +797,9 @@ class RawCollateralTradingClient:
 
         activation_price : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
 
@@ -837,9 +843,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateCollateralTriggerMarketOrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateCollateralTriggerMarketOrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -850,7 +857,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -861,11 +868,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -916,9 +923,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CollateralAccountSummaryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CollateralAccountSummaryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -929,7 +937,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -940,11 +948,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1004,9 +1012,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetOpenPositionsResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetOpenPositionsResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -1017,7 +1026,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1028,11 +1037,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1042,8 +1051,8 @@ class RawCollateralTradingClient:
         *,
         position_id: int,
         market: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         position_side: typing.Optional[ClosePositionRequestPositionSide] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[None]:
@@ -1060,9 +1069,9 @@ class RawCollateralTradingClient:
 
         market : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         position_side : typing.Optional[ClosePositionRequestPositionSide]
 
@@ -1100,7 +1109,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1111,7 +1120,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1122,7 +1131,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1133,11 +1142,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1196,9 +1205,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetPositionsHistoryResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetPositionsHistoryResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -1209,7 +1219,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1220,7 +1230,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1231,7 +1241,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1242,11 +1252,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1316,9 +1326,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetFundingHistoryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetFundingHistoryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -1329,7 +1340,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1340,17 +1351,22 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
     def change_collateral_account_leverage(
-        self, *, leverage: int, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        leverage: int,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[ChangeCollateralAccountLeverageResponse]:
         """
         The endpoint changes account leverage.
@@ -1363,9 +1379,9 @@ class RawCollateralTradingClient:
         ----------
         leverage : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -1394,9 +1410,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     ChangeCollateralAccountLeverageResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=ChangeCollateralAccountLeverageResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -1407,7 +1424,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1418,11 +1435,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1473,9 +1490,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetCollateralHedgeModeResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetCollateralHedgeModeResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -1486,7 +1504,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1497,7 +1515,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1508,17 +1526,22 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
     def update_hedge_mode(
-        self, *, hedge_mode: bool, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        hedge_mode: bool,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[None]:
         """
         The endpoint updates hedge mode.
@@ -1531,9 +1554,9 @@ class RawCollateralTradingClient:
         ----------
         hedge_mode : bool
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -1567,7 +1590,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1578,7 +1601,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1589,11 +1612,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1656,9 +1679,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetConditionalOrdersResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetConditionalOrdersResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -1669,7 +1693,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1680,7 +1704,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1691,11 +1715,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1758,9 +1782,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetOcoOrdersResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetOcoOrdersResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -1771,7 +1796,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1782,7 +1807,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1793,11 +1818,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1811,8 +1836,8 @@ class RawCollateralTradingClient:
         price: str,
         activation_price: str,
         stop_limit_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[CreateCollateralOcoOrderResponse]:
@@ -1837,9 +1862,9 @@ class RawCollateralTradingClient:
 
         stop_limit_price : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
 
@@ -1876,9 +1901,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateCollateralOcoOrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateCollateralOcoOrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -1889,7 +1915,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1900,7 +1926,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1911,17 +1937,23 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
     def cancel_conditional_order(
-        self, *, market: str, id: int, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        market: str,
+        id: int,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[None]:
         """
         The endpoint cancels a conditional order.
@@ -1936,9 +1968,9 @@ class RawCollateralTradingClient:
 
         id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -1973,7 +2005,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1984,7 +2016,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1995,11 +2027,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2009,8 +2041,8 @@ class RawCollateralTradingClient:
         *,
         market: str,
         order_id: int,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[CancelOcoOrderResponse]:
         """
@@ -2026,9 +2058,9 @@ class RawCollateralTradingClient:
 
         order_id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -2058,9 +2090,10 @@ class RawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CancelOcoOrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CancelOcoOrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -2071,7 +2104,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2082,7 +2115,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2093,11 +2126,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2107,8 +2140,8 @@ class RawCollateralTradingClient:
         *,
         market: str,
         oto_id: int,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[None]:
         """
@@ -2124,9 +2157,9 @@ class RawCollateralTradingClient:
 
         oto_id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -2161,7 +2194,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2172,7 +2205,7 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2183,11 +2216,11 @@ class RawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2268,9 +2301,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, float],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, float],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -2281,7 +2315,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2292,11 +2326,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2372,9 +2406,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[CollateralAccountBalanceSummaryResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[CollateralAccountBalanceSummaryResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -2385,7 +2420,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2396,11 +2431,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2412,8 +2447,8 @@ class AsyncRawCollateralTradingClient:
         side: CreateCollateralLimitOrderRequestSide,
         amount: str,
         price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
@@ -2462,9 +2497,9 @@ class AsyncRawCollateralTradingClient:
         price : str
             Price in [money](/glossary#money) currency. Example: '9800'
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores.
@@ -2530,9 +2565,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateCollateralLimitOrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateCollateralLimitOrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -2543,7 +2579,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2554,11 +2590,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2626,9 +2662,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[CreateCollateralBulkOrderResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[CreateCollateralBulkOrderResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -2639,7 +2676,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2650,7 +2687,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2661,11 +2698,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2676,8 +2713,8 @@ class AsyncRawCollateralTradingClient:
         market: str,
         side: CreateCollateralMarketOrderRequestSide,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
@@ -2699,9 +2736,9 @@ class AsyncRawCollateralTradingClient:
 
         amount : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
 
@@ -2744,9 +2781,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateCollateralMarketOrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateCollateralMarketOrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -2757,7 +2795,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2768,11 +2806,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2785,8 +2823,8 @@ class AsyncRawCollateralTradingClient:
         amount: str,
         price: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
@@ -2812,9 +2850,9 @@ class AsyncRawCollateralTradingClient:
 
         activation_price : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         stop_loss : typing.Optional[str]
 
@@ -2859,9 +2897,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateCollateralStopLimitOrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateCollateralStopLimitOrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -2872,7 +2911,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2883,7 +2922,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2894,11 +2933,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2910,8 +2949,8 @@ class AsyncRawCollateralTradingClient:
         side: CreateCollateralTriggerMarketOrderRequestSide,
         amount: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stop_loss: typing.Optional[str] = OMIT,
         take_profit: typing.Optional[str] = OMIT,
@@ -2935,9 +2974,9 @@ class AsyncRawCollateralTradingClient:
 
         activation_price : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
 
@@ -2981,9 +3020,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateCollateralTriggerMarketOrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateCollateralTriggerMarketOrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -2994,7 +3034,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3005,11 +3045,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -3060,9 +3100,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CollateralAccountSummaryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CollateralAccountSummaryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -3073,7 +3114,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3084,11 +3125,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -3148,9 +3189,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetOpenPositionsResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetOpenPositionsResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -3161,7 +3203,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3172,11 +3214,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -3186,8 +3228,8 @@ class AsyncRawCollateralTradingClient:
         *,
         position_id: int,
         market: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         position_side: typing.Optional[ClosePositionRequestPositionSide] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[None]:
@@ -3204,9 +3246,9 @@ class AsyncRawCollateralTradingClient:
 
         market : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         position_side : typing.Optional[ClosePositionRequestPositionSide]
 
@@ -3244,7 +3286,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3255,7 +3297,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3266,7 +3308,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3277,11 +3319,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -3340,9 +3382,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetPositionsHistoryResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetPositionsHistoryResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -3353,7 +3396,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3364,7 +3407,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3375,7 +3418,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3386,11 +3429,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -3460,9 +3503,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetFundingHistoryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetFundingHistoryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -3473,7 +3517,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3484,17 +3528,22 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
     async def change_collateral_account_leverage(
-        self, *, leverage: int, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        leverage: int,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[ChangeCollateralAccountLeverageResponse]:
         """
         The endpoint changes account leverage.
@@ -3507,9 +3556,9 @@ class AsyncRawCollateralTradingClient:
         ----------
         leverage : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -3538,9 +3587,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     ChangeCollateralAccountLeverageResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=ChangeCollateralAccountLeverageResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -3551,7 +3601,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3562,11 +3612,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -3617,9 +3667,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetCollateralHedgeModeResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetCollateralHedgeModeResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -3630,7 +3681,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3641,7 +3692,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3652,17 +3703,22 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
     async def update_hedge_mode(
-        self, *, hedge_mode: bool, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        hedge_mode: bool,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[None]:
         """
         The endpoint updates hedge mode.
@@ -3675,9 +3731,9 @@ class AsyncRawCollateralTradingClient:
         ----------
         hedge_mode : bool
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -3711,7 +3767,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3722,7 +3778,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3733,11 +3789,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -3800,9 +3856,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetConditionalOrdersResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetConditionalOrdersResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -3813,7 +3870,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3824,7 +3881,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3835,11 +3892,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -3902,9 +3959,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetOcoOrdersResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetOcoOrdersResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -3915,7 +3973,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3926,7 +3984,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3937,11 +3995,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -3955,8 +4013,8 @@ class AsyncRawCollateralTradingClient:
         price: str,
         activation_price: str,
         stop_limit_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[CreateCollateralOcoOrderResponse]:
@@ -3981,9 +4039,9 @@ class AsyncRawCollateralTradingClient:
 
         stop_limit_price : str
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
 
@@ -4020,9 +4078,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateCollateralOcoOrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateCollateralOcoOrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -4033,7 +4092,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4044,7 +4103,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4055,17 +4114,23 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
     async def cancel_conditional_order(
-        self, *, market: str, id: int, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        market: str,
+        id: int,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[None]:
         """
         The endpoint cancels a conditional order.
@@ -4080,9 +4145,9 @@ class AsyncRawCollateralTradingClient:
 
         id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -4117,7 +4182,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4128,7 +4193,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4139,11 +4204,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -4153,8 +4218,8 @@ class AsyncRawCollateralTradingClient:
         *,
         market: str,
         order_id: int,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[CancelOcoOrderResponse]:
         """
@@ -4170,9 +4235,9 @@ class AsyncRawCollateralTradingClient:
 
         order_id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -4202,9 +4267,10 @@ class AsyncRawCollateralTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CancelOcoOrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CancelOcoOrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -4215,7 +4281,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4226,7 +4292,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4237,11 +4303,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -4251,8 +4317,8 @@ class AsyncRawCollateralTradingClient:
         *,
         market: str,
         oto_id: int,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[None]:
         """
@@ -4268,9 +4334,9 @@ class AsyncRawCollateralTradingClient:
 
         oto_id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
@@ -4305,7 +4371,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4316,7 +4382,7 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4327,11 +4393,11 @@ class AsyncRawCollateralTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
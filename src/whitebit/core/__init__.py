@@ -3,50 +3,117 @@
 # isort: skip_file
 
 from .api_error import ApiError
+from .batch import BatchResult, map_concurrent, run_batch
+from .book_arrays import BookArrays, book_arrays
+from .clock_sync import AsyncClockSync, ClockSample, ClockSync
 from .client_wrapper import AsyncClientWrapper, BaseClientWrapper, SyncClientWrapper
 from .datetime_utils import serialize_datetime
 from .file import File, convert_file_dict_to_httpx_tuples, with_content_type
 from .http_client import AsyncHttpClient, HttpClient
 from .http_response import AsyncHttpResponse, HttpResponse
+from .http_transport import AdmissionAsyncHTTPTransport, build_async_httpx_client, build_httpx_client, build_limits
+from .json_codec import JsonCodec, MsgspecJsonCodec, OrjsonCodec, default_json_codec
 from .jsonable_encoder import jsonable_encoder
+from .lazy_response import LazyDict, LazyList, LazyModel, lazy_parse_obj_as
+from .metrics import EndpointMetrics, LatencyHistogram, MetricsCollector, MetricsSnapshot
+from .nonce import NonceGenerator
+from .pagination import aiter_offset_pages, iter_offset_pages, page_items
 from .pydantic_utilities import (
     IS_PYDANTIC_V2,
     UniversalBaseModel,
     UniversalRootModel,
+    construct_obj_as,
+    get_type_adapter,
     parse_obj_as,
     universal_field_validator,
     universal_root_validator,
     update_forward_refs,
+    warm_type_adapters,
 )
 from .query_encoder import encode_query
+from .rate_limit import RATE_LIMITS, RateLimit, RateLimiter
 from .remove_none_from_dict import remove_none_from_dict
-from .request_options import RequestOptions
+from .request_options import RequestOptions, ResponseMode
+from .retry import IdempotencyClass, RetryBudget, classify_request
+from .response_cache import CACHE_TTLS, ResponseCache
 from .serialization import FieldMetadata, convert_and_respect_annotation_metadata
+from .sharding import aiter_time_windows, iter_time_windows, record_field
+from .signing import RequestSigner
+from .timing import RequestTiming, TimingObserver
+from .singleflight import AsyncSingleFlight, SingleFlight
 
 __all__ = [
+    "AdmissionAsyncHTTPTransport",
     "ApiError",
     "AsyncClientWrapper",
+    "AsyncClockSync",
     "AsyncHttpClient",
     "AsyncHttpResponse",
+    "AsyncSingleFlight",
+    "CACHE_TTLS",
     "BaseClientWrapper",
+    "BatchResult",
+    "BookArrays",
+    "ClockSample",
+    "ClockSync",
+    "EndpointMetrics",
     "FieldMetadata",
     "File",
     "HttpClient",
     "HttpResponse",
     "IS_PYDANTIC_V2",
+    "IdempotencyClass",
+    "JsonCodec",
+    "LatencyHistogram",
+    "LazyDict",
+    "LazyList",
+    "LazyModel",
+    "MetricsCollector",
+    "MetricsSnapshot",
+    "MsgspecJsonCodec",
+    "NonceGenerator",
+    "OrjsonCodec",
+    "RATE_LIMITS",
+    "RateLimit",
+    "RateLimiter",
     "RequestOptions",
+    "RequestSigner",
+    "RequestTiming",
+    "ResponseCache",
+    "ResponseMode",
+    "RetryBudget",
+    "SingleFlight",
     "SyncClientWrapper",
+    "TimingObserver",
     "UniversalBaseModel",
     "UniversalRootModel",
+    "aiter_offset_pages",
+    "aiter_time_windows",
+    "book_arrays",
+    "build_async_httpx_client",
+    "build_httpx_client",
+    "build_limits",
+    "classify_request",
+    "construct_obj_as",
     "convert_and_respect_annotation_metadata",
     "convert_file_dict_to_httpx_tuples",
+    "default_json_codec",
     "encode_query",
+    "get_type_adapter",
+    "iter_offset_pages",
+    "iter_time_windows",
     "jsonable_encoder",
+    "lazy_parse_obj_as",
+    "map_concurrent",
+    "page_items",
     "parse_obj_as",
+    "record_field",
     "remove_none_from_dict",
+    "run_batch",
     "serialize_datetime",
     "universal_field_validator",
     "universal_root_validator",
     "update_forward_refs",
+    "warm_type_adapters",
     "with_content_type",
 ]
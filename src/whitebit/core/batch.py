@@ -0,0 +1,109 @@
+import asyncio
+import typing
+
+T = typing.TypeVar("T")
+R = typing.TypeVar("R")
+
+DEFAULT_BATCH_CONCURRENCY = 16
+
+
+class BatchResult(typing.NamedTuple):
+    """
+    The outcome of one call of a batch: its `index` in the input, the input `item`, and either the `result` or
+    the `error` the call raised.
+    """
+
+    index: int
+    item: typing.Any
+    result: typing.Any
+    error: typing.Optional[BaseException]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> typing.Any:
+        """Returns the result, raising the error of a failed call."""
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+async def map_concurrent(
+    func: typing.Callable[[T], typing.Awaitable[R]],
+    items: typing.Iterable[T],
+    *,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> typing.AsyncIterator[BatchResult]:
+    """
+    Calls `func` on every item with at most `concurrency` calls in flight, yielding the results as they complete.
+
+    A failed call yields its error instead of aborting the batch; cancellation is not caught. Items are pulled
+    from `items` only as workers free up, so it may be a long or lazy iterable, and closing the iterator early
+    cancels the calls still in flight.
+
+    Parameters
+    ----------
+    func : typing.Callable[[T], typing.Awaitable[R]]
+        The coroutine function to call on every item, typically a method of an `AsyncWhitebitApi`. Its requests go
+        through the client's rate limiter and retries like any other.
+
+    items : typing.Iterable[T]
+        The inputs of the calls.
+
+    concurrency : int
+        The maximum number of calls in flight. Defaults to 16.
+
+    Examples
+    --------
+    async for outcome in map_concurrent(lambda market: client.market_fee.get_market_fee(market=market), markets):
+        if outcome.ok:
+            fees[outcome.item] = outcome.result
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    pending = enumerate(items)
+    done: "asyncio.Queue[typing.Optional[BatchResult]]" = asyncio.Queue()
+
+    async def worker() -> None:
+        try:
+            # Workers share the input iterator, each taking the next item once its call completes
+            for index, item in pending:
+                try:
+                    result = await func(item)
+                except Exception as error:
+                    done.put_nowait(BatchResult(index, item, None, error))
+                else:
+                    done.put_nowait(BatchResult(index, item, result, None))
+        finally:
+            done.put_nowait(None)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    running = len(workers)
+    try:
+        while running:
+            outcome = await done.get()
+            if outcome is None:
+                running -= 1
+            else:
+                yield outcome
+        # A worker only stops early when the input iterator raised, which is surfaced here
+        for task in workers:
+            task.result()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def run_batch(
+    calls: typing.Iterable[typing.Callable[[], typing.Awaitable[R]]],
+    *,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> typing.AsyncIterator[BatchResult]:
+    """
+    Runs zero-argument call specs, such as `functools.partial(client.spot_trading.cancel_order, market="BTC_USDT",
+    order_id=order_id)`, with at most `concurrency` in flight, yielding their results as they complete. See
+    `map_concurrent`.
+    """
+    return map_concurrent(lambda call: call(), calls, concurrency=concurrency)
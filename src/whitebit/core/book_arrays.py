@@ -0,0 +1,147 @@
+import decimal
+import typing
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+
+class BookArrays(typing.NamedTuple):
+    """
+    An order book as contiguous NumPy arrays, one per side and column, best level first: float64 prices and
+    amounts, or int64 ones in units of 10 ** -`decimals` when built with `decimals`.
+
+    The analytics work on both and return floats in price and amount units.
+    """
+
+    ask_prices: typing.Any
+    ask_amounts: typing.Any
+    bid_prices: typing.Any
+    bid_amounts: typing.Any
+    decimals: typing.Optional[int] = None
+
+    def _side(self, side: str) -> typing.Tuple[typing.Any, typing.Any]:
+        if side == "asks":
+            prices, amounts = self.ask_prices, self.ask_amounts
+        elif side == "bids":
+            prices, amounts = self.bid_prices, self.bid_amounts
+        else:
+            raise ValueError("side must be 'asks' or 'bids'")
+        if self.decimals is not None:
+            scale = 10.0**self.decimals
+            return prices / scale, amounts / scale
+        return prices, amounts
+
+    @property
+    def best_ask(self) -> float:
+        return float(self._side("asks")[0][0]) if len(self.ask_prices) else float("nan")
+
+    @property
+    def best_bid(self) -> float:
+        return float(self._side("bids")[0][0]) if len(self.bid_prices) else float("nan")
+
+    @property
+    def mid(self) -> float:
+        return (self.best_ask + self.best_bid) / 2
+
+    def cumulative_depth(self, side: str, *, quote: bool = False) -> typing.Any:
+        """
+        The amount available up to each level of `side`, best first, in the base asset, or with `quote` in the quote
+        asset.
+        """
+        prices, amounts = self._side(side)
+        return np.cumsum(prices * amounts if quote else amounts)
+
+    def vwap(self, side: str, size: float) -> float:
+        """
+        The average price of taking `size` of the base asset from `side`, walking the book from the best level, or
+        NaN when the book is not deep enough.
+        """
+        prices, amounts = self._side(side)
+        depth = np.cumsum(amounts)
+        if size <= 0 or not len(depth) or size > depth[-1]:
+            return float("nan")
+        # The level that completes the fill, taken only partly
+        last = int(np.searchsorted(depth, size))
+        filled_before = depth[last - 1] if last else 0.0
+        notional = np.dot(prices[:last], amounts[:last]) + prices[last] * (size - filled_before)
+        return float(notional / size)
+
+    def slippage(self, side: str, size: float) -> float:
+        """
+        The cost of taking `size` from `side` relative to the mid price, as a fraction: how much higher the average
+        price of buying from the asks is, or how much lower that of selling into the bids is. NaN when the book is
+        not deep enough.
+        """
+        mid = self.mid
+        vwap = self.vwap(side, size)
+        return (vwap - mid) / mid if side == "asks" else (mid - vwap) / mid
+
+    def imbalance(self, levels: typing.Optional[int] = None) -> float:
+        """
+        The order book imbalance over the `levels` best levels of each side, all by default: the bid amount minus
+        the ask amount over their sum, from -1 (asks only) to 1 (bids only).
+        """
+        bids = float(np.sum(self._side("bids")[1][:levels]))
+        asks = float(np.sum(self._side("asks")[1][:levels]))
+        total = bids + asks
+        return (bids - asks) / total if total else 0.0
+
+
+def _levels(book: typing.Any, side: str) -> typing.Any:
+    if isinstance(book, typing.Mapping):
+        return book.get(side)
+    return getattr(book, side, None)
+
+
+def _fixed_point(value: typing.Any, decimals: int) -> int:
+    if isinstance(value, float):
+        # Already rounded to binary: the nearest integer is the best there is
+        return round(value * 10**decimals)
+    # Decimal strings (and Decimals) scale exactly
+    return int(decimal.Decimal(value).scaleb(decimals).to_integral_value(rounding=decimal.ROUND_HALF_EVEN))
+
+
+def _side_arrays(levels: typing.Any, decimals: typing.Optional[int]) -> typing.Tuple[typing.Any, typing.Any]:
+    if decimals is not None:
+        pairs = levels.items() if isinstance(levels, typing.Mapping) else levels or ()
+        fixed = [(_fixed_point(price, decimals), _fixed_point(amount, decimals)) for price, amount in pairs]
+        values = np.array(fixed, dtype=np.int64).reshape(-1, 2)
+    elif not levels:
+        values = np.empty((0, 2), dtype=np.float64)
+    elif isinstance(levels, typing.Mapping):
+        # A price -> amount mapping, such as a side of a `whitebit.stream.book.OrderBook`
+        values = np.empty((len(levels), 2), dtype=np.float64)
+        values[:, 0] = np.fromiter(levels.keys(), dtype=np.float64, count=len(levels))
+        values[:, 1] = np.fromiter(levels.values(), dtype=np.float64, count=len(levels))
+    else:
+        # [price, amount] levels, parsed from their strings by NumPy in one pass
+        values = np.array(levels, dtype=np.float64)
+    return np.ascontiguousarray(values[:, 0]), np.ascontiguousarray(values[:, 1])
+
+
+def book_arrays(book: typing.Any, *, decimals: typing.Optional[int] = None) -> BookArrays:
+    """
+    Converts an order book to `BookArrays`: the result of `public_api_v4.orderbook()` or `depth()`, parsed or raw,
+    or any object or mapping whose `asks` and `bids` are lists of [price, amount] levels or price -> amount mappings,
+    such as the books kept by the legacy WebSocket client.
+
+    Requires NumPy (`pip install whitebit-python-sdk[numpy]`).
+
+    Parameters
+    ----------
+    book : typing.Any
+        The order book, its sides ordered best level first.
+
+    decimals : typing.Optional[int]
+        Builds int64 fixed-point arrays in units of 10 ** -`decimals` rather than float64 ones. Decimal strings, as
+        the API sends them, and `decimal.Decimal` values are parsed straight to integers, exactly, rounding half to
+        even beyond `decimals`; this runs at Python speed rather than NumPy's. Float values are rounded from their
+        binary value.
+    """
+    if np is None:
+        raise ImportError("book_arrays requires numpy: pip install whitebit-python-sdk[numpy]")
+    ask_prices, ask_amounts = _side_arrays(_levels(book, "asks"), decimals)
+    bid_prices, bid_amounts = _side_arrays(_levels(book, "bids"), decimals)
+    return BookArrays(ask_prices, ask_amounts, bid_prices, bid_amounts, decimals)
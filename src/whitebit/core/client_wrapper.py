@@ -1,10 +1,25 @@
 # This file was auto-generated by Fern from our API Definition.
 
+import types
 import typing
 
 import httpx
 from ..environment import WhitebitApiEnvironment
 from .http_client import AsyncHttpClient, HttpClient
+from .json_codec import JsonCodec, default_json_codec
+from .jsonable_encoder import jsonable_encoder
+from .lazy_response import lazy_parse_obj_as
+from .metrics import MetricsCollector
+from .pydantic_utilities import construct_obj_as, parse_obj_as
+from .rate_limit import RateLimiter
+from .request_options import RequestOptions, ResponseMode
+from .response_cache import ResponseCache
+from .retry import RetryBudget
+from .signing import RequestSigner
+from .singleflight import AsyncSingleFlight, SingleFlight, get_shared_results
+from .timing import RequestTiming, TimingObserver, get_response_timing, timed
+
+T = typing.TypeVar("T")
 
 
 class BaseClientWrapper:
@@ -12,25 +27,64 @@ class BaseClientWrapper:
         self,
         *,
         txc_apikey: str,
-        token: typing.Union[str, typing.Callable[[], str]],
+        token: typing.Optional[typing.Union[str, typing.Callable[[], str]]] = None,
         environment: WhitebitApiEnvironment,
         timeout: typing.Optional[float] = None,
+        response_mode: ResponseMode = "validate",
+        json_codec: typing.Optional[JsonCodec] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        api_secret: typing.Optional[str] = None,
+        nonce_generator: typing.Optional[typing.Callable[[], int]] = None,
+        timing_observers: typing.Optional[typing.Sequence[TimingObserver]] = None,
+        metrics: typing.Optional[MetricsCollector] = None,
     ):
         self._txc_apikey = txc_apikey
         self._token = token
         self._environment = environment
         self._timeout = timeout
+        self._response_mode = response_mode
+        self._json_codec = json_codec if json_codec is not None else default_json_codec()
+        self._retry_budget = retry_budget if retry_budget is not None else RetryBudget()
+        self._rate_limiter = rate_limiter
+        self._coalesce_requests = coalesce_requests
+        self._response_cache = response_cache
+        self._signer = (
+            RequestSigner(api_key=txc_apikey, api_secret=api_secret, nonce_factory=nonce_generator)
+            if api_secret is not None
+            else None
+        )
+        self._timing_observers = list(timing_observers) if timing_observers is not None else []
+        self._metrics = metrics
+        if metrics is not None:
+            self._timing_observers.append(metrics)
+        # The encoded base headers together with the token they were built for
+        self._headers_snapshot: typing.Optional[typing.Tuple[typing.Optional[str], typing.Mapping[str, str]]] = None
+
+    def get_headers(self) -> typing.Mapping[str, str]:
+        """
+        Returns a read-only snapshot of the encoded base headers. The snapshot is rebuilt only when the
+        token changes, so a static token costs nothing per request and a token callable costs one call.
+        """
+        token = self._get_token()
+        snapshot = self._headers_snapshot
+        if snapshot is not None and snapshot[0] == token:
+            return snapshot[1]
 
-    def get_headers(self) -> typing.Dict[str, str]:
         headers: typing.Dict[str, str] = {
             "X-Fern-Language": "Python",
         }
         headers["X-TXC-APIKEY"] = self._txc_apikey
-        headers["Authorization"] = f"Bearer {self._get_token()}"
-        return headers
+        if token is not None:
+            headers["Authorization"] = f"Bearer {token}"
+        encoded_headers = types.MappingProxyType(jsonable_encoder(headers))
+        self._headers_snapshot = (token, encoded_headers)
+        return encoded_headers
 
-    def _get_token(self) -> str:
-        if isinstance(self._token, str):
+    def _get_token(self) -> typing.Optional[str]:
+        if self._token is None or isinstance(self._token, str):
             return self._token
         else:
             return self._token()
@@ -41,20 +95,150 @@ class BaseClientWrapper:
     def get_timeout(self) -> typing.Optional[float]:
         return self._timeout
 
+    def get_json_codec(self) -> JsonCodec:
+        return self._json_codec
+
+    def decode_json(self, response: httpx.Response) -> typing.Any:
+        """
+        Decodes a response body with the client's JSON codec, raising `json.JSONDecodeError` if it is not JSON.
+        """
+        return self._json_codec.loads(response.content)
+
+    def get_retry_budget(self) -> RetryBudget:
+        return self._retry_budget
+
+    def get_rate_limiter(self) -> typing.Optional[RateLimiter]:
+        return self._rate_limiter
+
+    def get_response_cache(self) -> typing.Optional[ResponseCache]:
+        return self._response_cache
+
+    def get_signer(self) -> typing.Optional[RequestSigner]:
+        return self._signer
+
+    def get_timing_observers(self) -> typing.List[TimingObserver]:
+        return self._timing_observers
+
+    def get_metrics(self) -> typing.Optional[MetricsCollector]:
+        return self._metrics
+
+    def get_response_mode(self, request_options: typing.Optional[RequestOptions] = None) -> ResponseMode:
+        if request_options is not None:
+            response_mode = request_options.get("response_mode")
+            if response_mode is not None:
+                return response_mode
+        return self._response_mode
+
+    def parse_response(
+        self,
+        *,
+        type_: typing.Type[T],
+        response: httpx.Response,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> T:
+        """
+        Decodes a successful response body into `type_`, following the response mode of the request,
+        or of the client when the request does not set one.
+        """
+        response_mode = self.get_response_mode(request_options)
+        timing = get_response_timing(response)
+        if timing is None:
+            return self._parse_shared(type_, response, response_mode, None)
+        try:
+            return self._parse_shared(type_, response, response_mode, timing)
+        except BaseException as error:
+            timing.finish(error=error)
+            raise
+
+    def _parse_shared(
+        self,
+        type_: typing.Type[T],
+        response: httpx.Response,
+        response_mode: ResponseMode,
+        timing: typing.Optional[RequestTiming],
+    ) -> T:
+        shared_results = get_shared_results(response)
+        if shared_results is None:
+            return self._parse(type_, response, response_mode, timing)
+
+        # The response was coalesced and handed to several callers, which share the parsed result as well
+        try:
+            return shared_results[(type_, response_mode)]
+        except (KeyError, TypeError):
+            pass
+        result = self._parse(type_, response, response_mode, timing)
+        try:
+            shared_results[(type_, response_mode)] = result
+        except TypeError:
+            pass
+        return result
+
+    def _parse(
+        self,
+        type_: typing.Type[T],
+        response: httpx.Response,
+        response_mode: ResponseMode,
+        timing: typing.Optional[RequestTiming],
+    ) -> T:
+        with timed(timing, "decode"):
+            object_ = self._json_codec.loads(response.content)
+        with timed(timing, "validate"):
+            if response_mode == "raw":
+                return typing.cast(T, object_)
+            if response_mode == "construct":
+                return construct_obj_as(type_, object_)
+            if response_mode == "lazy":
+                return lazy_parse_obj_as(type_, object_)
+            return parse_obj_as(type_, object_)
+
 
 class SyncClientWrapper(BaseClientWrapper):
     def __init__(
         self,
         *,
         txc_apikey: str,
-        token: typing.Union[str, typing.Callable[[], str]],
+        token: typing.Optional[typing.Union[str, typing.Callable[[], str]]] = None,
         environment: WhitebitApiEnvironment,
         timeout: typing.Optional[float] = None,
+        response_mode: ResponseMode = "validate",
+        json_codec: typing.Optional[JsonCodec] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        api_secret: typing.Optional[str] = None,
+        nonce_generator: typing.Optional[typing.Callable[[], int]] = None,
+        timing_observers: typing.Optional[typing.Sequence[TimingObserver]] = None,
+        metrics: typing.Optional[MetricsCollector] = None,
         httpx_client: httpx.Client,
     ):
-        super().__init__(txc_apikey=txc_apikey, token=token, environment=environment, timeout=timeout)
+        super().__init__(
+            txc_apikey=txc_apikey,
+            token=token,
+            environment=environment,
+            timeout=timeout,
+            response_mode=response_mode,
+            json_codec=json_codec,
+            retry_budget=retry_budget,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            api_secret=api_secret,
+            nonce_generator=nonce_generator,
+            timing_observers=timing_observers,
+            metrics=metrics,
+        )
         self.httpx_client = HttpClient(
-            httpx_client=httpx_client, base_headers=self.get_headers, base_timeout=self.get_timeout
+            httpx_client=httpx_client,
+            base_headers=self.get_headers,
+            base_timeout=self.get_timeout,
+            json_codec=self.get_json_codec(),
+            retry_budget=self.get_retry_budget(),
+            rate_limiter=self.get_rate_limiter(),
+            singleflight=SingleFlight() if coalesce_requests else None,
+            response_cache=self.get_response_cache(),
+            signer=self.get_signer(),
+            timing_observers=self.get_timing_observers(),
         )
 
 
@@ -63,12 +247,46 @@ class AsyncClientWrapper(BaseClientWrapper):
         self,
         *,
         txc_apikey: str,
-        token: typing.Union[str, typing.Callable[[], str]],
+        token: typing.Optional[typing.Union[str, typing.Callable[[], str]]] = None,
         environment: WhitebitApiEnvironment,
         timeout: typing.Optional[float] = None,
+        response_mode: ResponseMode = "validate",
+        json_codec: typing.Optional[JsonCodec] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        response_cache: typing.Optional[ResponseCache] = None,
+        api_secret: typing.Optional[str] = None,
+        nonce_generator: typing.Optional[typing.Callable[[], int]] = None,
+        timing_observers: typing.Optional[typing.Sequence[TimingObserver]] = None,
+        metrics: typing.Optional[MetricsCollector] = None,
         httpx_client: httpx.AsyncClient,
     ):
-        super().__init__(txc_apikey=txc_apikey, token=token, environment=environment, timeout=timeout)
+        super().__init__(
+            txc_apikey=txc_apikey,
+            token=token,
+            environment=environment,
+            timeout=timeout,
+            response_mode=response_mode,
+            json_codec=json_codec,
+            retry_budget=retry_budget,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            api_secret=api_secret,
+            nonce_generator=nonce_generator,
+            timing_observers=timing_observers,
+            metrics=metrics,
+        )
         self.httpx_client = AsyncHttpClient(
-            httpx_client=httpx_client, base_headers=self.get_headers, base_timeout=self.get_timeout
+            httpx_client=httpx_client,
+            base_headers=self.get_headers,
+            base_timeout=self.get_timeout,
+            json_codec=self.get_json_codec(),
+            retry_budget=self.get_retry_budget(),
+            rate_limiter=self.get_rate_limiter(),
+            singleflight=AsyncSingleFlight() if coalesce_requests else None,
+            response_cache=self.get_response_cache(),
+            signer=self.get_signer(),
+            timing_observers=self.get_timing_observers(),
         )
@@ -0,0 +1,283 @@
+import asyncio
+import collections
+import threading
+import time
+import typing
+
+from .request_options import RequestOptions
+
+DEFAULT_SYNC_INTERVAL = 60.0
+DEFAULT_WINDOW = 8
+DEFAULT_SMOOTHING = 0.25
+
+# Clock samples are timed around a single attempt: a retry's backoff would only widen their bounds. The response is
+# validated whatever the client's response mode, so that `server_time` returns a model with a `time` attribute.
+_SAMPLE_REQUEST_OPTIONS: RequestOptions = {"max_retries": 0, "response_mode": "validate"}
+
+
+class ClockSample(typing.NamedTuple):
+    """
+    One exchange of the clock synchronization. `lower` and `upper` bound the exchange clock's offset from the local
+    monotonic clock: the server read its clock, which has a one second resolution, somewhere within the round trip.
+    """
+
+    server_time: int
+    rtt: float
+    lower: float
+    upper: float
+    taken_at: float
+
+    @property
+    def offset(self) -> float:
+        return (self.lower + self.upper) / 2
+
+
+class BaseClockSync:
+    """
+    Estimates the exchange clock from `server_time` samples, the way NTP does: every sample bounds the offset by
+    the round trip it was taken in, the bounds of the last `window` samples are intersected, and the offset is
+    smoothed within them. The offset is kept against the local monotonic clock, so that `exchange_now` does not
+    follow the host clock when it drifts or steps.
+
+    Parameters
+    ----------
+    public_api : typing.Any
+        The `public_api_v4` client of a `WhitebitApi`, or of an `AsyncWhitebitApi` for `AsyncClockSync`.
+
+    interval : float
+        The number of seconds between samples when running in the background. Defaults to 60.
+
+    window : int
+        The number of recent samples the offset and the round trip statistics are computed over. Defaults to 8.
+
+    smoothing : float
+        The weight of a new estimate in the smoothed offset, between 0 and 1. Defaults to 0.25.
+    """
+
+    def __init__(
+        self,
+        public_api: typing.Any,
+        *,
+        interval: float = DEFAULT_SYNC_INTERVAL,
+        window: int = DEFAULT_WINDOW,
+        smoothing: float = DEFAULT_SMOOTHING,
+        monotonic: typing.Callable[[], float] = time.monotonic,
+        wall_clock: typing.Callable[[], float] = time.time,
+    ):
+        self.public_api = public_api
+        self.interval = interval
+        self.smoothing = smoothing
+        self.failures = 0
+        self.last_error: typing.Optional[BaseException] = None
+        self._monotonic = monotonic
+        self._wall_clock = wall_clock
+        self._samples: typing.Deque[ClockSample] = collections.deque(maxlen=window)
+        self._rtts: typing.Deque[float] = collections.deque(maxlen=window)
+        # The smoothed offset of the exchange clock from the monotonic clock, None until the first sample
+        self._offset: typing.Optional[float] = None
+        self._bounds = (float("-inf"), float("inf"))
+        self._lock = threading.Lock()
+
+    def exchange_now(self) -> float:
+        """
+        The exchange's current time, in seconds since the epoch. Falls back to the host clock until the first
+        sample is taken. Pass it as the `clock` of a `NonceGenerator` to keep nonces within the exchange's window.
+        """
+        offset = self._offset
+        if offset is None:
+            return self._wall_clock()
+        return self._monotonic() + offset
+
+    @property
+    def offset(self) -> float:
+        """How far the exchange clock is ahead of the host clock, in seconds."""
+        return self.exchange_now() - self._wall_clock()
+
+    @property
+    def synced(self) -> bool:
+        return self._offset is not None
+
+    def _record_ping(self, started_at: float) -> None:
+        rtt = self._monotonic() - started_at
+        with self._lock:
+            self._rtts.append(rtt)
+
+    def _record_sample(self, server_time: typing.Optional[int], started_at: float) -> ClockSample:
+        finished_at = self._monotonic()
+        if server_time is None:
+            raise ValueError("The server time response carries no time")
+        sample = ClockSample(
+            server_time=server_time,
+            rtt=finished_at - started_at,
+            lower=server_time - finished_at,
+            upper=server_time + 1 - started_at,
+            taken_at=finished_at,
+        )
+        with self._lock:
+            self._samples.append(sample)
+            self._rtts.append(sample.rtt)
+            lower, upper = self._intersect()
+            estimate = (lower + upper) / 2
+            if self._offset is None:
+                offset = estimate
+            else:
+                offset = self._offset + self.smoothing * (estimate - self._offset)
+            # The smoothed offset never leaves the bounds the samples agree on
+            self._offset = min(max(offset, lower), upper)
+            self._bounds = (lower, upper)
+        return sample
+
+    def _intersect(self) -> typing.Tuple[float, float]:
+        """
+        The intersection of the sample bounds. When the samples disagree, the clocks have drifted apart or one of
+        them stepped, and the oldest samples are dropped until the remaining ones agree.
+        """
+        while True:
+            lower = max(sample.lower for sample in self._samples)
+            upper = min(sample.upper for sample in self._samples)
+            if lower <= upper or len(self._samples) == 1:
+                return lower, upper
+            self._samples.popleft()
+
+    def _record_failure(self, error: BaseException) -> None:
+        self.failures += 1
+        self.last_error = error
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        The synchronization state, for monitoring drift: the offset of the exchange clock from the host clock and
+        its uncertainty, and the latest, minimum and mean round trip with its jitter, the mean difference between
+        consecutive round trips, all in seconds.
+        """
+        with self._lock:
+            rtts = list(self._rtts)
+            samples = len(self._samples)
+            lower, upper = self._bounds
+            last_sample = self._samples[-1] if self._samples else None
+        synced = self._offset is not None
+        return {
+            "synced": synced,
+            "offset": self.offset if synced else None,
+            "uncertainty": (upper - lower) / 2 if synced else None,
+            "rtt": rtts[-1] if rtts else None,
+            "rtt_min": min(rtts) if rtts else None,
+            "rtt_mean": sum(rtts) / len(rtts) if rtts else None,
+            "jitter": (
+                sum(abs(current - previous) for previous, current in zip(rtts, rtts[1:])) / (len(rtts) - 1)
+                if len(rtts) > 1
+                else None
+            ),
+            "samples": samples,
+            "age": self._monotonic() - last_sample.taken_at if last_sample is not None else None,
+            "failures": self.failures,
+        }
+
+
+class ClockSync(BaseClockSync):
+    """
+    Keeps an estimate of the exchange clock, sampled from a `WhitebitApi` in a background thread once started.
+
+    Examples
+    --------
+    from whitebit import WhitebitApi
+    from whitebit.core import ClockSync, NonceGenerator
+    public_client = WhitebitApi(txc_apikey="YOUR_TXC_APIKEY", )
+    clock = ClockSync(public_client.public_api_v4).start()
+    client = WhitebitApi(txc_apikey="YOUR_TXC_APIKEY", api_secret="YOUR_API_SECRET", nonce_generator=NonceGenerator(clock=clock.exchange_now), )
+    """
+
+    def __init__(self, public_api: typing.Any, **kwargs: typing.Any):
+        super().__init__(public_api, **kwargs)
+        self._stopped = threading.Event()
+        self._thread: typing.Optional[threading.Thread] = None
+
+    def sync(self) -> ClockSample:
+        """
+        Takes one sample. A `server_status` ping goes first, so that the timed request reuses a warm connection
+        and its round trip is not inflated by a handshake.
+        """
+        started_at = self._monotonic()
+        self.public_api.server_status(request_options=_SAMPLE_REQUEST_OPTIONS)
+        self._record_ping(started_at)
+        started_at = self._monotonic()
+        response = self.public_api.server_time(request_options=_SAMPLE_REQUEST_OPTIONS)
+        return self._record_sample(response.time, started_at)
+
+    def start(self) -> "ClockSync":
+        """Starts sampling every `interval` seconds in a daemon thread, beginning with an immediate sample."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="whitebit-clock-sync", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.sync()
+            except Exception as error:
+                self._record_failure(error)
+            self._stopped.wait(self.interval)
+
+    def __enter__(self) -> "ClockSync":
+        return self.start()
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.stop()
+
+
+class AsyncClockSync(BaseClockSync):
+    """
+    Keeps an estimate of the exchange clock, sampled from an `AsyncWhitebitApi` in a background task once started.
+    """
+
+    def __init__(self, public_api: typing.Any, **kwargs: typing.Any):
+        super().__init__(public_api, **kwargs)
+        self._task: typing.Optional["asyncio.Task[None]"] = None
+
+    async def sync(self) -> ClockSample:
+        """
+        Takes one sample. A `server_status` ping goes first, so that the timed request reuses a warm connection
+        and its round trip is not inflated by a handshake.
+        """
+        started_at = self._monotonic()
+        await self.public_api.server_status(request_options=_SAMPLE_REQUEST_OPTIONS)
+        self._record_ping(started_at)
+        started_at = self._monotonic()
+        response = await self.public_api.server_time(request_options=_SAMPLE_REQUEST_OPTIONS)
+        return self._record_sample(response.time, started_at)
+
+    def start(self) -> "AsyncClockSync":
+        """Starts sampling every `interval` seconds in a task of the running loop, beginning with a sample."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        return self
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sync()
+            except Exception as error:
+                self._record_failure(error)
+            await asyncio.sleep(self.interval)
+
+    async def __aenter__(self) -> "AsyncClockSync":
+        return self.start()
+
+    async def __aexit__(self, *args: typing.Any) -> None:
+        await self.stop()
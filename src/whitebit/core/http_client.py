@@ -1,90 +1,24 @@
 # This file was auto-generated by Fern from our API Definition.
 
 import asyncio
-import email.utils
-import re
 import time
 import typing
 import urllib.parse
 from contextlib import asynccontextmanager, contextmanager
-from random import random
 
 import httpx
 from .file import File, convert_file_dict_to_httpx_tuples
+from .json_codec import JsonCodec, default_json_codec
 from .jsonable_encoder import jsonable_encoder
 from .query_encoder import encode_query
+from .rate_limit import RateLimiter
 from .remove_none_from_dict import remove_none_from_dict
 from .request_options import RequestOptions
-
-INITIAL_RETRY_DELAY_SECONDS = 0.5
-MAX_RETRY_DELAY_SECONDS = 10
-MAX_RETRY_DELAY_SECONDS_FROM_HEADER = 30
-
-
-def _parse_retry_after(response_headers: httpx.Headers) -> typing.Optional[float]:
-    """
-    This function parses the `Retry-After` header in a HTTP response and returns the number of seconds to wait.
-
-    Inspired by the urllib3 retry implementation.
-    """
-    retry_after_ms = response_headers.get("retry-after-ms")
-    if retry_after_ms is not None:
-        try:
-            return int(retry_after_ms) / 1000 if retry_after_ms > 0 else 0
-        except Exception:
-            pass
-
-    retry_after = response_headers.get("retry-after")
-    if retry_after is None:
-        return None
-
-    # Attempt to parse the header as an int.
-    if re.match(r"^\s*[0-9]+\s*$", retry_after):
-        seconds = float(retry_after)
-    # Fallback to parsing it as a date.
-    else:
-        retry_date_tuple = email.utils.parsedate_tz(retry_after)
-        if retry_date_tuple is None:
-            return None
-        if retry_date_tuple[9] is None:  # Python 2
-            # Assume UTC if no timezone was specified
-            # On Python2.7, parsedate_tz returns None for a timezone offset
-            # instead of 0 if no timezone is given, where mktime_tz treats
-            # a None timezone offset as local time.
-            retry_date_tuple = retry_date_tuple[:9] + (0,) + retry_date_tuple[10:]
-
-        retry_date = email.utils.mktime_tz(retry_date_tuple)
-        seconds = retry_date - time.time()
-
-    if seconds < 0:
-        seconds = 0
-
-    return seconds
-
-
-def _retry_timeout(response: httpx.Response, retries: int) -> float:
-    """
-    Determine the amount of time to wait before retrying a request.
-    This function begins by trying to parse a retry-after header from the response, and then proceeds to use exponential backoff
-    with a jitter to determine the number of seconds to wait.
-    """
-
-    # If the API asks us to wait a certain amount of time (and it's a reasonable amount), just do what it says.
-    retry_after = _parse_retry_after(response.headers)
-    if retry_after is not None and retry_after <= MAX_RETRY_DELAY_SECONDS_FROM_HEADER:
-        return retry_after
-
-    # Apply exponential backoff, capped at MAX_RETRY_DELAY_SECONDS.
-    retry_delay = min(INITIAL_RETRY_DELAY_SECONDS * pow(2.0, retries), MAX_RETRY_DELAY_SECONDS)
-
-    # Add a randomness / jitter to the retry delay to avoid overwhelming the server with retries.
-    timeout = retry_delay * (1 - 0.25 * random())
-    return timeout if timeout >= 0 else 0
-
-
-def _should_retry(response: httpx.Response) -> bool:
-    retryable_400s = [429, 408, 409]
-    return response.status_code >= 500 or response.status_code in retryable_400s
+from .response_cache import ResponseCache
+from .retry import RetryBudget, RetryState, classify_request
+from .signing import RequestSigner
+from .singleflight import AsyncSingleFlight, SingleFlight, is_coalescable, request_key, share_response
+from .timing import RequestTiming, TimingObserver, timed
 
 
 def remove_omit_from_dict(
@@ -145,19 +79,98 @@ def get_request_body(
     return (json_body if json_body != {} else None), data_body if data_body != {} else None
 
 
+def encode_json_body(
+    *,
+    json_body: typing.Optional[typing.Any],
+    content: typing.Optional[typing.Union[bytes, typing.Iterator[bytes], typing.AsyncIterator[bytes]]],
+    headers: typing.Optional[typing.Dict[str, typing.Any]],
+    json_codec: JsonCodec,
+) -> typing.Tuple[
+    typing.Optional[typing.Any],
+    typing.Optional[typing.Union[bytes, typing.Iterator[bytes], typing.AsyncIterator[bytes]]],
+    typing.Optional[typing.Dict[str, typing.Any]],
+]:
+    """
+    Encodes a JSON body with `json_codec` up front, so that httpx sends the bytes as they are instead of
+    running its own stdlib encoder. Returns the json, content and headers to hand over to httpx.
+    """
+    if json_body is None or content is not None:
+        return json_body, content, headers
+    headers = dict(headers) if headers is not None else {}
+    if not any(key.lower() == "content-type" for key in headers):
+        headers["content-type"] = "application/json"
+    return None, json_codec.dumps(json_body), headers
+
+
+def merge_headers(
+    base_headers: typing.Mapping[str, str],
+    headers: typing.Optional[typing.Dict[str, typing.Any]],
+    request_options: typing.Optional[RequestOptions],
+) -> typing.Mapping[str, str]:
+    """
+    Merges per-request headers into the already encoded base headers. Only the per-request values are encoded,
+    and a `None` value removes the header. When there is nothing to merge the base headers are used as they are.
+    """
+    additional_headers = request_options.get("additional_headers") if request_options is not None else None
+    if not headers and not additional_headers:
+        return base_headers
+
+    merged_headers = dict(base_headers)
+    for extra_headers in (headers, additional_headers):
+        if not extra_headers:
+            continue
+        for key, value in extra_headers.items():
+            if value is None:
+                merged_headers.pop(key, None)
+            else:
+                merged_headers[key] = jsonable_encoder(value)
+    return merged_headers
+
+
+def build_retry_state(
+    method: str,
+    path: typing.Optional[str],
+    request_options: typing.Optional[RequestOptions],
+    retry_budget: typing.Optional[RetryBudget],
+    retries: int = 0,
+) -> RetryState:
+    max_retries = request_options.get("max_retries", 0) if request_options is not None else 0
+    idempotency = request_options.get("idempotency") if request_options is not None else None
+    return RetryState(
+        max_retries=max_retries or 0,
+        idempotency=idempotency if idempotency is not None else classify_request(method, path),
+        budget=retry_budget,
+        retries=retries,
+    )
+
+
 class HttpClient:
     def __init__(
         self,
         *,
         httpx_client: httpx.Client,
         base_timeout: typing.Callable[[], typing.Optional[float]],
-        base_headers: typing.Callable[[], typing.Dict[str, str]],
+        base_headers: typing.Callable[[], typing.Mapping[str, str]],
         base_url: typing.Optional[typing.Callable[[], str]] = None,
+        json_codec: typing.Optional[JsonCodec] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        singleflight: typing.Optional[SingleFlight] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        signer: typing.Optional[RequestSigner] = None,
+        timing_observers: typing.Optional[typing.Sequence[TimingObserver]] = None,
     ):
         self.base_url = base_url
         self.base_timeout = base_timeout
         self.base_headers = base_headers
         self.httpx_client = httpx_client
+        self.json_codec = json_codec if json_codec is not None else default_json_codec()
+        self.retry_budget = retry_budget
+        self.rate_limiter = rate_limiter
+        self.singleflight = singleflight
+        self.response_cache = response_cache
+        self.signer = signer
+        self.timing_observers = timing_observers
 
     def get_base_url(self, maybe_base_url: typing.Optional[str]) -> str:
         base_url = maybe_base_url
@@ -181,9 +194,18 @@ class HttpClient:
         files: typing.Optional[typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]]] = None,
         headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
         request_options: typing.Optional[RequestOptions] = None,
-        retries: int = 2,
+        retries: int = 0,
         omit: typing.Optional[typing.Any] = None,
     ) -> httpx.Response:
+        """
+        Sends a request, retrying it in a loop under the policy of `core.retry`: up to
+        `request_options["max_retries"]` retries, as far as the idempotency class of the request and the
+        client's retry budget allow. `max_retries` is the number of retries, not of attempts.
+
+        `retries` is the number of retries already spent on this request and counts against `max_retries`.
+        It used to start at 2, which left `max_retries=N` with N - 2 retries; it now defaults to 0.
+        """
+        timing = RequestTiming(method, path, self.timing_observers) if self.timing_observers else None
         base_url = self.get_base_url(base_url)
         timeout = (
             request_options.get("timeout_in_seconds")
@@ -192,66 +214,110 @@ class HttpClient:
         )
 
         json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
+        # Signed bodies are serialized by the signer, right before each attempt so that retries get a fresh nonce
+        signer = self.signer if path is not None and content is None and files is None else None
+        signed_body: typing.Optional[typing.Dict[str, typing.Any]] = None
+        if signer is not None and signer.applies_to(method, path) and isinstance(json_body, (dict, type(None))):
+            signed_body, json_body = json_body or {}, None
+        json_body, request_content, request_headers = encode_json_body(
+            json_body=json_body, content=content, headers=headers, json_codec=self.json_codec
+        )
 
-        response = self.httpx_client.request(
-            method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
+        url = urllib.parse.urljoin(f"{base_url}/", path)
+        request_headers = merge_headers(self.base_headers(), request_headers, request_options)
+        query = encode_query(
+            jsonable_encoder(
                 remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {}) or {}
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit,
-                        )
+                    remove_omit_from_dict(
+                        {
+                            **(params if params is not None else {}),
+                            **(
+                                request_options.get("additional_query_parameters", {}) or {}
+                                if request_options is not None
+                                else {}
+                            ),
+                        },
+                        omit,
                     )
                 )
-            ),
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=(
-                convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
-                if (files is not None and files is not omit)
-                else None
-            ),
-            timeout=timeout,
+            )
         )
 
-        max_retries: int = request_options.get("max_retries", 0) if request_options is not None else 0
-        if _should_retry(response=response):
-            if max_retries > retries:
-                time.sleep(_retry_timeout(response=response, retries=retries))
-                return self.request(
-                    path=path,
-                    method=method,
-                    base_url=base_url,
-                    params=params,
-                    json=json,
-                    content=content,
-                    files=files,
-                    headers=headers,
-                    request_options=request_options,
-                    retries=retries + 1,
-                    omit=omit,
-                )
-
-        return response
+        def send() -> httpx.Response:
+            retry_state = build_retry_state(method, path, request_options, self.retry_budget, retries)
+            while True:
+                if self.rate_limiter is not None:
+                    with timed(timing, "rate_limit_wait"):
+                        self.rate_limiter.acquire(path)
+                attempt_content, attempt_headers = request_content, request_headers
+                if signer is not None and signed_body is not None:
+                    with timed(timing, "sign"):
+                        attempt_content, signature_headers = signer.sign(path or "", signed_body, self.json_codec)
+                    attempt_headers = {**request_headers, **signature_headers}
+                if timing is not None:
+                    timing.start_attempt()
+                try:
+                    response = self.httpx_client.request(
+                        method=method,
+                        url=url,
+                        headers=attempt_headers,
+                        params=query,
+                        json=json_body,
+                        data=data_body,
+                        content=attempt_content,
+                        files=(
+                            convert_file_dict_to_httpx_tuples(
+                                remove_omit_from_dict(remove_none_from_dict(files), omit)
+                            )
+                            if (files is not None and files is not omit)
+                            else None
+                        ),
+                        timeout=timeout,
+                        extensions={"trace": timing.trace} if timing is not None else None,
+                    )
+                except httpx.TransportError as error:
+                    delay = retry_state.next_delay(error=error)
+                    if delay is None:
+                        raise
+                else:
+                    if timing is not None and response.status_code == 429:
+                        timing.rate_limited += 1
+                    delay = retry_state.next_delay(response=response)
+                    if delay is None:
+                        return response
+                    response.close()
+                with timed(timing, "backoff"):
+                    time.sleep(delay)
+
+        def dispatch() -> httpx.Response:
+            coalescable = is_coalescable(method, json_body, data_body, request_content, files)
+            cache_ttl = self.response_cache.get_ttl(path) if self.response_cache is not None and coalescable else None
+            if cache_ttl is None and (self.singleflight is None or not coalescable):
+                return send()
+
+            key = request_key(url, query, request_headers)
+            cache = self.response_cache if cache_ttl is not None and key is not None else None
+            if cache is not None and key is not None:
+                cached_response = cache.get(key)
+                if cached_response is not None:
+                    if timing is not None:
+                        timing.cached = True
+                    return cached_response
+            response = self.singleflight.do(key, send) if self.singleflight is not None else send()
+            if cache is not None and key is not None and cache_ttl is not None and response.status_code == 200:
+                # Cached responses are handed to several callers, which then share the parsed result as well
+                share_response(response)
+                cache.set(key, response, cache_ttl)
+            return response
+
+        if timing is None:
+            return dispatch()
+        try:
+            response = dispatch()
+        except BaseException as error:
+            timing.finish(error=error)
+            raise
+        return timing.attach(response)
 
     @contextmanager
     def stream(
@@ -267,9 +333,16 @@ class HttpClient:
         files: typing.Optional[typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]]] = None,
         headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
         request_options: typing.Optional[RequestOptions] = None,
-        retries: int = 2,
+        retries: int = 0,
         omit: typing.Optional[typing.Any] = None,
     ) -> typing.Iterator[httpx.Response]:
+        """
+        Opens a streamed response, going through the same steps as `request`: the rate limiter, the signer and
+        the retry policy apply to every attempt at opening it, and the client's timing observers receive a record
+        once it is closed. Once the response is handed over it is not retried, and it is neither coalesced nor
+        cached.
+        """
+        timing = RequestTiming(method, path, self.timing_observers) if self.timing_observers else None
         base_url = self.get_base_url(base_url)
         timeout = (
             request_options.get("timeout_in_seconds")
@@ -278,48 +351,95 @@ class HttpClient:
         )
 
         json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
+        # Signed bodies are serialized by the signer, right before each attempt so that retries get a fresh nonce
+        signer = self.signer if path is not None and content is None and files is None else None
+        signed_body: typing.Optional[typing.Dict[str, typing.Any]] = None
+        if signer is not None and signer.applies_to(method, path) and isinstance(json_body, (dict, type(None))):
+            signed_body, json_body = json_body or {}, None
+        json_body, request_content, request_headers = encode_json_body(
+            json_body=json_body, content=content, headers=headers, json_codec=self.json_codec
+        )
 
-        with self.httpx_client.stream(
-            method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
+        url = urllib.parse.urljoin(f"{base_url}/", path)
+        request_headers = merge_headers(self.base_headers(), request_headers, request_options)
+        query = encode_query(
+            jsonable_encoder(
                 remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {})
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit,
-                        )
+                    remove_omit_from_dict(
+                        {
+                            **(params if params is not None else {}),
+                            **(
+                                request_options.get("additional_query_parameters", {})
+                                if request_options is not None
+                                else {}
+                            ),
+                        },
+                        omit,
                     )
                 )
-            ),
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=(
-                convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
-                if (files is not None and files is not omit)
-                else None
-            ),
-            timeout=timeout,
-        ) as stream:
-            yield stream
-
+            )
+        )
+        retry_state = build_retry_state(method, path, request_options, self.retry_budget, retries)
+        if not isinstance(request_content, (bytes, type(None))):
+            # A streamed request body cannot be sent twice
+            retry_state.max_retries = 0
+        try:
+            while True:
+                if self.rate_limiter is not None:
+                    with timed(timing, "rate_limit_wait"):
+                        self.rate_limiter.acquire(path)
+                attempt_content, attempt_headers = request_content, request_headers
+                if signer is not None and signed_body is not None:
+                    with timed(timing, "sign"):
+                        attempt_content, signature_headers = signer.sign(path or "", signed_body, self.json_codec)
+                    attempt_headers = {**request_headers, **signature_headers}
+                request = self.httpx_client.build_request(
+                    method=method,
+                    url=url,
+                    headers=attempt_headers,
+                    params=query,
+                    json=json_body,
+                    data=data_body,
+                    content=attempt_content,
+                    files=(
+                        convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
+                        if (files is not None and files is not omit)
+                        else None
+                    ),
+                    timeout=timeout,
+                    extensions={"trace": timing.trace} if timing is not None else None,
+                )
+                if timing is not None:
+                    timing.start_attempt()
+                try:
+                    response = self.httpx_client.send(request, stream=True)
+                except httpx.TransportError as error:
+                    delay = retry_state.next_delay(error=error)
+                    if delay is None:
+                        raise
+                else:
+                    if timing is not None and response.status_code == 429:
+                        timing.rate_limited += 1
+                    delay = retry_state.next_delay(response=response)
+                    if delay is None:
+                        break
+                    response.close()
+                with timed(timing, "backoff"):
+                    time.sleep(delay)
+        except BaseException as error:
+            if timing is not None:
+                timing.finish(error=error)
+            raise
+        stream_error: typing.Optional[BaseException] = None
+        try:
+            yield response
+        except BaseException as error:
+            stream_error = error
+            raise
+        finally:
+            response.close()
+            if timing is not None:
+                timing.finish_stream(response, error=stream_error)
 
 class AsyncHttpClient:
     def __init__(
@@ -327,13 +447,27 @@ class AsyncHttpClient:
         *,
         httpx_client: httpx.AsyncClient,
         base_timeout: typing.Callable[[], typing.Optional[float]],
-        base_headers: typing.Callable[[], typing.Dict[str, str]],
+        base_headers: typing.Callable[[], typing.Mapping[str, str]],
         base_url: typing.Optional[typing.Callable[[], str]] = None,
+        json_codec: typing.Optional[JsonCodec] = None,
+        retry_budget: typing.Optional[RetryBudget] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        singleflight: typing.Optional[AsyncSingleFlight] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        signer: typing.Optional[RequestSigner] = None,
+        timing_observers: typing.Optional[typing.Sequence[TimingObserver]] = None,
     ):
         self.base_url = base_url
         self.base_timeout = base_timeout
         self.base_headers = base_headers
         self.httpx_client = httpx_client
+        self.json_codec = json_codec if json_codec is not None else default_json_codec()
+        self.retry_budget = retry_budget
+        self.rate_limiter = rate_limiter
+        self.singleflight = singleflight
+        self.response_cache = response_cache
+        self.signer = signer
+        self.timing_observers = timing_observers
 
     def get_base_url(self, maybe_base_url: typing.Optional[str]) -> str:
         base_url = maybe_base_url
@@ -357,9 +491,18 @@ class AsyncHttpClient:
         files: typing.Optional[typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]]] = None,
         headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
         request_options: typing.Optional[RequestOptions] = None,
-        retries: int = 2,
+        retries: int = 0,
         omit: typing.Optional[typing.Any] = None,
     ) -> httpx.Response:
+        """
+        Sends a request, retrying it in a loop under the policy of `core.retry`: up to
+        `request_options["max_retries"]` retries, as far as the idempotency class of the request and the
+        client's retry budget allow. `max_retries` is the number of retries, not of attempts.
+
+        `retries` is the number of retries already spent on this request and counts against `max_retries`.
+        It used to start at 2, which left `max_retries=N` with N - 2 retries; it now defaults to 0.
+        """
+        timing = RequestTiming(method, path, self.timing_observers) if self.timing_observers else None
         base_url = self.get_base_url(base_url)
         timeout = (
             request_options.get("timeout_in_seconds")
@@ -368,66 +511,110 @@ class AsyncHttpClient:
         )
 
         json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
+        # Signed bodies are serialized by the signer, right before each attempt so that retries get a fresh nonce
+        signer = self.signer if path is not None and content is None and files is None else None
+        signed_body: typing.Optional[typing.Dict[str, typing.Any]] = None
+        if signer is not None and signer.applies_to(method, path) and isinstance(json_body, (dict, type(None))):
+            signed_body, json_body = json_body or {}, None
+        json_body, request_content, request_headers = encode_json_body(
+            json_body=json_body, content=content, headers=headers, json_codec=self.json_codec
+        )
 
-        # Add the input to each of these and do None-safety checks
-        response = await self.httpx_client.request(
-            method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
+        url = urllib.parse.urljoin(f"{base_url}/", path)
+        request_headers = merge_headers(self.base_headers(), request_headers, request_options)
+        query = encode_query(
+            jsonable_encoder(
                 remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {}) or {}
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit,
-                        )
+                    remove_omit_from_dict(
+                        {
+                            **(params if params is not None else {}),
+                            **(
+                                request_options.get("additional_query_parameters", {}) or {}
+                                if request_options is not None
+                                else {}
+                            ),
+                        },
+                        omit,
                     )
                 )
-            ),
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=(
-                convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
-                if files is not None
-                else None
-            ),
-            timeout=timeout,
+            )
         )
 
-        max_retries: int = request_options.get("max_retries", 0) if request_options is not None else 0
-        if _should_retry(response=response):
-            if max_retries > retries:
-                await asyncio.sleep(_retry_timeout(response=response, retries=retries))
-                return await self.request(
-                    path=path,
-                    method=method,
-                    base_url=base_url,
-                    params=params,
-                    json=json,
-                    content=content,
-                    files=files,
-                    headers=headers,
-                    request_options=request_options,
-                    retries=retries + 1,
-                    omit=omit,
-                )
-        return response
+        async def send() -> httpx.Response:
+            retry_state = build_retry_state(method, path, request_options, self.retry_budget, retries)
+            while True:
+                if self.rate_limiter is not None:
+                    with timed(timing, "rate_limit_wait"):
+                        await self.rate_limiter.async_acquire(path)
+                attempt_content, attempt_headers = request_content, request_headers
+                if signer is not None and signed_body is not None:
+                    with timed(timing, "sign"):
+                        attempt_content, signature_headers = signer.sign(path or "", signed_body, self.json_codec)
+                    attempt_headers = {**request_headers, **signature_headers}
+                if timing is not None:
+                    timing.start_attempt()
+                try:
+                    response = await self.httpx_client.request(
+                        method=method,
+                        url=url,
+                        headers=attempt_headers,
+                        params=query,
+                        json=json_body,
+                        data=data_body,
+                        content=attempt_content,
+                        files=(
+                            convert_file_dict_to_httpx_tuples(
+                                remove_omit_from_dict(remove_none_from_dict(files), omit)
+                            )
+                            if files is not None
+                            else None
+                        ),
+                        timeout=timeout,
+                        extensions={"trace": timing.atrace} if timing is not None else None,
+                    )
+                except httpx.TransportError as error:
+                    delay = retry_state.next_delay(error=error)
+                    if delay is None:
+                        raise
+                else:
+                    if timing is not None and response.status_code == 429:
+                        timing.rate_limited += 1
+                    delay = retry_state.next_delay(response=response)
+                    if delay is None:
+                        return response
+                    await response.aclose()
+                with timed(timing, "backoff"):
+                    await asyncio.sleep(delay)
+
+        async def dispatch() -> httpx.Response:
+            coalescable = is_coalescable(method, json_body, data_body, request_content, files)
+            cache_ttl = self.response_cache.get_ttl(path) if self.response_cache is not None and coalescable else None
+            if cache_ttl is None and (self.singleflight is None or not coalescable):
+                return await send()
+
+            key = request_key(url, query, request_headers)
+            cache = self.response_cache if cache_ttl is not None and key is not None else None
+            if cache is not None and key is not None:
+                cached_response = cache.get(key)
+                if cached_response is not None:
+                    if timing is not None:
+                        timing.cached = True
+                    return cached_response
+            response = await self.singleflight.do(key, send) if self.singleflight is not None else await send()
+            if cache is not None and key is not None and cache_ttl is not None and response.status_code == 200:
+                # Cached responses are handed to several callers, which then share the parsed result as well
+                share_response(response)
+                cache.set(key, response, cache_ttl)
+            return response
+
+        if timing is None:
+            return await dispatch()
+        try:
+            response = await dispatch()
+        except BaseException as error:
+            timing.finish(error=error)
+            raise
+        return timing.attach(response)
 
     @asynccontextmanager
     async def stream(
@@ -443,9 +630,16 @@ class AsyncHttpClient:
         files: typing.Optional[typing.Dict[str, typing.Optional[typing.Union[File, typing.List[File]]]]] = None,
         headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
         request_options: typing.Optional[RequestOptions] = None,
-        retries: int = 2,
+        retries: int = 0,
         omit: typing.Optional[typing.Any] = None,
     ) -> typing.AsyncIterator[httpx.Response]:
+        """
+        Opens a streamed response, going through the same steps as `request`: the rate limiter, the signer and
+        the retry policy apply to every attempt at opening it, and the client's timing observers receive a record
+        once it is closed. Once the response is handed over it is not retried, and it is neither coalesced nor
+        cached.
+        """
+        timing = RequestTiming(method, path, self.timing_observers) if self.timing_observers else None
         base_url = self.get_base_url(base_url)
         timeout = (
             request_options.get("timeout_in_seconds")
@@ -454,44 +648,92 @@ class AsyncHttpClient:
         )
 
         json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
+        # Signed bodies are serialized by the signer, right before each attempt so that retries get a fresh nonce
+        signer = self.signer if path is not None and content is None and files is None else None
+        signed_body: typing.Optional[typing.Dict[str, typing.Any]] = None
+        if signer is not None and signer.applies_to(method, path) and isinstance(json_body, (dict, type(None))):
+            signed_body, json_body = json_body or {}, None
+        json_body, request_content, request_headers = encode_json_body(
+            json_body=json_body, content=content, headers=headers, json_codec=self.json_codec
+        )
 
-        async with self.httpx_client.stream(
-            method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
+        url = urllib.parse.urljoin(f"{base_url}/", path)
+        request_headers = merge_headers(self.base_headers(), request_headers, request_options)
+        query = encode_query(
+            jsonable_encoder(
                 remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
-                    remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {})
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit=omit,
-                        )
+                    remove_omit_from_dict(
+                        {
+                            **(params if params is not None else {}),
+                            **(
+                                request_options.get("additional_query_parameters", {})
+                                if request_options is not None
+                                else {}
+                            ),
+                        },
+                        omit=omit,
                     )
                 )
-            ),
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=(
-                convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
-                if files is not None
-                else None
-            ),
-            timeout=timeout,
-        ) as stream:
-            yield stream
+            )
+        )
+        retry_state = build_retry_state(method, path, request_options, self.retry_budget, retries)
+        if not isinstance(request_content, (bytes, type(None))):
+            # A streamed request body cannot be sent twice
+            retry_state.max_retries = 0
+        try:
+            while True:
+                if self.rate_limiter is not None:
+                    with timed(timing, "rate_limit_wait"):
+                        await self.rate_limiter.async_acquire(path)
+                attempt_content, attempt_headers = request_content, request_headers
+                if signer is not None and signed_body is not None:
+                    with timed(timing, "sign"):
+                        attempt_content, signature_headers = signer.sign(path or "", signed_body, self.json_codec)
+                    attempt_headers = {**request_headers, **signature_headers}
+                request = self.httpx_client.build_request(
+                    method=method,
+                    url=url,
+                    headers=attempt_headers,
+                    params=query,
+                    json=json_body,
+                    data=data_body,
+                    content=attempt_content,
+                    files=(
+                        convert_file_dict_to_httpx_tuples(remove_omit_from_dict(remove_none_from_dict(files), omit))
+                        if files is not None
+                        else None
+                    ),
+                    timeout=timeout,
+                    extensions={"trace": timing.atrace} if timing is not None else None,
+                )
+                if timing is not None:
+                    timing.start_attempt()
+                try:
+                    response = await self.httpx_client.send(request, stream=True)
+                except httpx.TransportError as error:
+                    delay = retry_state.next_delay(error=error)
+                    if delay is None:
+                        raise
+                else:
+                    if timing is not None and response.status_code == 429:
+                        timing.rate_limited += 1
+                    delay = retry_state.next_delay(response=response)
+                    if delay is None:
+                        break
+                    await response.aclose()
+                with timed(timing, "backoff"):
+                    await asyncio.sleep(delay)
+        except BaseException as error:
+            if timing is not None:
+                timing.finish(error=error)
+            raise
+        stream_error: typing.Optional[BaseException] = None
+        try:
+            yield response
+        except BaseException as error:
+            stream_error = error
+            raise
+        finally:
+            await response.aclose()
+            if timing is not None:
+                timing.finish_stream(response, error=stream_error)
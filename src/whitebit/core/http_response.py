@@ -3,6 +3,7 @@
 from typing import Dict, Generic, TypeVar
 
 import httpx
+from .timing import get_response_timing
 
 T = TypeVar("T")
 """Generic to represent the underlying type of the data wrapped by the HTTP response."""
@@ -15,6 +16,10 @@ class BaseHttpResponse:
 
     def __init__(self, response: httpx.Response):
         self._response = response
+        # Wrapping the response completes the call, whose timing record, if any, is then final
+        timing = get_response_timing(response)
+        if timing is not None:
+            timing.finish()
 
     @property
     def headers(self) -> Dict[str, str]:
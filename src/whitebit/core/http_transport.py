@@ -0,0 +1,135 @@
+import asyncio
+import typing
+import weakref
+
+import httpx
+
+# Defaults tuned for trading workloads: enough connections for bursts of concurrent requests, and an expiry long
+# enough to survive quiet periods between bursts without a new TLS handshake. Idle connections stay at httpx's 20:
+# httpcore's pool rescans every connection for each idle one whenever a request starts or ends, so keeping a
+# whole burst's worth of connections open costs more CPU than the handshakes it saves.
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+
+def build_limits(
+    *,
+    max_connections: typing.Optional[int] = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: typing.Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: typing.Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def build_httpx_client(
+    *,
+    timeout: typing.Optional[float],
+    follow_redirects: typing.Optional[bool] = None,
+    limits: typing.Optional[httpx.Limits] = None,
+    http2: bool = False,
+    local_address: typing.Optional[str] = None,
+) -> httpx.Client:
+    """
+    Builds the default httpx client. `http2` requires the `h2` package, `local_address` binds outgoing
+    connections to the given local IP address (e.g. "0.0.0.0" to force IPv4).
+    """
+    transport = httpx.HTTPTransport(
+        limits=limits if limits is not None else build_limits(),
+        http2=http2,
+        local_address=local_address,
+    )
+    return httpx.Client(timeout=timeout, follow_redirects=bool(follow_redirects), transport=transport)
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """
+    Wraps a response body, calling `release` once, when the body has been read to the end or closed.
+    """
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: typing.Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: typing.Optional[typing.Callable[[], None]] = release
+
+    def _done(self) -> None:
+        if self._release is not None:
+            self._release()
+            self._release = None
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+        self._done()
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._done()
+
+
+class AdmissionAsyncHTTPTransport(httpx.AsyncHTTPTransport):
+    """
+    An `httpx.AsyncHTTPTransport` that lets at most `max_requests` requests into the connection pool at a time,
+    from sending until their response body is read to the end or closed. The others wait on a semaphore rather
+    than in httpcore's pool queue, which is scanned in full, against every connection, each time a request starts
+    or ends: with hundreds of requests queued there, the event loop spends its time on that scan.
+    """
+
+    def __init__(self, *, max_requests: int, **kwargs: typing.Any) -> None:
+        super().__init__(**kwargs)
+        self._max_requests = max_requests
+        # One semaphore per event loop the client is used from, as a semaphore cannot be awaited from another
+        # loop than the one it was first awaited in, e.g. when the client is reused across asyncio.run calls
+        self._admissions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _get_admission(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        admission = self._admissions.get(loop)
+        if admission is None:
+            admission = self._admissions[loop] = asyncio.Semaphore(self._max_requests)
+        return admission
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        admission = self._get_admission()
+        await admission.acquire()
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            admission.release()
+            raise
+        if isinstance(response.stream, httpx.ByteStream):
+            # The body is already in memory, so the response holds nothing in the pool
+            admission.release()
+            return response
+        response.stream = _ReleasingStream(typing.cast(httpx.AsyncByteStream, response.stream), admission.release)
+        return response
+
+
+def build_async_httpx_client(
+    *,
+    timeout: typing.Optional[float],
+    follow_redirects: typing.Optional[bool] = None,
+    limits: typing.Optional[httpx.Limits] = None,
+    http2: bool = False,
+    local_address: typing.Optional[str] = None,
+) -> httpx.AsyncClient:
+    """
+    Async counterpart of `build_httpx_client`. Without HTTP/2, requests beyond the connection limit wait for
+    admission outside the pool (see `AdmissionAsyncHTTPTransport`).
+    """
+    limits = limits if limits is not None else build_limits()
+    transport: httpx.AsyncHTTPTransport
+    if limits.max_connections is not None and not http2:
+        transport = AdmissionAsyncHTTPTransport(
+            max_requests=limits.max_connections, limits=limits, local_address=local_address
+        )
+    else:
+        transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2, local_address=local_address)
+    return httpx.AsyncClient(timeout=timeout, follow_redirects=bool(follow_redirects), transport=transport)
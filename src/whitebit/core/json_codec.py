@@ -0,0 +1,98 @@
+import json
+import math
+import typing
+from json.decoder import JSONDecodeError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore[assignment]
+
+
+class JsonCodec:
+    """
+    Encodes request bodies to and decodes response bodies from JSON bytes.
+
+    Subclass it to plug in another JSON library. `loads` must raise `json.JSONDecodeError` (or a subclass)
+    on malformed input, as that is what the raw clients catch to report non-JSON error bodies. Every codec
+    encodes NaN and infinite floats as `null`, as orjson and msgspec do, since JSON has no value for them.
+    """
+
+    name: str = "json"
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        try:
+            return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+        except ValueError as exc:
+            if "Out of range float" not in str(exc):
+                raise
+        # Only bodies holding a non-finite float pay for rewriting them
+        return json.dumps(
+            _null_non_finite(obj), ensure_ascii=False, separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+    def loads(self, data: typing.Union[bytes, str]) -> typing.Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Integers beyond 64 bits and other values orjson refuses, the stdlib encoder handles them
+            return super().dumps(obj)
+
+    def loads(self, data: typing.Union[bytes, str]) -> typing.Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+
+
+class MsgspecJsonCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: typing.Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except (TypeError, OverflowError):
+            # Integers beyond what msgspec encodes and other values it refuses, the stdlib encoder handles them
+            return super().dumps(obj)
+
+    def loads(self, data: typing.Union[bytes, str]) -> typing.Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as exc:
+            text = data.decode("utf-8", errors="replace") if isinstance(data, bytes) else data
+            raise JSONDecodeError(str(exc), text, 0) from exc
+
+
+def _null_non_finite(obj: typing.Any) -> typing.Any:
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _null_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_null_non_finite(value) for value in obj]
+    return obj
+
+
+def default_json_codec() -> JsonCodec:
+    """
+    Returns the fastest codec available: orjson, then msgspec, then the standard library.
+    """
+    if orjson is not None:
+        return OrjsonCodec()
+    if msgspec is not None:
+        return MsgspecJsonCodec()
+    return JsonCodec()
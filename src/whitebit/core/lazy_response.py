@@ -0,0 +1,191 @@
+import collections.abc
+import inspect
+import typing
+
+import pydantic
+import typing_extensions
+from .pydantic_utilities import (
+    IS_PYDANTIC_V2,
+    _get_field_default,
+    _get_model_field_types,
+    _get_model_fields,
+    parse_obj_as,
+)
+from .serialization import _remove_annotations, get_field_to_alias_mapping
+
+T = typing.TypeVar("T")
+M = typing.TypeVar("M", bound=pydantic.BaseModel)
+
+_MISSING = object()
+
+# Field name to JSON key mappings per model class, for fields aliased through `FieldMetadata`.
+_FIELD_ALIASES: typing.Dict[typing.Any, typing.Dict[str, str]] = {}
+
+
+def _is_required(field: typing.Any) -> bool:
+    if IS_PYDANTIC_V2:
+        return bool(field.is_required())
+    return bool(field.required)
+
+
+def lazy_parse_obj_as(type_: typing.Type[T], object_: typing.Any) -> T:
+    """
+    Like `parse_obj_as`, but keeps the decoded JSON and defers validation until values are read.
+
+    Lists and dicts are returned as `LazyList` / `LazyDict`, which validate an entry into its model the
+    first time that entry is accessed, and models as `LazyModel`, which validates a field on first
+    attribute access. Everything else is validated right away.
+    """
+    if object_ is None:
+        return typing.cast(T, None)
+    clean_type = _remove_annotations(type_)
+    origin = typing_extensions.get_origin(clean_type)
+    args = typing_extensions.get_args(clean_type)
+
+    if origin == typing.Union:
+        members = [member for member in args if member is not type(None)]
+        if len(members) == 1:
+            return lazy_parse_obj_as(members[0], object_)
+    elif inspect.isclass(clean_type) and issubclass(clean_type, pydantic.BaseModel):
+        if isinstance(object_, collections.abc.Mapping):
+            return typing.cast(T, LazyModel(clean_type, object_))
+    elif origin in (list, collections.abc.Sequence) and args and isinstance(object_, list):
+        return typing.cast(T, LazyList(args[0], object_))
+    elif origin == dict and len(args) == 2 and isinstance(object_, dict):
+        return typing.cast(T, LazyDict(args[1], object_))
+    return parse_obj_as(type_, object_)
+
+
+class LazyList(collections.abc.Sequence, typing.Generic[T]):  # type: ignore[type-arg]
+    """
+    A read-only list of decoded JSON items that are validated into `item_type` one by one, on first access.
+    """
+
+    __slots__ = ("_item_type", "_items", "_parsed")
+
+    def __init__(self, item_type: typing.Type[T], items: typing.List[typing.Any]):
+        self._item_type = item_type
+        self._items = items
+        self._parsed: typing.List[typing.Any] = [_MISSING] * len(items)
+
+    @typing.overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> typing.List[T]: ...
+
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Union[T, typing.List[T]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        value = self._parsed[index]
+        if value is _MISSING:
+            value = parse_obj_as(self._item_type, self._items[index])
+            self._parsed[index] = value
+        return value
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def raw(self) -> typing.List[typing.Any]:
+        """The decoded JSON items, as received."""
+        return self._items
+
+    def __repr__(self) -> str:
+        return f"LazyList[{getattr(self._item_type, '__name__', self._item_type)}](len={len(self._items)})"
+
+
+class LazyDict(collections.abc.Mapping, typing.Generic[T]):  # type: ignore[type-arg]
+    """
+    A read-only mapping of decoded JSON values that are validated into `value_type` one by one, on first access.
+    """
+
+    __slots__ = ("_value_type", "_items", "_parsed")
+
+    def __init__(self, value_type: typing.Type[T], items: typing.Dict[str, typing.Any]):
+        self._value_type = value_type
+        self._items = items
+        self._parsed: typing.Dict[str, T] = {}
+
+    def __getitem__(self, key: str) -> T:
+        try:
+            return self._parsed[key]
+        except KeyError:
+            pass
+        value = parse_obj_as(self._value_type, self._items[key])
+        self._parsed[key] = value
+        return value
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    @property
+    def raw(self) -> typing.Dict[str, typing.Any]:
+        """The decoded JSON values, as received."""
+        return self._items
+
+    def __repr__(self) -> str:
+        return f"LazyDict[{getattr(self._value_type, '__name__', self._value_type)}](len={len(self._items)})"
+
+
+class LazyModel(typing.Generic[M]):
+    """
+    Exposes the fields of `model_type` as attributes, under the same names as the generated model, validating
+    each field from the decoded JSON the first time it is read. List and dict fields come back lazy as well.
+    Reading a required field that is missing from the JSON raises `AttributeError`, as validating the whole model
+    would have failed. Use `to_model()` to validate everything into an actual `model_type` instance.
+    """
+
+    __slots__ = ("_model_type", "_object", "_fields")
+
+    def __init__(self, model_type: typing.Type[M], object_: typing.Mapping[str, typing.Any]):
+        self._model_type = model_type
+        self._object = object_
+        self._fields: typing.Dict[str, typing.Any] = {}
+
+    def __getattr__(self, name: str) -> typing.Any:
+        try:
+            return self._fields[name]
+        except KeyError:
+            pass
+
+        field_types = _get_model_field_types(self._model_type)
+        if name not in field_types:
+            # Extra properties the model would have kept as is
+            if name in self._object:
+                return self._object[name]
+            raise AttributeError(f"'{self._model_type.__name__}' object has no attribute '{name}'")
+
+        aliases = _FIELD_ALIASES.get(self._model_type)
+        if aliases is None:
+            aliases = _FIELD_ALIASES[self._model_type] = get_field_to_alias_mapping(self._model_type)
+        alias = aliases.get(name, name)
+        raw_value = self._object.get(alias, _MISSING)
+        if raw_value is _MISSING:
+            field = _get_model_fields(self._model_type)[name]
+            if _is_required(field):
+                raise AttributeError(
+                    f"'{self._model_type.__name__}' is missing the required field '{name}' (JSON key '{alias}')"
+                )
+            value = _get_field_default(field)
+        else:
+            value = lazy_parse_obj_as(field_types[name], raw_value)
+        self._fields[name] = value
+        return value
+
+    @property
+    def raw(self) -> typing.Mapping[str, typing.Any]:
+        """The decoded JSON object, as received."""
+        return self._object
+
+    def to_model(self) -> M:
+        return parse_obj_as(self._model_type, self._object)
+
+    def __repr__(self) -> str:
+        return f"Lazy{self._model_type.__name__}({dict(self._object)!r})"
@@ -0,0 +1,337 @@
+import threading
+import time
+import typing
+
+from .rate_limit import RATE_LIMITS
+from .timing import RequestTiming
+
+# Latencies are recorded in microseconds into log-linear buckets: exact below 2 ** _PRECISION_BITS, then
+# 2 ** (_PRECISION_BITS - 1) buckets per power of two, so that a recorded value is within 1/64 of the real one
+_PRECISION_BITS = 7
+_HALF_BUCKET_COUNT = 1 << (_PRECISION_BITS - 1)
+_LINEAR_LIMIT = 1 << _PRECISION_BITS
+
+# The `le` bounds of the exported histogram, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+
+# The endpoints with path parameters, longest first, which are labelled by their route so that every market does
+# not get its own series
+_PARAMETERIZED_ROUTES = sorted((key for key in RATE_LIMITS if key.endswith("/")), key=len, reverse=True)
+
+_COUNTERS = (
+    ("requests", "requests_total", "API calls completed."),
+    ("retries", "retries_total", "Attempts beyond the first of API calls."),
+    ("rate_limited", "rate_limited_total", "Attempts of API calls answered with a 429."),
+    ("errors", "errors_total", "API calls that failed without an error status, on transport or parsing errors."),
+    ("cache_hits", "cache_hits_total", "API calls answered from the response cache."),
+    ("coalesced", "coalesced_total", "API calls answered by a concurrent identical request."),
+    ("request_bytes", "request_bytes_total", "Bytes of request bodies sent by API calls."),
+    ("response_bytes", "response_bytes_total", "Bytes of response bodies received by API calls."),
+)
+
+
+def _bucket_index(value: int) -> int:
+    if value < _LINEAR_LIMIT:
+        return value
+    shift = value.bit_length() - _PRECISION_BITS
+    return shift * _HALF_BUCKET_COUNT + (value >> shift)
+
+
+def _bucket_bounds(index: int) -> typing.Tuple[int, int]:
+    """The lowest value of a bucket and the lowest value of the next one."""
+    if index < _LINEAR_LIMIT:
+        return index, index + 1
+    shift = index // _HALF_BUCKET_COUNT - 1
+    mantissa = index - shift * _HALF_BUCKET_COUNT
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+def endpoint_label(path: typing.Optional[str]) -> str:
+    """
+    The endpoint a request path is reported under: the route of an endpoint with path parameters, as in
+    `api/v4/public/orderbook/{market}`, or else the path itself.
+    """
+    if path is None:
+        return ""
+    path = path.strip("/")
+    if path in RATE_LIMITS:
+        return path
+    for route in _PARAMETERIZED_ROUTES:
+        if path.startswith(route):
+            return route + "{market}"
+    return path
+
+
+def status_class(status_code: typing.Optional[int]) -> str:
+    """The status class of a response, such as "2xx", or "error" for a call that got no response."""
+    return f"{status_code // 100}xx" if status_code is not None else "error"
+
+
+class LatencyHistogram:
+    """
+    An HDR-style histogram of durations: recording is a couple of integer operations and a dict update, memory
+    grows with the number of distinct buckets rather than of values, and every percentile is within 1/64 of the
+    real value, from microseconds to hours.
+    """
+
+    __slots__ = ("counts", "count", "sum", "min", "max")
+
+    def __init__(self) -> None:
+        # Counts by bucket index, of durations in microseconds
+        self.counts: typing.Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        index = _bucket_index(max(int(seconds * 1_000_000), 0))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        if self.count == 0 or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.count += 1
+        self.sum += seconds
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        if other.count:
+            self.min = other.min if self.count == 0 else min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        self.count += other.count
+        self.sum += other.sum
+
+    def copy(self) -> "LatencyHistogram":
+        histogram = LatencyHistogram()
+        histogram.merge(self)
+        return histogram
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """The duration, in seconds, that `percent` percent of the recorded ones do not exceed."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(self.count * percent / 100 + 0.5))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                lowest, highest = _bucket_bounds(index)
+                # The middle of the bucket, kept within the extremes actually recorded
+                value = (lowest + highest - 1) / 2 / 1_000_000
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def cumulative_counts(self, bounds: typing.Sequence[float]) -> typing.List[int]:
+        """
+        The number of durations within each of the ascending `bounds`, in seconds, as of bucket precision: a bucket
+        straddling a bound counts above it, so that no count includes a duration beyond its bound.
+        """
+        limits = [round(bound * 1_000_000) for bound in bounds]
+        totals = [0] * len(limits)
+        for index, count in self.counts.items():
+            # The highest duration, in microseconds, the bucket holds
+            highest = _bucket_bounds(index)[1] - 1
+            for position, limit in enumerate(limits):
+                if highest <= limit:
+                    totals[position] += count
+        return totals
+
+    def __repr__(self) -> str:
+        return (
+            f"LatencyHistogram(count={self.count}, p50={self.percentile(50):.6f}, p99={self.percentile(99):.6f}, "
+            f"max={self.max:.6f})"
+        )
+
+
+class EndpointMetrics:
+    """The counters and latency histogram of the calls to one endpoint that ended in one status class."""
+
+    __slots__ = ("endpoint", "status_class", "latency", *(name for name, _, _ in _COUNTERS))
+
+    def __init__(self, endpoint: str, status_class: str):
+        self.endpoint = endpoint
+        self.status_class = status_class
+        self.latency = LatencyHistogram()
+        self.requests = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def merge(self, other: "EndpointMetrics") -> None:
+        for name, _, _ in _COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.latency.merge(other.latency)
+
+    def copy(self) -> "EndpointMetrics":
+        metrics = EndpointMetrics(self.endpoint, self.status_class)
+        metrics.merge(self)
+        return metrics
+
+    def as_dict(self) -> typing.Dict[str, typing.Any]:
+        record: typing.Dict[str, typing.Any] = {"endpoint": self.endpoint, "status_class": self.status_class}
+        for name, _, _ in _COUNTERS:
+            record[name] = getattr(self, name)
+        record["latency"] = {
+            "count": self.latency.count,
+            "mean": self.latency.mean,
+            "min": self.latency.min,
+            "p50": self.latency.percentile(50),
+            "p90": self.latency.percentile(90),
+            "p99": self.latency.percentile(99),
+            "p999": self.latency.percentile(99.9),
+            "max": self.latency.max,
+        }
+        return record
+
+    def __repr__(self) -> str:
+        return f"EndpointMetrics({self.endpoint} {self.status_class}, requests={self.requests})"
+
+
+class MetricsSnapshot(typing.NamedTuple):
+    """
+    A point-in-time copy of a `MetricsCollector`, covering the calls completed from `started_at` to `taken_at`
+    (`time.time()` timestamps).
+    """
+
+    started_at: float
+    taken_at: float
+    endpoints: typing.List[EndpointMetrics]
+
+    def get(self, endpoint: str, status_class: typing.Optional[str] = None) -> EndpointMetrics:
+        """The metrics of an endpoint, for one status class or all of them."""
+        total = EndpointMetrics(endpoint, status_class or "all")
+        for metrics in self.endpoints:
+            if metrics.endpoint == endpoint and (status_class is None or metrics.status_class == status_class):
+                total.merge(metrics)
+        return total
+
+    def totals(self) -> EndpointMetrics:
+        """The metrics of all the calls."""
+        total = EndpointMetrics("all", "all")
+        for metrics in self.endpoints:
+            total.merge(metrics)
+        return total
+
+    def as_dict(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "started_at": self.started_at,
+            "taken_at": self.taken_at,
+            "totals": self.totals().as_dict(),
+            "endpoints": [metrics.as_dict() for metrics in self.endpoints],
+        }
+
+
+class MetricsCollector:
+    """
+    Aggregates the timing records of a client's calls into per-endpoint counters and latency histograms, split by
+    status class, e.g. `WhitebitApi(..., metrics=MetricsCollector())`. It is a timing observer, so it can also be
+    passed in `timing_observers` or shared between clients.
+
+    Read it with `snapshot()`, or export it with `prometheus()` in the Prometheus text format, to be served on a
+    `/metrics` endpoint or written to a node exporter textfile.
+
+    Parameters
+    ----------
+    namespace : str
+        The prefix of the exported metric names. Defaults to "whitebit_sdk".
+
+    buckets : typing.Sequence[float]
+        The `le` bounds, in seconds, of the exported latency histogram. Defaults to `DEFAULT_BUCKETS`, from 5 ms
+        to 10 seconds.
+    """
+
+    def __init__(self, *, namespace: str = "whitebit_sdk", buckets: typing.Sequence[float] = DEFAULT_BUCKETS):
+        self.namespace = namespace
+        self.buckets = tuple(sorted(buckets))
+        self._endpoints: typing.Dict[typing.Tuple[str, str], EndpointMetrics] = {}
+        self._labels: typing.Dict[typing.Optional[str], str] = {}
+        self._started_at = time.time()
+        self._lock = threading.Lock()
+
+    def __call__(self, timing: RequestTiming) -> None:
+        endpoint = self._labels.get(timing.path)
+        if endpoint is None:
+            endpoint = endpoint_label(timing.path)
+            if len(self._labels) < 10_000:
+                self._labels[timing.path] = endpoint
+        key = (endpoint, status_class(timing.status_code))
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = EndpointMetrics(*key)
+            metrics.requests += 1
+            metrics.retries += timing.retries
+            metrics.rate_limited += timing.rate_limited
+            metrics.request_bytes += timing.request_bytes
+            metrics.response_bytes += timing.response_bytes
+            if timing.error is not None:
+                metrics.errors += 1
+            if timing.cached:
+                metrics.cache_hits += 1
+            if timing.coalesced:
+                metrics.coalesced += 1
+            metrics.latency.record(timing.total)
+
+    def snapshot(self, *, reset: bool = False) -> MetricsSnapshot:
+        """
+        Copies the metrics. With `reset`, they then start over, so that successive snapshots cover disjoint periods.
+        """
+        with self._lock:
+            taken_at = time.time()
+            started_at = self._started_at
+            if reset:
+                endpoints = list(self._endpoints.values())
+                self._endpoints = {}
+                self._started_at = taken_at
+            else:
+                endpoints = [metrics.copy() for metrics in self._endpoints.values()]
+        endpoints.sort(key=lambda metrics: (metrics.endpoint, metrics.status_class))
+        return MetricsSnapshot(started_at, taken_at, endpoints)
+
+    def reset(self) -> None:
+        self.snapshot(reset=True)
+
+    def prometheus(self) -> str:
+        """The metrics in the Prometheus text exposition format (version 0.0.4)."""
+        endpoints = self.snapshot().endpoints
+        lines: typing.List[str] = []
+        for name, metric, help_text in _COUNTERS:
+            metric = f"{self.namespace}_{metric}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} counter")
+            for metrics in endpoints:
+                lines.append(f"{metric}{{{_labels(metrics)}}} {getattr(metrics, name)}")
+
+        metric = f"{self.namespace}_request_duration_seconds"
+        lines.append(f"# HELP {metric} Duration of API calls, retries included.")
+        lines.append(f"# TYPE {metric} histogram")
+        for metrics in endpoints:
+            labels = _labels(metrics)
+            for bound, count in zip(self.buckets, metrics.latency.cumulative_counts(self.buckets)):
+                lines.append(f'{metric}_bucket{{{labels},le="{_format_float(bound)}"}} {count}')
+            lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {metrics.latency.count}')
+            lines.append(f"{metric}_sum{{{labels}}} {_format_float(metrics.latency.sum)}")
+            lines.append(f"{metric}_count{{{labels}}} {metrics.latency.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(metrics: EndpointMetrics) -> str:
+    return f'endpoint="{_escape(metrics.endpoint)}",status_class="{metrics.status_class}"'
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
@@ -0,0 +1,71 @@
+import ctypes
+import multiprocessing
+import threading
+import time
+import typing
+
+
+class NonceGenerator:
+    """
+    Produces strictly increasing nonces, millisecond timestamps by default. When two requests fall within the same
+    millisecond the second one gets the next integer, so nonces never repeat across the threads of a process, nor
+    across worker processes when the generator is created with `shared=True` and handed to them (as a
+    `multiprocessing.Process` argument, or through fork).
+
+    Parameters
+    ----------
+    clock : typing.Callable[[], float]
+        Returns the current time in seconds. Pass a synchronized clock, such as `ClockSync.exchange_now`, to keep
+        nonces within the exchange's nonce window when the host clock drifts. Defaults to `time.time`.
+
+    resolution : int
+        Nonces per second of clock time. Defaults to 1000, i.e. millisecond timestamps.
+
+    shared : bool
+        Whether the last nonce lives in shared memory, coordinating every process the generator is handed to.
+        Defaults to False.
+
+    context : typing.Optional[typing.Any]
+        The multiprocessing context to allocate the shared memory from, when `shared` is set.
+
+    The legacy client has its own copy in `whitebit/nonce.py`, as neither package can import the other: keep the
+    two in sync.
+    """
+
+    def __init__(
+        self,
+        *,
+        clock: typing.Callable[[], float] = time.time,
+        resolution: int = 1000,
+        shared: bool = False,
+        context: typing.Optional[typing.Any] = None,
+    ):
+        self._clock = clock
+        self._resolution = resolution
+        # A 64-bit integer in shared memory, guarded by its own process-shared lock
+        self._shared = (context or multiprocessing).Value(ctypes.c_int64, 0) if shared else None
+        self._last = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> int:
+        now = int(self._clock() * self._resolution)
+        if self._shared is None:
+            with self._lock:
+                self._last = nonce = max(self._last + 1, now)
+            return nonce
+        with self._shared.get_lock():
+            self._shared.value = nonce = max(self._shared.value + 1, now)
+        return nonce
+
+    def __getstate__(self) -> typing.Dict[str, typing.Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: typing.Dict[str, typing.Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+# Used by every client that is not given its own generator, so that clients of a process never share a nonce
+default_nonce_generator = NonceGenerator()
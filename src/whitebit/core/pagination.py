@@ -0,0 +1,113 @@
+import asyncio
+import concurrent.futures
+import typing
+
+T = typing.TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def page_items(page: typing.Any, field: str) -> typing.Sequence[typing.Any]:
+    """
+    The records of a page response, held in `field`, whether the response was parsed into a model or returned as
+    raw JSON.
+    """
+    if isinstance(page, typing.Mapping):
+        items = page.get(field)
+    else:
+        items = getattr(page, field, None)
+    return items if items is not None else []
+
+
+def iter_offset_pages(
+    fetch_page: typing.Callable[[int, int], typing.Sequence[T]],
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+    prefetch: bool = True,
+) -> typing.Iterator[T]:
+    """
+    Yields the records of an offset/limit endpoint page by page, until a page comes back short.
+
+    With `prefetch`, the next page is requested in a background thread as soon as a full page arrives, so that it
+    is on its way while the caller consumes the current one. Closing the iterator early discards it.
+
+    Parameters
+    ----------
+    fetch_page : typing.Callable[[int, int], typing.Sequence[T]]
+        Fetches the records at an offset, given the offset and the limit.
+
+    page_size : int
+        The limit of every page. It must not exceed the endpoint's maximum, as a capped page would read as the last.
+        Defaults to 100.
+
+    offset : int
+        The offset of the first page. Defaults to 0.
+
+    prefetch : bool
+        Whether to fetch the next page while the current one is consumed. Defaults to True.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if not prefetch:
+        while True:
+            page = fetch_page(offset, page_size)
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="whitebit-prefetch")
+    try:
+        future = executor.submit(fetch_page, offset, page_size)
+        while True:
+            page = future.result()
+            full = len(page) >= page_size
+            if full:
+                offset += page_size
+                future = executor.submit(fetch_page, offset, page_size)
+            yield from page
+            if not full:
+                return
+    finally:
+        future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_offset_pages(
+    fetch_page: typing.Callable[[int, int], typing.Awaitable[typing.Sequence[T]]],
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+    prefetch: bool = True,
+) -> typing.AsyncIterator[T]:
+    """
+    Yields the records of an offset/limit endpoint page by page, until a page comes back short.
+
+    With `prefetch`, the next page is requested in a task as soon as a full page arrives, so that it is on its way
+    while the caller consumes the current one. Closing the iterator early cancels it. See `iter_offset_pages`.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    next_page: typing.Optional["asyncio.Future[typing.Sequence[T]]"] = None
+    try:
+        page = await fetch_page(offset, page_size)
+        while True:
+            full = len(page) >= page_size
+            if full:
+                offset += page_size
+                if prefetch:
+                    next_page = asyncio.ensure_future(fetch_page(offset, page_size))
+            for item in page:
+                yield item
+            if not full:
+                return
+            if next_page is not None:
+                page = await next_page
+                next_page = None
+            else:
+                page = await fetch_page(offset, page_size)
+    finally:
+        # A prefetch that already failed is retrieved, so that its error is not reported as unhandled
+        if next_page is not None and not next_page.cancel() and not next_page.cancelled():
+            next_page.exception()
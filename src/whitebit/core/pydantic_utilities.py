@@ -1,9 +1,27 @@
 # This file was auto-generated by Fern from our API Definition.
 
 # nopycln: file
+import collections.abc
 import datetime as dt
+import inspect
+import threading
 from collections import defaultdict
-from typing import Any, Callable, ClassVar, Dict, List, Mapping, Optional, Set, Tuple, Type, TypeVar, Union, cast
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import pydantic
 
@@ -28,22 +46,127 @@ else:
     from pydantic.typing import is_literal_type as is_literal_type  # type: ignore[no-redef]
     from pydantic.typing import is_union as is_union  # type: ignore[no-redef]
 
+import typing_extensions
 from .datetime_utils import serialize_datetime
-from .serialization import convert_and_respect_annotation_metadata
+from .serialization import _remove_annotations, convert_and_respect_annotation_metadata
 from typing_extensions import TypeAlias
 
 T = TypeVar("T")
 Model = TypeVar("Model", bound=pydantic.BaseModel)
 
 
+# Process-wide registry of compiled `pydantic.TypeAdapter`s, keyed by the annotation they validate.
+_TYPE_ADAPTERS: Dict[Any, Any] = {}
+_TYPE_ADAPTERS_LOCK = threading.Lock()
+
+
+def get_type_adapter(type_: Type[T]) -> "pydantic.TypeAdapter[T]":  # type: ignore[name-defined]
+    """
+    Returns the shared `pydantic.TypeAdapter` for `type_`, building it on first use.
+
+    Building an adapter compiles the core validation schema, which costs far more than validating a
+    typical response, so every adapter is built once per process and reused by `parse_obj_as`.
+    Only available on Pydantic V2.
+    """
+    try:
+        return _TYPE_ADAPTERS[type_]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable annotations cannot be cached, fall back to a one-off adapter
+        return pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
+
+    with _TYPE_ADAPTERS_LOCK:
+        adapter = _TYPE_ADAPTERS.get(type_)
+        if adapter is None:
+            adapter = pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
+            _TYPE_ADAPTERS[type_] = adapter
+    return adapter
+
+
+def warm_type_adapters(types: Iterable[Any]) -> None:
+    """
+    Eagerly compiles the adapters for `types`, e.g. the response types of an order-entry hot path,
+    so that the first request does not pay for schema compilation. A no-op on Pydantic V1, where
+    `pydantic.parse_obj_as` already caches its parsing models.
+    """
+    if not IS_PYDANTIC_V2:
+        return
+    for type_ in types:
+        get_type_adapter(type_)
+
+
 def parse_obj_as(type_: Type[T], object_: Any) -> T:
     dealiased_object = convert_and_respect_annotation_metadata(object_=object_, annotation=type_, direction="read")
     if IS_PYDANTIC_V2:
-        adapter = pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
-        return adapter.validate_python(dealiased_object)
+        return get_type_adapter(type_).validate_python(dealiased_object)
     return pydantic.parse_obj_as(type_, dealiased_object)
 
 
+def construct_obj_as(type_: Type[T], object_: Any) -> T:
+    """
+    Builds `type_` from `object_` without validation: models, including nested ones, are created with
+    `model_construct` and every other value is kept exactly as decoded. Only meant for trusted payloads,
+    such as exchange responses on latency-sensitive paths, where field types are known to be right.
+    """
+    # Aliases are resolved once, for the whole payload, so that models are then constructed from field names
+    dealiased_object = convert_and_respect_annotation_metadata(object_=object_, annotation=type_, direction="read")
+    return cast(T, _construct(type_, dealiased_object))
+
+
+# Resolved field annotations per model class, used to construct nested values.
+_MODEL_FIELD_TYPES: Dict[Any, Dict[str, Any]] = {}
+
+
+def _get_model_field_types(model: Any) -> Dict[str, Any]:
+    field_types = _MODEL_FIELD_TYPES.get(model)
+    if field_types is None:
+        try:
+            hints = typing_extensions.get_type_hints(model)
+        except NameError:
+            hints = {}
+        field_types = {name: hints.get(name, Any) for name in _get_model_fields(model)}
+        _MODEL_FIELD_TYPES[model] = field_types
+    return field_types
+
+
+def _construct(type_: Any, object_: Any) -> Any:
+    if object_ is None:
+        return None
+    clean_type = _remove_annotations(type_)
+
+    if inspect.isclass(clean_type) and issubclass(clean_type, pydantic.BaseModel):
+        if not isinstance(object_, Mapping):
+            return object_
+        field_types = _get_model_field_types(clean_type)
+        values = {
+            key: _construct(field_types[key], value) if key in field_types else value for key, value in object_.items()
+        }
+        # Pydantic's own construct: the override on UniversalBaseModel would dealias the values twice more
+        if IS_PYDANTIC_V2:
+            return pydantic.BaseModel.model_construct.__func__(clean_type, None, **values)  # type: ignore[attr-defined]
+        return pydantic.BaseModel.construct.__func__(clean_type, None, **values)  # type: ignore[attr-defined]
+
+    origin = get_origin(clean_type)
+    args = get_args(clean_type)
+    if origin is None or not args:
+        return object_
+
+    if is_union(origin):
+        if isinstance(object_, Mapping):
+            for member in args:
+                member = _remove_annotations(member)
+                if inspect.isclass(member) and issubclass(member, pydantic.BaseModel):
+                    return _construct(member, object_)
+        non_none_members = [member for member in args if member is not type(None)]
+        return _construct(non_none_members[0], object_) if len(non_none_members) == 1 else object_
+    if origin is dict and isinstance(object_, dict) and len(args) == 2:
+        return {key: _construct(args[1], value) for key, value in object_.items()}
+    if origin in (list, set, collections.abc.Sequence) and isinstance(object_, list):
+        return [_construct(args[0], item) for item in object_]
+    return object_
+
+
 def to_jsonable_with_fallback(obj: Any, fallback_serializer: Callable[[Any], Any]) -> Any:
     if IS_PYDANTIC_V2:
         from pydantic_core import to_jsonable_python
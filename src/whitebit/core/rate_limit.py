@@ -0,0 +1,285 @@
+import asyncio
+import collections
+import threading
+import time
+import typing
+
+
+class RateLimit(typing.NamedTuple):
+    """At most `limit` requests in any `period` seconds."""
+
+    limit: int
+    period: float
+
+
+PUBLIC_RATE_LIMIT = RateLimit(2000, 10.0)
+TRADING_RATE_LIMIT = RateLimit(10000, 10.0)
+TRADE_ACCOUNT_RATE_LIMIT = RateLimit(12000, 10.0)
+MAIN_ACCOUNT_RATE_LIMIT = RateLimit(1000, 10.0)
+
+# Per-endpoint limits, as documented on the endpoints. Every key has its own window. Keys ending with "/" are
+# for endpoints with path parameters: they match every path under them, sharing one window, and the longest wins.
+RATE_LIMITS: typing.Dict[str, RateLimit] = {
+    # Public API
+    "api/v4/public/assets": PUBLIC_RATE_LIMIT,
+    "api/v4/public/collateral/markets": PUBLIC_RATE_LIMIT,
+    "api/v4/public/fee": PUBLIC_RATE_LIMIT,
+    "api/v4/public/funding-history/": PUBLIC_RATE_LIMIT,
+    "api/v4/public/futures": PUBLIC_RATE_LIMIT,
+    "api/v4/public/markets": PUBLIC_RATE_LIMIT,
+    "api/v4/public/mining-pool": RateLimit(1000, 10.0),
+    "api/v4/public/orderbook/": RateLimit(600, 10.0),
+    "api/v4/public/orderbook/depth/": PUBLIC_RATE_LIMIT,
+    "api/v4/public/ping": PUBLIC_RATE_LIMIT,
+    "api/v4/public/ticker": PUBLIC_RATE_LIMIT,
+    "api/v4/public/time": PUBLIC_RATE_LIMIT,
+    "api/v4/public/trades/": PUBLIC_RATE_LIMIT,
+    # Authentication
+    "oauth2/refresh_token": RateLimit(1, 1.0),
+    "oauth2/token": RateLimit(1, 1.0),
+    "api/v4/profile/websocket_token": RateLimit(10, 60.0),
+    # Spot and collateral trading
+    "api/v4/collateral-account/balance": TRADE_ACCOUNT_RATE_LIMIT,
+    "api/v4/collateral-account/balance-summary": TRADE_ACCOUNT_RATE_LIMIT,
+    "api/v4/collateral-account/funding-history": TRADE_ACCOUNT_RATE_LIMIT,
+    "api/v4/collateral-account/hedge-mode": TRADE_ACCOUNT_RATE_LIMIT,
+    "api/v4/collateral-account/hedge-mode/update": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/collateral-account/leverage": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/collateral-account/position/close": TRADING_RATE_LIMIT,
+    "api/v4/collateral-account/positions": TRADE_ACCOUNT_RATE_LIMIT,
+    "api/v4/collateral-account/positions/history": TRADE_ACCOUNT_RATE_LIMIT,
+    "api/v4/collateral-account/summary": TRADE_ACCOUNT_RATE_LIMIT,
+    "api/v4/order/cancel": TRADING_RATE_LIMIT,
+    "api/v4/order/cancel/all": TRADING_RATE_LIMIT,
+    "api/v4/order/collateral/bulk": TRADING_RATE_LIMIT,
+    "api/v4/order/collateral/limit": TRADING_RATE_LIMIT,
+    "api/v4/order/collateral/market": TRADING_RATE_LIMIT,
+    "api/v4/order/collateral/oco": TRADING_RATE_LIMIT,
+    "api/v4/order/collateral/stop-limit": TRADING_RATE_LIMIT,
+    "api/v4/order/collateral/trigger-market": TRADING_RATE_LIMIT,
+    "api/v4/order/conditional-cancel": TRADING_RATE_LIMIT,
+    "api/v4/order/kill-switch": TRADING_RATE_LIMIT,
+    "api/v4/order/kill-switch/status": TRADING_RATE_LIMIT,
+    "api/v4/order/market": TRADING_RATE_LIMIT,
+    "api/v4/order/modify": TRADING_RATE_LIMIT,
+    "api/v4/order/new": TRADING_RATE_LIMIT,
+    "api/v4/order/oco-cancel": TRADING_RATE_LIMIT,
+    "api/v4/order/oto-cancel": TRADING_RATE_LIMIT,
+    "api/v4/order/stock_market": TRADING_RATE_LIMIT,
+    "api/v4/order/stop_limit": TRADING_RATE_LIMIT,
+    "api/v4/order/stop_market": TRADING_RATE_LIMIT,
+    "api/v4/orders": TRADE_ACCOUNT_RATE_LIMIT,
+    "api/v4/orders/conditional": TRADE_ACCOUNT_RATE_LIMIT,
+    "api/v4/orders/oco": TRADE_ACCOUNT_RATE_LIMIT,
+    "api/v4/trade-account/balance": TRADE_ACCOUNT_RATE_LIMIT,
+    "api/v4/trade-account/executed-history": TRADE_ACCOUNT_RATE_LIMIT,
+    "api/v4/trade-account/order": TRADE_ACCOUNT_RATE_LIMIT,
+    "api/v4/trade-account/order/history": TRADE_ACCOUNT_RATE_LIMIT,
+    # Convert
+    "api/v4/convert/confirm": TRADING_RATE_LIMIT,
+    "api/v4/convert/estimate": TRADING_RATE_LIMIT,
+    "api/v4/convert/history": TRADING_RATE_LIMIT,
+    # Main account, deposits, withdrawals, codes, lending, sub-accounts, mining and credit line
+    "api/card-token": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/credit-line/loans/info": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/address": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/balance": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/codes": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/codes/apply": RateLimit(60, 1.0),
+    "api/v4/main-account/codes/history": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/codes/my": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/create-new-address": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/fee": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/fiat-deposit-url": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/history": RateLimit(200, 10.0),
+    "api/v4/main-account/refund-deposit": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/smart-flex/investments": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/smart-flex/investments/auto-invest": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/smart-flex/investments/close": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/smart-flex/investments/history": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/smart-flex/investments/invest": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/smart-flex/investments/payment-history": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/smart-flex/investments/withdraw": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/smart-flex/plans": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/smart/interest-payment-history": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/smart/investment": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/smart/investment/close": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/smart/investments": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/smart/plans": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/transfer": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/withdraw": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/main-account/withdraw-pay": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/mining/accounts": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/mining/accounts/create": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/mining/hashrate": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/mining/miners/info": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/mining/payout-destination": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/mining/payout-destination/edit": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/mining/rewards": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/mining/watcher-links/create": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/mining/watcher-links/list": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/mining/workers/hashrate": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/mining/workers/names": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/api-key/create": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/api-key/delete": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/api-key/edit": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/api-key/ip-address/create": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/api-key/ip-address/delete": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/api-key/ip-address/list": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/api-key/list": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/api-key/reset": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/balances": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/block": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/create": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/delete": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/edit": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/list": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/transfer": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/transfer/history": MAIN_ACCOUNT_RATE_LIMIT,
+    "api/v4/sub-account/unblock": MAIN_ACCOUNT_RATE_LIMIT,
+}
+
+
+class SlidingWindow:
+    """
+    A sliding-window log of the last `limit` request slots of one endpoint.
+
+    Slots are handed out in order: a request gets the current time when fewer than `limit` slots were handed out
+    over the last `period` seconds, and otherwise the moment the oldest of those slots leaves the window. Callers
+    wait until their slot instead of failing, so that bursts queue up behind the limit.
+    """
+
+    def __init__(self, rate_limit: RateLimit):
+        self.rate_limit = rate_limit
+        self._slots: typing.Deque[float] = collections.deque(maxlen=rate_limit.limit)
+        self._lock = threading.Lock()
+
+    def reserve(self, now: float) -> float:
+        """Reserves the next slot and returns it, as a `time.monotonic()` timestamp."""
+        with self._lock:
+            slot = now
+            if len(self._slots) == self.rate_limit.limit:
+                slot = max(now, self._slots[0] + self.rate_limit.period)
+            self._slots.append(slot)
+            return slot
+
+    def headroom(self, now: float) -> int:
+        """The number of requests that can be sent right away."""
+        with self._lock:
+            window_start = now - self.rate_limit.period
+            in_window = sum(1 for slot in self._slots if slot > window_start)
+            return max(0, self.rate_limit.limit - in_window)
+
+
+class RateLimiter:
+    """
+    Keeps a client within WhiteBIT's per-endpoint rate limits by delaying requests that would exceed them,
+    rather than letting them fail with a 429.
+
+    Limits apply per limiter, so share one instance between the clients that use the same API key (or IP address,
+    for the public API) and use a lower `utilization` when other processes send requests on their behalf too.
+
+    Parameters
+    ----------
+    overrides : typing.Optional[typing.Dict[str, typing.Optional[RateLimit]]]
+        Limits replacing or extending `RATE_LIMITS`, keyed like it. A `None` limit disables limiting for that key.
+
+    default : typing.Optional[RateLimit]
+        The limit of each endpoint missing from the table. Unlimited by default.
+
+    utilization : float
+        The fraction of each limit to use, e.g. 0.9 to keep 10% in reserve. Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        *,
+        overrides: typing.Optional[typing.Dict[str, typing.Optional[RateLimit]]] = None,
+        default: typing.Optional[RateLimit] = None,
+        utilization: float = 1.0,
+    ):
+        limits: typing.Dict[str, typing.Optional[RateLimit]] = {**RATE_LIMITS, **(overrides or {})}
+        self._exact: typing.Dict[str, typing.Optional[RateLimit]] = {}
+        self._prefixes: typing.List[typing.Tuple[str, typing.Optional[RateLimit]]] = []
+        for key, rate_limit in limits.items():
+            if rate_limit is not None:
+                rate_limit = RateLimit(max(1, int(rate_limit.limit * utilization)), rate_limit.period)
+            if key.endswith("/"):
+                self._prefixes.append((key, rate_limit))
+            else:
+                self._exact[key] = rate_limit
+        self._prefixes.sort(key=lambda item: len(item[0]), reverse=True)
+        self._default = (
+            RateLimit(max(1, int(default.limit * utilization)), default.period) if default is not None else None
+        )
+        self._windows: typing.Dict[str, SlidingWindow] = {}
+        self._resolved: typing.Dict[str, typing.Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    def _resolve(self, path: str) -> typing.Optional[str]:
+        """Returns the key of the window `path` counts against, or None when it is not limited."""
+        path = path.strip("/")
+        try:
+            return self._resolved[path]
+        except KeyError:
+            pass
+
+        key: typing.Optional[str] = None
+        rate_limit: typing.Optional[RateLimit] = None
+        if path in self._exact:
+            key, rate_limit = path, self._exact[path]
+        else:
+            for prefix, prefix_limit in self._prefixes:
+                if path.startswith(prefix):
+                    key, rate_limit = prefix, prefix_limit
+                    break
+            else:
+                key, rate_limit = path, self._default
+
+        with self._lock:
+            if rate_limit is None:
+                key = None
+            elif key not in self._windows:
+                self._windows[key] = SlidingWindow(rate_limit)
+            if len(self._resolved) < 10_000:
+                self._resolved[path] = key
+        return key
+
+    def acquire_delay(self, path: typing.Optional[str]) -> float:
+        """
+        Reserves a slot for a request to `path` and returns how many seconds to wait before sending it.
+        """
+        if path is None:
+            return 0.0
+        key = self._resolve(path)
+        if key is None:
+            return 0.0
+        now = time.monotonic()
+        return self._windows[key].reserve(now) - now
+
+    def acquire(self, path: typing.Optional[str]) -> None:
+        delay = self.acquire_delay(path)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def async_acquire(self, path: typing.Optional[str]) -> None:
+        delay = self.acquire_delay(path)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def get_limit(self, path: str) -> typing.Optional[RateLimit]:
+        """The limit applied to `path`, None when unlimited."""
+        key = self._resolve(path)
+        return self._windows[key].rate_limit if key is not None else None
+
+    def headroom(self, path: str) -> typing.Optional[int]:
+        """The number of requests to `path` that can be sent right away, None when unlimited."""
+        key = self._resolve(path)
+        return self._windows[key].headroom(time.monotonic()) if key is not None else None
+
+    def snapshot(self) -> typing.Dict[str, int]:
+        """The current headroom of every window looked up so far, keyed like `RATE_LIMITS`."""
+        now = time.monotonic()
+        with self._lock:
+            windows = dict(self._windows)
+        return {key: window.headroom(now) for key, window in windows.items()}
@@ -2,11 +2,26 @@
 
 import typing
 
+from .retry import IdempotencyClass
+
 try:
     from typing import NotRequired  # type: ignore
 except ImportError:
     from typing_extensions import NotRequired
 
+ResponseMode = typing.Literal["validate", "construct", "lazy", "raw"]
+"""
+How successful response bodies are turned into return values:
+
+    - "validate": full pydantic validation into the annotated response type (the default).
+    - "construct": unvalidated `model_construct` instances, for trusted payloads on hot paths.
+    - "lazy": the decoded JSON wrapped in `LazyList` / `LazyDict` / `LazyModel`, validating entries on first access.
+    - "raw": the decoded JSON as is, without alias conversion or model construction.
+
+Only "validate" and "construct" return the types the client methods declare: "lazy" returns `LazyModel` /
+`LazyList` / `LazyDict` proxies of them and "raw" returns plain JSON values.
+"""
+
 
 class RequestOptions(typing.TypedDict, total=False):
     """
@@ -16,7 +31,7 @@ class RequestOptions(typing.TypedDict, total=False):
     Attributes:
         - timeout_in_seconds: int. The number of seconds to await an API call before timing out.
 
-        - max_retries: int. The max number of retries to attempt if the API call fails.
+        - max_retries: int. The max number of retries to attempt if the API call fails, as far as the request's idempotency class and the client's retry budget allow.
 
         - additional_headers: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's header dict
 
@@ -25,6 +40,10 @@ class RequestOptions(typing.TypedDict, total=False):
         - additional_body_parameters: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's body parameters dict
 
         - chunk_size: int. The size, in bytes, to process each chunk of data being streamed back within the response. This equates to leveraging `chunk_size` within `requests` or `httpx`, and is only leveraged for file downloads.
+
+        - response_mode: ResponseMode. Overrides the client's response mode for this request: "validate", "construct", "lazy" or "raw".
+
+        - idempotency: IdempotencyClass. Overrides the idempotency class the endpoint is retried under: "safe", "idempotent" or "unsafe".
     """
 
     timeout_in_seconds: NotRequired[int]
@@ -33,3 +52,5 @@ class RequestOptions(typing.TypedDict, total=False):
     additional_query_parameters: NotRequired[typing.Dict[str, typing.Any]]
     additional_body_parameters: NotRequired[typing.Dict[str, typing.Any]]
     chunk_size: NotRequired[int]
+    response_mode: NotRequired[ResponseMode]
+    idempotency: NotRequired[IdempotencyClass]
@@ -0,0 +1,137 @@
+import collections
+import threading
+import time
+import typing
+
+import httpx
+
+# Cache lifetimes, in seconds, of public endpoints. Live market data follows the window the API caches the
+# response for itself, as documented on the endpoints, so that polling faster than that is served locally.
+# Reference data that rarely changes is kept longer. Keys ending with "/" match every path under them.
+CACHE_TTLS: typing.Dict[str, float] = {
+    "api/v4/public/assets": 60.0,
+    "api/v4/public/collateral/markets": 60.0,
+    "api/v4/public/fee": 60.0,
+    "api/v4/public/futures": 1.0,
+    "api/v4/public/markets": 60.0,
+    "api/v4/public/orderbook/": 0.1,
+    "api/v4/public/orderbook/depth/": 1.0,
+    "api/v4/public/ticker": 1.0,
+    "api/v4/public/trades/": 1.0,
+}
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+class ResponseCache:
+    """
+    A TTL cache of successful GET responses, evicting the least recently used entries beyond `max_entries`
+    entries or `max_bytes` bytes of response bodies.
+
+    Subclass it to plug in another store: the HTTP clients only call `get_ttl`, `get` and `set`.
+
+    Parameters
+    ----------
+    ttls : typing.Optional[typing.Dict[str, typing.Optional[float]]]
+        Lifetimes replacing or extending `CACHE_TTLS`, keyed like it. A `None` or zero lifetime disables caching
+        for that key.
+
+    max_entries : int
+        The maximum number of cached responses. Defaults to 1024.
+
+    max_bytes : int
+        The maximum total size of the cached response bodies. Defaults to 32 MiB.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttls: typing.Optional[typing.Dict[str, typing.Optional[float]]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        merged_ttls: typing.Dict[str, typing.Optional[float]] = {**CACHE_TTLS, **(ttls or {})}
+        self._exact = {key: ttl for key, ttl in merged_ttls.items() if not key.endswith("/")}
+        self._prefixes = sorted(
+            ((key, ttl) for key, ttl in merged_ttls.items() if key.endswith("/")),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "collections.OrderedDict[typing.Hashable, typing.Tuple[float, httpx.Response]]" = (
+            collections.OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get_ttl(self, path: typing.Optional[str]) -> typing.Optional[float]:
+        """The lifetime of responses from `path`, None when they are not cached."""
+        if path is None:
+            return None
+        path = path.strip("/")
+        if path in self._exact:
+            ttl = self._exact[path]
+        else:
+            ttl = next((prefix_ttl for prefix, prefix_ttl in self._prefixes if path.startswith(prefix)), None)
+        return ttl if ttl else None
+
+    def get(self, key: typing.Hashable) -> typing.Optional[httpx.Response]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, response = entry
+            if expires_at <= now:
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return response
+
+    def set(self, key: typing.Hashable, response: httpx.Response, ttl: float) -> None:
+        size = len(response.content)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: typing.Hashable) -> None:
+        _, response = self._entries.pop(key)
+        self._bytes -= len(response.content)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached response bodies, in bytes."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> typing.Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
@@ -0,0 +1,268 @@
+import email.utils
+import re
+import threading
+import time
+import typing
+from random import random
+
+import httpx
+
+INITIAL_RETRY_DELAY_SECONDS = 0.5
+MAX_RETRY_DELAY_SECONDS = 10
+MAX_RETRY_DELAY_SECONDS_FROM_HEADER = 30
+
+IdempotencyClass = typing.Literal["safe", "idempotent", "unsafe"]
+"""
+How freely a request may be retried:
+
+    - "safe": public reads, retried on 408, 409, 429, 5xx and any transport error.
+    - "idempotent": private reads, retried on the same conditions as "safe".
+    - "unsafe": requests with side effects (orders, cancels, withdrawals, transfers, ...). They are only retried
+      when the exchange provably did not act on them: a 429, or a connection that could not be established.
+"""
+
+# Private endpoints that are POSTed to but only read state. Any other POST is treated as "unsafe".
+IDEMPOTENT_PATHS: typing.FrozenSet[str] = frozenset(
+    {
+        "api/v4/accounts/balances/main",
+        "api/v4/accounts/balances/spot",
+        "api/v4/accounts/converts",
+        "api/v4/accounts/deals",
+        "api/v4/accounts/orders",
+        "api/v4/accounts/transactions",
+        "api/v4/collateral-account/balance",
+        "api/v4/collateral-account/balance-summary",
+        "api/v4/collateral-account/funding-history",
+        "api/v4/collateral-account/hedge-mode",
+        "api/v4/collateral-account/positions",
+        "api/v4/collateral-account/positions/history",
+        "api/v4/collateral-account/summary",
+        "api/v4/convert/estimate",
+        "api/v4/convert/history",
+        "api/v4/credit-line/loans/info",
+        "api/v4/main-account/address",
+        "api/v4/main-account/balance",
+        "api/v4/main-account/codes/history",
+        "api/v4/main-account/codes/my",
+        "api/v4/main-account/fee",
+        "api/v4/main-account/history",
+        "api/v4/main-account/smart-flex/investments",
+        "api/v4/main-account/smart-flex/investments/history",
+        "api/v4/main-account/smart-flex/investments/payment-history",
+        "api/v4/main-account/smart-flex/plans",
+        "api/v4/main-account/smart/interest-payment-history",
+        "api/v4/main-account/smart/investments",
+        "api/v4/main-account/smart/plans",
+        "api/v4/market/fee",
+        "api/v4/mining/accounts",
+        "api/v4/mining/hashrate",
+        "api/v4/mining/miners/info",
+        "api/v4/mining/payout-destination",
+        "api/v4/mining/rewards",
+        "api/v4/mining/watcher-links/list",
+        "api/v4/mining/workers/hashrate",
+        "api/v4/mining/workers/names",
+        "api/v4/order/kill-switch/status",
+        "api/v4/orders",
+        "api/v4/orders/conditional",
+        "api/v4/orders/oco",
+        "api/v4/profile/websocket_token",
+        "api/v4/sub-account/api-key/ip-address/list",
+        "api/v4/sub-account/api-key/list",
+        "api/v4/sub-account/balances",
+        "api/v4/sub-account/list",
+        "api/v4/sub-account/transfer/history",
+        "api/v4/trade-account/balance",
+        "api/v4/trade-account/executed-history",
+        "api/v4/trade-account/order",
+        "api/v4/trade-account/order/history",
+    }
+)
+
+# Transport errors raised before the request could reach the exchange
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def classify_request(method: str, path: typing.Optional[str]) -> IdempotencyClass:
+    """
+    Returns the idempotency class of a request from its method and path.
+    """
+    if method.upper() in ("GET", "HEAD", "OPTIONS"):
+        return "safe"
+    if path is not None and path.strip("/") in IDEMPOTENT_PATHS:
+        return "idempotent"
+    return "unsafe"
+
+
+def _parse_retry_after(response_headers: httpx.Headers) -> typing.Optional[float]:
+    """
+    This function parses the `Retry-After` header in a HTTP response and returns the number of seconds to wait.
+
+    Inspired by the urllib3 retry implementation.
+    """
+    retry_after_ms = response_headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return int(retry_after_ms) / 1000 if int(retry_after_ms) > 0 else 0
+        except Exception:
+            pass
+
+    retry_after = response_headers.get("retry-after")
+    if retry_after is None:
+        return None
+
+    # Attempt to parse the header as an int.
+    if re.match(r"^\s*[0-9]+\s*$", retry_after):
+        seconds = float(retry_after)
+    # Fallback to parsing it as a date.
+    else:
+        retry_date_tuple = email.utils.parsedate_tz(retry_after)
+        if retry_date_tuple is None:
+            return None
+        if retry_date_tuple[9] is None:
+            # Assume UTC if no timezone was specified
+            retry_date_tuple = retry_date_tuple[:9] + (0,) + retry_date_tuple[10:]
+
+        retry_date = email.utils.mktime_tz(retry_date_tuple)
+        seconds = retry_date - time.time()
+
+    if seconds < 0:
+        seconds = 0
+
+    return seconds
+
+
+def _retry_timeout(response: typing.Optional[httpx.Response], retries: int) -> float:
+    """
+    Determine the amount of time to wait before retrying a request.
+    A reasonable `Retry-After` header from the response wins, otherwise the delay is drawn uniformly between zero
+    and an exponentially growing cap ("full jitter"), which spreads the retries of many clients hit by the same
+    incident instead of having them come back in waves.
+    """
+    if response is not None:
+        retry_after = _parse_retry_after(response.headers)
+        if retry_after is not None and retry_after <= MAX_RETRY_DELAY_SECONDS_FROM_HEADER:
+            return retry_after
+
+    retry_delay = min(INITIAL_RETRY_DELAY_SECONDS * pow(2.0, retries), MAX_RETRY_DELAY_SECONDS)
+    return retry_delay * random()
+
+
+def _should_retry(response: httpx.Response, idempotency: IdempotencyClass) -> bool:
+    if idempotency == "unsafe":
+        # Rate limited requests are rejected before they are processed
+        return response.status_code == 429
+    retryable_400s = [429, 408, 409]
+    return response.status_code >= 500 or response.status_code in retryable_400s
+
+
+def _should_retry_error(error: Exception, idempotency: IdempotencyClass) -> bool:
+    if isinstance(error, _NOT_SENT_ERRORS):
+        return True
+    return idempotency != "unsafe" and isinstance(error, httpx.TransportError)
+
+
+class RetryBudget:
+    """
+    A token bucket that caps retries at a fraction of the traffic of a client, so that an exchange incident
+    does not get amplified by every request being retried `max_retries` times.
+
+    Every request deposits `retry_ratio` tokens and every retry withdraws one. On top of that the bucket refills
+    at `min_retries_per_second`, so that a client sending little traffic can still retry, and holds at most
+    `max_tokens`. A retry is skipped, and the last response returned or error raised, when the bucket is empty.
+
+    Parameters
+    ----------
+    retry_ratio : float
+        Retries allowed per request, e.g. 0.1 allows retrying 10% of the requests. Defaults to 0.1.
+
+    min_retries_per_second : float
+        Retries allowed per second regardless of traffic. Defaults to 1.
+
+    max_tokens : float
+        The maximum number of retries that can be saved up. Defaults to 10.
+    """
+
+    def __init__(
+        self,
+        *,
+        retry_ratio: float = 0.1,
+        min_retries_per_second: float = 1.0,
+        max_tokens: float = 10.0,
+    ):
+        self.retry_ratio = retry_ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = max_tokens
+        self.retries_allowed = 0
+        self.retries_rejected = 0
+        self._tokens = max_tokens
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._updated_at) * self.min_retries_per_second)
+        self._updated_at = now
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.max_tokens, self._tokens + self.retry_ratio)
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.retries_allowed += 1
+                return True
+            self.retries_rejected += 1
+            return False
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class RetryState:
+    """
+    Tracks the attempts of a single request and decides whether, and after how long, to retry it.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int,
+        idempotency: IdempotencyClass,
+        budget: typing.Optional[RetryBudget],
+        retries: int = 0,
+    ):
+        self.max_retries = max_retries
+        self.idempotency = idempotency
+        self.budget = budget
+        self.retries = retries
+        if budget is not None:
+            budget.record_request()
+
+    def next_delay(
+        self,
+        *,
+        response: typing.Optional[httpx.Response] = None,
+        error: typing.Optional[Exception] = None,
+    ) -> typing.Optional[float]:
+        """
+        Returns the number of seconds to wait before the next attempt, or None when the response should be returned
+        (or the error raised) as is.
+        """
+        if self.retries >= self.max_retries:
+            return None
+        if response is not None and not _should_retry(response, self.idempotency):
+            return None
+        if error is not None and not _should_retry_error(error, self.idempotency):
+            return None
+        if self.budget is not None and not self.budget.try_acquire():
+            return None
+        delay = _retry_timeout(response, self.retries)
+        self.retries += 1
+        return delay
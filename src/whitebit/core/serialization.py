@@ -1,7 +1,8 @@
 # This file was auto-generated by Fern from our API Definition.
 
-import collections
+import collections.abc
 import inspect
+import threading
 import typing
 
 import pydantic
@@ -39,6 +40,9 @@ def convert_and_respect_annotation_metadata(
     TypedDicts, which cannot support aliasing out of the box, and can be extended for additional
     utilities, such as defaults.
 
+    The annotation is only inspected once per direction: the resulting converter is cached, and
+    annotations that carry no `FieldMetadata` aliases at any depth return the object untouched.
+
     Parameters
     ----------
     object_ : typing.Any
@@ -58,137 +62,165 @@ def convert_and_respect_annotation_metadata(
     if inner_type is None:
         inner_type = annotation
 
-    clean_type = _remove_annotations(inner_type)
-    # Pydantic models
-    if (
-        inspect.isclass(clean_type)
-        and issubclass(clean_type, pydantic.BaseModel)
-        and isinstance(object_, typing.Mapping)
-    ):
-        return _convert_mapping(object_, clean_type, direction)
-    # TypedDicts
-    if typing_extensions.is_typeddict(clean_type) and isinstance(object_, typing.Mapping):
-        return _convert_mapping(object_, clean_type, direction)
+    converter = _get_converter(inner_type, direction)
+    if converter is None:
+        return object_
+    return converter(object_)
+
+
+_Converter = typing.Callable[[typing.Any], typing.Any]
+
+# Compiled converters keyed by (annotation, direction). A `None` entry means the annotation has no
+# aliased fields anywhere within it, so objects of that type never need to be walked.
+_CONVERTERS: typing.Dict[typing.Tuple[typing.Any, str], typing.Optional[_Converter]] = {}
+_CONVERTERS_LOCK = threading.RLock()
+_COMPILING: typing.Set[typing.Tuple[typing.Any, str]] = set()
+
+
+def _get_converter(type_: typing.Any, direction: str) -> typing.Optional[_Converter]:
+    key = (type_, direction)
+    try:
+        return _CONVERTERS[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable annotations cannot be cached, compile them on every call
+        return _compile_converter(type_, direction)
+
+    with _CONVERTERS_LOCK:
+        if key in _CONVERTERS:
+            return _CONVERTERS[key]
+        if key in _COMPILING:
+            # A self-referencing type, resolve the converter once compilation has finished
+            return lambda object_: _apply_converter(_CONVERTERS.get(key), object_)
+        _COMPILING.add(key)
+        try:
+            converter = _compile_converter(type_, direction)
+        finally:
+            _COMPILING.discard(key)
+        _CONVERTERS[key] = converter
+    return converter
+
+
+def _apply_converter(converter: typing.Optional[_Converter], object_: typing.Any) -> typing.Any:
+    if converter is None or object_ is None:
+        return object_
+    return converter(object_)
 
+
+def _compile_converter(type_: typing.Any, direction: str) -> typing.Optional[_Converter]:
+    clean_type = _remove_annotations(type_)
+
+    # Pydantic models and TypedDicts
     if (
-        typing_extensions.get_origin(clean_type) == typing.Dict
-        or typing_extensions.get_origin(clean_type) == dict
-        or clean_type == typing.Dict
-    ) and isinstance(object_, typing.Dict):
-        key_type = typing_extensions.get_args(clean_type)[0]
-        value_type = typing_extensions.get_args(clean_type)[1]
-
-        return {
-            key: convert_and_respect_annotation_metadata(
-                object_=value,
-                annotation=annotation,
-                inner_type=value_type,
-                direction=direction,
-            )
-            for key, value in object_.items()
-        }
-
-    # If you're iterating on a string, do not bother to coerce it to a sequence.
-    if not isinstance(object_, str):
-        if (
-            typing_extensions.get_origin(clean_type) == typing.Set
-            or typing_extensions.get_origin(clean_type) == set
-            or clean_type == typing.Set
-        ) and isinstance(object_, typing.Set):
-            inner_type = typing_extensions.get_args(clean_type)[0]
-            return {
-                convert_and_respect_annotation_metadata(
-                    object_=item,
-                    annotation=annotation,
-                    inner_type=inner_type,
-                    direction=direction,
-                )
-                for item in object_
-            }
-        elif (
-            (
-                typing_extensions.get_origin(clean_type) == typing.List
-                or typing_extensions.get_origin(clean_type) == list
-                or clean_type == typing.List
-            )
-            and isinstance(object_, typing.List)
-        ) or (
-            (
-                typing_extensions.get_origin(clean_type) == typing.Sequence
-                or typing_extensions.get_origin(clean_type) == collections.abc.Sequence
-                or clean_type == typing.Sequence
-            )
-            and isinstance(object_, typing.Sequence)
-        ):
-            inner_type = typing_extensions.get_args(clean_type)[0]
-            return [
-                convert_and_respect_annotation_metadata(
-                    object_=item,
-                    annotation=annotation,
-                    inner_type=inner_type,
-                    direction=direction,
-                )
-                for item in object_
-            ]
-
-    if typing_extensions.get_origin(clean_type) == typing.Union:
+        inspect.isclass(clean_type) and issubclass(clean_type, pydantic.BaseModel)
+    ) or typing_extensions.is_typeddict(clean_type):
+        return _compile_mapping_converter(clean_type, direction)
+
+    origin = typing_extensions.get_origin(clean_type)
+    args = typing_extensions.get_args(clean_type)
+
+    if origin == typing.Union:
+        member_converters = [
+            converter
+            for converter in (_get_converter(member, direction) for member in args)
+            if converter is not None
+        ]
+        if not member_converters:
+            return None
+
         # We should be able to ~relatively~ safely try to convert keys against all
         # member types in the union, the edge case here is if one member aliases a field
         # of the same name to a different name from another member
         # Or if another member aliases a field of the same name that another member does not.
-        for member in typing_extensions.get_args(clean_type):
-            object_ = convert_and_respect_annotation_metadata(
-                object_=object_,
-                annotation=annotation,
-                inner_type=member,
-                direction=direction,
-            )
-        return object_
+        def convert_union(object_: typing.Any) -> typing.Any:
+            for converter in member_converters:
+                object_ = _apply_converter(converter, object_)
+            return object_
 
-    annotated_type = _get_annotation(annotation)
-    if annotated_type is None:
-        return object_
+        return convert_union
 
-    # If the object is not a TypedDict, a Union, or other container (list, set, sequence, etc.)
-    # Then we can safely call it on the recursive conversion.
-    return object_
+    if origin is None or not args:
+        return None
 
+    if origin == dict:
+        value_converter = _get_converter(args[1], direction) if len(args) > 1 else None
+        if value_converter is None:
+            return None
 
-def _convert_mapping(
-    object_: typing.Mapping[str, object],
-    expected_type: typing.Any,
-    direction: typing.Literal["read", "write"],
-) -> typing.Mapping[str, object]:
-    converted_object: typing.Dict[str, object] = {}
+        def convert_dict(object_: typing.Any) -> typing.Any:
+            if not isinstance(object_, dict):
+                return object_
+            return {key: _apply_converter(value_converter, value) for key, value in object_.items()}
+
+        return convert_dict
+
+    item_converter = _get_converter(args[0], direction)
+    if item_converter is None:
+        return None
+
+    if origin == set:
+
+        def convert_set(object_: typing.Any) -> typing.Any:
+            if not isinstance(object_, set):
+                return object_
+            return {_apply_converter(item_converter, item) for item in object_}
+
+        return convert_set
+
+    if origin in (list, collections.abc.Sequence):
+        container_type = list if origin == list else collections.abc.Sequence
+
+        def convert_sequence(object_: typing.Any) -> typing.Any:
+            # If you're iterating on a string, do not bother to coerce it to a sequence.
+            if isinstance(object_, str) or not isinstance(object_, container_type):
+                return object_
+            return [_apply_converter(item_converter, item) for item in object_]
+
+        return convert_sequence
+
+    return None
+
+
+def _compile_mapping_converter(expected_type: typing.Any, direction: str) -> typing.Optional[_Converter]:
     try:
         annotations = typing_extensions.get_type_hints(expected_type, include_extras=True)
     except NameError:
         # The TypedDict contains a circular reference, so
         # we use the __annotations__ attribute directly.
         annotations = getattr(expected_type, "__annotations__", {})
-    aliases_to_field_names = _get_alias_to_field_name(annotations)
-    for key, value in object_.items():
-        if direction == "read" and key in aliases_to_field_names:
-            dealiased_key = aliases_to_field_names.get(key)
-            if dealiased_key is not None:
-                type_ = annotations.get(dealiased_key)
-        else:
-            type_ = annotations.get(key)
-        # Note you can't get the annotation by the field name if you're in read mode, so you must check the aliases map
-        #
-        # So this is effectively saying if we're in write mode, and we don't have a type, or if we're in read mode and we don't have an alias
-        # then we can just pass the value through as is
-        if type_ is None:
-            converted_object[key] = value
-        elif direction == "read" and key not in aliases_to_field_names:
-            converted_object[key] = convert_and_respect_annotation_metadata(
-                object_=value, annotation=type_, direction=direction
-            )
-        else:
-            converted_object[_alias_key(key, type_, direction, aliases_to_field_names)] = (
-                convert_and_respect_annotation_metadata(object_=value, annotation=type_, direction=direction)
-            )
-    return converted_object
+
+    # Maps each incoming key to the key it is written under and the converter for its value.
+    # Keys without an entry are passed through as is.
+    plan: typing.Dict[str, typing.Tuple[str, typing.Optional[_Converter]]] = {}
+    if direction == "read":
+        # You can't get the annotation by the field name if you're in read mode, so aliased keys
+        # are resolved through the aliases map first.
+        for key, type_ in annotations.items():
+            plan[key] = (key, _get_converter(type_, direction))
+        for alias, field_name in _get_alias_to_field_name(annotations).items():
+            plan[alias] = (field_name, _get_converter(annotations[field_name], direction))
+    else:
+        for key, type_ in annotations.items():
+            plan[key] = (_get_alias_from_type(type_=type_) or key, _get_converter(type_, direction))
+
+    plan = {key: entry for key, entry in plan.items() if entry[0] != key or entry[1] is not None}
+    if not plan:
+        return None
+
+    def convert_mapping(object_: typing.Any) -> typing.Any:
+        if not isinstance(object_, typing.Mapping):
+            return object_
+        converted_object: typing.Dict[str, object] = {}
+        for key, value in object_.items():
+            entry = plan.get(key)
+            if entry is None:
+                converted_object[key] = value
+            else:
+                converted_object[entry[0]] = _apply_converter(entry[1], value)
+        return converted_object
+
+    return convert_mapping
 
 
 def _get_annotation(type_: typing.Any) -> typing.Optional[typing.Any]:
@@ -263,14 +295,3 @@ def _get_alias_from_type(type_: typing.Any) -> typing.Optional[str]:
             if isinstance(annotation, FieldMetadata) and annotation.alias is not None:
                 return annotation.alias
     return None
-
-
-def _alias_key(
-    key: str,
-    type_: typing.Any,
-    direction: typing.Literal["read", "write"],
-    aliases_to_field_names: typing.Dict[str, str],
-) -> str:
-    if direction == "read":
-        return aliases_to_field_names.get(key, key)
-    return _get_alias_from_type(type_=type_) or key
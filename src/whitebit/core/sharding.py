@@ -0,0 +1,273 @@
+import asyncio
+import concurrent.futures
+import heapq
+import typing
+
+from .pagination import DEFAULT_PAGE_SIZE
+
+T = typing.TypeVar("T")
+
+DEFAULT_WINDOWS = 8
+DEFAULT_SHARD_CONCURRENCY = 8
+
+# Fetches one page of a time window: window start, window end (in seconds), offset and limit
+WindowPageFetcher = typing.Callable[[int, int, int, int], typing.Sequence[T]]
+AsyncWindowPageFetcher = typing.Callable[[int, int, int, int], typing.Awaitable[typing.Sequence[T]]]
+
+
+def record_field(record: typing.Any, name: str, alias: typing.Optional[str] = None) -> typing.Any:
+    """A field of a record, whether it was parsed into a model or returned as raw JSON, under its `alias` if any."""
+    if isinstance(record, typing.Mapping):
+        return record.get(alias if alias is not None else name)
+    return getattr(record, name, None)
+
+
+class _Window:
+    __slots__ = ("start", "end", "query_end", "records", "children", "pending")
+
+    def __init__(self, start: int, end: int, query_end: int):
+        self.start = start
+        self.end = end
+        # Requests run a second past the window, so that records timed within a second of its end are not missed.
+        # The window keeps only the records timed before end + 1, which the next window's request does not return
+        self.query_end = query_end
+        self.records: typing.List[typing.Any] = []
+        self.children: typing.Optional[typing.Tuple["_Window", "_Window"]] = None
+        # Whether a page of this window is still to be fetched or in flight
+        self.pending = True
+
+    @property
+    def resolved(self) -> bool:
+        if self.children is not None:
+            return all(child.resolved for child in self.children)
+        return not self.pending
+
+    def collect(self) -> typing.List[typing.Any]:
+        if self.children is not None:
+            return self.children[0].collect() + self.children[1].collect()
+        return self.records
+
+
+class _ShardPlan:
+    """
+    The scheduling state shared by the sync and async drivers. A window whose first page comes back full is split in
+    two, down to `min_window` seconds, below which it is paginated instead. Pages are handed out earliest window
+    first, so that the head of the stream resolves first, and windows are released in time order once resolved.
+
+    Windows are half-open: each keeps the records timed from its start up to, excluding, the start of the next, so
+    that the records its request shares with the next window's are yielded once.
+    """
+
+    def __init__(
+        self,
+        *,
+        start: int,
+        end: int,
+        windows: int,
+        page_size: int,
+        min_window: int,
+        time_key: typing.Callable[[typing.Any], typing.Any],
+        key: typing.Optional[typing.Callable[[typing.Any], typing.Hashable]],
+    ):
+        if end < start:
+            raise ValueError("end must not be before start")
+        if page_size < 1 or windows < 1:
+            raise ValueError("page_size and windows must be at least 1")
+        self.page_size = page_size
+        self.min_window = max(min_window, 1)
+        self.time_key = time_key
+        self.key = key
+        self.end = end
+        span = end - start + 1
+        windows = min(windows, span)
+        bounds = [start + span * index // windows for index in range(windows + 1)]
+        self.windows = [self._window(bounds[index], bounds[index + 1] - 1) for index in range(windows)]
+        self._next_window = 0
+        self._queue: typing.List[typing.Tuple[int, int, int, _Window]] = []
+        self._sequence = 0
+        for window in self.windows:
+            self._push(window, 0)
+        # Dedup state: the keys seen at the latest released time, as duplicates share their record's time
+        self._last_time: typing.Any = None
+        self._last_keys: typing.Set[typing.Hashable] = set()
+
+    def _window(self, start: int, end: int) -> _Window:
+        return _Window(start, end, min(end + 1, self.end))
+
+    def _push(self, window: _Window, offset: int) -> None:
+        self._sequence += 1
+        heapq.heappush(self._queue, (window.start, offset, self._sequence, window))
+
+    def has_work(self) -> bool:
+        return bool(self._queue)
+
+    def pop(self) -> typing.Tuple[_Window, int]:
+        _, offset, _, window = heapq.heappop(self._queue)
+        return window, offset
+
+    def complete(self, window: _Window, offset: int, page: typing.Sequence[typing.Any]) -> None:
+        full = len(page) >= self.page_size
+        if full and offset == 0 and window.end - window.start >= self.min_window:
+            middle = (window.start + window.end) // 2
+            window.children = (self._window(window.start, middle), self._window(middle + 1, window.end))
+            window.pending = False
+            for child in window.children:
+                self._push(child, 0)
+            return
+        time_key = self.time_key
+        window.records.extend(record for record in page if window.start <= time_key(record) < window.end + 1)
+        if full:
+            self._push(window, offset + self.page_size)
+        else:
+            window.pending = False
+
+    def release(self) -> typing.List[typing.Any]:
+        """The records of the windows resolved since the last call, in time order and deduplicated."""
+        released: typing.List[typing.Any] = []
+        while self._next_window < len(self.windows) and self.windows[self._next_window].resolved:
+            window = self.windows[self._next_window]
+            self.windows[self._next_window] = None  # type: ignore
+            self._next_window += 1
+            for record in sorted(window.collect(), key=self.time_key):
+                if self.key is not None:
+                    time = self.time_key(record)
+                    if time != self._last_time:
+                        self._last_time = time
+                        self._last_keys.clear()
+                    record_key = self.key(record)
+                    # Records without an identity cannot be told apart, so none of them is dropped
+                    if record_key is not None:
+                        if record_key in self._last_keys:
+                            continue
+                        self._last_keys.add(record_key)
+                released.append(record)
+        return released
+
+    @property
+    def done(self) -> bool:
+        return self._next_window >= len(self.windows)
+
+
+def iter_time_windows(
+    fetch_page: WindowPageFetcher,
+    *,
+    start: int,
+    end: int,
+    time_key: typing.Callable[[T], typing.Any],
+    key: typing.Optional[typing.Callable[[T], typing.Hashable]] = None,
+    windows: int = DEFAULT_WINDOWS,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    min_window: int = 1,
+    concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+) -> typing.Iterator[T]:
+    """
+    Yields the records of a time range of a history endpoint in time order, fetching it as `windows` time windows
+    concurrently.
+
+    A window whose first page comes back full is split in half rather than paginated, so that busy periods are
+    spread over more concurrent requests, down to `min_window` seconds. Windows are released as soon as they and
+    all the earlier ones have been fetched, sorted by `time_key` and, when `key` is given, deduplicated.
+
+    Parameters
+    ----------
+    fetch_page : typing.Callable[[int, int, int, int], typing.Sequence[T]]
+        Fetches a page of records, given the start and end of the window in seconds, then the offset and the limit.
+        Requests run a second past their window, so that fractional times in between are not missed, but each
+        window only keeps the records timed before the next one starts. It is called from worker threads.
+
+    start : int
+        The start of the range in Unix-time format, inclusive.
+
+    end : int
+        The end of the range in Unix-time format, inclusive.
+
+    time_key : typing.Callable[[T], typing.Any]
+        Returns the time of a record in Unix-time format, which the stream is ordered by and split into windows by.
+
+    key : typing.Optional[typing.Callable[[T], typing.Hashable]]
+        Returns the identity of a record, for dropping the duplicates that records shifting between the pages of a
+        window produce. Records whose identity is None are never dropped.
+
+    windows : int
+        The number of windows the range is initially split into. Defaults to 8.
+
+    page_size : int
+        The limit of every page. It must not exceed the endpoint's maximum. Defaults to 100.
+
+    min_window : int
+        The length, in seconds, below which full windows are paginated rather than split. Defaults to 1.
+
+    concurrency : int
+        The maximum number of pages in flight. Requests still go through the client's rate limiter. Defaults to 8.
+    """
+    plan = _ShardPlan(
+        start=start,
+        end=end,
+        windows=windows,
+        page_size=page_size,
+        min_window=min_window,
+        time_key=time_key,
+        key=key,
+    )
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="whitebit-shard")
+    in_flight: typing.Dict["concurrent.futures.Future[typing.Sequence[T]]", typing.Tuple[_Window, int]] = {}
+    try:
+        while not plan.done:
+            while plan.has_work() and len(in_flight) < concurrency:
+                window, offset = plan.pop()
+                future = executor.submit(fetch_page, window.start, window.query_end, offset, page_size)
+                in_flight[future] = (window, offset)
+            completed, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in completed:
+                window, offset = in_flight.pop(future)
+                plan.complete(window, offset, future.result())
+            yield from plan.release()
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_time_windows(
+    fetch_page: AsyncWindowPageFetcher,
+    *,
+    start: int,
+    end: int,
+    time_key: typing.Callable[[T], typing.Any],
+    key: typing.Optional[typing.Callable[[T], typing.Hashable]] = None,
+    windows: int = DEFAULT_WINDOWS,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    min_window: int = 1,
+    concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+) -> typing.AsyncIterator[T]:
+    """
+    Yields the records of a time range of a history endpoint in time order, fetching it as `windows` time windows
+    concurrently in tasks. See `iter_time_windows`.
+    """
+    plan = _ShardPlan(
+        start=start,
+        end=end,
+        windows=windows,
+        page_size=page_size,
+        min_window=min_window,
+        time_key=time_key,
+        key=key,
+    )
+    in_flight: typing.Dict["asyncio.Future[typing.Sequence[T]]", typing.Tuple[_Window, int]] = {}
+    try:
+        while not plan.done:
+            while plan.has_work() and len(in_flight) < concurrency:
+                window, offset = plan.pop()
+                task = asyncio.ensure_future(fetch_page(window.start, window.query_end, offset, page_size))
+                in_flight[task] = (window, offset)
+            completed, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in completed:
+                window, offset = in_flight.pop(task)
+                plan.complete(window, offset, task.result())
+            for record in plan.release():
+                yield record
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import typing
+import weakref
+
+import httpx
+
+RequestKey = typing.Tuple[typing.Any, ...]
+
+# Parsed results of responses handed to more than one caller, keyed by response type and response mode
+_SHARED_RESULTS: "weakref.WeakKeyDictionary[httpx.Response, typing.Dict[typing.Any, typing.Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_SHARED_RESULTS_LOCK = threading.Lock()
+
+
+def is_coalescable(
+    method: str,
+    json_body: typing.Optional[typing.Any],
+    data_body: typing.Optional[typing.Any],
+    content: typing.Optional[typing.Any],
+    files: typing.Optional[typing.Any],
+) -> bool:
+    """Only GETs without a body are coalesced."""
+    return method.upper() == "GET" and json_body is None and data_body is None and content is None and files is None
+
+
+def request_key(
+    url: str,
+    query: typing.Optional[typing.List[typing.Tuple[str, typing.Any]]],
+    headers: typing.Mapping[str, str],
+) -> typing.Optional[RequestKey]:
+    """Identifies identical requests. Returns None when the request cannot be keyed, and should not be coalesced."""
+    key = (url, tuple(query) if query else (), tuple(headers.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def share_response(response: httpx.Response) -> None:
+    """Marks a response as handed to several callers, see `get_shared_results`."""
+    with _SHARED_RESULTS_LOCK:
+        _SHARED_RESULTS.setdefault(response, {})
+
+
+def get_shared_results(response: httpx.Response) -> typing.Optional[typing.Dict[typing.Any, typing.Any]]:
+    """
+    Returns the memo of parsed results of a response that was handed to several callers, so that it is parsed once.
+    Returns None for responses that were not shared.
+    """
+    with _SHARED_RESULTS_LOCK:
+        return _SHARED_RESULTS.get(response)
+
+
+class _Call:
+    __slots__ = ("done", "response", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: typing.Optional[httpx.Response] = None
+        self.error: typing.Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces identical requests made concurrently from several threads: the first caller sends the request,
+    the others wait for it and get the same response.
+    """
+
+    def __init__(self) -> None:
+        self._calls: typing.Dict[RequestKey, _Call] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.coalesced = 0
+
+    def do(self, key: typing.Optional[RequestKey], send: typing.Callable[[], httpx.Response]) -> httpx.Response:
+        if key is None:
+            return send()
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.requests += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return typing.cast(httpx.Response, call.response)
+
+        try:
+            call.response = send()
+            return call.response
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                if call.waiters and call.response is not None:
+                    share_response(call.response)
+            call.done.set()
+
+
+class _AsyncCall:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self) -> None:
+        self.task: typing.Optional["asyncio.Future[httpx.Response]"] = None
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces identical requests made concurrently from several coroutines: the first caller starts the request,
+    the others await it and get the same response. The request runs in its own task, so that it completes for
+    the remaining callers when the one that started it is cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._calls: typing.Dict[RequestKey, _AsyncCall] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    async def do(
+        self,
+        key: typing.Optional[RequestKey],
+        send: typing.Callable[[], typing.Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        if key is None:
+            return await send()
+
+        call = self._calls.get(key)
+        if call is not None and call.task is not None:
+            call.waiters += 1
+            self.coalesced += 1
+            response = await asyncio.shield(call.task)
+            share_response(response)
+            return response
+
+        self.requests += 1
+        call = self._calls[key] = _AsyncCall()
+        call.task = asyncio.ensure_future(self._run(key, call, send))
+        return await asyncio.shield(call.task)
+
+    async def _run(
+        self,
+        key: RequestKey,
+        call: _AsyncCall,
+        send: typing.Callable[[], typing.Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        try:
+            response = await send()
+        finally:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+        # Mark the response before any caller resumes, so that it is parsed once
+        if call.waiters:
+            share_response(response)
+        return response
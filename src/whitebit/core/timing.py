@@ -0,0 +1,258 @@
+import contextvars
+import time
+import typing
+
+import httpx
+
+# The phases of a call, in seconds, summed over its attempts:
+#   - rate_limit_wait: waiting for the client-side rate limiter
+#   - sign: serializing and signing the body
+#   - pool_wait: waiting for a connection from the pool, up to connecting or sending on a reused one
+#   - connect: opening the TCP connection
+#   - tls: the TLS handshake
+#   - send: writing the request headers and body
+#   - ttfb: waiting for the response headers once the request is sent
+#   - download: reading the response body
+#   - backoff: sleeping between attempts
+#   - decode: decoding the JSON body
+#   - validate: building the response models
+PHASES = (
+    "rate_limit_wait",
+    "sign",
+    "pool_wait",
+    "connect",
+    "tls",
+    "send",
+    "ttfb",
+    "download",
+    "backoff",
+    "decode",
+    "validate",
+)
+
+# httpcore trace events, by the name they share before ".started" / ".complete", and the phase they belong to
+_TRACE_PHASES = {
+    "connection.connect_tcp": "connect",
+    "connection.connect_unix_socket": "connect",
+    "connection.start_tls": "tls",
+    "http11.send_request_headers": "send",
+    "http11.send_request_body": "send",
+    "http11.receive_response_headers": "ttfb",
+    "http11.receive_response_body": "download",
+    "http2.send_request_headers": "send",
+    "http2.send_request_body": "send",
+    "http2.receive_response_headers": "ttfb",
+    "http2.receive_response_body": "download",
+}
+
+
+class RequestTiming:
+    """
+    The timing record of one API call, handed to the client's timing observers once the call completes: after its
+    response is parsed, or as soon as it fails.
+
+    Every phase in `PHASES` is an attribute holding its duration in seconds, summed over the attempts of the call,
+    and `total` is the duration of the whole call. Connection phases are only known for real connections, as they
+    come from the transport's trace events.
+    """
+
+    __slots__ = (
+        "method",
+        "path",
+        "status_code",
+        "attempts",
+        "rate_limited",
+        "request_bytes",
+        "response_bytes",
+        "cached",
+        "coalesced",
+        "error",
+        "total",
+        *PHASES,
+        "_observers",
+        "_started_at",
+        "_attempt_started_at",
+        "_trace_started_at",
+        "_response",
+        "_finished",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        path: typing.Optional[str],
+        observers: typing.Sequence[typing.Callable[["RequestTiming"], None]],
+    ):
+        self.method = method
+        self.path = path
+        self.status_code: typing.Optional[int] = None
+        self.attempts = 0
+        # The number of attempts answered with a 429
+        self.rate_limited = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        # Whether the response came from the response cache, or from a concurrent identical request
+        self.cached = False
+        self.coalesced = False
+        self.error: typing.Optional[BaseException] = None
+        self.total = 0.0
+        for phase in PHASES:
+            setattr(self, phase, 0.0)
+        self._observers = observers
+        self._started_at = time.perf_counter()
+        self._attempt_started_at: typing.Optional[float] = None
+        self._trace_started_at: typing.Dict[str, float] = {}
+        self._response: typing.Optional[httpx.Response] = None
+        self._finished = False
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+    def phase(self, name: str) -> "_Phase":
+        """Measures the enclosed block as part of the `name` phase."""
+        return _Phase(self, name)
+
+    def start_attempt(self) -> None:
+        self.attempts += 1
+        self._attempt_started_at = time.perf_counter()
+
+    def trace(self, event_name: str, info: typing.Dict[str, typing.Any]) -> None:
+        """The httpcore trace callback of the attempts of the call, deriving the connection phases."""
+        now = time.perf_counter()
+        if self._attempt_started_at is not None:
+            # Until the first trace event, the attempt was waiting for a connection
+            self.pool_wait += now - self._attempt_started_at
+            self._attempt_started_at = None
+        event, _, stage = event_name.rpartition(".")
+        phase = _TRACE_PHASES.get(event)
+        if phase is None:
+            return
+        if stage == "started":
+            self._trace_started_at[event] = now
+        elif event in self._trace_started_at:
+            setattr(self, phase, getattr(self, phase) + now - self._trace_started_at.pop(event))
+
+    async def atrace(self, event_name: str, info: typing.Dict[str, typing.Any]) -> None:
+        self.trace(event_name, info)
+
+    def attach(self, response: httpx.Response) -> httpx.Response:
+        """
+        Records the response of the call. A successful response is parsed by the raw client, which finishes the
+        record; any other is final, and the record is finished right away.
+        """
+        self._response = response
+        self.status_code = response.status_code
+        self.coalesced = self.attempts == 0 and not self.cached
+        request = response.request
+        try:
+            self.request_bytes = len(request.content)
+        except httpx.RequestNotRead:
+            pass
+        self.response_bytes = len(response.content)
+        if 200 <= response.status_code < 300:
+            _current_timing.set(self)
+        else:
+            self.finish()
+        return response
+
+    def finish_stream(self, response: httpx.Response, error: typing.Optional[BaseException] = None) -> None:
+        """
+        Records a streamed response once it is closed, and finishes the record. Its body is counted as far as it
+        was read.
+        """
+        self._response = response
+        self.status_code = response.status_code
+        try:
+            self.request_bytes = len(response.request.content)
+        except httpx.RequestNotRead:
+            pass
+        try:
+            self.response_bytes = len(response.content)
+        except httpx.ResponseNotRead:
+            self.response_bytes = response.num_bytes_downloaded
+        self.finish(error)
+
+    def finish(self, error: typing.Optional[BaseException] = None) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        self.error = error
+        self.total = time.perf_counter() - self._started_at
+        if _current_timing.get() is self:
+            _current_timing.set(None)
+        for observer in self._observers:
+            observer(self)
+
+    def as_dict(self) -> typing.Dict[str, typing.Any]:
+        record: typing.Dict[str, typing.Any] = {
+            "method": self.method,
+            "path": self.path,
+            "status_code": self.status_code,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "cached": self.cached,
+            "coalesced": self.coalesced,
+            "error": type(self.error).__name__ if self.error is not None else None,
+            "total": self.total,
+        }
+        for phase in PHASES:
+            record[phase] = getattr(self, phase)
+        return record
+
+    def __repr__(self) -> str:
+        return f"RequestTiming({self.method} {self.path} {self.status_code}, total={self.total:.6f})"
+
+
+TimingObserver = typing.Callable[[RequestTiming], None]
+"""Receives the timing record of every call of a client once the call completes. It must not raise."""
+
+
+class _Phase:
+    __slots__ = ("_timing", "_name", "_started_at")
+
+    def __init__(self, timing: RequestTiming, name: str):
+        self._timing = timing
+        self._name = name
+        self._started_at = 0.0
+
+    def __enter__(self) -> None:
+        self._started_at = time.perf_counter()
+
+    def __exit__(self, *args: typing.Any) -> None:
+        elapsed = time.perf_counter() - self._started_at
+        setattr(self._timing, self._name, getattr(self._timing, self._name) + elapsed)
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *args: typing.Any) -> None:
+        pass
+
+
+_NULL_PHASE = _NullPhase()
+
+# The record of the call whose successful response is being parsed in this context
+_current_timing: "contextvars.ContextVar[typing.Optional[RequestTiming]]" = contextvars.ContextVar(
+    "whitebit_request_timing", default=None
+)
+
+
+def timed(timing: typing.Optional[RequestTiming], phase: str) -> typing.Union[_Phase, _NullPhase]:
+    """Measures the enclosed block as part of `phase` of `timing`, when the call is being timed."""
+    return timing.phase(phase) if timing is not None else _NULL_PHASE
+
+
+def get_response_timing(response: httpx.Response) -> typing.Optional[RequestTiming]:
+    """The record of the call in this context that `response` answers, if it is being timed."""
+    timing = _current_timing.get()
+    if timing is not None and timing._response is response:
+        return timing
+    return None
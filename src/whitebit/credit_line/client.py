@@ -27,7 +27,11 @@ class CreditLineClient:
         return self._raw_client
 
     def get_credit_line_info(
-        self, *, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> CreditLine:
         """
         The endpoint returns an active loan.
@@ -43,10 +47,10 @@ class CreditLineClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -83,7 +87,11 @@ class AsyncCreditLineClient:
         return self._raw_client
 
     async def get_credit_line_info(
-        self, *, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> CreditLine:
         """
         The endpoint returns an active loan.
@@ -99,10 +107,10 @@ class AsyncCreditLineClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -22,7 +22,11 @@ class RawCreditLineClient:
         self._client_wrapper = client_wrapper
 
     def get_credit_line_info(
-        self, *, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[CreditLine]:
         """
         The endpoint returns an active loan.
@@ -38,10 +42,10 @@ class RawCreditLineClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -70,9 +74,10 @@ class RawCreditLineClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreditLine,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreditLine,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -83,7 +88,7 @@ class RawCreditLineClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -94,11 +99,11 @@ class RawCreditLineClient:
                         NotFoundErrorBody,
                         parse_obj_as(
                             type_=NotFoundErrorBody,  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -109,7 +114,11 @@ class AsyncRawCreditLineClient:
         self._client_wrapper = client_wrapper
 
     async def get_credit_line_info(
-        self, *, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[CreditLine]:
         """
         The endpoint returns an active loan.
@@ -125,10 +134,10 @@ class AsyncRawCreditLineClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -157,9 +166,10 @@ class AsyncRawCreditLineClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreditLine,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreditLine,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -170,7 +180,7 @@ class AsyncRawCreditLineClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -181,11 +191,11 @@ class AsyncRawCreditLineClient:
                         NotFoundErrorBody,
                         parse_obj_as(
                             type_=NotFoundErrorBody,  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
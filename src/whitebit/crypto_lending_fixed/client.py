@@ -3,8 +3,11 @@
 import typing
 
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.pagination import aiter_offset_pages, iter_offset_pages, page_items
 from ..core.request_options import RequestOptions
 from ..types.fixed_plan import FixedPlan
+from ..types.interest_payment import InterestPayment
+from ..types.investment import Investment
 from .raw_client import AsyncRawCryptoLendingFixedClient, RawCryptoLendingFixedClient
 from .types.create_fixed_investment_response import CreateFixedInvestmentResponse
 from .types.get_fixed_investments_history_response import GetFixedInvestmentsHistoryResponse
@@ -32,8 +35,8 @@ class CryptoLendingFixedClient:
     def get_fixed_plans(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.List[FixedPlan]:
@@ -60,10 +63,10 @@ class CryptoLendingFixedClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         ticker : typing.Optional[str]
@@ -93,8 +96,8 @@ class CryptoLendingFixedClient:
         *,
         plan_id: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> CreateFixedInvestmentResponse:
         """
@@ -116,10 +119,10 @@ class CryptoLendingFixedClient:
         amount : str
             Investment amount
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -142,7 +145,12 @@ class CryptoLendingFixedClient:
         return _response.data
 
     def close_fixed_investment(
-        self, *, id: str, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        id: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.Dict[str, typing.Optional[typing.Any]]:
         """
         The endpoint closes active investment.
@@ -160,10 +168,10 @@ class CryptoLendingFixedClient:
         id : str
             Investment identifier
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -188,8 +196,8 @@ class CryptoLendingFixedClient:
     def get_fixed_investments_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         id: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         status: typing.Optional[int] = OMIT,
@@ -210,10 +218,10 @@ class CryptoLendingFixedClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         id : typing.Optional[str]
@@ -257,11 +265,73 @@ class CryptoLendingFixedClient:
         )
         return _response.data
 
+    def iter_fixed_investments_history(
+        self,
+        *,
+        id: typing.Optional[str] = OMIT,
+        ticker: typing.Optional[str] = OMIT,
+        status: typing.Optional[int] = OMIT,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[Investment]:
+        """
+        Iterates over the fixed lending investments history, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        id : typing.Optional[str]
+            Investment identifier
+
+        ticker : typing.Optional[str]
+            [Invest plan](/glossary#crypto-lending) source currency's [ticker](/glossary#ticker)
+
+        status : typing.Optional[int]
+            Investment status (1 - active, 2 - closed)
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        Investment
+
+        Examples
+        --------
+        from whitebit import WhitebitApi
+        client = WhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        for investment in client.crypto_lending_fixed.iter_fixed_investments_history():
+            print(investment)
+        """
+
+        def fetch_page(page_offset: int, page_limit: int) -> typing.Sequence[typing.Any]:
+            page = self.get_fixed_investments_history(
+                id=id,
+                ticker=ticker,
+                status=status,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+            return page_items(page, "records")
+
+        return iter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
+
     def get_interest_payment_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         plan_id: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
@@ -281,10 +351,10 @@ class CryptoLendingFixedClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         plan_id : typing.Optional[str]
@@ -324,6 +394,63 @@ class CryptoLendingFixedClient:
         )
         return _response.data
 
+    def iter_interest_payment_history(
+        self,
+        *,
+        plan_id: typing.Optional[str] = OMIT,
+        ticker: typing.Optional[str] = OMIT,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[InterestPayment]:
+        """
+        Iterates over the fixed lending interest payment history, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        plan_id : typing.Optional[str]
+            [Invest plan](/glossary#crypto-lending) identifier
+
+        ticker : typing.Optional[str]
+            [Invest plan](/glossary#crypto-lending) target currency's [ticker](/glossary#ticker)
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        InterestPayment
+
+        Examples
+        --------
+        from whitebit import WhitebitApi
+        client = WhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        for payment in client.crypto_lending_fixed.iter_interest_payment_history():
+            print(payment)
+        """
+
+        def fetch_page(page_offset: int, page_limit: int) -> typing.Sequence[typing.Any]:
+            page = self.get_interest_payment_history(
+                plan_id=plan_id,
+                ticker=ticker,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+            return page_items(page, "records")
+
+        return iter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
+
 
 class AsyncCryptoLendingFixedClient:
     def __init__(self, *, client_wrapper: AsyncClientWrapper):
@@ -343,8 +470,8 @@ class AsyncCryptoLendingFixedClient:
     async def get_fixed_plans(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.List[FixedPlan]:
@@ -371,10 +498,10 @@ class AsyncCryptoLendingFixedClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         ticker : typing.Optional[str]
@@ -407,8 +534,8 @@ class AsyncCryptoLendingFixedClient:
         *,
         plan_id: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> CreateFixedInvestmentResponse:
         """
@@ -430,10 +557,10 @@ class AsyncCryptoLendingFixedClient:
         amount : str
             Investment amount
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -459,7 +586,12 @@ class AsyncCryptoLendingFixedClient:
         return _response.data
 
     async def close_fixed_investment(
-        self, *, id: str, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        id: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.Dict[str, typing.Optional[typing.Any]]:
         """
         The endpoint closes active investment.
@@ -477,10 +609,10 @@ class AsyncCryptoLendingFixedClient:
         id : str
             Investment identifier
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -508,8 +640,8 @@ class AsyncCryptoLendingFixedClient:
     async def get_fixed_investments_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         id: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         status: typing.Optional[int] = OMIT,
@@ -530,10 +662,10 @@ class AsyncCryptoLendingFixedClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         id : typing.Optional[str]
@@ -580,11 +712,76 @@ class AsyncCryptoLendingFixedClient:
         )
         return _response.data
 
+    def iter_fixed_investments_history(
+        self,
+        *,
+        id: typing.Optional[str] = OMIT,
+        ticker: typing.Optional[str] = OMIT,
+        status: typing.Optional[int] = OMIT,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[Investment]:
+        """
+        Iterates over the fixed lending investments history, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        id : typing.Optional[str]
+            Investment identifier
+
+        ticker : typing.Optional[str]
+            [Invest plan](/glossary#crypto-lending) source currency's [ticker](/glossary#ticker)
+
+        status : typing.Optional[int]
+            Investment status (1 - active, 2 - closed)
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        Investment
+
+        Examples
+        --------
+        from whitebit import AsyncWhitebitApi
+        import asyncio
+        client = AsyncWhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        async def main() -> None:
+            async for investment in client.crypto_lending_fixed.iter_fixed_investments_history():
+                print(investment)
+        asyncio.run(main())
+        """
+
+        async def fetch_page(page_offset: int, page_limit: int) -> typing.Sequence[typing.Any]:
+            page = await self.get_fixed_investments_history(
+                id=id,
+                ticker=ticker,
+                status=status,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+            return page_items(page, "records")
+
+        return aiter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
+
     async def get_interest_payment_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         plan_id: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
@@ -604,10 +801,10 @@ class AsyncCryptoLendingFixedClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         plan_id : typing.Optional[str]
@@ -649,3 +846,63 @@ class AsyncCryptoLendingFixedClient:
             request_options=request_options,
         )
         return _response.data
+
+    def iter_interest_payment_history(
+        self,
+        *,
+        plan_id: typing.Optional[str] = OMIT,
+        ticker: typing.Optional[str] = OMIT,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[InterestPayment]:
+        """
+        Iterates over the fixed lending interest payment history, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        plan_id : typing.Optional[str]
+            [Invest plan](/glossary#crypto-lending) identifier
+
+        ticker : typing.Optional[str]
+            [Invest plan](/glossary#crypto-lending) target currency's [ticker](/glossary#ticker)
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        InterestPayment
+
+        Examples
+        --------
+        from whitebit import AsyncWhitebitApi
+        import asyncio
+        client = AsyncWhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        async def main() -> None:
+            async for payment in client.crypto_lending_fixed.iter_interest_payment_history():
+                print(payment)
+        asyncio.run(main())
+        """
+
+        async def fetch_page(page_offset: int, page_limit: int) -> typing.Sequence[typing.Any]:
+            page = await self.get_interest_payment_history(
+                plan_id=plan_id,
+                ticker=ticker,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+            return page_items(page, "records")
+
+        return aiter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
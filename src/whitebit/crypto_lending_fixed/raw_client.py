@@ -26,8 +26,8 @@ class RawCryptoLendingFixedClient:
     def get_fixed_plans(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[typing.List[FixedPlan]]:
@@ -54,10 +54,10 @@ class RawCryptoLendingFixedClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         ticker : typing.Optional[str]
@@ -90,9 +90,10 @@ class RawCryptoLendingFixedClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[FixedPlan],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[FixedPlan],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -103,11 +104,11 @@ class RawCryptoLendingFixedClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -117,8 +118,8 @@ class RawCryptoLendingFixedClient:
         *,
         plan_id: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[CreateFixedInvestmentResponse]:
         """
@@ -140,10 +141,10 @@ class RawCryptoLendingFixedClient:
         amount : str
             Investment amount
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -174,9 +175,10 @@ class RawCryptoLendingFixedClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateFixedInvestmentResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateFixedInvestmentResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -187,7 +189,7 @@ class RawCryptoLendingFixedClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -198,17 +200,22 @@ class RawCryptoLendingFixedClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
     def close_fixed_investment(
-        self, *, id: str, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        id: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[typing.Dict[str, typing.Optional[typing.Any]]]:
         """
         The endpoint closes active investment.
@@ -226,10 +233,10 @@ class RawCryptoLendingFixedClient:
         id : str
             Investment identifier
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -259,9 +266,10 @@ class RawCryptoLendingFixedClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -272,11 +280,11 @@ class RawCryptoLendingFixedClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -284,8 +292,8 @@ class RawCryptoLendingFixedClient:
     def get_fixed_investments_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         id: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         status: typing.Optional[int] = OMIT,
@@ -306,10 +314,10 @@ class RawCryptoLendingFixedClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         id : typing.Optional[str]
@@ -358,9 +366,10 @@ class RawCryptoLendingFixedClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetFixedInvestmentsHistoryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetFixedInvestmentsHistoryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -371,11 +380,11 @@ class RawCryptoLendingFixedClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -383,8 +392,8 @@ class RawCryptoLendingFixedClient:
     def get_interest_payment_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         plan_id: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
@@ -404,10 +413,10 @@ class RawCryptoLendingFixedClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         plan_id : typing.Optional[str]
@@ -452,9 +461,10 @@ class RawCryptoLendingFixedClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetInterestPaymentHistoryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetInterestPaymentHistoryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -465,11 +475,11 @@ class RawCryptoLendingFixedClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -482,8 +492,8 @@ class AsyncRawCryptoLendingFixedClient:
     async def get_fixed_plans(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[typing.List[FixedPlan]]:
@@ -510,10 +520,10 @@ class AsyncRawCryptoLendingFixedClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         ticker : typing.Optional[str]
@@ -546,9 +556,10 @@ class AsyncRawCryptoLendingFixedClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[FixedPlan],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[FixedPlan],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -559,11 +570,11 @@ class AsyncRawCryptoLendingFixedClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -573,8 +584,8 @@ class AsyncRawCryptoLendingFixedClient:
         *,
         plan_id: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[CreateFixedInvestmentResponse]:
         """
@@ -596,10 +607,10 @@ class AsyncRawCryptoLendingFixedClient:
         amount : str
             Investment amount
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -630,9 +641,10 @@ class AsyncRawCryptoLendingFixedClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateFixedInvestmentResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateFixedInvestmentResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -643,7 +655,7 @@ class AsyncRawCryptoLendingFixedClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -654,17 +666,22 @@ class AsyncRawCryptoLendingFixedClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
     async def close_fixed_investment(
-        self, *, id: str, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        id: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[typing.Dict[str, typing.Optional[typing.Any]]]:
         """
         The endpoint closes active investment.
@@ -682,10 +699,10 @@ class AsyncRawCryptoLendingFixedClient:
         id : str
             Investment identifier
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -715,9 +732,10 @@ class AsyncRawCryptoLendingFixedClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -728,11 +746,11 @@ class AsyncRawCryptoLendingFixedClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -740,8 +758,8 @@ class AsyncRawCryptoLendingFixedClient:
     async def get_fixed_investments_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         id: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         status: typing.Optional[int] = OMIT,
@@ -762,10 +780,10 @@ class AsyncRawCryptoLendingFixedClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         id : typing.Optional[str]
@@ -814,9 +832,10 @@ class AsyncRawCryptoLendingFixedClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetFixedInvestmentsHistoryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetFixedInvestmentsHistoryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -827,11 +846,11 @@ class AsyncRawCryptoLendingFixedClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -839,8 +858,8 @@ class AsyncRawCryptoLendingFixedClient:
     async def get_interest_payment_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         plan_id: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
@@ -860,10 +879,10 @@ class AsyncRawCryptoLendingFixedClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         plan_id : typing.Optional[str]
@@ -908,9 +927,10 @@ class AsyncRawCryptoLendingFixedClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetInterestPaymentHistoryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetInterestPaymentHistoryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -921,11 +941,11 @@ class AsyncRawCryptoLendingFixedClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -3,7 +3,9 @@
 import typing
 
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.pagination import aiter_offset_pages, iter_offset_pages, page_items
 from ..core.request_options import RequestOptions
+from ..types.flex_investment_history import FlexInvestmentHistory
 from ..types.flex_plan import FlexPlan
 from .raw_client import AsyncRawCryptoLendingFlexClient, RawCryptoLendingFlexClient
 from .types.close_flex_investment_response import CloseFlexInvestmentResponse
@@ -36,8 +38,8 @@ class CryptoLendingFlexClient:
     def get_flex_plans(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         ticker: typing.Optional[str] = OMIT,
@@ -58,10 +60,10 @@ class CryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -95,8 +97,8 @@ class CryptoLendingFlexClient:
     def get_user_flex_investments(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         ticker: typing.Optional[str] = OMIT,
@@ -118,10 +120,10 @@ class CryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -172,8 +174,8 @@ class CryptoLendingFlexClient:
     def get_flex_investment_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         plan: typing.Optional[str] = OMIT,
@@ -205,10 +207,10 @@ class CryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -264,11 +266,88 @@ class CryptoLendingFlexClient:
         )
         return _response.data
 
+    def iter_flex_investment_history(
+        self,
+        *,
+        plan: typing.Optional[str] = OMIT,
+        investment: typing.Optional[str] = OMIT,
+        transaction: typing.Optional[str] = OMIT,
+        date_from: typing.Optional[int] = OMIT,
+        date_to: typing.Optional[int] = OMIT,
+        action_types: typing.Optional[typing.Sequence[int]] = OMIT,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[FlexInvestmentHistory]:
+        """
+        Iterates over the flex lending investment history, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        plan : typing.Optional[str]
+            Filter by plan ID (UUID).
+
+        investment : typing.Optional[str]
+            Filter by investment ID.
+
+        transaction : typing.Optional[str]
+            Filter by transaction ID.
+
+        date_from : typing.Optional[int]
+            Filter from date (timestamp).
+
+        date_to : typing.Optional[int]
+            Filter to date (timestamp).
+
+        action_types : typing.Optional[typing.Sequence[int]]
+            Array of operation type IDs. See table below.
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        FlexInvestmentHistory
+
+        Examples
+        --------
+        from whitebit import WhitebitApi
+        client = WhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        for entry in client.crypto_lending_flex.iter_flex_investment_history():
+            print(entry)
+        """
+
+        def fetch_page(page_offset: int, page_limit: int) -> typing.Sequence[typing.Any]:
+            page = self.get_flex_investment_history(
+                plan=plan,
+                investment=investment,
+                transaction=transaction,
+                date_from=date_from,
+                date_to=date_to,
+                action_types=action_types,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+            return page_items(page, "data")
+
+        return iter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
+
     def get_flex_payment_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         plan: typing.Optional[str] = OMIT,
@@ -293,10 +372,10 @@ class CryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -348,13 +427,85 @@ class CryptoLendingFlexClient:
         )
         return _response.data
 
+    def iter_flex_payment_history(
+        self,
+        *,
+        plan: typing.Optional[str] = OMIT,
+        investment: typing.Optional[str] = OMIT,
+        transaction: typing.Optional[str] = OMIT,
+        date_from: typing.Optional[int] = OMIT,
+        date_to: typing.Optional[int] = OMIT,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[FlexInvestmentHistory]:
+        """
+        Iterates over the flex lending payment history, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        plan : typing.Optional[str]
+            Filter by plan ID (UUID).
+
+        investment : typing.Optional[str]
+            Filter by investment ID.
+
+        transaction : typing.Optional[str]
+            Filter by transaction ID.
+
+        date_from : typing.Optional[int]
+            Filter from date (timestamp).
+
+        date_to : typing.Optional[int]
+            Filter to date (timestamp).
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        FlexInvestmentHistory
+
+        Examples
+        --------
+        from whitebit import WhitebitApi
+        client = WhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        for payment in client.crypto_lending_flex.iter_flex_payment_history():
+            print(payment)
+        """
+
+        def fetch_page(page_offset: int, page_limit: int) -> typing.Sequence[typing.Any]:
+            page = self.get_flex_payment_history(
+                plan=plan,
+                investment=investment,
+                transaction=transaction,
+                date_from=date_from,
+                date_to=date_to,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+            return page_items(page, "data")
+
+        return iter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
+
     def create_flex_investment(
         self,
         *,
         plan: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         with_reinvest: typing.Optional[bool] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> CreateFlexInvestmentResponse:
@@ -377,10 +528,10 @@ class CryptoLendingFlexClient:
         amount : str
             Investment amount.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         with_reinvest : typing.Optional[bool]
@@ -415,8 +566,8 @@ class CryptoLendingFlexClient:
         *,
         plan: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> WithdrawFromFlexInvestmentResponse:
         """
@@ -440,10 +591,10 @@ class CryptoLendingFlexClient:
         amount : str
             Withdrawal amount.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -466,7 +617,12 @@ class CryptoLendingFlexClient:
         return _response.data
 
     def close_flex_investment(
-        self, *, plan: str, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        plan: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> CloseFlexInvestmentResponse:
         """
         Completely close investment and withdraw all funds.
@@ -488,10 +644,10 @@ class CryptoLendingFlexClient:
         plan : str
             Plan external ID (UUID).
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -517,8 +673,8 @@ class CryptoLendingFlexClient:
         self,
         *,
         plan: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         enabled: typing.Optional[bool] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> UpdateFlexAutoReinvestmentResponse:
@@ -538,10 +694,10 @@ class CryptoLendingFlexClient:
         plan : str
             Plan external ID (UUID).
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         enabled : typing.Optional[bool]
@@ -585,8 +741,8 @@ class AsyncCryptoLendingFlexClient:
     async def get_flex_plans(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         ticker: typing.Optional[str] = OMIT,
@@ -607,10 +763,10 @@ class AsyncCryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -647,8 +803,8 @@ class AsyncCryptoLendingFlexClient:
     async def get_user_flex_investments(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         ticker: typing.Optional[str] = OMIT,
@@ -670,10 +826,10 @@ class AsyncCryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -727,8 +883,8 @@ class AsyncCryptoLendingFlexClient:
     async def get_flex_investment_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         plan: typing.Optional[str] = OMIT,
@@ -760,10 +916,10 @@ class AsyncCryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -822,11 +978,91 @@ class AsyncCryptoLendingFlexClient:
         )
         return _response.data
 
+    def iter_flex_investment_history(
+        self,
+        *,
+        plan: typing.Optional[str] = OMIT,
+        investment: typing.Optional[str] = OMIT,
+        transaction: typing.Optional[str] = OMIT,
+        date_from: typing.Optional[int] = OMIT,
+        date_to: typing.Optional[int] = OMIT,
+        action_types: typing.Optional[typing.Sequence[int]] = OMIT,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[FlexInvestmentHistory]:
+        """
+        Iterates over the flex lending investment history, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        plan : typing.Optional[str]
+            Filter by plan ID (UUID).
+
+        investment : typing.Optional[str]
+            Filter by investment ID.
+
+        transaction : typing.Optional[str]
+            Filter by transaction ID.
+
+        date_from : typing.Optional[int]
+            Filter from date (timestamp).
+
+        date_to : typing.Optional[int]
+            Filter to date (timestamp).
+
+        action_types : typing.Optional[typing.Sequence[int]]
+            Array of operation type IDs. See table below.
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        FlexInvestmentHistory
+
+        Examples
+        --------
+        from whitebit import AsyncWhitebitApi
+        import asyncio
+        client = AsyncWhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        async def main() -> None:
+            async for entry in client.crypto_lending_flex.iter_flex_investment_history():
+                print(entry)
+        asyncio.run(main())
+        """
+
+        async def fetch_page(page_offset: int, page_limit: int) -> typing.Sequence[typing.Any]:
+            page = await self.get_flex_investment_history(
+                plan=plan,
+                investment=investment,
+                transaction=transaction,
+                date_from=date_from,
+                date_to=date_to,
+                action_types=action_types,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+            return page_items(page, "data")
+
+        return aiter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
+
     async def get_flex_payment_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         plan: typing.Optional[str] = OMIT,
@@ -851,10 +1087,10 @@ class AsyncCryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -909,13 +1145,88 @@ class AsyncCryptoLendingFlexClient:
         )
         return _response.data
 
+    def iter_flex_payment_history(
+        self,
+        *,
+        plan: typing.Optional[str] = OMIT,
+        investment: typing.Optional[str] = OMIT,
+        transaction: typing.Optional[str] = OMIT,
+        date_from: typing.Optional[int] = OMIT,
+        date_to: typing.Optional[int] = OMIT,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[FlexInvestmentHistory]:
+        """
+        Iterates over the flex lending payment history, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        plan : typing.Optional[str]
+            Filter by plan ID (UUID).
+
+        investment : typing.Optional[str]
+            Filter by investment ID.
+
+        transaction : typing.Optional[str]
+            Filter by transaction ID.
+
+        date_from : typing.Optional[int]
+            Filter from date (timestamp).
+
+        date_to : typing.Optional[int]
+            Filter to date (timestamp).
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        FlexInvestmentHistory
+
+        Examples
+        --------
+        from whitebit import AsyncWhitebitApi
+        import asyncio
+        client = AsyncWhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        async def main() -> None:
+            async for payment in client.crypto_lending_flex.iter_flex_payment_history():
+                print(payment)
+        asyncio.run(main())
+        """
+
+        async def fetch_page(page_offset: int, page_limit: int) -> typing.Sequence[typing.Any]:
+            page = await self.get_flex_payment_history(
+                plan=plan,
+                investment=investment,
+                transaction=transaction,
+                date_from=date_from,
+                date_to=date_to,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+            return page_items(page, "data")
+
+        return aiter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
+
     async def create_flex_investment(
         self,
         *,
         plan: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         with_reinvest: typing.Optional[bool] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> CreateFlexInvestmentResponse:
@@ -938,10 +1249,10 @@ class AsyncCryptoLendingFlexClient:
         amount : str
             Investment amount.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         with_reinvest : typing.Optional[bool]
@@ -979,8 +1290,8 @@ class AsyncCryptoLendingFlexClient:
         *,
         plan: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> WithdrawFromFlexInvestmentResponse:
         """
@@ -1004,10 +1315,10 @@ class AsyncCryptoLendingFlexClient:
         amount : str
             Withdrawal amount.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -1033,7 +1344,12 @@ class AsyncCryptoLendingFlexClient:
         return _response.data
 
     async def close_flex_investment(
-        self, *, plan: str, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        plan: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> CloseFlexInvestmentResponse:
         """
         Completely close investment and withdraw all funds.
@@ -1055,10 +1371,10 @@ class AsyncCryptoLendingFlexClient:
         plan : str
             Plan external ID (UUID).
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -1087,8 +1403,8 @@ class AsyncCryptoLendingFlexClient:
         self,
         *,
         plan: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         enabled: typing.Optional[bool] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> UpdateFlexAutoReinvestmentResponse:
@@ -1108,10 +1424,10 @@ class AsyncCryptoLendingFlexClient:
         plan : str
             Plan external ID (UUID).
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         enabled : typing.Optional[bool]
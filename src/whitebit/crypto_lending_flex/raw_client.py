@@ -30,8 +30,8 @@ class RawCryptoLendingFlexClient:
     def get_flex_plans(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         ticker: typing.Optional[str] = OMIT,
@@ -52,10 +52,10 @@ class RawCryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -96,9 +96,10 @@ class RawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[FlexPlan],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[FlexPlan],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -109,11 +110,11 @@ class RawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -121,8 +122,8 @@ class RawCryptoLendingFlexClient:
     def get_user_flex_investments(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         ticker: typing.Optional[str] = OMIT,
@@ -144,10 +145,10 @@ class RawCryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -200,9 +201,10 @@ class RawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetUserFlexInvestmentsResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetUserFlexInvestmentsResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -213,11 +215,11 @@ class RawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -225,8 +227,8 @@ class RawCryptoLendingFlexClient:
     def get_flex_investment_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         plan: typing.Optional[str] = OMIT,
@@ -258,10 +260,10 @@ class RawCryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -322,9 +324,10 @@ class RawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetFlexInvestmentHistoryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetFlexInvestmentHistoryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -335,11 +338,11 @@ class RawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -347,8 +350,8 @@ class RawCryptoLendingFlexClient:
     def get_flex_payment_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         plan: typing.Optional[str] = OMIT,
@@ -373,10 +376,10 @@ class RawCryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -433,9 +436,10 @@ class RawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetFlexPaymentHistoryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetFlexPaymentHistoryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -446,11 +450,11 @@ class RawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -460,8 +464,8 @@ class RawCryptoLendingFlexClient:
         *,
         plan: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         with_reinvest: typing.Optional[bool] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[CreateFlexInvestmentResponse]:
@@ -484,10 +488,10 @@ class RawCryptoLendingFlexClient:
         amount : str
             Investment amount.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         with_reinvest : typing.Optional[bool]
@@ -522,9 +526,10 @@ class RawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateFlexInvestmentResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateFlexInvestmentResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -535,7 +540,7 @@ class RawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -546,11 +551,11 @@ class RawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -560,8 +565,8 @@ class RawCryptoLendingFlexClient:
         *,
         plan: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[WithdrawFromFlexInvestmentResponse]:
         """
@@ -585,10 +590,10 @@ class RawCryptoLendingFlexClient:
         amount : str
             Withdrawal amount.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -619,9 +624,10 @@ class RawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     WithdrawFromFlexInvestmentResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=WithdrawFromFlexInvestmentResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -632,7 +638,7 @@ class RawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -643,17 +649,22 @@ class RawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
     def close_flex_investment(
-        self, *, plan: str, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        plan: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[CloseFlexInvestmentResponse]:
         """
         Completely close investment and withdraw all funds.
@@ -675,10 +686,10 @@ class RawCryptoLendingFlexClient:
         plan : str
             Plan external ID (UUID).
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -708,9 +719,10 @@ class RawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CloseFlexInvestmentResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CloseFlexInvestmentResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -721,7 +733,7 @@ class RawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -732,11 +744,11 @@ class RawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -745,8 +757,8 @@ class RawCryptoLendingFlexClient:
         self,
         *,
         plan: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         enabled: typing.Optional[bool] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[UpdateFlexAutoReinvestmentResponse]:
@@ -766,10 +778,10 @@ class RawCryptoLendingFlexClient:
         plan : str
             Plan external ID (UUID).
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         enabled : typing.Optional[bool]
@@ -803,9 +815,10 @@ class RawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     UpdateFlexAutoReinvestmentResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=UpdateFlexAutoReinvestmentResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -816,7 +829,7 @@ class RawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -827,11 +840,11 @@ class RawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -844,8 +857,8 @@ class AsyncRawCryptoLendingFlexClient:
     async def get_flex_plans(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         ticker: typing.Optional[str] = OMIT,
@@ -866,10 +879,10 @@ class AsyncRawCryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -910,9 +923,10 @@ class AsyncRawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[FlexPlan],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[FlexPlan],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -923,11 +937,11 @@ class AsyncRawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -935,8 +949,8 @@ class AsyncRawCryptoLendingFlexClient:
     async def get_user_flex_investments(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         ticker: typing.Optional[str] = OMIT,
@@ -958,10 +972,10 @@ class AsyncRawCryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -1014,9 +1028,10 @@ class AsyncRawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetUserFlexInvestmentsResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetUserFlexInvestmentsResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1027,11 +1042,11 @@ class AsyncRawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1039,8 +1054,8 @@ class AsyncRawCryptoLendingFlexClient:
     async def get_flex_investment_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         plan: typing.Optional[str] = OMIT,
@@ -1072,10 +1087,10 @@ class AsyncRawCryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -1136,9 +1151,10 @@ class AsyncRawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetFlexInvestmentHistoryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetFlexInvestmentHistoryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1149,11 +1165,11 @@ class AsyncRawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1161,8 +1177,8 @@ class AsyncRawCryptoLendingFlexClient:
     async def get_flex_payment_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         limit: typing.Optional[int] = OMIT,
         offset: typing.Optional[int] = OMIT,
         plan: typing.Optional[str] = OMIT,
@@ -1187,10 +1203,10 @@ class AsyncRawCryptoLendingFlexClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         limit : typing.Optional[int]
@@ -1247,9 +1263,10 @@ class AsyncRawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetFlexPaymentHistoryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetFlexPaymentHistoryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1260,11 +1277,11 @@ class AsyncRawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1274,8 +1291,8 @@ class AsyncRawCryptoLendingFlexClient:
         *,
         plan: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         with_reinvest: typing.Optional[bool] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[CreateFlexInvestmentResponse]:
@@ -1298,10 +1315,10 @@ class AsyncRawCryptoLendingFlexClient:
         amount : str
             Investment amount.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         with_reinvest : typing.Optional[bool]
@@ -1336,9 +1353,10 @@ class AsyncRawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateFlexInvestmentResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateFlexInvestmentResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1349,7 +1367,7 @@ class AsyncRawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1360,11 +1378,11 @@ class AsyncRawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1374,8 +1392,8 @@ class AsyncRawCryptoLendingFlexClient:
         *,
         plan: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[WithdrawFromFlexInvestmentResponse]:
         """
@@ -1399,10 +1417,10 @@ class AsyncRawCryptoLendingFlexClient:
         amount : str
             Withdrawal amount.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -1433,9 +1451,10 @@ class AsyncRawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     WithdrawFromFlexInvestmentResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=WithdrawFromFlexInvestmentResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1446,7 +1465,7 @@ class AsyncRawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1457,17 +1476,22 @@ class AsyncRawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
 
     async def close_flex_investment(
-        self, *, plan: str, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        plan: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[CloseFlexInvestmentResponse]:
         """
         Completely close investment and withdraw all funds.
@@ -1489,10 +1513,10 @@ class AsyncRawCryptoLendingFlexClient:
         plan : str
             Plan external ID (UUID).
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -1522,9 +1546,10 @@ class AsyncRawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CloseFlexInvestmentResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CloseFlexInvestmentResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1535,7 +1560,7 @@ class AsyncRawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1546,11 +1571,11 @@ class AsyncRawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1559,8 +1584,8 @@ class AsyncRawCryptoLendingFlexClient:
         self,
         *,
         plan: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         enabled: typing.Optional[bool] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[UpdateFlexAutoReinvestmentResponse]:
@@ -1580,10 +1605,10 @@ class AsyncRawCryptoLendingFlexClient:
         plan : str
             Plan external ID (UUID).
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         enabled : typing.Optional[bool]
@@ -1617,9 +1642,10 @@ class AsyncRawCryptoLendingFlexClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     UpdateFlexAutoReinvestmentResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=UpdateFlexAutoReinvestmentResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1630,7 +1656,7 @@ class AsyncRawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1641,11 +1667,11 @@ class AsyncRawCryptoLendingFlexClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -35,8 +35,8 @@ class DepositClient:
         self,
         *,
         ticker: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         network: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> GetDepositAddressResponse:
@@ -88,10 +88,10 @@ class DepositClient:
         ticker : str
             Currencies ticker. Example: BTC ⚠️ Currency [ticker](/glossary#ticker) should not be [fiat](/glossary#fiat) and it’s “can_deposit” status must be “true”. See [Asset Status endpoint](/public/http-v4/asset-status-list) response for the status.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         network : typing.Optional[str]
@@ -122,8 +122,8 @@ class DepositClient:
         ticker: str,
         provider: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         unique_id: typing.Optional[str] = OMIT,
         customer: typing.Optional[GetFiatDepositUrlRequestCustomer] = OMIT,
         success_link: typing.Optional[str] = OMIT,
@@ -257,10 +257,10 @@ class DepositClient:
         amount : str
             Deposit amount
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         unique_id : typing.Optional[str]
@@ -350,8 +350,8 @@ class DepositClient:
         self,
         *,
         address: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         transaction_id: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> RefundDepositResponse:
@@ -401,10 +401,10 @@ class DepositClient:
         address : str
             Destination wallet address for the refund. The address must support the same network and asset as the original deposit. Cannot be a WhiteBIT address. Does not have to match the original deposit address.
 
-        request : str
+        request : typing.Optional[str]
             Base64-encoded request body. See the [authentication guide](/private/http-auth) for signature generation details.
 
-        nonce : str
+        nonce : typing.Optional[str]
             A unique identifier for the request. Use a monotonically increasing value such as a Unix timestamp in milliseconds.
 
         transaction_id : typing.Optional[str]
@@ -437,8 +437,8 @@ class DepositClient:
         self,
         *,
         ticker: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         network: typing.Optional[str] = OMIT,
         type: typing.Optional[CreateNewAddressRequestType] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -466,10 +466,10 @@ class DepositClient:
         ticker : str
             Currency's ticker.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         network : typing.Optional[str]
@@ -517,8 +517,8 @@ class AsyncDepositClient:
         self,
         *,
         ticker: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         network: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> GetDepositAddressResponse:
@@ -570,10 +570,10 @@ class AsyncDepositClient:
         ticker : str
             Currencies ticker. Example: BTC ⚠️ Currency [ticker](/glossary#ticker) should not be [fiat](/glossary#fiat) and it’s “can_deposit” status must be “true”. See [Asset Status endpoint](/public/http-v4/asset-status-list) response for the status.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         network : typing.Optional[str]
@@ -607,8 +607,8 @@ class AsyncDepositClient:
         ticker: str,
         provider: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         unique_id: typing.Optional[str] = OMIT,
         customer: typing.Optional[GetFiatDepositUrlRequestCustomer] = OMIT,
         success_link: typing.Optional[str] = OMIT,
@@ -742,10 +742,10 @@ class AsyncDepositClient:
         amount : str
             Deposit amount
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         unique_id : typing.Optional[str]
@@ -843,8 +843,8 @@ class AsyncDepositClient:
         self,
         *,
         address: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         transaction_id: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> RefundDepositResponse:
@@ -894,10 +894,10 @@ class AsyncDepositClient:
         address : str
             Destination wallet address for the refund. The address must support the same network and asset as the original deposit. Cannot be a WhiteBIT address. Does not have to match the original deposit address.
 
-        request : str
+        request : typing.Optional[str]
             Base64-encoded request body. See the [authentication guide](/private/http-auth) for signature generation details.
 
-        nonce : str
+        nonce : typing.Optional[str]
             A unique identifier for the request. Use a monotonically increasing value such as a Unix timestamp in milliseconds.
 
         transaction_id : typing.Optional[str]
@@ -933,8 +933,8 @@ class AsyncDepositClient:
         self,
         *,
         ticker: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         network: typing.Optional[str] = OMIT,
         type: typing.Optional[CreateNewAddressRequestType] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -962,10 +962,10 @@ class AsyncDepositClient:
         ticker : str
             Currency's ticker.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         network : typing.Optional[str]
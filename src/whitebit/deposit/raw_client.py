@@ -32,8 +32,8 @@ class RawDepositClient:
         self,
         *,
         ticker: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         network: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[GetDepositAddressResponse]:
@@ -85,10 +85,10 @@ class RawDepositClient:
         ticker : str
             Currencies ticker. Example: BTC ⚠️ Currency [ticker](/glossary#ticker) should not be [fiat](/glossary#fiat) and it’s “can_deposit” status must be “true”. See [Asset Status endpoint](/public/http-v4/asset-status-list) response for the status.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         network : typing.Optional[str]
@@ -122,9 +122,10 @@ class RawDepositClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetDepositAddressResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetDepositAddressResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -135,7 +136,7 @@ class RawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -146,11 +147,11 @@ class RawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -161,8 +162,8 @@ class RawDepositClient:
         ticker: str,
         provider: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         unique_id: typing.Optional[str] = OMIT,
         customer: typing.Optional[GetFiatDepositUrlRequestCustomer] = OMIT,
         success_link: typing.Optional[str] = OMIT,
@@ -296,10 +297,10 @@ class RawDepositClient:
         amount : str
             Deposit amount
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         unique_id : typing.Optional[str]
@@ -353,9 +354,10 @@ class RawDepositClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetFiatDepositUrlResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetFiatDepositUrlResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -366,7 +368,7 @@ class RawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -377,11 +379,11 @@ class RawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -441,7 +443,7 @@ class RawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -452,11 +454,11 @@ class RawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -465,8 +467,8 @@ class RawDepositClient:
         self,
         *,
         address: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         transaction_id: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[RefundDepositResponse]:
@@ -516,10 +518,10 @@ class RawDepositClient:
         address : str
             Destination wallet address for the refund. The address must support the same network and asset as the original deposit. Cannot be a WhiteBIT address. Does not have to match the original deposit address.
 
-        request : str
+        request : typing.Optional[str]
             Base64-encoded request body. See the [authentication guide](/private/http-auth) for signature generation details.
 
-        nonce : str
+        nonce : typing.Optional[str]
             A unique identifier for the request. Use a monotonically increasing value such as a Unix timestamp in milliseconds.
 
         transaction_id : typing.Optional[str]
@@ -553,9 +555,10 @@ class RawDepositClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     RefundDepositResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=RefundDepositResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -566,11 +569,11 @@ class RawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -579,8 +582,8 @@ class RawDepositClient:
         self,
         *,
         ticker: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         network: typing.Optional[str] = OMIT,
         type: typing.Optional[CreateNewAddressRequestType] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -608,10 +611,10 @@ class RawDepositClient:
         ticker : str
             Currency's ticker.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         network : typing.Optional[str]
@@ -649,9 +652,10 @@ class RawDepositClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateNewAddressResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateNewAddressResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -662,7 +666,7 @@ class RawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -673,11 +677,11 @@ class RawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -691,8 +695,8 @@ class AsyncRawDepositClient:
         self,
         *,
         ticker: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         network: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[GetDepositAddressResponse]:
@@ -744,10 +748,10 @@ class AsyncRawDepositClient:
         ticker : str
             Currencies ticker. Example: BTC ⚠️ Currency [ticker](/glossary#ticker) should not be [fiat](/glossary#fiat) and it’s “can_deposit” status must be “true”. See [Asset Status endpoint](/public/http-v4/asset-status-list) response for the status.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         network : typing.Optional[str]
@@ -781,9 +785,10 @@ class AsyncRawDepositClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetDepositAddressResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetDepositAddressResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -794,7 +799,7 @@ class AsyncRawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -805,11 +810,11 @@ class AsyncRawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -820,8 +825,8 @@ class AsyncRawDepositClient:
         ticker: str,
         provider: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         unique_id: typing.Optional[str] = OMIT,
         customer: typing.Optional[GetFiatDepositUrlRequestCustomer] = OMIT,
         success_link: typing.Optional[str] = OMIT,
@@ -955,10 +960,10 @@ class AsyncRawDepositClient:
         amount : str
             Deposit amount
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         unique_id : typing.Optional[str]
@@ -1012,9 +1017,10 @@ class AsyncRawDepositClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetFiatDepositUrlResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetFiatDepositUrlResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1025,7 +1031,7 @@ class AsyncRawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1036,11 +1042,11 @@ class AsyncRawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1100,7 +1106,7 @@ class AsyncRawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1111,11 +1117,11 @@ class AsyncRawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1124,8 +1130,8 @@ class AsyncRawDepositClient:
         self,
         *,
         address: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         transaction_id: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[RefundDepositResponse]:
@@ -1175,10 +1181,10 @@ class AsyncRawDepositClient:
         address : str
             Destination wallet address for the refund. The address must support the same network and asset as the original deposit. Cannot be a WhiteBIT address. Does not have to match the original deposit address.
 
-        request : str
+        request : typing.Optional[str]
             Base64-encoded request body. See the [authentication guide](/private/http-auth) for signature generation details.
 
-        nonce : str
+        nonce : typing.Optional[str]
             A unique identifier for the request. Use a monotonically increasing value such as a Unix timestamp in milliseconds.
 
         transaction_id : typing.Optional[str]
@@ -1212,9 +1218,10 @@ class AsyncRawDepositClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     RefundDepositResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=RefundDepositResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1225,11 +1232,11 @@ class AsyncRawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1238,8 +1245,8 @@ class AsyncRawDepositClient:
         self,
         *,
         ticker: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         network: typing.Optional[str] = OMIT,
         type: typing.Optional[CreateNewAddressRequestType] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -1267,10 +1274,10 @@ class AsyncRawDepositClient:
         ticker : str
             Currency's ticker.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         network : typing.Optional[str]
@@ -1308,9 +1315,10 @@ class AsyncRawDepositClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateNewAddressResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateNewAddressResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1321,7 +1329,7 @@ class AsyncRawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1332,11 +1340,11 @@ class AsyncRawDepositClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
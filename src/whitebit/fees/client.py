@@ -27,7 +27,11 @@ class FeesClient:
         return self._raw_client
 
     def get_fees(
-        self, *, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.List[FeeInfo]:
         """
         Returns an array of objects containing deposit/withdrawal [fees](/glossary#fee) for the corresponding currencies.
@@ -43,10 +47,10 @@ class FeesClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -83,7 +87,11 @@ class AsyncFeesClient:
         return self._raw_client
 
     async def get_fees(
-        self, *, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.List[FeeInfo]:
         """
         Returns an array of objects containing deposit/withdrawal [fees](/glossary#fee) for the corresponding currencies.
@@ -99,10 +107,10 @@ class AsyncFeesClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -6,7 +6,6 @@ from json.decoder import JSONDecodeError
 from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
 from ..core.http_response import AsyncHttpResponse, HttpResponse
-from ..core.pydantic_utilities import parse_obj_as
 from ..core.request_options import RequestOptions
 from ..types.fee_info import FeeInfo
 
@@ -19,7 +18,11 @@ class RawFeesClient:
         self._client_wrapper = client_wrapper
 
     def get_fees(
-        self, *, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[typing.List[FeeInfo]]:
         """
         Returns an array of objects containing deposit/withdrawal [fees](/glossary#fee) for the corresponding currencies.
@@ -35,10 +38,10 @@ class RawFeesClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -67,13 +70,14 @@ class RawFeesClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[FeeInfo],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[FeeInfo],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -84,7 +88,11 @@ class AsyncRawFeesClient:
         self._client_wrapper = client_wrapper
 
     async def get_fees(
-        self, *, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[typing.List[FeeInfo]]:
         """
         Returns an array of objects containing deposit/withdrawal [fees](/glossary#fee) for the corresponding currencies.
@@ -100,10 +108,10 @@ class AsyncRawFeesClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -132,13 +140,14 @@ class AsyncRawFeesClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[FeeInfo],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[FeeInfo],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
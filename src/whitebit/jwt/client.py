@@ -30,8 +30,8 @@ class JwtClient:
     def issue_jwt_token(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         nonce_window: typing.Optional[bool] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> IssueJwtTokenResponse:
@@ -45,10 +45,10 @@ class JwtClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         nonce_window : typing.Optional[bool]
@@ -74,7 +74,11 @@ class JwtClient:
         return _response.data
 
     def get_web_socket_token(
-        self, *, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> GetWebSocketTokenResponse:
         """
         The V4 endpoint can be used to retrieve the WebSocket token for user.
@@ -90,10 +94,10 @@ class JwtClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
@@ -132,8 +136,8 @@ class AsyncJwtClient:
     async def issue_jwt_token(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         nonce_window: typing.Optional[bool] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> IssueJwtTokenResponse:
@@ -147,10 +151,10 @@ class AsyncJwtClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         nonce_window : typing.Optional[bool]
@@ -179,7 +183,11 @@ class AsyncJwtClient:
         return _response.data
 
     async def get_web_socket_token(
-        self, *, request: str, nonce: str, request_options: typing.Optional[RequestOptions] = None
+        self,
+        *,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
     ) -> GetWebSocketTokenResponse:
         """
         The V4 endpoint can be used to retrieve the WebSocket token for user.
@@ -195,10 +203,10 @@ class AsyncJwtClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         request_options : typing.Optional[RequestOptions]
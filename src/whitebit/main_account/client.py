@@ -3,7 +3,9 @@
 import typing
 
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.pagination import aiter_offset_pages, iter_offset_pages, page_items
 from ..core.request_options import RequestOptions
+from ..types.transaction_history import TransactionHistory
 from .raw_client import AsyncRawMainAccountClient, RawMainAccountClient
 from .types.get_deposit_withdraw_history_response import GetDepositWithdrawHistoryResponse
 from .types.get_main_balance_response_value import GetMainBalanceResponseValue
@@ -30,8 +32,8 @@ class MainAccountClient:
     def get_main_balance(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.Dict[str, GetMainBalanceResponseValue]:
@@ -48,10 +50,10 @@ class MainAccountClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         ticker : typing.Optional[str]
@@ -79,8 +81,8 @@ class MainAccountClient:
     def get_deposit_withdraw_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         transaction_method: typing.Optional[int] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         address: typing.Optional[str] = OMIT,
@@ -127,10 +129,10 @@ class MainAccountClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         transaction_method : typing.Optional[int]
@@ -192,6 +194,90 @@ class MainAccountClient:
         )
         return _response.data
 
+    def iter_deposit_withdraw_history(
+        self,
+        *,
+        transaction_method: typing.Optional[int] = OMIT,
+        ticker: typing.Optional[str] = OMIT,
+        address: typing.Optional[str] = OMIT,
+        memo: typing.Optional[str] = OMIT,
+        addresses: typing.Optional[typing.Sequence[str]] = OMIT,
+        unique_id: typing.Optional[str] = OMIT,
+        status: typing.Optional[typing.Sequence[int]] = OMIT,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[TransactionHistory]:
+        """
+        Iterates over the deposit and withdrawal history, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        transaction_method : typing.Optional[int]
+            Method. Example: **1** to display deposits / **2** to display withdraws. Do not send this parameter in order to receive both deposits and withdraws.
+
+        ticker : typing.Optional[str]
+            Currency's [ticker](/glossary#ticker). Example: BTC
+
+        address : typing.Optional[str]
+            Can be used for filtering transactions by specific address.
+
+        memo : typing.Optional[str]
+            Can be used for filtering transactions by specific [memo](/glossary#memodestination-tag)
+
+        addresses : typing.Optional[typing.Sequence[str]]
+            Can be used for filtering transactions by specific array of addresses.
+
+        unique_id : typing.Optional[str]
+            Can be used for filtering transactions by specific unique id
+
+        status : typing.Optional[typing.Sequence[int]]
+            Can be used for filtering transactions by status codes.
+
+            ⚠️ Caution: Use this parameter with the appropriate `transactionMethod` and valid status codes for that method. See the endpoint description above for valid codes. Example: `"status": [3,7]`
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        TransactionHistory
+
+        Examples
+        --------
+        from whitebit import WhitebitApi
+        client = WhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        for transaction in client.main_account.iter_deposit_withdraw_history(transaction_method=1, ):
+            print(transaction)
+        """
+
+        def fetch_page(page_offset: int, page_limit: int) -> typing.Sequence[typing.Any]:
+            page = self.get_deposit_withdraw_history(
+                transaction_method=transaction_method,
+                ticker=ticker,
+                address=address,
+                memo=memo,
+                addresses=addresses,
+                unique_id=unique_id,
+                status=status,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+            return page_items(page, "records")
+
+        return iter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
+
 
 class AsyncMainAccountClient:
     def __init__(self, *, client_wrapper: AsyncClientWrapper):
@@ -211,8 +297,8 @@ class AsyncMainAccountClient:
     async def get_main_balance(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> typing.Dict[str, GetMainBalanceResponseValue]:
@@ -229,10 +315,10 @@ class AsyncMainAccountClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         ticker : typing.Optional[str]
@@ -263,8 +349,8 @@ class AsyncMainAccountClient:
     async def get_deposit_withdraw_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         transaction_method: typing.Optional[int] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         address: typing.Optional[str] = OMIT,
@@ -311,10 +397,10 @@ class AsyncMainAccountClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         transaction_method : typing.Optional[int]
@@ -378,3 +464,90 @@ class AsyncMainAccountClient:
             request_options=request_options,
         )
         return _response.data
+
+    def iter_deposit_withdraw_history(
+        self,
+        *,
+        transaction_method: typing.Optional[int] = OMIT,
+        ticker: typing.Optional[str] = OMIT,
+        address: typing.Optional[str] = OMIT,
+        memo: typing.Optional[str] = OMIT,
+        addresses: typing.Optional[typing.Sequence[str]] = OMIT,
+        unique_id: typing.Optional[str] = OMIT,
+        status: typing.Optional[typing.Sequence[int]] = OMIT,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[TransactionHistory]:
+        """
+        Iterates over the deposit and withdrawal history, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        transaction_method : typing.Optional[int]
+            Method. Example: **1** to display deposits / **2** to display withdraws. Do not send this parameter in order to receive both deposits and withdraws.
+
+        ticker : typing.Optional[str]
+            Currency's [ticker](/glossary#ticker). Example: BTC
+
+        address : typing.Optional[str]
+            Can be used for filtering transactions by specific address.
+
+        memo : typing.Optional[str]
+            Can be used for filtering transactions by specific [memo](/glossary#memodestination-tag)
+
+        addresses : typing.Optional[typing.Sequence[str]]
+            Can be used for filtering transactions by specific array of addresses.
+
+        unique_id : typing.Optional[str]
+            Can be used for filtering transactions by specific unique id
+
+        status : typing.Optional[typing.Sequence[int]]
+            Can be used for filtering transactions by status codes.
+
+            ⚠️ Caution: Use this parameter with the appropriate `transactionMethod` and valid status codes for that method. See the endpoint description above for valid codes. Example: `"status": [3,7]`
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        TransactionHistory
+
+        Examples
+        --------
+        from whitebit import AsyncWhitebitApi
+        import asyncio
+        client = AsyncWhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        async def main() -> None:
+            async for transaction in client.main_account.iter_deposit_withdraw_history(transaction_method=1, ):
+                print(transaction)
+        asyncio.run(main())
+        """
+
+        async def fetch_page(page_offset: int, page_limit: int) -> typing.Sequence[typing.Any]:
+            page = await self.get_deposit_withdraw_history(
+                transaction_method=transaction_method,
+                ticker=ticker,
+                address=address,
+                memo=memo,
+                addresses=addresses,
+                unique_id=unique_id,
+                status=status,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+            return page_items(page, "records")
+
+        return aiter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
@@ -24,8 +24,8 @@ class RawMainAccountClient:
     def get_main_balance(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[typing.Dict[str, GetMainBalanceResponseValue]]:
@@ -42,10 +42,10 @@ class RawMainAccountClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         ticker : typing.Optional[str]
@@ -78,9 +78,10 @@ class RawMainAccountClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, GetMainBalanceResponseValue],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, GetMainBalanceResponseValue],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -91,11 +92,11 @@ class RawMainAccountClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -103,8 +104,8 @@ class RawMainAccountClient:
     def get_deposit_withdraw_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         transaction_method: typing.Optional[int] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         address: typing.Optional[str] = OMIT,
@@ -151,10 +152,10 @@ class RawMainAccountClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         transaction_method : typing.Optional[int]
@@ -221,9 +222,10 @@ class RawMainAccountClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetDepositWithdrawHistoryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetDepositWithdrawHistoryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -234,7 +236,7 @@ class RawMainAccountClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -245,11 +247,11 @@ class RawMainAccountClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -262,8 +264,8 @@ class AsyncRawMainAccountClient:
     async def get_main_balance(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[typing.Dict[str, GetMainBalanceResponseValue]]:
@@ -280,10 +282,10 @@ class AsyncRawMainAccountClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         ticker : typing.Optional[str]
@@ -316,9 +318,10 @@ class AsyncRawMainAccountClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, GetMainBalanceResponseValue],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, GetMainBalanceResponseValue],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -329,11 +332,11 @@ class AsyncRawMainAccountClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -341,8 +344,8 @@ class AsyncRawMainAccountClient:
     async def get_deposit_withdraw_history(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         transaction_method: typing.Optional[int] = OMIT,
         ticker: typing.Optional[str] = OMIT,
         address: typing.Optional[str] = OMIT,
@@ -389,10 +392,10 @@ class AsyncRawMainAccountClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         transaction_method : typing.Optional[int]
@@ -459,9 +462,10 @@ class AsyncRawMainAccountClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetDepositWithdrawHistoryResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetDepositWithdrawHistoryResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -472,7 +476,7 @@ class AsyncRawMainAccountClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -483,11 +487,11 @@ class AsyncRawMainAccountClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -62,9 +62,10 @@ class RawMarketFeeClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMarketFeeResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMarketFeeResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -75,11 +76,11 @@ class RawMarketFeeClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -135,9 +136,10 @@ class AsyncRawMarketFeeClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMarketFeeResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMarketFeeResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -148,11 +150,11 @@ class AsyncRawMarketFeeClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
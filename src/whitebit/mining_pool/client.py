@@ -447,8 +447,8 @@ class MiningPoolClient:
         self,
         *,
         name: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         referral_code: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> CreateMiningAccountResponse:
@@ -464,10 +464,10 @@ class MiningPoolClient:
         name : str
             Mining pool account name. Must be unique. Alphanumeric characters and underscores allowed.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         referral_code : typing.Optional[str]
@@ -495,8 +495,8 @@ class MiningPoolClient:
     def get_mining_accounts(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         name: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> GetMiningAccountsResponse:
@@ -509,10 +509,10 @@ class MiningPoolClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         name : typing.Optional[str]
@@ -986,8 +986,8 @@ class AsyncMiningPoolClient:
         self,
         *,
         name: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         referral_code: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> CreateMiningAccountResponse:
@@ -1003,10 +1003,10 @@ class AsyncMiningPoolClient:
         name : str
             Mining pool account name. Must be unique. Alphanumeric characters and underscores allowed.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         referral_code : typing.Optional[str]
@@ -1037,8 +1037,8 @@ class AsyncMiningPoolClient:
     async def get_mining_accounts(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         name: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> GetMiningAccountsResponse:
@@ -1051,10 +1051,10 @@ class AsyncMiningPoolClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         name : typing.Optional[str]
@@ -100,9 +100,10 @@ class RawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMiningRewardsResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMiningRewardsResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -113,11 +114,11 @@ class RawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -184,9 +185,10 @@ class RawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMiningHashrateResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMiningHashrateResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -197,11 +199,11 @@ class RawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -246,9 +248,10 @@ class RawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMiningPayoutDestinationResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMiningPayoutDestinationResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -259,11 +262,11 @@ class RawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -321,9 +324,10 @@ class RawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     SetMiningPayoutDestinationResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=SetMiningPayoutDestinationResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -334,11 +338,11 @@ class RawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -383,9 +387,10 @@ class RawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMiningMinerInfoResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMiningMinerInfoResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -396,11 +401,11 @@ class RawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -458,9 +463,10 @@ class RawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMiningWorkerNamesResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMiningWorkerNamesResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -471,11 +477,11 @@ class RawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -543,9 +549,10 @@ class RawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMiningWorkerHashrateResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMiningWorkerHashrateResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -556,11 +563,11 @@ class RawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -623,9 +630,10 @@ class RawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateMiningWatcherLinkResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateMiningWatcherLinkResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -636,11 +644,11 @@ class RawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -685,9 +693,10 @@ class RawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     ListMiningWatcherLinksResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=ListMiningWatcherLinksResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -698,11 +707,11 @@ class RawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -711,8 +720,8 @@ class RawMiningPoolClient:
         self,
         *,
         name: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         referral_code: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[CreateMiningAccountResponse]:
@@ -728,10 +737,10 @@ class RawMiningPoolClient:
         name : str
             Mining pool account name. Must be unique. Alphanumeric characters and underscores allowed.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         referral_code : typing.Optional[str]
@@ -765,9 +774,10 @@ class RawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateMiningAccountResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateMiningAccountResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -778,11 +788,11 @@ class RawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -790,8 +800,8 @@ class RawMiningPoolClient:
     def get_mining_accounts(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         name: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> HttpResponse[GetMiningAccountsResponse]:
@@ -804,10 +814,10 @@ class RawMiningPoolClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         name : typing.Optional[str]
@@ -840,9 +850,10 @@ class RawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMiningAccountsResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMiningAccountsResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -853,11 +864,11 @@ class RawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -932,9 +943,10 @@ class AsyncRawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMiningRewardsResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMiningRewardsResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -945,11 +957,11 @@ class AsyncRawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1016,9 +1028,10 @@ class AsyncRawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMiningHashrateResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMiningHashrateResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1029,11 +1042,11 @@ class AsyncRawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1078,9 +1091,10 @@ class AsyncRawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMiningPayoutDestinationResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMiningPayoutDestinationResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1091,11 +1105,11 @@ class AsyncRawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1153,9 +1167,10 @@ class AsyncRawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     SetMiningPayoutDestinationResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=SetMiningPayoutDestinationResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1166,11 +1181,11 @@ class AsyncRawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1215,9 +1230,10 @@ class AsyncRawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMiningMinerInfoResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMiningMinerInfoResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1228,11 +1244,11 @@ class AsyncRawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1290,9 +1306,10 @@ class AsyncRawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMiningWorkerNamesResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMiningWorkerNamesResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1303,11 +1320,11 @@ class AsyncRawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1375,9 +1392,10 @@ class AsyncRawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMiningWorkerHashrateResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMiningWorkerHashrateResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1388,11 +1406,11 @@ class AsyncRawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1455,9 +1473,10 @@ class AsyncRawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateMiningWatcherLinkResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateMiningWatcherLinkResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1468,11 +1487,11 @@ class AsyncRawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1517,9 +1536,10 @@ class AsyncRawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     ListMiningWatcherLinksResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=ListMiningWatcherLinksResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1530,11 +1550,11 @@ class AsyncRawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1543,8 +1563,8 @@ class AsyncRawMiningPoolClient:
         self,
         *,
         name: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         referral_code: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[CreateMiningAccountResponse]:
@@ -1560,10 +1580,10 @@ class AsyncRawMiningPoolClient:
         name : str
             Mining pool account name. Must be unique. Alphanumeric characters and underscores allowed.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         referral_code : typing.Optional[str]
@@ -1597,9 +1617,10 @@ class AsyncRawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     CreateMiningAccountResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=CreateMiningAccountResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1610,11 +1631,11 @@ class AsyncRawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1622,8 +1643,8 @@ class AsyncRawMiningPoolClient:
     async def get_mining_accounts(
         self,
         *,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         name: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncHttpResponse[GetMiningAccountsResponse]:
@@ -1636,10 +1657,10 @@ class AsyncRawMiningPoolClient:
 
         Parameters
         ----------
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         name : typing.Optional[str]
@@ -1672,9 +1693,10 @@ class AsyncRawMiningPoolClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetMiningAccountsResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetMiningAccountsResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -1685,11 +1707,11 @@ class AsyncRawMiningPoolClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
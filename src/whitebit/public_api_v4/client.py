@@ -3,7 +3,10 @@
 import typing
 
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.pagination import aiter_offset_pages, iter_offset_pages
 from ..core.request_options import RequestOptions
+from ..core.sharding import aiter_time_windows, iter_time_windows, record_field
+from ..core.response_cache import ResponseCache
 from ..types.asset import Asset
 from ..types.orderbook_response import OrderbookResponse
 from .raw_client import AsyncRawPublicApiV4Client, RawPublicApiV4Client
@@ -22,6 +25,15 @@ from .types.get_api_v4public_trades_market_response_item import GetApiV4PublicTr
 class PublicApiV4Client:
     def __init__(self, *, client_wrapper: SyncClientWrapper):
         self._raw_client = RawPublicApiV4Client(client_wrapper=client_wrapper)
+        self._client_wrapper = client_wrapper
+
+    @property
+    def response_cache(self) -> typing.Optional[ResponseCache]:
+        """
+        The cache serving these endpoints, with its hit and miss counters. None unless the client was created
+        with a `response_cache`.
+        """
+        return self._client_wrapper.get_response_cache()
 
     @property
     def with_raw_response(self) -> RawPublicApiV4Client:
@@ -504,6 +516,139 @@ class PublicApiV4Client:
         )
         return _response.data
 
+    def iter_funding_history(
+        self,
+        *,
+        market: str,
+        start_date: typing.Optional[int] = None,
+        end_date: typing.Optional[int] = None,
+        page_size: int = 1000,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[GetApiV4PublicFundingHistoryMarketResponseItem]:
+        """
+        Iterates over the funding rate history of a futures market, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        market : str
+            Market name (e.g., BTC_PERP)
+
+        start_date : typing.Optional[int]
+            Start timestamp in seconds
+
+        end_date : typing.Optional[int]
+            End timestamp in seconds
+
+        page_size : int
+            The number of records requested per page. Default: 1000, Min: 1, Max: 1000
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        GetApiV4PublicFundingHistoryMarketResponseItem
+
+        Examples
+        --------
+        from whitebit import WhitebitApi
+        client = WhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        for funding in client.public_api_v4.iter_funding_history(market="BTC_PERP", ):
+            print(funding)
+        """
+
+        def fetch_page(page_offset: int, page_limit: int) -> typing.List[GetApiV4PublicFundingHistoryMarketResponseItem]:
+            return self.funding_history(
+                market=market,
+                start_date=start_date,
+                end_date=end_date,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+
+        return iter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
+
+    def iter_funding_history_range(
+        self,
+        *,
+        market: str,
+        start_date: int,
+        end_date: int,
+        windows: int = 8,
+        page_size: int = 1000,
+        concurrency: int = 8,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[GetApiV4PublicFundingHistoryMarketResponseItem]:
+        """
+        Iterates over the funding rate history of a futures market between two dates in time order, fetching time windows of the range concurrently. Windows whose first page is full are split further rather than paginated, and entries repeated across windows or pages are dropped.
+
+        Parameters
+        ----------
+        market : str
+            Market name (e.g., BTC_PERP)
+
+        start_date : int
+            Start timestamp in seconds
+
+        end_date : int
+            End timestamp in seconds
+
+        windows : int
+            The number of time windows the range is initially split into. Default: 8
+
+        page_size : int
+            The number of records requested per page. Default: 1000, Min: 1, Max: 1000
+
+        concurrency : int
+            The maximum number of pages in flight. Requests go through the client's rate limiter. Default: 8
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        GetApiV4PublicFundingHistoryMarketResponseItem
+
+        Examples
+        --------
+        from whitebit import WhitebitApi
+        client = WhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        for entry in client.public_api_v4.iter_funding_history_range(market="BTC_PERP", start_date=1727740800, end_date=1735689600, ):
+            print(entry)
+        """
+
+        def fetch_page(
+            window_start: int, window_end: int, page_offset: int, page_limit: int
+        ) -> typing.List[GetApiV4PublicFundingHistoryMarketResponseItem]:
+            return self.funding_history(
+                market=market,
+                start_date=window_start,
+                end_date=window_end,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+
+        return iter_time_windows(
+            fetch_page,
+            start=start_date,
+            end=end_date,
+            time_key=lambda entry: int(record_field(entry, "funding_time", "fundingTime") or 0),
+            key=lambda entry: record_field(entry, "funding_time", "fundingTime"),
+            windows=windows,
+            page_size=page_size,
+            concurrency=concurrency,
+        )
+
     def mining_pool_overview(
         self, *, request_options: typing.Optional[RequestOptions] = None
     ) -> GetApiV4PublicMiningPoolResponse:
@@ -539,6 +684,15 @@ class PublicApiV4Client:
 class AsyncPublicApiV4Client:
     def __init__(self, *, client_wrapper: AsyncClientWrapper):
         self._raw_client = AsyncRawPublicApiV4Client(client_wrapper=client_wrapper)
+        self._client_wrapper = client_wrapper
+
+    @property
+    def response_cache(self) -> typing.Optional[ResponseCache]:
+        """
+        The cache serving these endpoints, with its hit and miss counters. None unless the client was created
+        with a `response_cache`.
+        """
+        return self._client_wrapper.get_response_cache()
 
     @property
     def with_raw_response(self) -> AsyncRawPublicApiV4Client:
@@ -1064,6 +1218,145 @@ class AsyncPublicApiV4Client:
         )
         return _response.data
 
+    def iter_funding_history(
+        self,
+        *,
+        market: str,
+        start_date: typing.Optional[int] = None,
+        end_date: typing.Optional[int] = None,
+        page_size: int = 1000,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[GetApiV4PublicFundingHistoryMarketResponseItem]:
+        """
+        Iterates over the funding rate history of a futures market, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        market : str
+            Market name (e.g., BTC_PERP)
+
+        start_date : typing.Optional[int]
+            Start timestamp in seconds
+
+        end_date : typing.Optional[int]
+            End timestamp in seconds
+
+        page_size : int
+            The number of records requested per page. Default: 1000, Min: 1, Max: 1000
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        GetApiV4PublicFundingHistoryMarketResponseItem
+
+        Examples
+        --------
+        from whitebit import AsyncWhitebitApi
+        import asyncio
+        client = AsyncWhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        async def main() -> None:
+            async for funding in client.public_api_v4.iter_funding_history(market="BTC_PERP", ):
+                print(funding)
+        asyncio.run(main())
+        """
+
+        async def fetch_page(page_offset: int, page_limit: int) -> typing.List[GetApiV4PublicFundingHistoryMarketResponseItem]:
+            return await self.funding_history(
+                market=market,
+                start_date=start_date,
+                end_date=end_date,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+
+        return aiter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
+
+    def iter_funding_history_range(
+        self,
+        *,
+        market: str,
+        start_date: int,
+        end_date: int,
+        windows: int = 8,
+        page_size: int = 1000,
+        concurrency: int = 8,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[GetApiV4PublicFundingHistoryMarketResponseItem]:
+        """
+        Iterates over the funding rate history of a futures market between two dates in time order, fetching time windows of the range concurrently. Windows whose first page is full are split further rather than paginated, and entries repeated across windows or pages are dropped.
+
+        Parameters
+        ----------
+        market : str
+            Market name (e.g., BTC_PERP)
+
+        start_date : int
+            Start timestamp in seconds
+
+        end_date : int
+            End timestamp in seconds
+
+        windows : int
+            The number of time windows the range is initially split into. Default: 8
+
+        page_size : int
+            The number of records requested per page. Default: 1000, Min: 1, Max: 1000
+
+        concurrency : int
+            The maximum number of pages in flight. Requests go through the client's rate limiter. Default: 8
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        GetApiV4PublicFundingHistoryMarketResponseItem
+
+        Examples
+        --------
+        from whitebit import AsyncWhitebitApi
+        import asyncio
+        client = AsyncWhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        async def main() -> None:
+            async for entry in client.public_api_v4.iter_funding_history_range(market="BTC_PERP", start_date=1727740800, end_date=1735689600, ):
+                print(entry)
+        asyncio.run(main())
+        """
+
+        async def fetch_page(
+            window_start: int, window_end: int, page_offset: int, page_limit: int
+        ) -> typing.List[GetApiV4PublicFundingHistoryMarketResponseItem]:
+            return await self.funding_history(
+                market=market,
+                start_date=window_start,
+                end_date=window_end,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+
+        return aiter_time_windows(
+            fetch_page,
+            start=start_date,
+            end=end_date,
+            time_key=lambda entry: int(record_field(entry, "funding_time", "fundingTime") or 0),
+            key=lambda entry: record_field(entry, "funding_time", "fundingTime"),
+            windows=windows,
+            page_size=page_size,
+            concurrency=concurrency,
+        )
+
     async def mining_pool_overview(
         self, *, request_options: typing.Optional[RequestOptions] = None
     ) -> GetApiV4PublicMiningPoolResponse:
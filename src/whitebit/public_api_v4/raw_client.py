@@ -7,7 +7,6 @@ from ..core.api_error import ApiError
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
 from ..core.http_response import AsyncHttpResponse, HttpResponse
 from ..core.jsonable_encoder import jsonable_encoder
-from ..core.pydantic_utilities import parse_obj_as
 from ..core.request_options import RequestOptions
 from ..types.asset import Asset
 from ..types.orderbook_response import OrderbookResponse
@@ -53,13 +52,14 @@ class RawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetApiV4PublicPlatformStatusResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetApiV4PublicPlatformStatusResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -98,13 +98,14 @@ class RawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetApiV4PublicMarketsResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetApiV4PublicMarketsResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -143,13 +144,14 @@ class RawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, GetApiV4PublicTickerResponseValue],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, GetApiV4PublicTickerResponseValue],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -188,13 +190,14 @@ class RawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, Asset],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, Asset],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -251,13 +254,14 @@ class RawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderbookResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderbookResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -299,13 +303,14 @@ class RawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderbookResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderbookResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -362,13 +367,14 @@ class RawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetApiV4PublicTradesMarketResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetApiV4PublicTradesMarketResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -407,13 +413,14 @@ class RawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -452,13 +459,14 @@ class RawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetApiV4PublicTimeResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetApiV4PublicTimeResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -497,13 +505,14 @@ class RawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[str],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[str],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -542,13 +551,14 @@ class RawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetApiV4PublicCollateralMarketsResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetApiV4PublicCollateralMarketsResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -587,13 +597,14 @@ class RawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetApiV4PublicFuturesResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetApiV4PublicFuturesResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -656,13 +667,14 @@ class RawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetApiV4PublicFundingHistoryMarketResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetApiV4PublicFundingHistoryMarketResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -699,13 +711,14 @@ class RawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetApiV4PublicMiningPoolResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetApiV4PublicMiningPoolResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -741,13 +754,14 @@ class AsyncRawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetApiV4PublicPlatformStatusResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetApiV4PublicPlatformStatusResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -786,13 +800,14 @@ class AsyncRawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetApiV4PublicMarketsResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetApiV4PublicMarketsResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -831,13 +846,14 @@ class AsyncRawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, GetApiV4PublicTickerResponseValue],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, GetApiV4PublicTickerResponseValue],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -876,13 +892,14 @@ class AsyncRawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, Asset],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, Asset],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -939,13 +956,14 @@ class AsyncRawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderbookResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderbookResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -987,13 +1005,14 @@ class AsyncRawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderbookResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderbookResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1050,13 +1069,14 @@ class AsyncRawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetApiV4PublicTradesMarketResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetApiV4PublicTradesMarketResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1095,13 +1115,14 @@ class AsyncRawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1140,13 +1161,14 @@ class AsyncRawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetApiV4PublicTimeResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetApiV4PublicTimeResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1185,13 +1207,14 @@ class AsyncRawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[str],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[str],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1230,13 +1253,14 @@ class AsyncRawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetApiV4PublicCollateralMarketsResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetApiV4PublicCollateralMarketsResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1275,13 +1299,14 @@ class AsyncRawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetApiV4PublicFuturesResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetApiV4PublicFuturesResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1344,13 +1369,14 @@ class AsyncRawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetApiV4PublicFundingHistoryMarketResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetApiV4PublicFundingHistoryMarketResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1387,13 +1413,14 @@ class AsyncRawPublicApiV4Client:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetApiV4PublicMiningPoolResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetApiV4PublicMiningPoolResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
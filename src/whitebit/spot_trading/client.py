@@ -3,7 +3,9 @@
 import typing
 
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.pagination import aiter_offset_pages, iter_offset_pages
 from ..core.request_options import RequestOptions
+from ..core.sharding import aiter_time_windows, iter_time_windows, record_field
 from ..types.bulk_limit_order_response import BulkLimitOrderResponse
 from ..types.bulk_order_item import BulkOrderItem
 from ..types.market_order_request_side import MarketOrderRequestSide
@@ -126,8 +128,8 @@ class SpotTradingClient:
         side: LimitOrderRequestSide,
         amount: str,
         price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         post_only: typing.Optional[bool] = OMIT,
         ioc: typing.Optional[bool] = OMIT,
@@ -345,9 +347,9 @@ class SpotTradingClient:
         price : str
             Price in money currency. Example: '9800' or 9800
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -540,8 +542,8 @@ class SpotTradingClient:
         market: str,
         side: MarketOrderRequestSide,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stp: typing.Optional[MarketOrderRequestStp] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -670,9 +672,9 @@ class SpotTradingClient:
         amount : str
             Amount of [money](/glossary#money) currency to buy or amount in [stock](/glossary#stock) currency to sell. Example: '5 USDT' for buy (min total) and '0.001 BTC' for sell (min amount).
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -712,8 +714,8 @@ class SpotTradingClient:
         market: str,
         side: MarketOrderRequestSide,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stp: typing.Optional[MarketOrderRequestStp] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -830,9 +832,9 @@ class SpotTradingClient:
         amount : str
             Amount of [money](/glossary#money) currency to buy or amount in [stock](/glossary#stock) currency to sell. Example: '5 USDT' for buy (min total) and '0.001 BTC' for sell (min amount).
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -874,8 +876,8 @@ class SpotTradingClient:
         amount: str,
         price: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         bbo_role: typing.Optional[int] = OMIT,
         stp: typing.Optional[StopLimitOrderRequestStp] = OMIT,
@@ -1034,9 +1036,9 @@ class SpotTradingClient:
         activation_price : str
             Activation price in [money](/glossary#money) currency. Example: '10000' or 10000
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -1083,8 +1085,8 @@ class SpotTradingClient:
         side: StopMarketOrderRequestSide,
         amount: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stp: typing.Optional[StopMarketOrderRequestStp] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -1239,9 +1241,9 @@ class SpotTradingClient:
         activation_price : str
             Activation price in [money](/glossary#money) currency. Example: '10000' or 10000
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -1280,8 +1282,8 @@ class SpotTradingClient:
         self,
         *,
         market: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         order_id: typing.Optional[int] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -1375,9 +1377,9 @@ class SpotTradingClient:
         market : str
             Available [market](/glossary#market). Example: BTC_USDT
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         order_id : typing.Optional[int]
             Order Id. Example: 4180284841. Required if client_order_id is not set.
@@ -1686,12 +1688,155 @@ class SpotTradingClient:
         )
         return _response.data
 
+    def iter_executed_order_history(
+        self,
+        *,
+        market: typing.Optional[str] = OMIT,
+        client_order_id: typing.Optional[str] = OMIT,
+        start_date: typing.Optional[int] = OMIT,
+        end_date: typing.Optional[int] = OMIT,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[GetExecutedOrderHistoryResponseItem]:
+        """
+        Iterates over the executed order history, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        market : typing.Optional[str]
+            Requested [market](/glossary#market). Example: BTC_USDT
+
+        client_order_id : typing.Optional[str]
+            Filter by custom order identifier
+
+        start_date : typing.Optional[int]
+            Start date in Unix-time format
+
+        end_date : typing.Optional[int]
+            End date in Unix-time format
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        GetExecutedOrderHistoryResponseItem
+
+        Examples
+        --------
+        from whitebit import WhitebitApi
+        client = WhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        for order in client.spot_trading.iter_executed_order_history(market="BTC_USDT", ):
+            print(order)
+        """
+
+        def fetch_page(page_offset: int, page_limit: int) -> typing.List[GetExecutedOrderHistoryResponseItem]:
+            return self.get_executed_order_history(
+                market=market,
+                client_order_id=client_order_id,
+                start_date=start_date,
+                end_date=end_date,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+
+        return iter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
+
+    def iter_executed_order_history_range(
+        self,
+        *,
+        start_date: int,
+        end_date: int,
+        market: typing.Optional[str] = OMIT,
+        client_order_id: typing.Optional[str] = OMIT,
+        windows: int = 8,
+        page_size: int = 100,
+        concurrency: int = 8,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[GetExecutedOrderHistoryResponseItem]:
+        """
+        Iterates over the executed order history between two dates in time order, fetching time windows of the range concurrently. Windows whose first page is full are split further rather than paginated, and deals repeated across windows or pages are dropped.
+
+        Parameters
+        ----------
+        start_date : int
+            Start date in Unix-time format. The endpoint can retrieve data not older than 6 months from current month.
+
+        end_date : int
+            End date in Unix-time format
+
+        market : typing.Optional[str]
+            Requested [market](/glossary#market). Example: BTC_USDT
+
+        client_order_id : typing.Optional[str]
+            Filter by custom order identifier
+
+        windows : int
+            The number of time windows the range is initially split into. Default: 8
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        concurrency : int
+            The maximum number of pages in flight. Requests go through the client's rate limiter. Default: 8
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        GetExecutedOrderHistoryResponseItem
+
+        Examples
+        --------
+        from whitebit import WhitebitApi
+        client = WhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        for deal in client.spot_trading.iter_executed_order_history_range(start_date=1727740800, end_date=1735689600, market="BTC_USDT", ):
+            print(deal)
+        """
+
+        def fetch_page(
+            window_start: int, window_end: int, page_offset: int, page_limit: int
+        ) -> typing.List[GetExecutedOrderHistoryResponseItem]:
+            return self.get_executed_order_history(
+                market=market,
+                client_order_id=client_order_id,
+                start_date=window_start,
+                end_date=window_end,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+
+        return iter_time_windows(
+            fetch_page,
+            start=start_date,
+            end=end_date,
+            time_key=lambda deal: record_field(deal, "time") or 0,
+            key=lambda deal: record_field(deal, "id"),
+            windows=windows,
+            page_size=page_size,
+            concurrency=concurrency,
+        )
+
     def get_order_deals(
         self,
         *,
         order_id: int,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         offset: typing.Optional[int] = OMIT,
         limit: typing.Optional[int] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -1707,9 +1852,9 @@ class SpotTradingClient:
         ----------
         order_id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         offset : typing.Optional[int]
 
@@ -1786,8 +1931,8 @@ class SpotTradingClient:
         self,
         *,
         market: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         order_id: typing.Optional[int] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         amount: typing.Optional[str] = OMIT,
@@ -1857,9 +2002,9 @@ class SpotTradingClient:
         market : str
             Available [market](/glossary#market). Example: BTC_USDT
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         order_id : typing.Optional[int]
             Active order id. Required if client_order_id is not set.
@@ -2162,8 +2307,8 @@ class AsyncSpotTradingClient:
         side: LimitOrderRequestSide,
         amount: str,
         price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         post_only: typing.Optional[bool] = OMIT,
         ioc: typing.Optional[bool] = OMIT,
@@ -2381,9 +2526,9 @@ class AsyncSpotTradingClient:
         price : str
             Price in money currency. Example: '9800' or 9800
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -2582,8 +2727,8 @@ class AsyncSpotTradingClient:
         market: str,
         side: MarketOrderRequestSide,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stp: typing.Optional[MarketOrderRequestStp] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -2712,9 +2857,9 @@ class AsyncSpotTradingClient:
         amount : str
             Amount of [money](/glossary#money) currency to buy or amount in [stock](/glossary#stock) currency to sell. Example: '5 USDT' for buy (min total) and '0.001 BTC' for sell (min amount).
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -2757,8 +2902,8 @@ class AsyncSpotTradingClient:
         market: str,
         side: MarketOrderRequestSide,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stp: typing.Optional[MarketOrderRequestStp] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -2875,9 +3020,9 @@ class AsyncSpotTradingClient:
         amount : str
             Amount of [money](/glossary#money) currency to buy or amount in [stock](/glossary#stock) currency to sell. Example: '5 USDT' for buy (min total) and '0.001 BTC' for sell (min amount).
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -2922,8 +3067,8 @@ class AsyncSpotTradingClient:
         amount: str,
         price: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         bbo_role: typing.Optional[int] = OMIT,
         stp: typing.Optional[StopLimitOrderRequestStp] = OMIT,
@@ -3082,9 +3227,9 @@ class AsyncSpotTradingClient:
         activation_price : str
             Activation price in [money](/glossary#money) currency. Example: '10000' or 10000
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -3134,8 +3279,8 @@ class AsyncSpotTradingClient:
         side: StopMarketOrderRequestSide,
         amount: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stp: typing.Optional[StopMarketOrderRequestStp] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -3290,9 +3435,9 @@ class AsyncSpotTradingClient:
         activation_price : str
             Activation price in [money](/glossary#money) currency. Example: '10000' or 10000
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -3334,8 +3479,8 @@ class AsyncSpotTradingClient:
         self,
         *,
         market: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         order_id: typing.Optional[int] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -3429,9 +3574,9 @@ class AsyncSpotTradingClient:
         market : str
             Available [market](/glossary#market). Example: BTC_USDT
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         order_id : typing.Optional[int]
             Order Id. Example: 4180284841. Required if client_order_id is not set.
@@ -3752,12 +3897,161 @@ class AsyncSpotTradingClient:
         )
         return _response.data
 
+    def iter_executed_order_history(
+        self,
+        *,
+        market: typing.Optional[str] = OMIT,
+        client_order_id: typing.Optional[str] = OMIT,
+        start_date: typing.Optional[int] = OMIT,
+        end_date: typing.Optional[int] = OMIT,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[GetExecutedOrderHistoryResponseItem]:
+        """
+        Iterates over the executed order history, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        market : typing.Optional[str]
+            Requested [market](/glossary#market). Example: BTC_USDT
+
+        client_order_id : typing.Optional[str]
+            Filter by custom order identifier
+
+        start_date : typing.Optional[int]
+            Start date in Unix-time format
+
+        end_date : typing.Optional[int]
+            End date in Unix-time format
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        GetExecutedOrderHistoryResponseItem
+
+        Examples
+        --------
+        from whitebit import AsyncWhitebitApi
+        import asyncio
+        client = AsyncWhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        async def main() -> None:
+            async for order in client.spot_trading.iter_executed_order_history(market="BTC_USDT", ):
+                print(order)
+        asyncio.run(main())
+        """
+
+        async def fetch_page(page_offset: int, page_limit: int) -> typing.List[GetExecutedOrderHistoryResponseItem]:
+            return await self.get_executed_order_history(
+                market=market,
+                client_order_id=client_order_id,
+                start_date=start_date,
+                end_date=end_date,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+
+        return aiter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
+
+    def iter_executed_order_history_range(
+        self,
+        *,
+        start_date: int,
+        end_date: int,
+        market: typing.Optional[str] = OMIT,
+        client_order_id: typing.Optional[str] = OMIT,
+        windows: int = 8,
+        page_size: int = 100,
+        concurrency: int = 8,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[GetExecutedOrderHistoryResponseItem]:
+        """
+        Iterates over the executed order history between two dates in time order, fetching time windows of the range concurrently. Windows whose first page is full are split further rather than paginated, and deals repeated across windows or pages are dropped.
+
+        Parameters
+        ----------
+        start_date : int
+            Start date in Unix-time format. The endpoint can retrieve data not older than 6 months from current month.
+
+        end_date : int
+            End date in Unix-time format
+
+        market : typing.Optional[str]
+            Requested [market](/glossary#market). Example: BTC_USDT
+
+        client_order_id : typing.Optional[str]
+            Filter by custom order identifier
+
+        windows : int
+            The number of time windows the range is initially split into. Default: 8
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        concurrency : int
+            The maximum number of pages in flight. Requests go through the client's rate limiter. Default: 8
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        GetExecutedOrderHistoryResponseItem
+
+        Examples
+        --------
+        from whitebit import AsyncWhitebitApi
+        import asyncio
+        client = AsyncWhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        async def main() -> None:
+            async for deal in client.spot_trading.iter_executed_order_history_range(start_date=1727740800, end_date=1735689600, market="BTC_USDT", ):
+                print(deal)
+        asyncio.run(main())
+        """
+
+        async def fetch_page(
+            window_start: int, window_end: int, page_offset: int, page_limit: int
+        ) -> typing.List[GetExecutedOrderHistoryResponseItem]:
+            return await self.get_executed_order_history(
+                market=market,
+                client_order_id=client_order_id,
+                start_date=window_start,
+                end_date=window_end,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+
+        return aiter_time_windows(
+            fetch_page,
+            start=start_date,
+            end=end_date,
+            time_key=lambda deal: record_field(deal, "time") or 0,
+            key=lambda deal: record_field(deal, "id"),
+            windows=windows,
+            page_size=page_size,
+            concurrency=concurrency,
+        )
+
     async def get_order_deals(
         self,
         *,
         order_id: int,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         offset: typing.Optional[int] = OMIT,
         limit: typing.Optional[int] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -3773,9 +4067,9 @@ class AsyncSpotTradingClient:
         ----------
         order_id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         offset : typing.Optional[int]
 
@@ -3858,8 +4152,8 @@ class AsyncSpotTradingClient:
         self,
         *,
         market: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         order_id: typing.Optional[int] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         amount: typing.Optional[str] = OMIT,
@@ -3929,9 +4223,9 @@ class AsyncSpotTradingClient:
         market : str
             Available [market](/glossary#market). Example: BTC_USDT
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         order_id : typing.Optional[int]
             Active order id. Required if client_order_id is not set.
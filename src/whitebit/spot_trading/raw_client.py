@@ -123,9 +123,10 @@ class RawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, TradeAccountBalanceResponseValue],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, TradeAccountBalanceResponseValue],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -136,7 +137,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -147,7 +148,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -158,11 +159,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -174,8 +175,8 @@ class RawSpotTradingClient:
         side: LimitOrderRequestSide,
         amount: str,
         price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         post_only: typing.Optional[bool] = OMIT,
         ioc: typing.Optional[bool] = OMIT,
@@ -393,9 +394,9 @@ class RawSpotTradingClient:
         price : str
             Price in money currency. Example: '9800' or 9800
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -463,9 +464,10 @@ class RawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -476,7 +478,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -487,7 +489,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -498,11 +500,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -641,9 +643,10 @@ class RawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     BulkLimitOrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=BulkLimitOrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -654,7 +657,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -665,7 +668,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -676,11 +679,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -691,8 +694,8 @@ class RawSpotTradingClient:
         market: str,
         side: MarketOrderRequestSide,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stp: typing.Optional[MarketOrderRequestStp] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -821,9 +824,9 @@ class RawSpotTradingClient:
         amount : str
             Amount of [money](/glossary#money) currency to buy or amount in [stock](/glossary#stock) currency to sell. Example: '5 USDT' for buy (min total) and '0.001 BTC' for sell (min amount).
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -862,9 +865,10 @@ class RawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -875,7 +879,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -886,7 +890,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -897,11 +901,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -912,8 +916,8 @@ class RawSpotTradingClient:
         market: str,
         side: MarketOrderRequestSide,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stp: typing.Optional[MarketOrderRequestStp] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -1030,9 +1034,9 @@ class RawSpotTradingClient:
         amount : str
             Amount of [money](/glossary#money) currency to buy or amount in [stock](/glossary#stock) currency to sell. Example: '5 USDT' for buy (min total) and '0.001 BTC' for sell (min amount).
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -1071,9 +1075,10 @@ class RawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -1084,7 +1089,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1095,7 +1100,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1106,11 +1111,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1123,8 +1128,8 @@ class RawSpotTradingClient:
         amount: str,
         price: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         bbo_role: typing.Optional[int] = OMIT,
         stp: typing.Optional[StopLimitOrderRequestStp] = OMIT,
@@ -1283,9 +1288,9 @@ class RawSpotTradingClient:
         activation_price : str
             Activation price in [money](/glossary#money) currency. Example: '10000' or 10000
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -1330,9 +1335,10 @@ class RawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -1343,7 +1349,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1354,7 +1360,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1365,11 +1371,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1381,8 +1387,8 @@ class RawSpotTradingClient:
         side: StopMarketOrderRequestSide,
         amount: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stp: typing.Optional[StopMarketOrderRequestStp] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -1537,9 +1543,9 @@ class RawSpotTradingClient:
         activation_price : str
             Activation price in [money](/glossary#money) currency. Example: '10000' or 10000
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -1579,9 +1585,10 @@ class RawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -1592,7 +1599,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1603,11 +1610,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1616,8 +1623,8 @@ class RawSpotTradingClient:
         self,
         *,
         market: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         order_id: typing.Optional[int] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -1711,9 +1718,9 @@ class RawSpotTradingClient:
         market : str
             Available [market](/glossary#market). Example: BTC_USDT
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         order_id : typing.Optional[int]
             Order Id. Example: 4180284841. Required if client_order_id is not set.
@@ -1750,9 +1757,10 @@ class RawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -1763,7 +1771,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1774,7 +1782,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1785,11 +1793,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -1895,7 +1903,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1906,7 +1914,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -1917,11 +1925,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2024,9 +2032,10 @@ class RawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[OrderResponse],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[OrderResponse],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -2037,7 +2046,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2048,7 +2057,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2059,11 +2068,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2171,9 +2180,10 @@ class RawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetExecutedOrderHistoryResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetExecutedOrderHistoryResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -2184,7 +2194,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2195,7 +2205,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2206,11 +2216,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2219,8 +2229,8 @@ class RawSpotTradingClient:
         self,
         *,
         order_id: int,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         offset: typing.Optional[int] = OMIT,
         limit: typing.Optional[int] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -2236,9 +2246,9 @@ class RawSpotTradingClient:
         ----------
         order_id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         offset : typing.Optional[int]
 
@@ -2273,9 +2283,10 @@ class RawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetOrderDealsResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetOrderDealsResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -2286,7 +2297,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2297,7 +2308,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2308,11 +2319,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2375,9 +2386,10 @@ class RawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.List[GetOrderHistoryResponseValueItem]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.List[GetOrderHistoryResponseValueItem]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -2388,7 +2400,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2399,7 +2411,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2410,11 +2422,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2423,8 +2435,8 @@ class RawSpotTradingClient:
         self,
         *,
         market: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         order_id: typing.Optional[int] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         amount: typing.Optional[str] = OMIT,
@@ -2494,9 +2506,9 @@ class RawSpotTradingClient:
         market : str
             Available [market](/glossary#market). Example: BTC_USDT
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         order_id : typing.Optional[int]
             Active order id. Required if client_order_id is not set.
@@ -2549,9 +2561,10 @@ class RawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -2562,7 +2575,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2573,7 +2586,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2584,11 +2597,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2697,9 +2710,10 @@ class RawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     SetKillSwitchResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=SetKillSwitchResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -2710,7 +2724,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2721,11 +2735,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2798,9 +2812,10 @@ class RawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetKillSwitchStatusResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetKillSwitchStatusResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -2811,7 +2826,7 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2822,11 +2837,11 @@ class RawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2919,9 +2934,10 @@ class AsyncRawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, TradeAccountBalanceResponseValue],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, TradeAccountBalanceResponseValue],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -2932,7 +2948,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2943,7 +2959,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -2954,11 +2970,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -2970,8 +2986,8 @@ class AsyncRawSpotTradingClient:
         side: LimitOrderRequestSide,
         amount: str,
         price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         post_only: typing.Optional[bool] = OMIT,
         ioc: typing.Optional[bool] = OMIT,
@@ -3189,9 +3205,9 @@ class AsyncRawSpotTradingClient:
         price : str
             Price in money currency. Example: '9800' or 9800
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -3259,9 +3275,10 @@ class AsyncRawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -3272,7 +3289,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3283,7 +3300,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3294,11 +3311,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -3437,9 +3454,10 @@ class AsyncRawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     BulkLimitOrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=BulkLimitOrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -3450,7 +3468,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3461,7 +3479,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3472,11 +3490,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -3487,8 +3505,8 @@ class AsyncRawSpotTradingClient:
         market: str,
         side: MarketOrderRequestSide,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stp: typing.Optional[MarketOrderRequestStp] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -3617,9 +3635,9 @@ class AsyncRawSpotTradingClient:
         amount : str
             Amount of [money](/glossary#money) currency to buy or amount in [stock](/glossary#stock) currency to sell. Example: '5 USDT' for buy (min total) and '0.001 BTC' for sell (min amount).
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -3658,9 +3676,10 @@ class AsyncRawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -3671,7 +3690,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3682,7 +3701,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3693,11 +3712,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -3708,8 +3727,8 @@ class AsyncRawSpotTradingClient:
         market: str,
         side: MarketOrderRequestSide,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stp: typing.Optional[MarketOrderRequestStp] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -3826,9 +3845,9 @@ class AsyncRawSpotTradingClient:
         amount : str
             Amount of [money](/glossary#money) currency to buy or amount in [stock](/glossary#stock) currency to sell. Example: '5 USDT' for buy (min total) and '0.001 BTC' for sell (min amount).
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -3867,9 +3886,10 @@ class AsyncRawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -3880,7 +3900,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3891,7 +3911,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -3902,11 +3922,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -3919,8 +3939,8 @@ class AsyncRawSpotTradingClient:
         amount: str,
         price: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         bbo_role: typing.Optional[int] = OMIT,
         stp: typing.Optional[StopLimitOrderRequestStp] = OMIT,
@@ -4079,9 +4099,9 @@ class AsyncRawSpotTradingClient:
         activation_price : str
             Activation price in [money](/glossary#money) currency. Example: '10000' or 10000
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -4126,9 +4146,10 @@ class AsyncRawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -4139,7 +4160,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4150,7 +4171,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4161,11 +4182,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -4177,8 +4198,8 @@ class AsyncRawSpotTradingClient:
         side: StopMarketOrderRequestSide,
         amount: str,
         activation_price: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         stp: typing.Optional[StopMarketOrderRequestStp] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -4333,9 +4354,9 @@ class AsyncRawSpotTradingClient:
         activation_price : str
             Activation price in [money](/glossary#money) currency. Example: '10000' or 10000
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         client_order_id : typing.Optional[str]
             Identifier should be unique and contain letters, dashes, numbers, dots or underscores. The identifier must be unique.
@@ -4375,9 +4396,10 @@ class AsyncRawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -4388,7 +4410,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4399,11 +4421,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -4412,8 +4434,8 @@ class AsyncRawSpotTradingClient:
         self,
         *,
         market: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         order_id: typing.Optional[int] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -4507,9 +4529,9 @@ class AsyncRawSpotTradingClient:
         market : str
             Available [market](/glossary#market). Example: BTC_USDT
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         order_id : typing.Optional[int]
             Order Id. Example: 4180284841. Required if client_order_id is not set.
@@ -4546,9 +4568,10 @@ class AsyncRawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -4559,7 +4582,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4570,7 +4593,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4581,11 +4604,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -4691,7 +4714,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4702,7 +4725,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4713,11 +4736,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -4820,9 +4843,10 @@ class AsyncRawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[OrderResponse],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[OrderResponse],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -4833,7 +4857,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4844,7 +4868,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4855,11 +4879,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -4967,9 +4991,10 @@ class AsyncRawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetExecutedOrderHistoryResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetExecutedOrderHistoryResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -4980,7 +5005,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -4991,7 +5016,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -5002,11 +5027,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -5015,8 +5040,8 @@ class AsyncRawSpotTradingClient:
         self,
         *,
         order_id: int,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         offset: typing.Optional[int] = OMIT,
         limit: typing.Optional[int] = OMIT,
         request_options: typing.Optional[RequestOptions] = None,
@@ -5032,9 +5057,9 @@ class AsyncRawSpotTradingClient:
         ----------
         order_id : int
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         offset : typing.Optional[int]
 
@@ -5069,9 +5094,10 @@ class AsyncRawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     GetOrderDealsResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=GetOrderDealsResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -5082,7 +5108,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -5093,7 +5119,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -5104,11 +5130,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -5171,9 +5197,10 @@ class AsyncRawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.Dict[str, typing.List[GetOrderHistoryResponseValueItem]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.Dict[str, typing.List[GetOrderHistoryResponseValueItem]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -5184,7 +5211,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -5195,7 +5222,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -5206,11 +5233,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -5219,8 +5246,8 @@ class AsyncRawSpotTradingClient:
         self,
         *,
         market: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         order_id: typing.Optional[int] = OMIT,
         client_order_id: typing.Optional[str] = OMIT,
         amount: typing.Optional[str] = OMIT,
@@ -5290,9 +5317,9 @@ class AsyncRawSpotTradingClient:
         market : str
             Available [market](/glossary#market). Example: BTC_USDT
 
-        request : str
+        request : typing.Optional[str]
 
-        nonce : str
+        nonce : typing.Optional[str]
 
         order_id : typing.Optional[int]
             Active order id. Required if client_order_id is not set.
@@ -5345,9 +5372,10 @@ class AsyncRawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     OrderResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=OrderResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -5358,7 +5386,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -5369,7 +5397,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -5380,11 +5408,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -5493,9 +5521,10 @@ class AsyncRawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     SetKillSwitchResponse,
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=SetKillSwitchResponse,  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -5506,7 +5535,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -5517,11 +5546,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -5594,9 +5623,10 @@ class AsyncRawSpotTradingClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[GetKillSwitchStatusResponseItem],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[GetKillSwitchStatusResponseItem],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -5607,7 +5637,7 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -5618,11 +5648,11 @@ class AsyncRawSpotTradingClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
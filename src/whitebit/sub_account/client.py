@@ -3,8 +3,10 @@
 import typing
 
 from ..core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from ..core.pagination import aiter_offset_pages, iter_offset_pages, page_items
 from ..core.request_options import RequestOptions
 from ..types.sub_account import SubAccount
+from ..types.sub_account_transfer import SubAccountTransfer
 from .raw_client import AsyncRawSubAccountClient, RawSubAccountClient
 from .types.create_sub_account_request_permissions import CreateSubAccountRequestPermissions
 from .types.edit_sub_account_request_permissions import EditSubAccountRequestPermissions
@@ -440,6 +442,63 @@ class SubAccountClient:
         )
         return _response.data
 
+    def iter_sub_account_transfer_history(
+        self,
+        *,
+        id: str,
+        direction: typing.Optional[GetSubAccountTransferHistoryRequestDirection] = OMIT,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[SubAccountTransfer]:
+        """
+        Iterates over the transfer history of a sub-account, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        id : str
+            Sub-account id
+
+        direction : typing.Optional[GetSubAccountTransferHistoryRequestDirection]
+            Transfer direction (optional)
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        SubAccountTransfer
+
+        Examples
+        --------
+        from whitebit import WhitebitApi
+        client = WhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        for transfer in client.sub_account.iter_sub_account_transfer_history(id="0d2b9a3c-1234-4c7d-9f8e-1a2b3c4d5e6f", ):
+            print(transfer)
+        """
+
+        def fetch_page(page_offset: int, page_limit: int) -> typing.Sequence[typing.Any]:
+            page = self.get_sub_account_transfer_history(
+                id=id,
+                direction=direction,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+            return page_items(page, "data")
+
+        return iter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
+
 
 class AsyncSubAccountClient:
     def __init__(self, *, client_wrapper: AsyncClientWrapper):
@@ -890,3 +949,63 @@ class AsyncSubAccountClient:
             id=id, direction=direction, limit=limit, offset=offset, request_options=request_options
         )
         return _response.data
+
+    def iter_sub_account_transfer_history(
+        self,
+        *,
+        id: str,
+        direction: typing.Optional[GetSubAccountTransferHistoryRequestDirection] = OMIT,
+        page_size: int = 100,
+        offset: int = 0,
+        prefetch: bool = True,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[SubAccountTransfer]:
+        """
+        Iterates over the transfer history of a sub-account, requesting the next page while the current one is consumed and stopping at the first short page.
+
+        Parameters
+        ----------
+        id : str
+            Sub-account id
+
+        direction : typing.Optional[GetSubAccountTransferHistoryRequestDirection]
+            Transfer direction (optional)
+
+        page_size : int
+            The number of records requested per page. Default: 100, Min: 1, Max: 100
+
+        offset : int
+            Starting line index (OFFSET) of the first page. Default: 0, Min: 0
+
+        prefetch : bool
+            Whether to request the next page while the current one is consumed. Default: True
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        SubAccountTransfer
+
+        Examples
+        --------
+        from whitebit import AsyncWhitebitApi
+        import asyncio
+        client = AsyncWhitebitApi(txc_apikey="YOUR_TXC_APIKEY", token="YOUR_TOKEN", )
+        async def main() -> None:
+            async for transfer in client.sub_account.iter_sub_account_transfer_history(id="0d2b9a3c-1234-4c7d-9f8e-1a2b3c4d5e6f", ):
+                print(transfer)
+        asyncio.run(main())
+        """
+
+        async def fetch_page(page_offset: int, page_limit: int) -> typing.Sequence[typing.Any]:
+            page = await self.get_sub_account_transfer_history(
+                id=id,
+                direction=direction,
+                offset=page_offset,
+                limit=page_limit,
+                request_options=request_options,
+            )
+            return page_items(page, "data")
+
+        return aiter_offset_pages(fetch_page, page_size=page_size, offset=offset, prefetch=prefetch)
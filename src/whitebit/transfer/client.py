@@ -33,8 +33,8 @@ class TransferClient:
         *,
         ticker: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         method: typing.Optional[TransferBetweenBalancesRequestMethod] = OMIT,
         from_: typing.Optional[TransferBetweenBalancesRequestFrom] = OMIT,
         to: typing.Optional[TransferBetweenBalancesRequestTo] = OMIT,
@@ -63,10 +63,10 @@ class TransferClient:
         amount : str
             Amount to transfer. Max [precision](/glossary#precision) = 8, value must be greater than zero and less than or equal to the available balance.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         method : typing.Optional[TransferBetweenBalancesRequestMethod]
@@ -135,8 +135,8 @@ class AsyncTransferClient:
         *,
         ticker: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         method: typing.Optional[TransferBetweenBalancesRequestMethod] = OMIT,
         from_: typing.Optional[TransferBetweenBalancesRequestFrom] = OMIT,
         to: typing.Optional[TransferBetweenBalancesRequestTo] = OMIT,
@@ -165,10 +165,10 @@ class AsyncTransferClient:
         amount : str
             Amount to transfer. Max [precision](/glossary#precision) = 8, value must be greater than zero and less than or equal to the available balance.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         method : typing.Optional[TransferBetweenBalancesRequestMethod]
@@ -27,8 +27,8 @@ class RawTransferClient:
         *,
         ticker: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         method: typing.Optional[TransferBetweenBalancesRequestMethod] = OMIT,
         from_: typing.Optional[TransferBetweenBalancesRequestFrom] = OMIT,
         to: typing.Optional[TransferBetweenBalancesRequestTo] = OMIT,
@@ -57,10 +57,10 @@ class RawTransferClient:
         amount : str
             Amount to transfer. Max [precision](/glossary#precision) = 8, value must be greater than zero and less than or equal to the available balance.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         method : typing.Optional[TransferBetweenBalancesRequestMethod]
@@ -113,9 +113,10 @@ class RawTransferClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return HttpResponse(response=_response, data=_data)
@@ -126,7 +127,7 @@ class RawTransferClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -137,11 +138,11 @@ class RawTransferClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
@@ -156,8 +157,8 @@ class AsyncRawTransferClient:
         *,
         ticker: str,
         amount: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         method: typing.Optional[TransferBetweenBalancesRequestMethod] = OMIT,
         from_: typing.Optional[TransferBetweenBalancesRequestFrom] = OMIT,
         to: typing.Optional[TransferBetweenBalancesRequestTo] = OMIT,
@@ -186,10 +187,10 @@ class AsyncRawTransferClient:
         amount : str
             Amount to transfer. Max [precision](/glossary#precision) = 8, value must be greater than zero and less than or equal to the available balance.
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         method : typing.Optional[TransferBetweenBalancesRequestMethod]
@@ -242,9 +243,10 @@ class AsyncRawTransferClient:
             if 200 <= _response.status_code < 300:
                 _data = typing.cast(
                     typing.List[typing.Optional[typing.Any]],
-                    parse_obj_as(
+                    self._client_wrapper.parse_response(
                         type_=typing.List[typing.Optional[typing.Any]],  # type: ignore
-                        object_=_response.json(),
+                        response=_response,
+                        request_options=request_options,
                     ),
                 )
                 return AsyncHttpResponse(response=_response, data=_data)
@@ -255,7 +257,7 @@ class AsyncRawTransferClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
@@ -266,11 +268,11 @@ class AsyncRawTransferClient:
                         typing.Optional[typing.Any],
                         parse_obj_as(
                             type_=typing.Optional[typing.Any],  # type: ignore
-                            object_=_response.json(),
+                            object_=self._client_wrapper.decode_json(_response),
                         ),
                     ),
                 )
-            _response_json = _response.json()
+            _response_json = self._client_wrapper.decode_json(_response)
         except JSONDecodeError:
             raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
         raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response_json)
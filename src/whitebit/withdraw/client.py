@@ -33,8 +33,8 @@ class WithdrawClient:
         ticker: str,
         amount: str,
         address: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         memo: typing.Optional[str] = OMIT,
         unique_id: typing.Optional[str] = OMIT,
         provider: typing.Optional[str] = OMIT,
@@ -73,10 +73,10 @@ class WithdrawClient:
         address : str
             Target address (wallet address for cryptocurrencies, identifier/[card token](/glossary#card-token) for [fiat](/glossary#fiat) currencies)
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         memo : typing.Optional[str]
@@ -155,8 +155,8 @@ class WithdrawClient:
         ticker: str,
         amount: str,
         address: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         memo: typing.Optional[str] = OMIT,
         unique_id: typing.Optional[str] = OMIT,
         provider: typing.Optional[str] = OMIT,
@@ -192,10 +192,10 @@ class WithdrawClient:
         address : str
             Target address (wallet address for cryptocurrencies, identifier/[card token](/glossary#card-token) for [fiat](/glossary#fiat) currencies)
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         memo : typing.Optional[str]
@@ -272,8 +272,8 @@ class AsyncWithdrawClient:
         ticker: str,
         amount: str,
         address: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         memo: typing.Optional[str] = OMIT,
         unique_id: typing.Optional[str] = OMIT,
         provider: typing.Optional[str] = OMIT,
@@ -312,10 +312,10 @@ class AsyncWithdrawClient:
         address : str
             Target address (wallet address for cryptocurrencies, identifier/[card token](/glossary#card-token) for [fiat](/glossary#fiat) currencies)
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         memo : typing.Optional[str]
@@ -397,8 +397,8 @@ class AsyncWithdrawClient:
         ticker: str,
         amount: str,
         address: str,
-        request: str,
-        nonce: str,
+        request: typing.Optional[str] = OMIT,
+        nonce: typing.Optional[str] = OMIT,
         memo: typing.Optional[str] = OMIT,
         unique_id: typing.Optional[str] = OMIT,
         provider: typing.Optional[str] = OMIT,
@@ -434,10 +434,10 @@ class AsyncWithdrawClient:
         address : str
             Target address (wallet address for cryptocurrencies, identifier/[card token](/glossary#card-token) for [fiat](/glossary#fiat) currencies)
 
-        request : str
+        request : typing.Optional[str]
             Request signature
 
-        nonce : str
+        nonce : typing.Optional[str]
             Unique request identifier
 
         memo : typing.Optional[str]
@@ -0,0 +1,27 @@
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+SDK_TESTS = ROOT / 'tests' / 'sdk'
+
+sdk_session = False
+
+
+def _runs_sdk_tests(config) -> bool:
+    paths = [pathlib.Path(arg.split('::')[0]).resolve() for arg in config.args]
+    return bool(paths) and all(path == SDK_TESTS or SDK_TESTS in path.parents for path in paths)
+
+
+def pytest_configure(config):
+    # The legacy client (whitebit/) and the generated SDK (src/whitebit/) are both the whitebit package, so a
+    # session tests one of them: tests/sdk runs on its own, against src/
+    global sdk_session
+    sdk_session = _runs_sdk_tests(config)
+    if sdk_session:
+        sys.path.insert(0, str(ROOT / 'src'))
+
+
+def pytest_ignore_collect(collection_path, config):
+    if not sdk_session and (collection_path == SDK_TESTS or SDK_TESTS in collection_path.parents):
+        return True
+    return None
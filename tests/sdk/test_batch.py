@@ -0,0 +1,114 @@
+import asyncio
+import functools
+import unittest
+
+import httpx
+
+from whitebit import AsyncWhitebitApi, WhitebitApiEnvironment
+from whitebit.core.batch import map_concurrent
+
+
+async def collect(iterator):
+    return [outcome async for outcome in iterator]
+
+
+class MapConcurrentTestCase(unittest.TestCase):
+    def test_calls_stay_within_the_concurrency(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def call(item):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01 * (item % 3))
+            in_flight -= 1
+            return item * 2
+
+        outcomes = asyncio.run(collect(map_concurrent(call, range(20), concurrency=4)))
+        self.assertEqual(max_in_flight, 4)
+        results = sorted((outcome.index, outcome.result) for outcome in outcomes)
+        self.assertEqual(results, [(item, item * 2) for item in range(20)])
+
+    def test_failed_calls_yield_their_error(self):
+        async def call(item):
+            if item == 1:
+                raise ValueError('rejected')
+            return item
+
+        outcomes = sorted(asyncio.run(collect(map_concurrent(call, range(3)))), key=lambda outcome: outcome.index)
+        self.assertEqual([outcome.ok for outcome in outcomes], [True, False, True])
+        self.assertEqual(outcomes[2].unwrap(), 2)
+        with self.assertRaises(ValueError):
+            outcomes[1].unwrap()
+
+    def test_items_are_pulled_as_workers_free_up(self):
+        pulled = []
+
+        def items():
+            for item in range(100):
+                pulled.append(item)
+                yield item
+
+        async def call(item):
+            await asyncio.sleep(0)
+            return item
+
+        async def run():
+            iterator = map_concurrent(call, items(), concurrency=2)
+            first = await iterator.__anext__()
+            await iterator.aclose()
+            return first
+
+        asyncio.run(run())
+        self.assertLess(len(pulled), 10)
+
+    def test_closing_early_cancels_the_calls_in_flight(self):
+        cancelled = []
+
+        async def call(item):
+            try:
+                await asyncio.sleep(0 if item == 0 else 10)
+            except asyncio.CancelledError:
+                cancelled.append(item)
+                raise
+            return item
+
+        async def run():
+            iterator = map_concurrent(call, range(3), concurrency=3)
+            first = await iterator.__anext__()
+            await iterator.aclose()
+            return first
+
+        self.assertEqual(asyncio.run(asyncio.wait_for(run(), 5)).item, 0)
+        self.assertEqual(sorted(cancelled), [1, 2])
+
+    def test_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(collect(map_concurrent(asyncio.sleep, [0], concurrency=0)))
+
+
+class ClientBatchTestCase(unittest.TestCase):
+    def test_batch_runs_call_specs_through_the_client(self):
+        def handler(request):
+            if request.url.path == '/api/v4/public/time':
+                return httpx.Response(200, json={'time': 1700000000})
+            return httpx.Response(503, json={'message': 'maintenance'})
+
+        async def run():
+            client = AsyncWhitebitApi(
+                environment=WhitebitApiEnvironment(base='https://whitebit.test', production='', eu=''),
+                txc_apikey='key',
+                token='token',
+                httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            )
+            calls = [client.public_api_v4.server_time, functools.partial(client.public_api_v4.server_status)]
+            return await collect(client.batch(calls, concurrency=2))
+
+        outcomes = sorted(asyncio.run(run()), key=lambda outcome: outcome.index)
+        self.assertEqual(outcomes[0].result.time, 1700000000)
+        self.assertFalse(outcomes[1].ok)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import math
+import unittest
+from decimal import Decimal
+
+from whitebit.core.book_arrays import book_arrays, np
+
+BOOK = {
+    'asks': [['100.0', '1.0'], ['101.0', '2.0'], ['102.0', '3.0']],
+    'bids': [['99.0', '1.5'], ['98.0', '2.5']],
+}
+
+
+@unittest.skipIf(np is None, 'requires numpy')
+class BookArraysTestCase(unittest.TestCase):
+    def test_vwap_takes_the_last_level_partly(self):
+        arrays = book_arrays(BOOK)
+        self.assertEqual(arrays.vwap('asks', 1.0), 100.0)
+        # 1 at 100, 2 at 101 and 0.5 of the 3 at 102
+        self.assertAlmostEqual(arrays.vwap('asks', 3.5), (100 + 2 * 101 + 0.5 * 102) / 3.5)
+        self.assertAlmostEqual(arrays.vwap('bids', 2.0), (1.5 * 99 + 0.5 * 98) / 2)
+
+    def test_vwap_of_a_book_too_shallow_is_nan(self):
+        arrays = book_arrays(BOOK)
+        self.assertTrue(math.isnan(arrays.vwap('asks', 6.5)))
+        self.assertTrue(math.isnan(arrays.vwap('bids', 0)))
+        self.assertTrue(math.isnan(book_arrays({'asks': [], 'bids': []}).vwap('asks', 1)))
+
+    def test_slippage(self):
+        arrays = book_arrays(BOOK)
+        self.assertEqual(arrays.mid, 99.5)
+        self.assertAlmostEqual(arrays.slippage('asks', 1.0), 0.5 / 99.5)
+        self.assertAlmostEqual(arrays.slippage('bids', 1.0), 0.5 / 99.5)
+        self.assertTrue(math.isnan(arrays.slippage('bids', 10)))
+
+    def test_imbalance(self):
+        arrays = book_arrays(BOOK)
+        self.assertAlmostEqual(arrays.imbalance(), (4.0 - 6.0) / 10.0)
+        self.assertAlmostEqual(arrays.imbalance(1), (1.5 - 1.0) / 2.5)
+        self.assertEqual(book_arrays({'asks': [], 'bids': []}).imbalance(), 0.0)
+
+    def test_mapping_and_list_sides_agree(self):
+        mapping = {side: {float(price): float(amount) for price, amount in levels} for side, levels in BOOK.items()}
+        from_list, from_mapping = book_arrays(BOOK), book_arrays(mapping)
+        for field in ('ask_prices', 'ask_amounts', 'bid_prices', 'bid_amounts'):
+            np.testing.assert_array_equal(getattr(from_list, field), getattr(from_mapping, field))
+        np.testing.assert_array_equal(from_list.cumulative_depth('asks'), [1.0, 3.0, 6.0])
+
+    def test_fixed_point_is_exact(self):
+        book = {'asks': [['12345678.123456789', '0.000000001']], 'bids': {Decimal('0.1'): Decimal('3')}}
+        arrays = book_arrays(book, decimals=9)
+        self.assertEqual(arrays.ask_prices.dtype, np.int64)
+        self.assertEqual(arrays.ask_prices.tolist(), [12345678123456789])
+        self.assertEqual(arrays.ask_amounts.tolist(), [1])
+        self.assertEqual(arrays.bid_prices.tolist(), [100000000])
+        self.assertAlmostEqual(arrays.best_bid, 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
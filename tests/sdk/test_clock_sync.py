@@ -0,0 +1,92 @@
+import math
+import types
+import unittest
+
+import httpx
+
+from whitebit import WhitebitApi, WhitebitApiEnvironment
+from whitebit.core.clock_sync import ClockSync
+
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakePublicApi:
+    '''A server_time endpoint on an exchange clock `offset` seconds ahead of the monotonic clock, answering after
+    the given round trips, the server reading its clock halfway through'''
+
+    def __init__(self, clock, offset, rtts):
+        self.clock = clock
+        self.offset = offset
+        self.rtts = list(rtts)
+        self.request_options = []
+
+    def server_status(self, request_options=None):
+        self.clock.now += 0.1
+        return ['pong']
+
+    def server_time(self, request_options=None):
+        self.request_options.append(request_options)
+        rtt = self.rtts.pop(0)
+        self.clock.now += rtt / 2
+        server_time = math.floor(self.clock.now + self.offset)
+        self.clock.now += rtt / 2
+        return types.SimpleNamespace(time=server_time)
+
+
+class ClockSyncTestCase(unittest.TestCase):
+    def test_offset_is_taken_at_the_round_trip_midpoint(self):
+        clock = FakeClock()
+
+        def handler(request):
+            if request.url.path == '/api/v4/public/time':
+                clock.now += 0.05
+                return httpx.Response(200, json={'time': 1700000000})
+            return httpx.Response(200, json=['pong'])
+
+        client = WhitebitApi(
+            environment=WhitebitApiEnvironment(base='https://whitebit.test', production='', eu=''),
+            txc_apikey='key',
+            token='token',
+            httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+            # Samples are validated whatever the response mode of the client
+            response_mode='raw',
+        )
+        sync = ClockSync(client.public_api_v4, monotonic=clock, wall_clock=lambda: 1699999000.0)
+        sample = sync.sync()
+
+        self.assertAlmostEqual(sample.rtt, 0.05)
+        # The server read its one second resolution clock within the round trip, from 100.0 to 100.05
+        self.assertAlmostEqual(sample.lower, 1700000000 - 100.05, delta=1e-6)
+        self.assertAlmostEqual(sample.upper, 1700000001 - 100.0, delta=1e-6)
+        # Half a second past the reading at the midpoint, 100.025, and 0.025 seconds later
+        self.assertAlmostEqual(sync.exchange_now(), 1700000000 + 0.5 + 0.025, delta=1e-6)
+        self.assertAlmostEqual(sync.offset, 1000 + 0.5 + 0.025, delta=1e-6)
+
+    def test_lowest_round_trip_sample_bounds_the_offset(self):
+        clock = FakeClock()
+        api = FakePublicApi(clock, offset=1700000000.3, rtts=[0.4, 0.02, 0.3])
+        sync = ClockSync(api, monotonic=clock)
+        for _ in range(3):
+            sync.sync()
+            clock.now += 0.37
+
+        stats = sync.stats()
+        self.assertAlmostEqual(stats['rtt_min'], 0.02)
+        self.assertLessEqual(stats['uncertainty'], (1 + 0.02) / 2)
+        self.assertLessEqual(abs(sync.exchange_now() - (clock.now + api.offset)), 2 * stats['uncertainty'])
+        self.assertEqual({options['response_mode'] for options in api.request_options}, {'validate'})
+
+    def test_falls_back_to_the_host_clock_until_synced(self):
+        sync = ClockSync(FakePublicApi(FakeClock(), 0, []), wall_clock=lambda: 1700000000.0)
+        self.assertFalse(sync.synced)
+        self.assertEqual(sync.exchange_now(), 1700000000.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
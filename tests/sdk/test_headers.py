@@ -0,0 +1,66 @@
+import unittest
+
+import httpx
+
+from whitebit import WhitebitApiEnvironment
+from whitebit.core.client_wrapper import SyncClientWrapper
+from whitebit.core.http_client import merge_headers
+
+
+def build_wrapper(token, handler=None):
+    return SyncClientWrapper(
+        txc_apikey='key',
+        token=token,
+        environment=WhitebitApiEnvironment(base='https://whitebit.test', production='', eu=''),
+        timeout=10,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler or (lambda request: httpx.Response(200)))),
+    )
+
+
+class HeaderSnapshotTestCase(unittest.TestCase):
+    def test_snapshot_is_reused_while_the_token_is_unchanged(self):
+        wrapper = build_wrapper('token')
+        headers = wrapper.get_headers()
+        self.assertIs(wrapper.get_headers(), headers)
+        self.assertEqual(headers['Authorization'], 'Bearer token')
+        self.assertEqual(headers['X-TXC-APIKEY'], 'key')
+        with self.assertRaises(TypeError):
+            headers['X-TXC-APIKEY'] = 'other'
+
+    def test_snapshot_follows_a_token_callable(self):
+        tokens = iter(['first', 'first', 'second'])
+        wrapper = build_wrapper(lambda: next(tokens))
+        first = wrapper.get_headers()
+        self.assertIs(wrapper.get_headers(), first)
+        second = wrapper.get_headers()
+        self.assertEqual((first['Authorization'], second['Authorization']), ('Bearer first', 'Bearer second'))
+
+    def test_merge_headers(self):
+        base = build_wrapper('token').get_headers()
+        self.assertIs(merge_headers(base, None, None), base)
+        request_options = {'additional_headers': {'X-Extra': 'a'}}
+        merged = merge_headers(base, {'X-Request': 'r', 'Authorization': None}, request_options)
+        self.assertEqual(merged['X-Request'], 'r')
+        self.assertEqual(merged['X-Extra'], 'a')
+        self.assertNotIn('Authorization', merged)
+        # The snapshot itself is left untouched
+        self.assertEqual(base['Authorization'], 'Bearer token')
+
+    def test_requests_carry_the_snapshot(self):
+        seen = []
+
+        def handler(request):
+            seen.append(dict(request.headers))
+            return httpx.Response(200, json={})
+
+        wrapper = build_wrapper('token', handler)
+        base_url = wrapper.get_environment().base
+        wrapper.httpx_client.request('api/v4/public/ping', method='GET', base_url=base_url)
+        wrapper.httpx_client.request('api/v4/public/ping', method='GET', base_url=base_url, headers={'X-Request': 'a'})
+        self.assertEqual([headers['authorization'] for headers in seen], ['Bearer token', 'Bearer token'])
+        self.assertEqual(seen[1]['x-request'], 'a')
+        self.assertNotIn('x-request', seen[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
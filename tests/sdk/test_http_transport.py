@@ -0,0 +1,160 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import httpx
+
+from whitebit import AsyncWhitebitApi, WhitebitApi
+from whitebit.core.http_transport import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    AdmissionAsyncHTTPTransport,
+    build_async_httpx_client,
+    build_limits,
+)
+
+
+def pool(client):
+    return client._client_wrapper.httpx_client.httpx_client._transport._pool
+
+
+class Body(httpx.AsyncByteStream):
+    '''A response body read from the network, as httpcore returns it'''
+
+    async def __aiter__(self):
+        yield b'{"ok": true}'
+
+
+class AdmissionAsyncHTTPTransportTestCase(unittest.TestCase):
+    def test_requests_beyond_the_limit_wait_for_a_response_to_close(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def send(transport, request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, stream=Body())
+
+        async def run():
+            client = httpx.AsyncClient(transport=AdmissionAsyncHTTPTransport(max_requests=3))
+            with mock.patch.object(httpx.AsyncHTTPTransport, 'handle_async_request', send):
+                requests = asyncio.gather(*(client.get('https://whitebit.test/') for _ in range(10)))
+                responses = await asyncio.wait_for(requests, 5)
+            await client.aclose()
+            return responses
+
+        responses = asyncio.run(run())
+        self.assertEqual([response.json() for response in responses], [{'ok': True}] * 10)
+        self.assertEqual(max_in_flight, 3)
+
+    def test_responses_read_to_the_end_release_their_admission(self):
+        async def send(transport, request):
+            return httpx.Response(200, stream=Body())
+
+        async def run():
+            client = httpx.AsyncClient(transport=AdmissionAsyncHTTPTransport(max_requests=1))
+            with mock.patch.object(httpx.AsyncHTTPTransport, 'handle_async_request', send):
+                for _ in range(3):
+                    # Read through the transport's stream directly, without closing the response
+                    request = client.build_request('GET', 'https://whitebit.test/')
+                    response = await asyncio.wait_for(client.send(request, stream=True), 1)
+                    self.assertEqual(b''.join([chunk async for chunk in response.stream]), b'{"ok": true}')
+            await client.aclose()
+
+        asyncio.run(run())
+
+    def test_buffered_responses_do_not_hold_their_admission(self):
+        async def send(transport, request):
+            return httpx.Response(200, json={'ok': True})
+
+        async def run():
+            client = httpx.AsyncClient(transport=AdmissionAsyncHTTPTransport(max_requests=1))
+            with mock.patch.object(httpx.AsyncHTTPTransport, 'handle_async_request', send):
+                for _ in range(3):
+                    response = await asyncio.wait_for(client.get('https://whitebit.test/'), 1)
+                    self.assertEqual(response.json(), {'ok': True})
+            await client.aclose()
+
+        asyncio.run(run())
+
+    def test_failed_requests_release_their_admission(self):
+        async def send(transport, request):
+            raise httpx.ConnectError('connection refused', request=request)
+
+        async def run():
+            transport = AdmissionAsyncHTTPTransport(max_requests=1)
+            client = httpx.AsyncClient(transport=transport)
+            with mock.patch.object(httpx.AsyncHTTPTransport, 'handle_async_request', send):
+                for _ in range(3):
+                    with self.assertRaises(httpx.ConnectError):
+                        await asyncio.wait_for(client.get('https://whitebit.test/'), 1)
+            await client.aclose()
+
+        asyncio.run(run())
+
+    def test_client_can_be_reused_across_event_loops(self):
+        async def send(transport, request):
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, stream=Body())
+
+        client = httpx.AsyncClient(transport=AdmissionAsyncHTTPTransport(max_requests=1))
+
+        async def run():
+            # Contended, so that the semaphore waits in, and binds to, the running loop
+            requests = asyncio.gather(*(client.get('https://whitebit.test/') for _ in range(3)))
+            return await asyncio.wait_for(requests, 5)
+
+        with mock.patch.object(httpx.AsyncHTTPTransport, 'handle_async_request', send):
+            for _ in range(2):
+                responses = asyncio.run(run())
+                self.assertEqual([response.json() for response in responses], [{'ok': True}] * 3)
+        asyncio.run(client.aclose())
+
+    def test_default_client(self):
+        client = build_async_httpx_client(timeout=10)
+        self.assertIsInstance(client._transport, AdmissionAsyncHTTPTransport)
+        # Without a connection limit, or with HTTP/2 multiplexing, there is nothing to admit
+        unlimited = build_async_httpx_client(timeout=10, limits=build_limits(max_connections=None))
+        self.assertNotIsInstance(unlimited._transport, AdmissionAsyncHTTPTransport)
+        asyncio.run(client.aclose())
+        asyncio.run(unlimited.aclose())
+
+
+class TransportOptionsTestCase(unittest.TestCase):
+    def test_default_pool(self):
+        defaults = pool(WhitebitApi(txc_apikey='key'))
+        self.assertEqual(
+            (defaults._max_connections, defaults._max_keepalive_connections, defaults._keepalive_expiry),
+            (DEFAULT_MAX_CONNECTIONS, DEFAULT_MAX_KEEPALIVE_CONNECTIONS, DEFAULT_KEEPALIVE_EXPIRY),
+        )
+        self.assertFalse(defaults._http2)
+
+    def test_pool_options_reach_the_default_clients(self):
+        options = dict(max_connections=7, max_keepalive_connections=3, keepalive_expiry=5, local_address='0.0.0.0')
+        for client in (WhitebitApi(txc_apikey='key', **options), AsyncWhitebitApi(txc_apikey='key', **options)):
+            configured = pool(client)
+            self.assertEqual(
+                (configured._max_connections, configured._max_keepalive_connections, configured._keepalive_expiry),
+                (7, 3, 5),
+            )
+            self.assertEqual(configured._local_address, '0.0.0.0')
+
+    def test_http2(self):
+        for client in (WhitebitApi(txc_apikey='key', http2=True), AsyncWhitebitApi(txc_apikey='key', http2=True)):
+            self.assertTrue(pool(client)._http2)
+        # HTTP/2 multiplexes requests over a connection, which admission would defeat
+        transport = AsyncWhitebitApi(txc_apikey='key', http2=True)._client_wrapper.httpx_client.httpx_client._transport
+        self.assertNotIsInstance(transport, AdmissionAsyncHTTPTransport)
+
+    def test_a_given_httpx_client_is_used_as_is(self):
+        httpx_client = httpx.Client()
+        client = WhitebitApi(txc_apikey='key', httpx_client=httpx_client, max_connections=7)
+        self.assertIs(client._client_wrapper.httpx_client.httpx_client, httpx_client)
+
+
+if __name__ == '__main__':
+    unittest.main()
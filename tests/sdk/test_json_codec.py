@@ -0,0 +1,115 @@
+import json
+import unittest
+from unittest import mock
+
+import httpx
+
+from whitebit import WhitebitApi, WhitebitApiEnvironment
+from whitebit.core import json_codec
+from whitebit.core.api_error import ApiError
+from whitebit.core.http_client import HttpClient
+from whitebit.core.json_codec import JsonCodec, MsgspecJsonCodec, OrjsonCodec, default_json_codec, msgspec, orjson
+
+BODY = {'market': 'BTC_USDT', 'amount': '0.01', 'price': '40000', 'clientOrderId': 'бот-1'}
+
+
+class CodecTestCase(unittest.TestCase):
+    codecs = [JsonCodec()]
+    if orjson is not None:
+        codecs.append(OrjsonCodec())
+    if msgspec is not None:
+        codecs.append(MsgspecJsonCodec())
+
+    def test_round_trip(self):
+        for codec in self.codecs:
+            encoded = codec.dumps(BODY)
+            self.assertIsInstance(encoded, bytes, codec.name)
+            self.assertEqual(json.loads(encoded), BODY, codec.name)
+            self.assertEqual(codec.loads(encoded), BODY, codec.name)
+
+    def test_malformed_input_raises_json_decode_error(self):
+        for codec in self.codecs:
+            with self.assertRaises(json.JSONDecodeError, msg=codec.name):
+                codec.loads(b'<html>502 Bad Gateway</html>')
+
+    @unittest.skipIf(orjson is None, 'requires orjson')
+    def test_orjson_falls_back_to_the_stdlib_for_big_integers(self):
+        self.assertEqual(json.loads(OrjsonCodec().dumps({'id': 2**70})), {'id': 2**70})
+
+    @unittest.skipIf(msgspec is None, 'requires msgspec')
+    def test_msgspec_falls_back_to_the_stdlib_for_values_it_refuses(self):
+        codec = MsgspecJsonCodec()
+        with mock.patch.object(codec, '_encoder', mock.Mock(encode=mock.Mock(side_effect=OverflowError))):
+            self.assertEqual(json.loads(codec.dumps({'id': 2**70})), {'id': 2**70})
+
+    def test_non_finite_floats_are_encoded_as_null(self):
+        body = {'price': float('nan'), 'levels': [1.5, float('inf'), (float('-inf'),)]}
+        for codec in self.codecs:
+            self.assertEqual(json.loads(codec.dumps(body)), {'price': None, 'levels': [1.5, None, [None]]}, codec.name)
+
+    def test_other_stdlib_value_errors_are_raised(self):
+        body = []
+        body.append(body)
+        with self.assertRaises(ValueError):
+            JsonCodec().dumps(body)
+
+    def test_default_codec_falls_back_in_order(self):
+        with mock.patch.object(json_codec, 'orjson', None), mock.patch.object(json_codec, 'msgspec', None):
+            self.assertIs(type(default_json_codec()), JsonCodec)
+        if msgspec is not None:
+            with mock.patch.object(json_codec, 'orjson', None):
+                self.assertIsInstance(default_json_codec(), MsgspecJsonCodec)
+        if orjson is not None:
+            self.assertIsInstance(default_json_codec(), OrjsonCodec)
+
+
+class HttpClientCodecTestCase(unittest.TestCase):
+    def test_request_bodies_are_encoded_with_the_codec(self):
+        requests = []
+
+        class RecordingCodec(JsonCodec):
+            def dumps(self, obj):
+                requests.append(obj)
+                return super().dumps(obj)
+
+        def handler(request):
+            self.assertEqual(request.headers['content-type'], 'application/json')
+            self.assertEqual(json.loads(request.content), BODY)
+            return httpx.Response(200, json={})
+
+        client = HttpClient(
+            httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+            base_timeout=lambda: 10,
+            base_headers=lambda: {},
+            base_url=lambda: 'https://whitebit.test',
+            json_codec=RecordingCodec(),
+        )
+        self.assertEqual(client.request('api/v4/order/new', method='POST', json=BODY).status_code, 200)
+        self.assertEqual(requests, [BODY])
+
+    def test_error_bodies_are_decoded_with_the_codec(self):
+        decoded = []
+
+        class RecordingCodec(JsonCodec):
+            def loads(self, data):
+                decoded.append(data)
+                return super().loads(data)
+
+        def handler(request):
+            return httpx.Response(503, json={'message': 'maintenance'})
+
+        client = WhitebitApi(
+            environment=WhitebitApiEnvironment(base='https://whitebit.test', production='', eu=''),
+            txc_apikey='key',
+            token='token',
+            json_codec=RecordingCodec(),
+            httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+        with self.assertRaises(ApiError) as error:
+            client.public_api_v4.server_time(request_options={'max_retries': 0})
+        self.assertEqual(error.exception.body, {'message': 'maintenance'})
+        self.assertEqual(len(decoded), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import typing
+import unittest
+
+import pydantic
+
+from whitebit.core.lazy_response import LazyDict, LazyList, LazyModel, lazy_parse_obj_as
+from whitebit.core.pydantic_utilities import parse_obj_as
+from whitebit.types.candles_response import CandlesResponse
+from whitebit.types.sub_account_api_key_list import SubAccountApiKeyList
+from whitebit.types.sub_account_api_key_list_access_endpoints_item import SubAccountApiKeyListAccessEndpointsItem
+
+API_KEY = {
+    'subAccountId': 'a5c5a1f2',
+    'id': '17',
+    'isEnabled': True,
+    'apiKey': 'public-key',
+    'lastActivity': 1700000000,
+    'accessEndpoints': [{'name': 'trade', 'title': 'Spot trading'}],
+}
+
+
+class LazyModelTestCase(unittest.TestCase):
+    def test_aliased_fields_under_model_names(self):
+        key = lazy_parse_obj_as(SubAccountApiKeyList, API_KEY)
+        self.assertIsInstance(key, LazyModel)
+        self.assertEqual(key.sub_account_id, 'a5c5a1f2')
+        self.assertIs(key.is_enabled, True)
+        self.assertEqual(key.last_activity, 1700000000)
+
+    def test_nested_models_and_lists(self):
+        key = lazy_parse_obj_as(SubAccountApiKeyList, API_KEY)
+        endpoints = key.access_endpoints
+        self.assertIsInstance(endpoints, LazyList)
+        # Items are validated into their model on first access
+        self.assertEqual(endpoints[0], SubAccountApiKeyListAccessEndpointsItem(name='trade', title='Spot trading'))
+        self.assertEqual(key.to_model(), parse_obj_as(SubAccountApiKeyList, API_KEY))
+
+    def test_missing_optional_fields_get_their_default(self):
+        key = lazy_parse_obj_as(SubAccountApiKeyList, API_KEY)
+        self.assertIsNone(key.api_secret)
+        with self.assertRaises(AttributeError):
+            key.unknown_field
+
+    def test_missing_required_fields_raise(self):
+        response = lazy_parse_obj_as(CandlesResponse, {'id': 1})
+        self.assertEqual(response.id, 1)
+        with self.assertRaises(AttributeError):
+            response.result
+        # As validating the whole model would have
+        with self.assertRaises(pydantic.ValidationError):
+            response.to_model()
+
+
+class LazyCollectionsTestCase(unittest.TestCase):
+    def test_list_validates_items_on_first_access(self):
+        keys = lazy_parse_obj_as(typing.List[SubAccountApiKeyList], [API_KEY, {**API_KEY, 'id': '18'}])
+        self.assertIsInstance(keys, LazyList)
+        self.assertEqual(len(keys), 2)
+        self.assertIs(keys[1], keys[1])
+        self.assertEqual([key.id for key in keys[:2]], ['17', '18'])
+        self.assertEqual(keys.raw[0], API_KEY)
+
+    def test_dict_validates_values_on_first_access(self):
+        keys = lazy_parse_obj_as(typing.Dict[str, SubAccountApiKeyList], {'main': API_KEY})
+        self.assertIsInstance(keys, LazyDict)
+        self.assertIn('main', keys)
+        self.assertEqual(keys['main'], parse_obj_as(SubAccountApiKeyList, API_KEY))
+        self.assertEqual(list(keys), ['main'])
+
+
+if __name__ == '__main__':
+    unittest.main()
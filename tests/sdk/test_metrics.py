@@ -0,0 +1,80 @@
+import random
+import unittest
+
+from whitebit.core.metrics import LatencyHistogram, MetricsCollector
+from whitebit.core.timing import RequestTiming
+
+
+def timing(path, status_code, total, attempts=1):
+    record = RequestTiming('GET', path, [])
+    record.status_code = status_code
+    record.attempts = attempts
+    record.total = total
+    return record
+
+
+class LatencyHistogramTestCase(unittest.TestCase):
+    def test_percentiles_are_within_bucket_precision(self):
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(-4, 1) for _ in range(10_000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+        for percent in (50, 90, 99, 99.9):
+            expected = values[int(len(values) * percent / 100 + 0.5) - 1]
+            # Buckets hold 1/64 of their power of two, plus the microsecond resolution
+            self.assertAlmostEqual(histogram.percentile(percent), expected, delta=expected / 64 + 1e-6)
+        self.assertEqual(histogram.count, 10_000)
+        self.assertEqual((histogram.min, histogram.max), (values[0], values[-1]))
+
+    def test_cumulative_counts_never_exceed_their_bound(self):
+        histogram = LatencyHistogram()
+        for seconds in (0.004, 0.00505, 0.009, 0.2):
+            histogram.record(seconds)
+        # 0.00505 shares its bucket, from 4992 to 5055 microseconds, with 0.005: it counts above 5 ms
+        self.assertEqual(histogram.cumulative_counts([0.005, 0.01, 0.1, 1.0]), [1, 3, 3, 4])
+
+    def test_merge(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(0.01)
+        second.record(0.03)
+        first.merge(second)
+        self.assertEqual((first.count, first.min, first.max), (2, 0.01, 0.03))
+        self.assertAlmostEqual(first.mean, 0.02)
+
+
+class MetricsCollectorTestCase(unittest.TestCase):
+    def test_calls_are_aggregated_per_route_and_status_class(self):
+        collector = MetricsCollector()
+        collector(timing('api/v4/public/orderbook/BTC_USDT', 200, 0.02))
+        collector(timing('api/v4/public/orderbook/ETH_USDT', 200, 0.04, attempts=2))
+        collector(timing('api/v4/public/orderbook/ETH_USDT', 503, 0.5))
+        snapshot = collector.snapshot()
+        orderbook = snapshot.get('api/v4/public/orderbook/{market}', '2xx')
+        self.assertEqual((orderbook.requests, orderbook.retries), (2, 1))
+        self.assertEqual(snapshot.get('api/v4/public/orderbook/{market}').requests, 3)
+        self.assertEqual(snapshot.totals().latency.count, 3)
+
+    def test_prometheus_text_format(self):
+        collector = MetricsCollector(namespace='sdk', buckets=(0.01, 0.1))
+        collector(timing('api/v4/public/ticker', 200, 0.05))
+        lines = collector.prometheus().splitlines()
+        self.assertIn('# TYPE sdk_requests_total counter', lines)
+        self.assertIn('sdk_requests_total{endpoint="api/v4/public/ticker",status_class="2xx"} 1', lines)
+        self.assertIn('# TYPE sdk_request_duration_seconds histogram', lines)
+        labels = 'endpoint="api/v4/public/ticker",status_class="2xx"'
+        self.assertIn(f'sdk_request_duration_seconds_bucket{{{labels},le="0.01"}} 0', lines)
+        self.assertIn(f'sdk_request_duration_seconds_bucket{{{labels},le="0.1"}} 1', lines)
+        self.assertIn(f'sdk_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1', lines)
+        self.assertIn(f'sdk_request_duration_seconds_sum{{{labels}}} 0.05', lines)
+        self.assertIn(f'sdk_request_duration_seconds_count{{{labels}}} 1', lines)
+
+    def test_reset(self):
+        collector = MetricsCollector()
+        collector(timing('api/v4/public/ticker', 200, 0.05))
+        self.assertEqual(len(collector.snapshot(reset=True).endpoints), 1)
+        self.assertEqual(collector.snapshot().endpoints, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,218 @@
+import asyncio
+import json
+import threading
+import unittest
+
+import httpx
+
+from whitebit import AsyncWhitebitApi, WhitebitApi, WhitebitApiEnvironment
+from whitebit.core.pagination import aiter_offset_pages, iter_offset_pages, page_items
+
+
+def records(offset, limit, total):
+    return list(range(offset, min(offset + limit, total)))
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+class PageItemsTestCase(unittest.TestCase):
+    def test_reads_models_and_raw_json(self):
+        class Page:
+            data = [1, 2]
+
+        self.assertEqual(page_items(Page(), 'data'), [1, 2])
+        self.assertEqual(page_items({'data': [3]}, 'data'), [3])
+        self.assertEqual(page_items({'data': None}, 'data'), [])
+        self.assertEqual(page_items(object(), 'data'), [])
+
+
+class IterOffsetPagesTestCase(unittest.TestCase):
+    def test_stops_at_the_first_short_page(self):
+        for prefetch in (True, False):
+            calls = []
+
+            def fetch_page(offset, limit):
+                calls.append((offset, limit))
+                return records(offset, limit, 7)
+
+            items = list(iter_offset_pages(fetch_page, page_size=3, offset=0, prefetch=prefetch))
+            self.assertEqual(items, list(range(7)))
+            self.assertEqual(calls, [(0, 3), (3, 3), (6, 3)])
+
+    def test_an_exactly_full_last_page_costs_one_empty_page(self):
+        calls = []
+
+        def fetch_page(offset, limit):
+            calls.append(offset)
+            return records(offset, limit, 6)
+
+        self.assertEqual(list(iter_offset_pages(fetch_page, page_size=3, offset=0)), list(range(6)))
+        self.assertEqual(calls, [0, 3, 6])
+
+    def test_starts_at_the_given_offset(self):
+        items = list(iter_offset_pages(lambda offset, limit: records(offset, limit, 5), page_size=2, offset=3))
+        self.assertEqual(items, [3, 4])
+
+    def test_next_page_is_requested_before_the_current_one_is_consumed(self):
+        requested = threading.Event()
+
+        def fetch_page(offset, limit):
+            if offset == 2:
+                requested.set()
+            return records(offset, limit, 3)
+
+        iterator = iter_offset_pages(fetch_page, page_size=2)
+        self.assertEqual(next(iterator), 0)
+        self.assertTrue(requested.wait(5))
+        self.assertEqual(list(iterator), [1, 2])
+
+    def test_without_prefetch_pages_are_requested_on_demand(self):
+        calls = []
+
+        def fetch_page(offset, limit):
+            calls.append(offset)
+            return records(offset, limit, 10)
+
+        iterator = iter_offset_pages(fetch_page, page_size=2, prefetch=False)
+        self.assertEqual(next(iterator), 0)
+        self.assertEqual(calls, [0])
+        iterator.close()
+
+    def test_closing_early_discards_the_pending_page(self):
+        release = threading.Event()
+        calls = []
+
+        def fetch_page(offset, limit):
+            calls.append(offset)
+            if offset > 0:
+                release.wait(5)
+            return records(offset, limit, 100)
+
+        iterator = iter_offset_pages(fetch_page, page_size=2)
+        self.assertEqual(next(iterator), 0)
+        iterator.close()
+        release.set()
+        self.assertLessEqual(len(calls), 2)
+
+    def test_errors_of_a_page_reach_the_caller(self):
+        def fetch_page(offset, limit):
+            if offset > 0:
+                raise RuntimeError('page failed')
+            return records(offset, limit, 10)
+
+        iterator = iter_offset_pages(fetch_page, page_size=2)
+        self.assertEqual([next(iterator), next(iterator)], [0, 1])
+        with self.assertRaises(RuntimeError):
+            next(iterator)
+
+    def test_invalid_page_size(self):
+        with self.assertRaises(ValueError):
+            list(iter_offset_pages(lambda offset, limit: [], page_size=0))
+
+
+class AiterOffsetPagesTestCase(unittest.TestCase):
+    def test_stops_at_the_first_short_page(self):
+        for prefetch in (True, False):
+            calls = []
+
+            async def fetch_page(offset, limit):
+                calls.append(offset)
+                return records(offset, limit, 5)
+
+            items = asyncio.run(collect(aiter_offset_pages(fetch_page, page_size=2, prefetch=prefetch)))
+            self.assertEqual(items, list(range(5)))
+            self.assertEqual(calls, [0, 2, 4])
+
+    def test_next_page_is_requested_before_the_current_one_is_consumed(self):
+        calls = []
+
+        async def fetch_page(offset, limit):
+            calls.append(offset)
+            return records(offset, limit, 3)
+
+        async def run():
+            iterator = aiter_offset_pages(fetch_page, page_size=2)
+            first = await iterator.__anext__()
+            await asyncio.sleep(0)
+            seen = list(calls)
+            rest = await collect(iterator)
+            return first, seen, rest
+
+        first, seen, rest = asyncio.run(run())
+        self.assertEqual(first, 0)
+        self.assertEqual(seen, [0, 2])
+        self.assertEqual(rest, [1, 2])
+
+    def test_closing_early_cancels_the_pending_page(self):
+        cancelled = []
+
+        async def fetch_page(offset, limit):
+            if offset > 0:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(offset)
+                    raise
+            return records(offset, limit, 100)
+
+        async def run():
+            iterator = aiter_offset_pages(fetch_page, page_size=2)
+            first = await iterator.__anext__()
+            await asyncio.sleep(0)
+            await iterator.aclose()
+            await asyncio.sleep(0)
+            return first
+
+        self.assertEqual(asyncio.run(asyncio.wait_for(run(), 5)), 0)
+        self.assertEqual(cancelled, [2])
+
+
+def codes_history_handler(total):
+    requested = []
+
+    def handler(request):
+        body = json.loads(request.content)
+        requested.append((body['offset'], body['limit']))
+        data = [{'code': str(index)} for index in records(body['offset'], body['limit'], total)]
+        return httpx.Response(200, json={'data': data, 'limit': body['limit'], 'offset': body['offset']})
+
+    return handler, requested
+
+
+def environment():
+    return WhitebitApiEnvironment(base='https://whitebit.test', production='', eu='')
+
+
+class ClientIterTestCase(unittest.TestCase):
+    def test_iter_codes_history_walks_the_pages(self):
+        handler, requested = codes_history_handler(5)
+        client = WhitebitApi(
+            environment=environment(),
+            txc_apikey='key',
+            token='token',
+            httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+        codes = [code.code for code in client.codes.iter_codes_history(page_size=2)]
+        self.assertEqual(codes, ['0', '1', '2', '3', '4'])
+        self.assertEqual(requested, [(0, 2), (2, 2), (4, 2)])
+
+    def test_async_iter_codes_history_walks_the_pages(self):
+        handler, requested = codes_history_handler(3)
+
+        async def run():
+            client = AsyncWhitebitApi(
+                environment=environment(),
+                txc_apikey='key',
+                token='token',
+                httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            )
+            return [code.code async for code in client.codes.iter_codes_history(page_size=2, offset=1)]
+
+        self.assertEqual(asyncio.run(asyncio.wait_for(run(), 5)), ['1', '2'])
+        self.assertEqual(requested, [(1, 2), (3, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
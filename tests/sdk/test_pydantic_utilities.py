@@ -0,0 +1,74 @@
+import typing
+import unittest
+from unittest import mock
+
+import pydantic
+
+from whitebit import AsyncWhitebitApi, WhitebitApi
+from whitebit.core import pydantic_utilities
+from whitebit.core.pydantic_utilities import (
+    IS_PYDANTIC_V2,
+    construct_obj_as,
+    get_type_adapter,
+    parse_obj_as,
+    warm_type_adapters,
+)
+from whitebit.types.sub_account_api_key_list import SubAccountApiKeyList
+
+API_KEY = {
+    'subAccountId': 'a5c5a1f2',
+    'id': '17',
+    'isEnabled': True,
+    'apiKey': 'public-key',
+    'lastActivity': 1700000000,
+    'accessEndpoints': [{'name': 'trade', 'title': 'Spot trading'}],
+}
+
+
+@unittest.skipUnless(IS_PYDANTIC_V2, 'TypeAdapters are Pydantic V2 only')
+class TypeAdapterRegistryTestCase(unittest.TestCase):
+    def test_adapters_are_built_once_per_type(self):
+        type_ = typing.List[SubAccountApiKeyList]
+        self.assertIs(get_type_adapter(type_), get_type_adapter(typing.List[SubAccountApiKeyList]))
+
+    def test_parse_obj_as_reuses_the_adapter(self):
+        type_ = typing.Dict[str, SubAccountApiKeyList]
+        parse_obj_as(type_, {'main': API_KEY})
+        with mock.patch.object(pydantic, 'TypeAdapter', side_effect=AssertionError('adapter rebuilt')):
+            parsed = parse_obj_as(type_, {'main': API_KEY})
+        self.assertEqual(parsed['main'].api_key, 'public-key')
+
+    def test_warm_type_adapters(self):
+        type_ = typing.Optional[typing.List[SubAccountApiKeyList]]
+        pydantic_utilities._TYPE_ADAPTERS.pop(type_, None)
+        warm_type_adapters([type_])
+        self.assertIn(type_, pydantic_utilities._TYPE_ADAPTERS)
+
+    def test_clients_warm_the_given_types(self):
+        type_ = typing.Dict[str, SubAccountApiKeyList]
+        pydantic_utilities._TYPE_ADAPTERS.pop(type_, None)
+        WhitebitApi(txc_apikey='key', token='token', warm_types=[type_])
+        self.assertIn(type_, pydantic_utilities._TYPE_ADAPTERS)
+        pydantic_utilities._TYPE_ADAPTERS.pop(type_, None)
+        AsyncWhitebitApi(txc_apikey='key', token='token', warm_types=[type_])
+        self.assertIn(type_, pydantic_utilities._TYPE_ADAPTERS)
+
+
+class ConstructObjAsTestCase(unittest.TestCase):
+    def test_matches_validation_for_aliased_nested_models(self):
+        type_ = typing.List[SubAccountApiKeyList]
+        constructed = construct_obj_as(type_, [API_KEY, API_KEY])
+        self.assertEqual(constructed, parse_obj_as(type_, [API_KEY, API_KEY]))
+        self.assertEqual(constructed[0].sub_account_id, 'a5c5a1f2')
+        self.assertEqual(constructed[0].access_endpoints[0].title, 'Spot trading')
+
+    def test_dealiases_the_payload_once(self):
+        convert = pydantic_utilities.convert_and_respect_annotation_metadata
+        with mock.patch.object(pydantic_utilities, 'convert_and_respect_annotation_metadata',
+                               side_effect=convert) as spy:
+            construct_obj_as(typing.List[SubAccountApiKeyList], [API_KEY, API_KEY])
+        self.assertEqual(spy.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
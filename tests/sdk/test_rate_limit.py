@@ -0,0 +1,101 @@
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+import httpx
+
+from whitebit.core.http_client import AsyncHttpClient
+from whitebit.core.rate_limit import RateLimit, RateLimiter, SlidingWindow
+
+
+class SlidingWindowTestCase(unittest.TestCase):
+    def test_slots_queue_behind_the_limit(self):
+        window = SlidingWindow(RateLimit(3, 10.0))
+        self.assertEqual([window.reserve(100.0) for _ in range(3)], [100.0, 100.0, 100.0])
+        # The fourth and fifth requests wait for the first and second slots to leave the window
+        self.assertEqual(window.reserve(101.0), 110.0)
+        self.assertEqual(window.reserve(101.0), 110.0)
+        self.assertEqual(window.reserve(115.0), 115.0)
+
+    def test_headroom(self):
+        window = SlidingWindow(RateLimit(3, 10.0))
+        window.reserve(100.0)
+        window.reserve(105.0)
+        self.assertEqual(window.headroom(106.0), 1)
+        self.assertEqual(window.headroom(111.0), 2)
+        self.assertEqual(window.headroom(116.0), 3)
+
+
+class RateLimiterTestCase(unittest.TestCase):
+    def test_endpoint_groups(self):
+        limiter = RateLimiter()
+        self.assertEqual(limiter.get_limit('/api/v4/public/orderbook/BTC_USDT'), RateLimit(600, 10.0))
+        # The longest matching prefix wins
+        self.assertEqual(limiter.get_limit('api/v4/public/orderbook/depth/BTC_USDT'), RateLimit(2000, 10.0))
+        self.assertEqual(limiter.get_limit('api/v4/order/new'), RateLimit(10000, 10.0))
+        self.assertIsNone(limiter.get_limit('api/v4/unknown'))
+
+    def test_paths_of_a_group_share_its_window(self):
+        limiter = RateLimiter(overrides={'api/v4/public/orderbook/': RateLimit(2, 1.0)})
+        with mock.patch('whitebit.core.rate_limit.time.monotonic', return_value=50.0):
+            delays = [
+                limiter.acquire_delay(path)
+                for path in ('api/v4/public/orderbook/BTC_USDT', 'api/v4/public/orderbook/ETH_USDT',
+                             'api/v4/public/orderbook/XRP_USDT')
+            ]
+            # Another group is not held back
+            self.assertEqual(limiter.acquire_delay('api/v4/public/orderbook/depth/BTC_USDT'), 0.0)
+            self.assertEqual(limiter.headroom('api/v4/public/orderbook/BTC_USDT'), 0)
+        self.assertEqual(delays, [0.0, 0.0, 1.0])
+
+    def test_utilization_and_default(self):
+        limiter = RateLimiter(
+            overrides={'api/v4/order/new': RateLimit(10, 1.0), 'api/v4/order/cancel': None},
+            default=RateLimit(100, 1.0),
+            utilization=0.5,
+        )
+        self.assertEqual(limiter.get_limit('api/v4/order/new'), RateLimit(5, 1.0))
+        self.assertIsNone(limiter.get_limit('api/v4/order/cancel'))
+        self.assertEqual(limiter.get_limit('api/v4/unknown'), RateLimit(50, 1.0))
+        self.assertEqual(limiter.acquire_delay(None), 0.0)
+
+    def test_snapshot(self):
+        limiter = RateLimiter(overrides={'api/v4/order/new': RateLimit(10, 1.0)})
+        limiter.acquire_delay('api/v4/order/new')
+        self.assertEqual(limiter.snapshot(), {'api/v4/order/new': 9})
+
+
+class AsyncRateLimitingTestCase(unittest.TestCase):
+    def test_concurrent_requests_are_spread_over_the_window(self):
+        sent_at = []
+
+        def handler(request):
+            sent_at.append(time.monotonic())
+            return httpx.Response(200, json={})
+
+        async def run():
+            client = AsyncHttpClient(
+                httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                base_timeout=lambda: 10,
+                base_headers=lambda: {},
+                base_url=lambda: 'https://whitebit.test',
+                rate_limiter=RateLimiter(overrides={'api/v4/order/new': RateLimit(2, 0.2)}),
+            )
+            started = time.monotonic()
+            await asyncio.gather(
+                *(client.request('api/v4/order/new', method='POST', json={}) for _ in range(5))
+            )
+            return started
+
+        started = asyncio.run(run())
+        offsets = sorted(at - started for at in sent_at)
+        self.assertEqual(len(offsets), 5)
+        # Two requests right away, two once they leave the window, the last one a window later
+        self.assertLess(offsets[1], 0.1)
+        self.assertGreaterEqual(offsets[2], 0.19)
+        self.assertGreaterEqual(offsets[4], 0.39)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+from unittest import mock
+
+import httpx
+
+from whitebit.core.http_client import HttpClient
+from whitebit.core.response_cache import ResponseCache
+
+
+def response(size):
+    return httpx.Response(200, content=b'x' * size)
+
+
+class ResponseCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch('whitebit.core.response_cache.time.monotonic', return_value=100.0)
+        self.clock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_ttls(self):
+        cache = ResponseCache(ttls={'api/v4/public/ticker': 5.0, 'api/v4/public/markets': None})
+        self.assertEqual(cache.get_ttl('/api/v4/public/ticker'), 5.0)
+        self.assertEqual(cache.get_ttl('api/v4/public/orderbook/BTC_USDT'), 0.1)
+        self.assertEqual(cache.get_ttl('api/v4/public/orderbook/depth/BTC_USDT'), 1.0)
+        self.assertIsNone(cache.get_ttl('api/v4/public/markets'))
+        self.assertIsNone(cache.get_ttl('api/v4/order/new'))
+
+    def test_entries_expire(self):
+        cache = ResponseCache()
+        cache.set('ticker', response(10), 1.0)
+        self.clock.return_value = 100.9
+        self.assertIsNotNone(cache.get('ticker'))
+        self.clock.return_value = 101.0
+        self.assertIsNone(cache.get('ticker'))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1, 'evictions': 0, 'entries': 0, 'bytes': 0})
+
+    def test_least_recently_used_entry_is_evicted_beyond_max_entries(self):
+        cache = ResponseCache(max_entries=2)
+        cache.set('a', response(1), 10.0)
+        cache.set('b', response(1), 10.0)
+        cache.get('a')
+        cache.set('c', response(1), 10.0)
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNotNone(cache.get('c'))
+        self.assertEqual(cache.evictions, 1)
+
+    def test_least_recently_used_entries_are_evicted_beyond_max_bytes(self):
+        cache = ResponseCache(max_bytes=100)
+        cache.set('a', response(40), 10.0)
+        cache.set('b', response(40), 10.0)
+        cache.get('a')
+        cache.set('c', response(40), 10.0)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.size, 80)
+        # A response larger than the whole cache is not cached, nor evicts anything
+        cache.set('d', response(101), 10.0)
+        self.assertIsNone(cache.get('d'))
+        self.assertEqual(len(cache), 2)
+
+    def test_replacing_an_entry_updates_the_size(self):
+        cache = ResponseCache()
+        cache.set('a', response(40), 10.0)
+        cache.set('a', response(10), 10.0)
+        self.assertEqual(cache.size, 10)
+        cache.clear()
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+
+class HttpClientCacheTestCase(unittest.TestCase):
+    def test_get_responses_are_served_from_the_cache(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={'BTC_USDT': {'last_price': '30000'}})
+
+        client = HttpClient(
+            httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+            base_timeout=lambda: 10,
+            base_headers=lambda: {},
+            base_url=lambda: 'https://whitebit.test',
+            response_cache=ResponseCache(),
+        )
+        first = client.request('api/v4/public/ticker', method='GET')
+        second = client.request('api/v4/public/ticker', method='GET')
+        client.request('api/v4/public/orderbook/BTC_USDT', method='GET', params={'limit': 5})
+        client.request('api/v4/public/orderbook/BTC_USDT', method='GET', params={'limit': 10})
+        self.assertIs(second, first)
+        # Requests differing in their query are cached apart
+        self.assertEqual(len(requests), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,243 @@
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+import httpx
+
+from whitebit.core.http_client import AsyncHttpClient, HttpClient
+from whitebit.core.rate_limit import RateLimiter
+from whitebit.core.retry import RetryBudget, RetryState, classify_request
+from whitebit.core.signing import RequestSigner
+
+
+def build_client(handler, retry_budget=None):
+    return HttpClient(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        base_timeout=lambda: 10,
+        base_headers=lambda: {},
+        base_url=lambda: 'https://whitebit.test',
+        retry_budget=retry_budget,
+    )
+
+
+def failing_handler(statuses):
+    '''Answers with the given statuses in turn, then 200, recording the requests'''
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        status = statuses[len(requests) - 1] if len(requests) <= len(statuses) else 200
+        # Retry-After: 0 keeps the backoff out of the tests
+        return httpx.Response(status, json={}, headers={'retry-after': '0'})
+
+    return handler, requests
+
+
+class ClassifyRequestTestCase(unittest.TestCase):
+    def test_classes(self):
+        self.assertEqual(classify_request('GET', 'api/v4/public/ticker'), 'safe')
+        self.assertEqual(classify_request('POST', '/api/v4/trade-account/balance'), 'idempotent')
+        self.assertEqual(classify_request('POST', 'api/v4/order/new'), 'unsafe')
+        self.assertEqual(classify_request('POST', None), 'unsafe')
+
+
+class RetryStateTestCase(unittest.TestCase):
+    def test_retries_per_idempotency_class(self):
+        server_error = httpx.Response(503, headers={'retry-after': '0'})
+        rate_limited = httpx.Response(429, headers={'retry-after': '0'})
+        read_error = httpx.ReadError('connection reset')
+        connect_error = httpx.ConnectError('connection refused')
+        cases = {
+            'safe': (True, True, True, True),
+            'idempotent': (True, True, True, True),
+            # Orders and the like may have been executed, unless rejected by the rate limit or never sent
+            'unsafe': (False, True, False, True),
+        }
+        for idempotency, expected in cases.items():
+            actual = tuple(
+                RetryState(max_retries=2, idempotency=idempotency, budget=None).next_delay(**outcome) is not None
+                for outcome in (
+                    {'response': server_error},
+                    {'response': rate_limited},
+                    {'error': read_error},
+                    {'error': connect_error},
+                )
+            )
+            self.assertEqual(actual, expected, idempotency)
+
+    def test_client_errors_are_not_retried(self):
+        state = RetryState(max_retries=2, idempotency='safe', budget=None)
+        self.assertIsNone(state.next_delay(response=httpx.Response(400)))
+
+    def test_max_retries(self):
+        state = RetryState(max_retries=2, idempotency='safe', budget=None)
+        response = httpx.Response(503, headers={'retry-after': '0'})
+        self.assertEqual([state.next_delay(response=response) for _ in range(3)], [0, 0, None])
+
+    def test_retry_after_header(self):
+        state = RetryState(max_retries=1, idempotency='safe', budget=None)
+        self.assertEqual(state.next_delay(response=httpx.Response(429, headers={'retry-after': '3'})), 3)
+
+
+class RetryBudgetTestCase(unittest.TestCase):
+    def test_exhaustion(self):
+        budget = RetryBudget(retry_ratio=0.5, min_retries_per_second=0, max_tokens=2)
+        self.assertEqual([budget.try_acquire() for _ in range(3)], [True, True, False])
+        self.assertEqual((budget.retries_allowed, budget.retries_rejected), (2, 1))
+        # Two requests earn one more retry
+        budget.record_request()
+        budget.record_request()
+        self.assertTrue(budget.try_acquire())
+        self.assertFalse(budget.try_acquire())
+
+    def test_exhausted_budget_returns_the_response(self):
+        budget = RetryBudget(retry_ratio=0, min_retries_per_second=0, max_tokens=1)
+        handler, requests = failing_handler([503, 503, 503])
+        client = build_client(handler, retry_budget=budget)
+        response = client.request('api/v4/public/ticker', method='GET', request_options={'max_retries': 5})
+        self.assertEqual(response.status_code, 503)
+        # The one token in the bucket paid for a single retry
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(budget.retries_rejected, 1)
+
+
+class HttpClientRetryTestCase(unittest.TestCase):
+    def test_safe_request_is_retried_on_server_errors(self):
+        handler, requests = failing_handler([502, 503])
+        response = build_client(handler).request(
+            'api/v4/public/ticker', method='GET', request_options={'max_retries': 3}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(requests), 3)
+
+    def test_idempotent_post_is_retried_on_server_errors(self):
+        handler, requests = failing_handler([500])
+        response = build_client(handler).request(
+            'api/v4/trade-account/balance', method='POST', json={}, request_options={'max_retries': 3}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(requests), 2)
+
+    def test_unsafe_post_is_not_retried_on_server_errors(self):
+        handler, requests = failing_handler([500])
+        response = build_client(handler).request(
+            'api/v4/order/new', method='POST', json={'market': 'BTC_USDT'}, request_options={'max_retries': 3}
+        )
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(len(requests), 1)
+
+    def test_unsafe_post_is_retried_when_rate_limited(self):
+        handler, requests = failing_handler([429, 429])
+        response = build_client(handler).request(
+            'api/v4/order/new', method='POST', json={'market': 'BTC_USDT'}, request_options={'max_retries': 3}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(requests), 3)
+
+    def test_unsafe_post_is_not_retried_after_a_read_error(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            raise httpx.ReadError('connection reset', request=request)
+
+        with self.assertRaises(httpx.ReadError):
+            build_client(handler).request(
+                'api/v4/order/new', method='POST', json={'market': 'BTC_USDT'}, request_options={'max_retries': 3}
+            )
+        self.assertEqual(len(requests), 1)
+
+    def test_idempotency_override(self):
+        handler, requests = failing_handler([500])
+        response = build_client(handler).request(
+            'api/v4/order/new',
+            method='POST',
+            json={'market': 'BTC_USDT', 'clientOrderId': 'bot-1'},
+            request_options={'max_retries': 3, 'idempotency': 'idempotent'},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(requests), 2)
+
+    def test_retries_already_spent_count_against_max_retries(self):
+        handler, requests = failing_handler([503, 503, 503])
+        response = build_client(handler).request(
+            'api/v4/public/ticker', method='GET', request_options={'max_retries': 3}, retries=2
+        )
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(requests), 2)
+
+    def test_stream_is_retried_under_the_same_policy(self):
+        handler, requests = failing_handler([503])
+        client = build_client(handler)
+        with client.stream('api/v4/public/ticker', method='GET', request_options={'max_retries': 3}) as response:
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(requests), 2)
+
+        handler, requests = failing_handler([500])
+        client = build_client(handler)
+        with client.stream(
+            'api/v4/order/new', method='POST', json={'market': 'BTC_USDT'}, request_options={'max_retries': 3}
+        ) as response:
+            self.assertEqual(response.status_code, 500)
+        self.assertEqual(len(requests), 1)
+
+
+class StreamTestCase(unittest.TestCase):
+    def test_every_attempt_is_rate_limited_signed_and_timed(self):
+        handler, requests = failing_handler([429])
+        limiter = RateLimiter()
+        records = []
+        client = HttpClient(
+            httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+            base_timeout=lambda: 10,
+            base_headers=lambda: {},
+            base_url=lambda: 'https://whitebit.test',
+            rate_limiter=limiter,
+            signer=RequestSigner(api_key='key', api_secret='secret', nonce_factory=iter(range(1, 10)).__next__),
+            timing_observers=[records.append],
+        )
+        with mock.patch.object(limiter, 'acquire', wraps=limiter.acquire) as acquire:
+            with client.stream(
+                'api/v4/trade-account/balance',
+                method='POST',
+                json={'ticker': 'BTC'},
+                request_options={'max_retries': 2},
+            ) as response:
+                self.assertEqual(response.read(), b'{}')
+                self.assertEqual(records, [])
+        self.assertEqual(acquire.call_count, 2)
+        # Each attempt was signed with a fresh nonce
+        self.assertEqual([json.loads(request.content)['nonce'] for request in requests], [1, 2])
+        self.assertTrue(all('X-TXC-SIGNATURE' in request.headers for request in requests))
+        (record,) = records
+        self.assertEqual((record.status_code, record.attempts, record.rate_limited), (200, 2, 1))
+        self.assertEqual(record.response_bytes, 2)
+        self.assertIsNone(record.error)
+
+    def test_async_stream_records_transport_errors(self):
+        records = []
+
+        def handler(request):
+            raise httpx.ConnectError('connection refused', request=request)
+
+        async def run():
+            client = AsyncHttpClient(
+                httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                base_timeout=lambda: 10,
+                base_headers=lambda: {},
+                base_url=lambda: 'https://whitebit.test',
+                timing_observers=[records.append],
+            )
+            async with client.stream('api/v4/public/ticker', method='GET'):
+                pass
+
+        with self.assertRaises(httpx.ConnectError):
+            asyncio.run(asyncio.wait_for(run(), 5))
+        (record,) = records
+        self.assertEqual(record.attempts, 1)
+        self.assertIsInstance(record.error, httpx.ConnectError)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import typing
+import unittest
+from unittest import mock
+
+import typing_extensions
+
+from whitebit.core import serialization
+from whitebit.core.serialization import FieldMetadata, convert_and_respect_annotation_metadata
+from whitebit.types.orderbook_response import OrderbookResponse
+from whitebit.types.sub_account_api_key_list import SubAccountApiKeyList
+
+API_KEY = {
+    'subAccountId': 'a5c5a1f2',
+    'isEnabled': True,
+    'accessEndpoints': [{'name': 'trade', 'title': 'Spot trading'}],
+}
+
+
+class TransferParams(typing_extensions.TypedDict):
+    client_order_id: typing_extensions.Annotated[str, FieldMetadata(alias='clientOrderId')]
+    amount: str
+
+
+def convert(object_, annotation, direction='read'):
+    return convert_and_respect_annotation_metadata(object_=object_, annotation=annotation, direction=direction)
+
+
+class ConvertAndRespectAnnotationMetadataTestCase(unittest.TestCase):
+    def test_reads_aliases_of_nested_lists_of_models(self):
+        converted = convert([API_KEY], typing.List[SubAccountApiKeyList])
+        self.assertEqual(converted, [{
+            'sub_account_id': 'a5c5a1f2',
+            'is_enabled': True,
+            'access_endpoints': [{'name': 'trade', 'title': 'Spot trading'}],
+        }])
+        # The payload itself is left as decoded
+        self.assertIn('subAccountId', API_KEY)
+
+    def test_writes_aliases_of_typed_dicts(self):
+        converted = convert({'client_order_id': 'bot-1', 'amount': '1'}, TransferParams, 'write')
+        self.assertEqual(converted, {'clientOrderId': 'bot-1', 'amount': '1'})
+        self.assertEqual(convert(converted, TransferParams), {'client_order_id': 'bot-1', 'amount': '1'})
+
+    def test_annotations_without_aliases_are_not_walked(self):
+        orderbook = {'ticker_id': 'BTC_USDT', 'asks': [['1', '2']] * 100, 'bids': []}
+        self.assertIs(convert(orderbook, OrderbookResponse), orderbook)
+        orderbooks = [orderbook]
+        self.assertIs(convert(orderbooks, typing.List[OrderbookResponse]), orderbooks)
+        self.assertIsNone(serialization._CONVERTERS[(OrderbookResponse, 'read')])
+
+    def test_plans_are_compiled_once_per_annotation_and_direction(self):
+        type_ = typing.Dict[str, SubAccountApiKeyList]
+        convert({'main': API_KEY}, type_)
+        with mock.patch.object(serialization, '_compile_converter', side_effect=AssertionError('recompiled')):
+            converted = convert({'main': API_KEY}, type_)
+        self.assertEqual(converted['main']['sub_account_id'], 'a5c5a1f2')
+        self.assertIn((type_, 'read'), serialization._CONVERTERS)
+        self.assertNotIn((type_, 'write'), serialization._CONVERTERS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,228 @@
+import asyncio
+import threading
+import time
+import unittest
+
+import httpx
+
+from whitebit import WhitebitApi, WhitebitApiEnvironment
+from whitebit.core.sharding import aiter_time_windows, iter_time_windows, record_field
+
+# Three records a second over a minute, as (time, id)
+RECORDS = [(second, index) for second in range(60) for index in range(3)]
+
+
+def window_page(window_start, window_end, offset, limit):
+    matching = [record for record in RECORDS if window_start <= record[0] <= window_end]
+    return matching[offset : offset + limit]
+
+
+def time_key(record):
+    return record[0]
+
+
+async def collect(iterator):
+    return [record async for record in iterator]
+
+
+class RecordFieldTestCase(unittest.TestCase):
+    def test_reads_models_and_raw_json(self):
+        class Record:
+            funding_time = '5'
+
+        self.assertEqual(record_field(Record(), 'funding_time', 'fundingTime'), '5')
+        self.assertEqual(record_field({'fundingTime': '6'}, 'funding_time', 'fundingTime'), '6')
+        self.assertEqual(record_field({'time': 7}, 'time'), 7)
+
+
+class IterTimeWindowsTestCase(unittest.TestCase):
+    def test_merges_the_windows_in_time_order_without_duplicates(self):
+        records = list(iter_time_windows(window_page, start=0, end=59, time_key=time_key, key=lambda r: r, windows=4))
+        self.assertEqual(records, RECORDS)
+
+    def test_windows_are_half_open_without_a_key(self):
+        calls = []
+
+        def fetch_page(window_start, window_end, offset, limit):
+            calls.append((window_start, window_end))
+            return window_page(window_start, window_end, offset, limit)
+
+        records = list(iter_time_windows(fetch_page, start=0, end=59, time_key=time_key, windows=4))
+        self.assertEqual(records, RECORDS)
+        # The requests still overlap, so that fractional times between windows are not missed
+        self.assertEqual(sorted(calls), [(0, 15), (15, 30), (30, 45), (45, 59)])
+
+    def test_fractional_times_between_windows_are_yielded_once(self):
+        records = [(second + 0.5, 0) for second in range(59)]
+
+        def fetch_page(window_start, window_end, offset, limit):
+            matching = [record for record in records if window_start <= record[0] <= window_end]
+            return matching[offset : offset + limit]
+
+        self.assertEqual(list(iter_time_windows(fetch_page, start=0, end=59, time_key=time_key, windows=4)), records)
+
+    def test_records_without_an_identity_are_not_deduplicated(self):
+        def fetch_page(window_start, window_end, offset, limit):
+            page = [{'time': second, 'id': None} for second in range(window_start, window_end + 1) for _ in range(2)]
+            return page[offset : offset + limit]
+
+        records = list(
+            iter_time_windows(
+                fetch_page, start=0, end=9, time_key=lambda r: r['time'], key=lambda r: r['id'], windows=2
+            )
+        )
+        self.assertEqual([record['time'] for record in records], [second for second in range(10) for _ in range(2)])
+
+    def test_full_windows_are_split_rather_than_paginated(self):
+        calls = []
+
+        def fetch_page(window_start, window_end, offset, limit):
+            calls.append((window_start, window_end, offset))
+            return window_page(window_start, window_end, offset, limit)
+
+        records = list(
+            iter_time_windows(fetch_page, start=0, end=59, time_key=time_key, key=lambda r: r, windows=2, page_size=10)
+        )
+        self.assertEqual(records, RECORDS)
+        self.assertIn((0, 15), [(window_start, window_end) for window_start, window_end, _ in calls])
+        # One-second windows hold three records, so nothing needs a second page
+        self.assertEqual({offset for _, _, offset in calls}, {0})
+
+    def test_windows_at_min_window_are_paginated(self):
+        calls = []
+
+        def fetch_page(window_start, window_end, offset, limit):
+            calls.append((window_start, window_end, offset))
+            return window_page(window_start, window_end, offset, limit)
+
+        records = list(
+            iter_time_windows(
+                fetch_page, start=0, end=59, time_key=time_key, key=lambda r: r, windows=2, page_size=10, min_window=60
+            )
+        )
+        self.assertEqual(records, RECORDS)
+        self.assertEqual({(window_start, window_end) for window_start, window_end, _ in calls}, {(0, 30), (30, 59)})
+        self.assertIn(10, {offset for _, _, offset in calls})
+
+    def test_pages_in_flight_stay_within_the_concurrency(self):
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def fetch_page(window_start, window_end, offset, limit):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return window_page(window_start, window_end, offset, limit)
+
+        records = list(
+            iter_time_windows(
+                fetch_page, start=0, end=59, time_key=time_key, key=lambda r: r, windows=8, concurrency=3
+            )
+        )
+        self.assertEqual(records, RECORDS)
+        self.assertLessEqual(max_in_flight, 3)
+        self.assertGreater(max_in_flight, 1)
+
+    def test_earlier_windows_are_released_before_later_ones_complete(self):
+        release = threading.Event()
+
+        def fetch_page(window_start, window_end, offset, limit):
+            if window_start >= 30:
+                release.wait(5)
+            return window_page(window_start, window_end, offset, limit)
+
+        iterator = iter_time_windows(fetch_page, start=0, end=59, time_key=time_key, key=lambda r: r, windows=2)
+        self.assertEqual(next(iterator), (0, 0))
+        self.assertFalse(release.is_set())
+        release.set()
+        self.assertEqual([(0, 0)] + list(iterator), RECORDS)
+
+    def test_errors_of_a_page_reach_the_caller(self):
+        def fetch_page(window_start, window_end, offset, limit):
+            raise RuntimeError('page failed')
+
+        with self.assertRaises(RuntimeError):
+            list(iter_time_windows(fetch_page, start=0, end=59, time_key=time_key))
+
+    def test_invalid_ranges(self):
+        with self.assertRaises(ValueError):
+            list(iter_time_windows(window_page, start=10, end=0, time_key=time_key))
+        with self.assertRaises(ValueError):
+            list(iter_time_windows(window_page, start=0, end=10, time_key=time_key, windows=0))
+
+
+class AiterTimeWindowsTestCase(unittest.TestCase):
+    def test_merges_the_windows_in_time_order_without_duplicates(self):
+        async def fetch_page(window_start, window_end, offset, limit):
+            await asyncio.sleep(0.001 * (60 - window_start) / 60)
+            return window_page(window_start, window_end, offset, limit)
+
+        records = asyncio.run(
+            collect(
+                aiter_time_windows(
+                    fetch_page, start=0, end=59, time_key=time_key, key=lambda r: r, windows=4, page_size=10
+                )
+            )
+        )
+        self.assertEqual(records, RECORDS)
+
+    def test_closing_early_cancels_the_pages_in_flight(self):
+        cancelled = []
+
+        async def fetch_page(window_start, window_end, offset, limit):
+            if window_start >= 30:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(window_start)
+                    raise
+            return window_page(window_start, window_end, offset, limit)
+
+        async def run():
+            iterator = aiter_time_windows(fetch_page, start=0, end=59, time_key=time_key, key=lambda r: r, windows=2)
+            first = await iterator.__anext__()
+            await iterator.aclose()
+            return first
+
+        self.assertEqual(asyncio.run(asyncio.wait_for(run(), 5)), (0, 0))
+        self.assertEqual(cancelled, [30])
+
+
+class ClientRangeTestCase(unittest.TestCase):
+    def test_iter_funding_history_range_shards_the_range(self):
+        lock = threading.Lock()
+        requested = []
+
+        def handler(request):
+            start_date = int(request.url.params['startDate'])
+            end_date = int(request.url.params['endDate'])
+            with lock:
+                requested.append((start_date, end_date))
+            entries = [
+                {'market': 'BTC_PERP', 'fundingTime': str(second), 'fundingRate': '0.0001', 'settlementPrice': '1',
+                 'rateCalculatedTime': str(second)}
+                for second in range(start_date, end_date + 1)
+                if second % 10 == 0
+            ]
+            return httpx.Response(200, json=entries)
+
+        client = WhitebitApi(
+            environment=WhitebitApiEnvironment(base='https://whitebit.test', production='', eu=''),
+            txc_apikey='key',
+            token='token',
+            httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+        entries = list(
+            client.public_api_v4.iter_funding_history_range(market='BTC_PERP', start_date=0, end_date=99, windows=4)
+        )
+        self.assertEqual([entry.funding_time for entry in entries], [str(second) for second in range(0, 100, 10)])
+        self.assertEqual(sorted(requested), [(0, 25), (25, 50), (50, 75), (75, 99)])
+
+
+if __name__ == '__main__':
+    unittest.main()
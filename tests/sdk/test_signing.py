@@ -0,0 +1,115 @@
+import base64
+import hashlib
+import hmac
+import json
+import unittest
+
+import httpx
+
+from whitebit import WhitebitApi, WhitebitApiEnvironment
+from whitebit.core.json_codec import JsonCodec
+from whitebit.core.signing import RequestSigner
+
+API_KEY = 'public-key'
+API_SECRET = 'secret-key'
+NONCE = 1700000000123
+
+
+def baseline_sign(params, uri, nonce):
+    '''The signing of the original client: a fresh HMAC per request over the ASCII JSON of the params'''
+    params = dict(params)
+    params['request'] = uri
+    params['nonce'] = nonce
+    params['nonceWindow'] = True
+    data_json = json.dumps(params, separators=(',', ':'))
+    payload = base64.b64encode(data_json.encode('ascii'))
+    return payload, hmac.new(API_SECRET.encode('ascii'), payload, hashlib.sha512).hexdigest()
+
+
+class RequestSignerTestCase(unittest.TestCase):
+    def test_matches_the_baseline_signing(self):
+        signer = RequestSigner(api_key=API_KEY, api_secret=API_SECRET, nonce_factory=lambda: NONCE)
+        params = {'market': 'BTC_USDT', 'side': 'buy', 'amount': '0.001', 'price': '40000'}
+        content, headers = signer.sign('/api/v4/order/new', params, JsonCodec())
+
+        payload, signature = baseline_sign(params, '/api/v4/order/new', NONCE)
+        self.assertEqual(headers['X-TXC-PAYLOAD'], payload)
+        self.assertEqual(headers['X-TXC-SIGNATURE'], signature)
+        self.assertEqual(headers['X-TXC-APIKEY'], API_KEY)
+        # The signed bytes are the ones sent
+        self.assertEqual(base64.b64decode(payload), content)
+
+    def test_keyed_hmac_is_reused_without_leaking_state(self):
+        signer = RequestSigner(api_key=API_KEY, api_secret=API_SECRET, nonce_factory=iter(range(1, 100)).__next__)
+        for nonce in (1, 2, 3):
+            _, headers = signer.sign('api/v4/trade-account/balance', {}, JsonCodec())
+            self.assertEqual(headers['X-TXC-SIGNATURE'], baseline_sign({}, '/api/v4/trade-account/balance', nonce)[1])
+
+    def test_caller_nonce_is_kept(self):
+        signer = RequestSigner(api_key=API_KEY, api_secret=API_SECRET, nonce_factory=lambda: NONCE)
+        content, _ = signer.sign('api/v4/trade-account/balance', {'nonce': 42}, JsonCodec())
+        self.assertEqual(json.loads(content)['nonce'], 42)
+
+    def test_applies_to_private_posts(self):
+        signer = RequestSigner(api_key=API_KEY, api_secret=API_SECRET)
+        self.assertTrue(signer.applies_to('POST', '/api/v4/order/new'))
+        self.assertFalse(signer.applies_to('GET', 'api/v4/order/new'))
+        self.assertFalse(signer.applies_to('POST', 'api/v4/public/ticker'))
+        self.assertFalse(signer.applies_to('POST', 'oauth2/token'))
+
+
+class SignedClientTestCase(unittest.TestCase):
+    def test_sent_request_matches_the_baseline_signing(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={'orderId': 1})
+
+        client = WhitebitApi(
+            environment=WhitebitApiEnvironment(base='https://whitebit.test', production='', eu=''),
+            txc_apikey=API_KEY,
+            api_secret=API_SECRET,
+            nonce_generator=lambda: NONCE,
+            json_codec=JsonCodec(),
+            response_mode='raw',
+            httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+        client.spot_trading.create_limit_order(market='BTC_USDT', side='buy', amount='0.001', price='40000')
+
+        (request,) = requests
+        sent = json.loads(request.content)
+        params = {key: value for key, value in sent.items() if key not in ('request', 'nonce', 'nonceWindow')}
+        payload, signature = baseline_sign(params, '/api/v4/order/new', NONCE)
+        self.assertEqual(sent['request'], '/api/v4/order/new')
+        self.assertEqual(request.headers['X-TXC-PAYLOAD'].encode('ascii'), payload)
+        self.assertEqual(request.headers['X-TXC-SIGNATURE'], signature)
+        self.assertEqual(base64.b64decode(payload), request.content)
+        self.assertNotIn('Authorization', request.headers)
+
+    def test_request_and_nonce_are_left_to_the_signer(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=[])
+
+        client = WhitebitApi(
+            environment=WhitebitApiEnvironment(base='https://whitebit.test', production='', eu=''),
+            txc_apikey=API_KEY,
+            api_secret=API_SECRET,
+            nonce_generator=lambda: NONCE,
+            json_codec=JsonCodec(),
+            httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+        self.assertEqual(client.fees.get_fees(), [])
+
+        (request,) = requests
+        sent = json.loads(request.content)
+        self.assertEqual(sent['request'], '/api/v4/main-account/fee')
+        self.assertEqual(sent['nonce'], NONCE)
+        self.assertEqual(request.headers['X-TXC-SIGNATURE'], baseline_sign({}, '/api/v4/main-account/fee', NONCE)[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
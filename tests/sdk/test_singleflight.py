@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import unittest
+
+import httpx
+
+from whitebit.core.http_client import AsyncHttpClient
+from whitebit.core.singleflight import AsyncSingleFlight, SingleFlight, get_shared_results, is_coalescable
+
+
+def build_client(handler, singleflight):
+    return AsyncHttpClient(
+        httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        base_timeout=lambda: 10,
+        base_headers=lambda: {},
+        base_url=lambda: 'https://whitebit.test',
+        singleflight=singleflight,
+    )
+
+
+class SingleFlightTestCase(unittest.TestCase):
+    def test_concurrent_identical_calls_share_one_request(self):
+        singleflight = SingleFlight()
+        release = threading.Event()
+        sent = []
+        responses = []
+
+        def send():
+            sent.append(1)
+            release.wait(5)
+            return httpx.Response(200, json={})
+
+        def call():
+            responses.append(singleflight.do(('ticker',), send))
+
+        threads = [threading.Thread(target=call) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        # Every caller but the leader waits on the call in flight
+        while singleflight.coalesced < 4:
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(len({id(response) for response in responses}), 1)
+        self.assertIsNotNone(get_shared_results(responses[0]))
+        self.assertEqual((singleflight.requests, singleflight.coalesced), (1, 4))
+
+    def test_errors_reach_every_caller(self):
+        singleflight = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def send():
+            release.wait(5)
+            raise httpx.ConnectError('connection refused')
+
+        def call():
+            try:
+                singleflight.do(('ticker',), send)
+            except httpx.ConnectError as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        while singleflight.coalesced < 2:
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(errors), 3)
+
+    def test_only_bodiless_gets_are_coalesced(self):
+        self.assertTrue(is_coalescable('GET', None, None, None, None))
+        self.assertFalse(is_coalescable('POST', None, None, None, None))
+        self.assertFalse(is_coalescable('GET', {'market': 'BTC_USDT'}, None, None, None))
+
+
+class AsyncSingleFlightTestCase(unittest.TestCase):
+    def test_identical_gets_are_sent_once(self):
+        paths = []
+
+        async def handler(request):
+            paths.append(request.url.path + '?' + request.url.query.decode())
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={'ok': True})
+
+        async def run():
+            client = build_client(handler, AsyncSingleFlight())
+            return await asyncio.gather(
+                *(client.request('api/v4/public/ticker', method='GET') for _ in range(5)),
+                client.request('api/v4/public/orderbook/BTC_USDT', method='GET', params={'limit': 5}),
+                client.request('api/v4/public/orderbook/BTC_USDT', method='GET', params={'limit': 10}),
+            )
+
+        responses = asyncio.run(run())
+        self.assertEqual(sorted(paths), [
+            '/api/v4/public/orderbook/BTC_USDT?limit=10',
+            '/api/v4/public/orderbook/BTC_USDT?limit=5',
+            '/api/v4/public/ticker?',
+        ])
+        self.assertEqual(len({id(response) for response in responses[:5]}), 1)
+
+    def test_the_request_completes_when_its_leader_is_cancelled(self):
+        async def handler(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={'ok': True})
+
+        async def run():
+            singleflight = AsyncSingleFlight()
+            client = build_client(handler, singleflight)
+            leader = asyncio.ensure_future(client.request('api/v4/public/ticker', method='GET'))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(client.request('api/v4/public/ticker', method='GET'))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            response = await asyncio.wait_for(follower, 5)
+            return response, singleflight
+
+        response, singleflight = asyncio.run(run())
+        self.assertEqual(response.json(), {'ok': True})
+        self.assertEqual((singleflight.requests, singleflight.coalesced), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import asyncio
+import unittest
+
+import httpx
+
+from whitebit import AsyncWhitebitApi, WhitebitApi, WhitebitApiEnvironment
+from whitebit.core.api_error import ApiError
+from whitebit.core.timing import PHASES, RequestTiming
+
+ENVIRONMENT = WhitebitApiEnvironment(base='https://whitebit.test', production='', eu='')
+
+
+def build_client(handler, records):
+    return WhitebitApi(
+        environment=ENVIRONMENT,
+        txc_apikey='key',
+        token='token',
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        timing_observers=[records.append],
+    )
+
+
+def answering(*responses):
+    '''Answers with the given (status, body) pairs in turn, with Retry-After: 0 to keep the backoff out of the tests'''
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        status, body = responses[min(len(calls), len(responses)) - 1]
+        return httpx.Response(status, json=body, headers={'retry-after': '0'})
+
+    return handler
+
+
+class RequestTimingTestCase(unittest.TestCase):
+    def test_successful_call_is_recorded_once_parsed(self):
+        records = []
+        client = build_client(answering((200, {'time': 1700000000})), records)
+        self.assertEqual(client.public_api_v4.server_time().time, 1700000000)
+        self.assertEqual(len(records), 1)
+        record = records[0]
+        self.assertIsInstance(record, RequestTiming)
+        self.assertEqual(record.method, 'GET')
+        self.assertIn('public/time', record.path)
+        self.assertEqual(record.status_code, 200)
+        self.assertEqual((record.attempts, record.retries, record.rate_limited), (1, 0, 0))
+        self.assertGreater(record.response_bytes, 0)
+        self.assertIsNone(record.error)
+        self.assertFalse(record.cached or record.coalesced)
+        self.assertGreater(record.total, 0)
+        for phase in PHASES:
+            self.assertGreaterEqual(getattr(record, phase), 0)
+        self.assertLessEqual(record.decode + record.validate, record.total)
+
+    def test_retried_attempts_are_counted(self):
+        records = []
+        client = build_client(answering((429, {}), (503, {}), (200, {'time': 1})), records)
+        client.public_api_v4.server_time(request_options={'max_retries': 2})
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].status_code, 200)
+        self.assertEqual((records[0].attempts, records[0].retries, records[0].rate_limited), (3, 2, 1))
+
+    def test_error_responses_finish_the_record(self):
+        records = []
+        client = build_client(answering((503, {'message': 'maintenance'})), records)
+        with self.assertRaises(ApiError):
+            client.public_api_v4.server_time(request_options={'max_retries': 0})
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].status_code, 503)
+        self.assertEqual(records[0].attempts, 1)
+
+    def test_transport_errors_are_recorded(self):
+        records = []
+
+        def handler(request):
+            raise httpx.ConnectError('connection refused', request=request)
+
+        client = build_client(handler, records)
+        with self.assertRaises(httpx.ConnectError):
+            client.public_api_v4.server_time(request_options={'max_retries': 0})
+        self.assertEqual(len(records), 1)
+        self.assertIsNone(records[0].status_code)
+        self.assertIsInstance(records[0].error, httpx.ConnectError)
+        self.assertEqual(records[0].as_dict()['error'], 'ConnectError')
+
+    def test_parse_failures_are_recorded(self):
+        records = []
+
+        def handler(request):
+            return httpx.Response(200, content=b'not json', headers={'content-type': 'application/json'})
+
+        client = build_client(handler, records)
+        with self.assertRaises(ApiError):
+            client.public_api_v4.server_time()
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].status_code, 200)
+        self.assertIsInstance(records[0].error, ValueError)
+
+    def test_as_dict_holds_every_phase(self):
+        records = []
+        build_client(answering((200, {'time': 1})), records).public_api_v4.server_time()
+        record = records[0].as_dict()
+        self.assertEqual(record['status_code'], 200)
+        self.assertEqual(record['attempts'], 1)
+        self.assertIsNone(record['error'])
+        for phase in PHASES:
+            self.assertIn(phase, record)
+
+    def test_async_calls_are_recorded(self):
+        records = []
+
+        async def run():
+            client = AsyncWhitebitApi(
+                environment=ENVIRONMENT,
+                txc_apikey='key',
+                token='token',
+                httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(answering((200, {'time': 5})))),
+                timing_observers=[records.append],
+            )
+            return await client.public_api_v4.server_time()
+
+        self.assertEqual(asyncio.run(asyncio.wait_for(run(), 5)).time, 5)
+        self.assertEqual(len(records), 1)
+        self.assertEqual((records[0].status_code, records[0].attempts), (200, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
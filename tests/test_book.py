@@ -0,0 +1,278 @@
+import asyncio
+import json
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+import websockets
+
+from whitebit.stream.book import ASK, BID, OrderBook, OrderBookManager
+from whitebit.stream.ws import ConnectWebsocket, WhitebitWsClient
+
+SNAPSHOT = {
+    'timestamp': 1689600180.5164471,
+    'update_id': 100,
+    'asks': [['30050.5', '0.2'], ['30050.1', '0.5'], ['30052', '1.1']],
+    'bids': [['30049.9', '0.4'], ['30048', '2'], ['30049.5', '0.1']],
+    'event_time': 1689600180.5164471,
+}
+
+
+def update(update_id, past_update_id, asks=(), bids=()):
+    return {'update_id': update_id, 'past_update_id': past_update_id, 'asks': list(asks), 'bids': list(bids),
+            'timestamp': 1689600181.0, 'event_time': 1689600181.0}
+
+
+class OrderBookTestCase(unittest.TestCase):
+    def test_snapshot_is_sorted_best_first(self):
+        book = OrderBook('BTC_USDT')
+        self.assertTrue(book.apply(True, SNAPSHOT))
+        self.assertEqual(book.best_ask, (30050.1, 0.5))
+        self.assertEqual(book.best_bid, (30049.9, 0.4))
+        self.assertEqual(list(book.top(ASK, 2)), [(30050.1, 0.5), (30050.5, 0.2)])
+        self.assertEqual(list(book.top(BID, 5)), [(30049.9, 0.4), (30049.5, 0.1), (30048.0, 2.0)])
+        self.assertAlmostEqual(book.spread, 0.2)
+
+    def test_incremental_updates_insert_change_and_delete_levels(self):
+        book = OrderBook('BTC_USDT')
+        book.apply(True, SNAPSHOT)
+        self.assertTrue(book.apply(False, update(101, 100, asks=[['30050.1', '0']], bids=[['30050', '0.3']])))
+        self.assertEqual(book.best_ask, (30050.5, 0.2))
+        self.assertEqual(book.best_bid, (30050.0, 0.3))
+        self.assertEqual(book.amount_at(BID, '30048'), 2.0)
+        self.assertEqual(book.amount_at(ASK, '30050.1'), 0)
+        self.assertEqual(book.update_id, 101)
+
+    def test_book_is_trimmed_to_its_limit(self):
+        book = OrderBook('BTC_USDT', limit=2)
+        book.apply(True, SNAPSHOT)
+        self.assertEqual(book.levels(ASK), [(30050.1, 0.5), (30050.5, 0.2)])
+        self.assertEqual(book.levels(BID), [(30049.9, 0.4), (30049.5, 0.1)])
+
+    def test_gap_invalidates_until_next_snapshot(self):
+        book = OrderBook('BTC_USDT')
+        book.apply(True, SNAPSHOT)
+        self.assertFalse(book.apply(False, update(103, 102, asks=[['30040', '1']])))
+        self.assertFalse(book.synced)
+        self.assertEqual(book.gaps, 1)
+        self.assertIsNone(book.best_ask)
+        self.assertFalse(book.apply(False, update(104, 103)))
+        self.assertTrue(book.apply(True, SNAPSHOT))
+        self.assertEqual(book.best_ask, (30050.1, 0.5))
+
+    def test_decimal_numbers(self):
+        book = OrderBook('BTC_USDT', number=Decimal)
+        book.apply(True, SNAPSHOT)
+        self.assertEqual(book.best_ask, (Decimal('30050.1'), Decimal('0.5')))
+
+
+class OrderBookManagerTestCase(unittest.TestCase):
+    def test_resyncs_once_per_gap(self):
+        resyncs = []
+
+        async def resync(market):
+            resyncs.append(market)
+
+        async def run():
+            manager = OrderBookManager(resync=resync)
+            book = manager.add('BTC_USDT')
+            # Updates before the first snapshot are dropped without resyncing
+            await manager.handle({'method': 'depth_update', 'params': [False, update(99, 98), 'BTC_USDT']})
+            await manager.handle({'method': 'depth_update', 'params': [True, SNAPSHOT, 'BTC_USDT']})
+            await manager.handle({'method': 'depth_update', 'params': [False, update(102, 101), 'BTC_USDT']})
+            await manager.handle({'method': 'depth_update', 'params': [False, update(103, 102), 'BTC_USDT']})
+            self.assertFalse(await manager.handle({'method': 'depth_update', 'params': [True, SNAPSHOT, 'ETH_USDT']}))
+            self.assertFalse(await manager.handle({'method': 'lastprice_update', 'params': ['BTC_USDT', '1']}))
+            return book
+
+        book = asyncio.run(run())
+        self.assertEqual(resyncs, ['BTC_USDT'])
+        self.assertFalse(book.synced)
+
+    def test_reset_invalidates_every_book(self):
+        resyncs = []
+
+        async def resync(market):
+            resyncs.append(market)
+
+        async def run():
+            manager = OrderBookManager(resync=resync)
+            for market in ('BTC_USDT', 'ETH_USDT'):
+                manager.add(market)
+                await manager.handle({'method': 'depth_update', 'params': [True, SNAPSHOT, market]})
+            await manager.reset(['BTC_USDT'])
+            books = manager.books.values()
+            self.assertEqual([book.synced for book in books], [False, False])
+            self.assertEqual([book.best_ask for book in books], [None, None])
+            # Updates sent before the snapshot are not gaps
+            await manager.handle({'method': 'depth_update', 'params': [False, update(102, 101), 'BTC_USDT']})
+            await manager.handle({'method': 'depth_update', 'params': [True, SNAPSHOT, 'BTC_USDT']})
+            self.assertTrue(manager.get('BTC_USDT').synced)
+
+        asyncio.run(run())
+        # BTC_USDT gets its snapshot from its recovered subscription
+        self.assertEqual(resyncs, ['ETH_USDT'])
+
+    def test_stalled_resync_is_retried_until_the_snapshot(self):
+        resyncs = []
+
+        async def resync(market):
+            resyncs.append(market)
+
+        async def run():
+            manager = OrderBookManager(resync=resync, resync_timeout=0.05)
+            manager.add('BTC_USDT')
+            await manager.handle({'method': 'depth_update', 'params': [True, SNAPSHOT, 'BTC_USDT']})
+            await manager.handle({'method': 'depth_update', 'params': [False, update(102, 101), 'BTC_USDT']})
+            await asyncio.sleep(0.13)
+            stalled = len(resyncs)
+            await manager.handle({'method': 'depth_update', 'params': [True, SNAPSHOT, 'BTC_USDT']})
+            await asyncio.sleep(0.13)
+            return stalled
+
+        stalled = asyncio.run(run())
+        # The resync of the gap, then one per timeout until the snapshot arrived
+        self.assertGreaterEqual(stalled, 3)
+        self.assertEqual(len(resyncs), stalled)
+
+    def test_removed_books_are_not_resynced(self):
+        resyncs = []
+
+        async def resync(market):
+            resyncs.append(market)
+
+        async def run():
+            manager = OrderBookManager(resync=resync, resync_timeout=0.05)
+            manager.add('BTC_USDT')
+            await manager.reset()
+            manager.remove('BTC_USDT')
+            await asyncio.sleep(0.13)
+            await manager.reset()
+
+        asyncio.run(run())
+        self.assertEqual(resyncs, ['BTC_USDT'])
+
+
+class _Client:
+    exception_occur = False
+
+
+class ReconnectTestCase(unittest.TestCase):
+    def test_books_resync_after_a_reconnect(self):
+        connections = []
+
+        async def exchange(socket, path=None):
+            subscribed = []
+            connections.append(subscribed)
+            async for raw in socket:
+                msg = json.loads(raw)
+                if msg['method'] != 'depth_subscribe':
+                    continue
+                market = msg['params'][0]
+                subscribed.append(market)
+                snapshot = {**SNAPSHOT, 'update_id': len(connections)}
+                frame = {'id': None, 'method': 'depth_update', 'params': [True, snapshot, market]}
+                await socket.send(json.dumps(frame))
+                if len(connections) == 1 and len(subscribed) == 2:
+                    await socket.close()
+
+        async def run():
+            manager = OrderBookManager()
+            invalidated = []
+
+            async def callback(msg):
+                await manager.handle(msg)
+
+            async def on_connect():
+                invalidated.extend(book.synced for book in manager.books.values())
+                await manager.reset(['BTC_USDT', 'ETH_USDT'])
+
+            async with websockets.serve(exchange, '127.0.0.1', 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                connection = ConnectWebsocket(_Client(), f'ws://127.0.0.1:{port}', callback, on_connect=on_connect)
+                for market in ('BTC_USDT', 'ETH_USDT'):
+                    manager.add(market)
+                    subscription = {'id': connection.next_id(), 'method': 'depth_subscribe',
+                                    'params': [market, 100, '0', True]}
+                    connection.append_subscription(subscription)
+                    await connection.send_message(subscription)
+                books = list(manager.books.values())
+                while len(connections) < 2 or not all(book.synced and book.update_id == 2 for book in books):
+                    await asyncio.sleep(0.1)
+            return invalidated, books
+
+        invalidated, books = asyncio.run(asyncio.wait_for(run(), 30))
+        # Both depth subscriptions were recovered, each book getting a new snapshot
+        self.assertEqual(sorted(connections[1]), ['BTC_USDT', 'ETH_USDT'])
+        self.assertIn(True, invalidated)
+        self.assertEqual([book.update_id for book in books], [2, 2])
+
+    def test_unsubscribed_books_are_not_resubscribed_after_a_reconnect(self):
+        connections = []
+        sockets = []
+
+        async def exchange(socket, path=None):
+            methods = []
+            connections.append(methods)
+            sockets.append(socket)
+            async for raw in socket:
+                msg = json.loads(raw)
+                methods.append((msg['method'], (msg.get('params') or [None])[0]))
+                if msg['method'] == 'depth_subscribe':
+                    frame = {'id': None, 'method': 'depth_update', 'params': [True, SNAPSHOT, msg['params'][0]]}
+                    await socket.send(json.dumps(frame))
+
+        async def synced(books):
+            while not all(book.synced for book in books):
+                await asyncio.sleep(0.05)
+
+        async def run():
+            async with websockets.serve(exchange, '127.0.0.1', 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                with mock.patch.object(WhitebitWsClient, 'PROD_ENV_URL', f'ws://127.0.0.1:{port}'), \
+                        mock.patch.object(WhitebitWsClient, 'get_ws_token', return_value={'websocket_token': 'token'}):
+                    client = WhitebitWsClient(callback=lambda msg: asyncio.sleep(0))
+                btc = await client.subscribe_order_book('BTC_USDT')
+                eth = await client.subscribe_order_book('ETH_USDT')
+                await synced([btc, eth])
+                await client.unsubscribe_order_book('ETH_USDT')
+                while connections[0][-2:] != [('depth_unsubscribe', None), ('depth_subscribe', 'BTC_USDT')]:
+                    await asyncio.sleep(0.05)
+                await synced([btc])
+                await sockets[0].close()
+                while len(connections) < 2 or not connections[1]:
+                    await asyncio.sleep(0.1)
+                await synced([btc])
+                await asyncio.sleep(0.2)
+                return client, btc
+
+        client, btc = asyncio.run(asyncio.wait_for(run(), 30))
+        self.assertEqual(list(client.order_books.books), ['BTC_USDT'])
+        self.assertTrue(btc.synced)
+        # The book still tracked was subscribed to again after depth was unsubscribed from for every market
+        self.assertEqual(connections[0][-2:], [('depth_unsubscribe', None), ('depth_subscribe', 'BTC_USDT')])
+        self.assertNotIn(('depth_subscribe', 'ETH_USDT'), connections[1])
+        self.assertIn(('depth_subscribe', 'BTC_USDT'), connections[1])
+
+    def test_unsubscribing_from_depth_drops_the_books(self):
+        async def exchange(socket, path=None):
+            async for _ in socket:
+                pass
+
+        async def run():
+            async with websockets.serve(exchange, '127.0.0.1', 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                with mock.patch.object(WhitebitWsClient, 'PROD_ENV_URL', f'ws://127.0.0.1:{port}'), \
+                        mock.patch.object(WhitebitWsClient, 'get_ws_token', return_value={'websocket_token': 'token'}):
+                    client = WhitebitWsClient(callback=lambda msg: asyncio.sleep(0))
+                await client.subscribe_order_book('BTC_USDT')
+                await client.unsubscribe_market_depth()
+                return client
+
+        client = asyncio.run(asyncio.wait_for(run(), 30))
+        self.assertEqual(client.order_books.books, {})
+        self.assertEqual(client._conn.subscriptions, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import multiprocessing
+import threading
+import time
+import unittest
+
+from whitebit.nonce import NonceGenerator
+
+PROCESSES = 8
+NONCES_PER_PROCESS = 50_000 // PROCESSES
+
+
+def _generate(generator, count, results):
+    results.put([generator() for _ in range(count)])
+
+
+class NonceGeneratorTestCase(unittest.TestCase):
+    def test_nonces_follow_clock_in_milliseconds(self):
+        generator = NonceGenerator(clock=lambda: 1700000000.1234)
+        self.assertEqual(generator(), 1700000000123)
+        self.assertEqual(generator(), 1700000000124)
+
+    def test_threads_never_collide(self):
+        generator = NonceGenerator()
+        nonces = [[] for _ in range(8)]
+
+        def generate(index):
+            nonces[index].extend(generator() for _ in range(5_000))
+
+        threads = [threading.Thread(target=generate, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for thread_nonces in nonces:
+            self.assertEqual(thread_nonces, sorted(set(thread_nonces)))
+        self.assertEqual(len({nonce for thread_nonces in nonces for nonce in thread_nonces}), 40_000)
+
+    def test_processes_never_collide(self):
+        # 50k nonces from 8 processes drawing concurrently from one shared generator
+        generator = NonceGenerator(shared=True)
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=_generate, args=(generator, NONCES_PER_PROCESS, results))
+            for _ in range(PROCESSES)
+        ]
+        for process in processes:
+            process.start()
+        nonces = [results.get(timeout=60) for _ in processes]
+        for process in processes:
+            process.join()
+
+        for process_nonces in nonces:
+            self.assertEqual(process_nonces, sorted(set(process_nonces)))
+        unique = {nonce for process_nonces in nonces for nonce in process_nonces}
+        self.assertEqual(len(unique), PROCESSES * NONCES_PER_PROCESS)
+        # Nonces run ahead of the clock only by the number of nonces drawn within the same milliseconds
+        self.assertLessEqual(max(unique), int((time.time() + 1) * 1000) + PROCESSES * NONCES_PER_PROCESS)
+
+
+if __name__ == '__main__':
+    unittest.main()
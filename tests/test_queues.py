@@ -0,0 +1,151 @@
+import asyncio
+import unittest
+
+from whitebit.stream.queues import (BLOCK, CONFLATE, DROP_OLDEST, ChannelDispatcher, ChannelQueue, ConflatedFeed,
+                                    message_key)
+
+
+def last_price(market, price):
+    return {'id': None, 'method': 'lastprice_update', 'params': [market, price]}
+
+
+class ChannelQueueTestCase(unittest.TestCase):
+    def test_drop_oldest_keeps_the_newest(self):
+        async def run():
+            queue = ChannelQueue('lastprice_update', maxsize=2, policy=DROP_OLDEST)
+            for price in ('1', '2', '3'):
+                await queue.put(last_price('BTC_USDT', price))
+            return [(await queue.get())['params'][1] for _ in range(2)], queue.stats()
+
+        prices, stats = asyncio.run(run())
+        self.assertEqual(prices, ['2', '3'])
+        self.assertEqual(stats, {'depth': 0, 'max_depth': 2, 'received': 3, 'dispatched': 2, 'dropped': 1,
+                                 'conflated': 0})
+
+    def test_conflate_keeps_the_latest_per_market_in_arrival_order(self):
+        async def run():
+            queue = ChannelQueue('lastprice_update', policy=CONFLATE)
+            for market, price in (('BTC_USDT', '1'), ('ETH_USDT', '10'), ('BTC_USDT', '2')):
+                await queue.put(last_price(market, price))
+            return [(await queue.get())['params'] for _ in range(2)], queue.stats()
+
+        params, stats = asyncio.run(run())
+        self.assertEqual(params, [['BTC_USDT', '2'], ['ETH_USDT', '10']])
+        self.assertEqual(stats['conflated'], 1)
+        self.assertEqual(stats['max_depth'], 2)
+
+    def test_block_waits_for_the_consumer(self):
+        async def run():
+            queue = ChannelQueue('depth_update', maxsize=1, policy=BLOCK)
+            await queue.put(last_price('BTC_USDT', '1'))
+            put = asyncio.ensure_future(queue.put(last_price('BTC_USDT', '2')))
+            await asyncio.sleep(0)
+            blocked = not put.done()
+            first = await queue.get()
+            await put
+            return blocked, first['params'][1], (await queue.get())['params'][1]
+
+        self.assertEqual(asyncio.run(run()), (True, '1', '2'))
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            ChannelQueue('lastprice_update', policy='latest')
+
+
+class ChannelDispatcherTestCase(unittest.TestCase):
+    def test_slow_channel_does_not_delay_the_others(self):
+        async def run():
+            received = []
+            release = asyncio.Event()
+
+            async def callback(msg):
+                if msg['method'] == 'depth_update':
+                    await release.wait()
+                received.append(msg['method'])
+
+            dispatcher = ChannelDispatcher(callback, policies={'lastprice_update': CONFLATE})
+            await dispatcher.put({'method': 'depth_update', 'params': [True, {}, 'BTC_USDT']})
+            for price in ('1', '2', '3'):
+                await dispatcher.put(last_price('BTC_USDT', price))
+            await asyncio.sleep(0.01)
+            before_release = list(received)
+            release.set()
+            await asyncio.sleep(0.01)
+            dispatcher.close()
+            return before_release, received, dispatcher.stats()
+
+        before_release, received, stats = asyncio.run(run())
+        self.assertNotIn('depth_update', before_release)
+        self.assertIn('lastprice_update', before_release)
+        self.assertEqual(received[-1], 'depth_update')
+        self.assertEqual(stats['depth_update']['dispatched'], 1)
+        self.assertEqual(stats['lastprice_update']['received'], 3)
+
+    def test_callback_errors_do_not_stop_the_channel(self):
+        async def run():
+            received = []
+
+            async def callback(msg):
+                if msg['params'][1] == '1':
+                    raise RuntimeError('callback failed')
+                received.append(msg['params'][1])
+
+            dispatcher = ChannelDispatcher(callback)
+            await dispatcher.put(last_price('BTC_USDT', '1'))
+            await dispatcher.put(last_price('BTC_USDT', '2'))
+            await asyncio.sleep(0.01)
+            dispatcher.close()
+            return received
+
+        with self.assertLogs(level='ERROR'):
+            self.assertEqual(asyncio.run(run()), ['2'])
+
+
+class ConflatedFeedTestCase(unittest.TestCase):
+    def test_book_ticker_key(self):
+        msg = {'id': None, 'method': 'bookTicker_update',
+               'params': [[1689600180.5, 1689600180.6, 'BTC_USDT', 123, '30000', '1', '30001', '2']]}
+        self.assertEqual(message_key(msg), 'BTC_USDT')
+
+    def test_get_returns_the_latest_of_the_updated_markets(self):
+        async def run():
+            feed = ConflatedFeed('lastprice_update')
+            for market, price in (('BTC_USDT', '1'), ('ETH_USDT', '10'), ('BTC_USDT', '2')):
+                feed.put(last_price(market, price))
+            first = await feed.get()
+            feed.put(last_price('ETH_USDT', '11'))
+            second = await feed.get()
+            return first, second, feed.snapshot(), feed.stats()
+
+        first, second, snapshot, stats = asyncio.run(run())
+        self.assertEqual({market: msg['params'][1] for market, msg in first.items()},
+                         {'BTC_USDT': '2', 'ETH_USDT': '10'})
+        self.assertEqual(list(second), ['ETH_USDT'])
+        self.assertEqual({market: msg['params'][1] for market, msg in snapshot.items()},
+                         {'BTC_USDT': '2', 'ETH_USDT': '11'})
+        self.assertEqual(stats, {'keys': 2, 'pending': 0, 'received': 4, 'delivered': 3, 'conflated': 1})
+
+    def test_dispatcher_diverts_the_channel_until_the_feed_is_removed(self):
+        async def run():
+            received = []
+
+            async def callback(msg):
+                received.append(msg['params'][1])
+
+            dispatcher = ChannelDispatcher(callback)
+            feed = dispatcher.feed('lastprice_update')
+            await dispatcher.put(last_price('BTC_USDT', '1'))
+            dispatcher.remove_feed('lastprice_update')
+            await dispatcher.put(last_price('BTC_USDT', '2'))
+            await asyncio.sleep(0.01)
+            dispatcher.close()
+            return received, [updates async for updates in feed]
+
+        received, updates = asyncio.run(run())
+        self.assertEqual(received, ['2'])
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(updates[0]['BTC_USDT']['params'][1], '1')
+
+
+if __name__ == '__main__':
+    unittest.main()
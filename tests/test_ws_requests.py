@@ -0,0 +1,58 @@
+import asyncio
+import json
+import unittest
+
+import websockets
+
+from whitebit.stream.ws import ConnectWebsocket, WsRequestError
+
+
+class _Client:
+    exception_occur = False
+
+
+async def _exchange(socket, path=None):
+    async for raw in socket:
+        msg = json.loads(raw)
+        if msg['method'] == 'ping':
+            await socket.send(json.dumps({'id': msg['id'], 'result': 'pong', 'error': None}))
+        elif msg['method'] == 'depth_request':
+            # Replies out of order, after an update of the same market
+            await asyncio.sleep(0.05 if msg['params'][0] == 'BTC_USDT' else 0)
+            await socket.send(json.dumps({'id': None, 'method': 'depth_update', 'params': [True, {}, 'BTC_USDT']}))
+            await socket.send(json.dumps({'id': msg['id'], 'result': {'market': msg['params'][0]}, 'error': None}))
+        elif msg['method'] == 'kline_request':
+            await socket.send(json.dumps({'id': msg['id'], 'result': None,
+                                          'error': {'code': 2, 'message': 'invalid argument'}}))
+
+
+class WsRequestTestCase(unittest.TestCase):
+    def test_replies_resolve_their_requests(self):
+        updates = []
+
+        async def callback(msg):
+            updates.append(msg)
+
+        async def run():
+            async with websockets.serve(_exchange, '127.0.0.1', 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                connection = ConnectWebsocket(_Client(), f'ws://127.0.0.1:{port}', callback)
+                results = await asyncio.gather(
+                    connection.request({'method': 'depth_request', 'params': ['BTC_USDT', 100, '0']}, timeout=10),
+                    connection.request({'method': 'depth_request', 'params': ['ETH_USDT', 100, '0']}, timeout=10),
+                )
+                with self.assertRaises(WsRequestError) as error:
+                    await connection.request({'method': 'kline_request', 'params': []}, timeout=10)
+                with self.assertRaises(asyncio.TimeoutError):
+                    await connection.request({'method': 'unanswered', 'params': []}, timeout=0.1)
+                return results, error.exception, [msg.get('method') for msg in updates]
+
+        results, error, methods = asyncio.run(run())
+        self.assertEqual(results, [{'market': 'BTC_USDT'}, {'market': 'ETH_USDT'}])
+        self.assertEqual(error.error['code'], 2)
+        # Only the updates reach the callback
+        self.assertEqual(methods, ['depth_update', 'depth_update'])
+
+
+if __name__ == '__main__':
+    unittest.main()
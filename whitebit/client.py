@@ -1,11 +1,12 @@
 import math
-import time
 import requests
 import base64
 import hashlib
 import hmac
 import json
 
+from whitebit.nonce import default_nonce_generator
+
 
 def _create_uri(params) -> str:
     data = ''
@@ -17,9 +18,13 @@ def _create_uri(params) -> str:
 
 
 class Whitebit:
-    def __init__(self, api_key: str = '', api_secret: str = ''):
+    def __init__(self, api_key: str = '', api_secret: str = '', nonce_generator=None):
         self.__api_key = api_key
         self.__api_secret = api_secret
+        # Keyed once, copied for every signature
+        self.__hmac = hmac.new(api_secret.encode('ascii'), digestmod=hashlib.sha512)
+        # Shared by default, so that clients of the same process never produce the same nonce
+        self.__nonce_generator = nonce_generator if nonce_generator is not None else default_nonce_generator
         self.__url = "https://whitebit.com"
         self.__session = requests.Session()
         self.__session.headers.update({'User-Agent': 'python-whitebit-sdk'})
@@ -38,9 +43,9 @@ class Whitebit:
         headers = {'Content-Type': 'application/json'}
 
         if auth:
-            self.__create_authed_request(params, headers, uri)
+            body = self.__create_authed_request(params, headers, uri)
             return self.__check_response_data(
-                self.__session.request(method=method, url=self.__url + uri, headers=headers, json=params,
+                self.__session.request(method=method, url=self.__url + uri, headers=headers, data=body,
                                        timeout=timeout),
                 return_raw
             )
@@ -58,18 +63,22 @@ class Whitebit:
         if not self.__api_key or self.__api_key == '' or not self.__api_secret or self.__api_secret == '': raise ValueError(
             'Missing credentials.')
         params['request'] = uri
-        params['nonce'] = int(time.time() * 1000)
+        params['nonce'] = self.__nonce_generator()
         params['nonceWindow'] = True
+        body = json.dumps(params, separators=(',', ':')).encode('ascii')  # use separators param for deleting spaces
+        payload = base64.b64encode(body)
         headers.update({
             'X-TXC-APIKEY': self.__api_key,
-            'X-TXC-SIGNATURE': self.__get_signature(params),
-            'X-TXC-PAYLOAD': self.__payload.decode('ascii'),
+            'X-TXC-SIGNATURE': self.__get_signature(payload),
+            'X-TXC-PAYLOAD': payload,
         })
+        # The signed bytes are the ones sent
+        return body
 
-    def __get_signature(self, data: dict) -> str:
-        data_json = json.dumps(data, separators=(',', ':'))  # use separators param for deleting spaces
-        self.__payload = base64.b64encode(data_json.encode('ascii'))
-        return hmac.new(self.__api_secret.encode('ascii'), self.__payload, hashlib.sha512).hexdigest()
+    def __get_signature(self, payload: bytes) -> str:
+        signature = self.__hmac.copy()
+        signature.update(payload)
+        return signature.hexdigest()
 
     def __check_response_data(self, response_data, return_raw: bool = False) -> dict:
         if response_data.status_code in ['200', 200, '201', 201]:
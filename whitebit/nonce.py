@@ -0,0 +1,49 @@
+import ctypes
+import multiprocessing
+import threading
+import time
+
+
+class NonceGenerator:
+    """
+    Strictly increasing nonces, millisecond timestamps by default. When two requests fall in the same millisecond
+    the second gets the next integer, so nonces never repeat across the threads of a process, nor across
+    processes when the generator is created with shared=True and handed to them (as a Process argument or by
+    fork).
+
+    clock returns the current time in seconds; pass a synchronized clock to keep nonces within the exchange's
+    nonce window when the host clock drifts.
+
+    Mirrors whitebit.core.nonce of the generated SDK (src/whitebit), which this package cannot import: keep the
+    two in sync.
+    """
+
+    def __init__(self, clock=time.time, resolution: int = 1000, shared: bool = False, context=None):
+        self._clock = clock
+        self._resolution = resolution
+        # A 64-bit integer in shared memory, guarded by its own process-shared lock
+        self._shared = (context or multiprocessing).Value(ctypes.c_int64, 0) if shared else None
+        self._last = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> int:
+        now = int(self._clock() * self._resolution)
+        if self._shared is None:
+            with self._lock:
+                self._last = nonce = max(self._last + 1, now)
+            return nonce
+        with self._shared.get_lock():
+            self._shared.value = nonce = max(self._shared.value + 1, now)
+        return nonce
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+default_nonce_generator = NonceGenerator()
@@ -1 +1,3 @@
 from .ws import ConnectWebsocket
+from .book import OrderBook, OrderBookManager
+from .queues import BLOCK, CONFLATE, DROP_OLDEST, ChannelDispatcher, ChannelQueue, ConflatedFeed
@@ -0,0 +1,220 @@
+import asyncio
+import itertools
+import logging
+import operator
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sortedcontainers import SortedDict
+
+ASK = 'asks'
+BID = 'bids'
+
+Level = Tuple[float, float]
+
+
+class OrderBook:
+    """
+    The L2 order book of one market, maintained from its depth_update frames.
+
+    Each side is a SortedDict from price to amount, bids ordered best (highest) first and asks best (lowest)
+    first, so that a level is inserted or deleted in O(log n) and the best levels are read without sorting.
+    Prices and amounts are parsed with number, float by default; pass decimal.Decimal for exact values.
+
+    An incremental update whose past_update_id is not the update_id of the previous one means frames were
+    missed: the book is cleared and marked out of sync until the next full snapshot, which resubscribing to the
+    market's depth triggers.
+    """
+
+    def __init__(self, market: str, limit: int = 100, number: Callable[[str], float] = float):
+        self.market = market
+        self.limit = limit
+        self._number = number
+        self.asks = SortedDict()
+        self.bids = SortedDict(operator.neg)
+        self.update_id: Optional[int] = None
+        self.timestamp: Optional[float] = None
+        self.synced = False
+        # The number of gaps detected, each of them a resync
+        self.gaps = 0
+
+    def apply(self, full_reload: bool, data: dict) -> bool:
+        """
+        Applies the data of a depth_update frame, returning whether the book is in sync. Incremental updates
+        received while out of sync are ignored.
+        """
+        if full_reload:
+            self.asks.clear()
+            self.bids.clear()
+            self.synced = True
+        elif not self.synced:
+            return False
+        else:
+            past_update_id = data.get('past_update_id')
+            if past_update_id is not None and self.update_id is not None and past_update_id != self.update_id:
+                self.gaps += 1
+                self.invalidate()
+                return False
+
+        number = self._number
+        for side, levels in ((self.asks, data.get('asks') or ()), (self.bids, data.get('bids') or ())):
+            for price, amount in levels:
+                price = number(price)
+                amount = number(amount)
+                if amount:
+                    side[price] = amount
+                else:
+                    side.pop(price, None)
+            # Levels pushed past the subscribed depth are no longer updated by the exchange
+            while len(side) > self.limit:
+                side.popitem()
+
+        self.update_id = data.get('update_id', self.update_id)
+        self.timestamp = data.get('timestamp', self.timestamp)
+        return True
+
+    def invalidate(self) -> None:
+        """Clears the book until the next full snapshot."""
+        self.asks.clear()
+        self.bids.clear()
+        self.update_id = None
+        self.synced = False
+
+    def _side(self, side: str) -> SortedDict:
+        if side == ASK:
+            return self.asks
+        if side == BID:
+            return self.bids
+        raise ValueError(f'side must be {ASK!r} or {BID!r}')
+
+    @property
+    def best_ask(self) -> Optional[Level]:
+        return self.asks.peekitem(0) if self.asks else None
+
+    @property
+    def best_bid(self) -> Optional[Level]:
+        return self.bids.peekitem(0) if self.bids else None
+
+    @property
+    def spread(self) -> Optional[float]:
+        if not self.asks or not self.bids:
+            return None
+        return self.asks.peekitem(0)[0] - self.bids.peekitem(0)[0]
+
+    @property
+    def mid(self) -> Optional[float]:
+        if not self.asks or not self.bids:
+            return None
+        return (self.asks.peekitem(0)[0] + self.bids.peekitem(0)[0]) / 2
+
+    def amount_at(self, side: str, price) -> float:
+        """The amount resting at a price level of a side, 0 when there is none."""
+        return self._side(side).get(self._number(price) if isinstance(price, str) else price, 0)
+
+    def top(self, side: str, n: int) -> Iterator[Level]:
+        """The n best levels of a side, best first, iterated over the live book rather than copied."""
+        return itertools.islice(self._side(side).items(), n)
+
+    def levels(self, side: str) -> List[Level]:
+        """A copy of the levels of a side, best first."""
+        return list(self._side(side).items())
+
+    def __repr__(self) -> str:
+        return f'OrderBook({self.market}, bid={self.best_bid}, ask={self.best_ask}, synced={self.synced})'
+
+
+class OrderBookManager:
+    """
+    The order books of several markets, fed the depth_update frames of a connection. When a book detects a gap,
+    resync(market) is awaited once, until the book has its snapshot again. A book still waiting for its snapshot
+    resync_timeout seconds later is resynced again, until the snapshot arrives or the book is removed.
+    """
+
+    DEPTH_UPDATE = 'depth_update'
+
+    def __init__(self, resync=None, number: Callable[[str], float] = float, resync_timeout: Optional[float] = 10):
+        self.books: Dict[str, OrderBook] = {}
+        self._resync = resync
+        self._number = number
+        self._resync_timeout = resync_timeout
+        self._resyncing = set()
+        self._watchdogs: Dict[str, asyncio.Task] = {}
+
+    def add(self, market: str, limit: int = 100) -> OrderBook:
+        book = self.books.get(market)
+        if book is None:
+            book = self.books[market] = OrderBook(market, limit, self._number)
+            # Waiting for the first snapshot
+            self._resyncing.add(market)
+        else:
+            book.limit = limit
+        return book
+
+    def remove(self, market: str) -> None:
+        self.books.pop(market, None)
+        self._resyncing.discard(market)
+        self._stop_watch(market)
+
+    def get(self, market: str) -> Optional[OrderBook]:
+        return self.books.get(market)
+
+    def watch(self, market: str) -> None:
+        """
+        Resyncs market every resync_timeout seconds for as long as its book waits for a snapshot, in case the
+        subscription that should send it was lost. Must be called from the connection's event loop.
+        """
+        if self._resync is None or not self._resync_timeout or market in self._watchdogs:
+            return
+        self._watchdogs[market] = asyncio.ensure_future(self._watch(market))
+
+    def _stop_watch(self, market: str) -> None:
+        watchdog = self._watchdogs.pop(market, None)
+        if watchdog is not None and watchdog is not asyncio.current_task():
+            watchdog.cancel()
+
+    async def _watch(self, market: str) -> None:
+        try:
+            while True:
+                await asyncio.sleep(self._resync_timeout)
+                if market not in self._resyncing or market not in self.books:
+                    return
+                logging.warning(f'Order book {market} got no snapshot within {self._resync_timeout}s, resyncing')
+                await self._resync(market)
+        finally:
+            if self._watchdogs.get(market) is asyncio.current_task():
+                del self._watchdogs[market]
+
+    async def _start_resync(self, market: str) -> None:
+        self._resyncing.add(market)
+        if self._resync is not None:
+            await self._resync(market)
+            self.watch(market)
+
+    async def reset(self, subscribed: Iterable[str] = ()) -> None:
+        """
+        Invalidates every book, as when the connection was lost, until its next snapshot. The markets in subscribed
+        get theirs from their recovered depth subscription, the others are resynced.
+        """
+        subscribed = set(subscribed)
+        for market, book in list(self.books.items()):
+            book.invalidate()
+            if market in subscribed:
+                self._resyncing.add(market)
+                self.watch(market)
+            else:
+                await self._start_resync(market)
+
+    async def handle(self, msg: dict) -> bool:
+        """Applies msg when it is a depth_update of a tracked market, returning whether it was."""
+        if msg.get('method') != self.DEPTH_UPDATE:
+            return False
+        full_reload, data, market = msg['params'][:3]
+        book = self.books.get(market)
+        if book is None:
+            return False
+        if book.apply(full_reload, data):
+            if market in self._resyncing:
+                self._resyncing.discard(market)
+                self._stop_watch(market)
+        elif market not in self._resyncing:
+            await self._start_resync(market)
+        return True
@@ -0,0 +1,251 @@
+import asyncio
+import collections
+import itertools
+import logging
+from typing import Callable, Dict, Hashable, Optional
+
+# What a full channel queue does with a new message
+BLOCK = 'block'  # the receive loop waits for the consumer, as when the callback was awaited inline
+DROP_OLDEST = 'drop_oldest'  # the oldest queued message is dropped
+CONFLATE = 'conflate'  # a message replaces the queued one with the same key; when full, the oldest key is dropped
+
+OVERFLOW_POLICIES = (BLOCK, DROP_OLDEST, CONFLATE)
+
+
+def message_key(msg: dict) -> Hashable:
+    '''The key messages are conflated by: the market of an update, its first string parameter, or that of its
+    first list parameter, as in bookTicker_update'''
+    for param in msg.get('params') or ():
+        if isinstance(param, str):
+            return param
+        if isinstance(param, (list, tuple)):
+            for value in param:
+                if isinstance(value, str):
+                    return value
+    return None
+
+
+class ChannelQueue:
+    """
+    A bounded queue of the messages of one channel, between the receive loop of a connection and the task
+    dispatching them to the callback. What happens to a message arriving while the queue is full depends on policy:
+    BLOCK, DROP_OLDEST or CONFLATE, which also keeps a single message per key at any time, the latest, in the
+    position of the earliest.
+    """
+
+    def __init__(self, name: str, maxsize: int = 1000, policy: str = BLOCK,
+                 key: Callable[[dict], Hashable] = message_key):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f'policy must be one of {OVERFLOW_POLICIES}')
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.name = name
+        self.maxsize = maxsize
+        self.policy = policy
+        self._key = key
+        # Messages by key when conflating, by sequence number otherwise, oldest first
+        self._buffer = collections.OrderedDict()
+        self._sequence = itertools.count()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+
+        self.received = 0
+        self.dispatched = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.max_depth = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self._buffer)
+
+    async def put(self, msg: dict) -> None:
+        self.received += 1
+        if self.policy == CONFLATE:
+            key = self._key(msg)
+            if key in self._buffer:
+                self._buffer[key] = msg
+                self.conflated += 1
+                return
+        else:
+            key = next(self._sequence)
+        while len(self._buffer) >= self.maxsize:
+            if self.policy == BLOCK:
+                self._writable.clear()
+                await self._writable.wait()
+            else:
+                self._buffer.popitem(last=False)
+                self.dropped += 1
+        self._buffer[key] = msg
+        self.max_depth = max(self.max_depth, len(self._buffer))
+        self._readable.set()
+
+    async def get(self) -> dict:
+        while not self._buffer:
+            self._readable.clear()
+            await self._readable.wait()
+        _, msg = self._buffer.popitem(last=False)
+        self.dispatched += 1
+        self._writable.set()
+        return msg
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'depth': self.depth,
+            'max_depth': self.max_depth,
+            'received': self.received,
+            'dispatched': self.dispatched,
+            'dropped': self.dropped,
+            'conflated': self.conflated,
+        }
+
+    def __repr__(self) -> str:
+        return f'ChannelQueue({self.name}, {self.policy}, depth={self.depth}/{self.maxsize})'
+
+
+class ConflatedFeed:
+    """
+    The latest update per key (market) of one channel, pulled by the consumer rather than pushed to the callback.
+
+    Updates overwrite the previous one of their key as they arrive, so that memory is bounded by the number of
+    markets and an update the consumer is too busy to read costs a dict assignment. get() waits for the keys
+    updated since the previous call and returns their latest updates; latest holds the current update of every key.
+    """
+
+    def __init__(self, channel: str, key: Callable[[dict], Hashable] = message_key):
+        self.channel = channel
+        self._key = key
+        self.latest: Dict[Hashable, dict] = {}
+        # The keys updated since the last get, in the order of their first update
+        self._changed: Dict[Hashable, None] = {}
+        self._readable = asyncio.Event()
+        self.closed = False
+
+        self.received = 0
+        self.delivered = 0
+        self.conflated = 0
+
+    def put(self, msg: dict) -> None:
+        key = self._key(msg)
+        self.received += 1
+        if key in self._changed:
+            self.conflated += 1
+        else:
+            self._changed[key] = None
+        self.latest[key] = msg
+        self._readable.set()
+
+    async def get(self) -> Optional[Dict[Hashable, dict]]:
+        '''Waits for updates and returns the latest one of every key updated since the previous call, or None once
+        the feed is closed and has nothing left'''
+        while not self._changed:
+            if self.closed:
+                return None
+            self._readable.clear()
+            await self._readable.wait()
+        changed, self._changed = self._changed, {}
+        self.delivered += len(changed)
+        return {key: self.latest[key] for key in changed}
+
+    def snapshot(self) -> Dict[Hashable, dict]:
+        '''A copy of the latest update of every key, without waiting or marking them read'''
+        return dict(self.latest)
+
+    def close(self) -> None:
+        self.closed = True
+        self._readable.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[Hashable, dict]:
+        updates = await self.get()
+        if updates is None:
+            raise StopAsyncIteration
+        return updates
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'keys': len(self.latest),
+            'pending': len(self._changed),
+            'received': self.received,
+            'delivered': self.delivered,
+            'conflated': self.conflated,
+        }
+
+    def __repr__(self) -> str:
+        return f'ConflatedFeed({self.channel}, keys={len(self.latest)}, pending={len(self._changed)})'
+
+
+class ChannelDispatcher:
+    """
+    Routes the messages of a connection to a ChannelQueue per channel (the method of an update) and runs a
+    consumer task per channel awaiting callback on each of them, so that a slow callback delays only its own
+    channel and never the receive loop, unless that channel's queue is full and blocks.
+    """
+
+    DEFAULT_CHANNEL = ''
+
+    def __init__(self, callback, maxsize: int = 1000, policy: str = BLOCK,
+                 policies: Optional[Dict[str, str]] = None, key: Callable[[dict], Hashable] = message_key):
+        if policy not in OVERFLOW_POLICIES or any(p not in OVERFLOW_POLICIES for p in (policies or {}).values()):
+            raise ValueError(f'policies must be among {OVERFLOW_POLICIES}')
+        self._callback = callback
+        self._maxsize = maxsize
+        self._policy = policy
+        self._policies = dict(policies or {})
+        self._key = key
+        self.queues: Dict[str, ChannelQueue] = {}
+        self.feeds: Dict[str, ConflatedFeed] = {}
+        self._consumers: Dict[str, asyncio.Task] = {}
+
+    def queue(self, channel: str) -> ChannelQueue:
+        queue = self.queues.get(channel)
+        if queue is None:
+            queue = self.queues[channel] = ChannelQueue(
+                channel, self._maxsize, self._policies.get(channel, self._policy), self._key
+            )
+            self._consumers[channel] = asyncio.ensure_future(self.__consume(queue))
+        return queue
+
+    def feed(self, channel: str, key: Callable[[dict], Hashable] = None) -> ConflatedFeed:
+        '''Diverts the messages of channel from the callback to a ConflatedFeed, returning the existing one if any'''
+        feed = self.feeds.get(channel)
+        if feed is None:
+            feed = self.feeds[channel] = ConflatedFeed(channel, key or self._key)
+        return feed
+
+    def remove_feed(self, channel: str) -> None:
+        '''Closes the feed of channel, whose messages go to the callback again'''
+        feed = self.feeds.pop(channel, None)
+        if feed is not None:
+            feed.close()
+
+    async def put(self, msg: dict) -> None:
+        channel = msg.get('method') or self.DEFAULT_CHANNEL
+        feed = self.feeds.get(channel)
+        if feed is not None:
+            feed.put(msg)
+            return
+        await self.queue(channel).put(msg)
+
+    async def __consume(self, queue: ChannelQueue) -> None:
+        while True:
+            msg = await queue.get()
+            try:
+                await self._callback(msg)
+            except Exception:
+                logging.exception(f'Callback failed on a {queue.name or "message"}')
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        '''The queue metrics of every channel: current and maximum depth, messages received, dispatched, dropped
+        and conflated'''
+        return {channel: queue.stats() for channel, queue in self.queues.items()}
+
+    def close(self) -> None:
+        for consumer in self._consumers.values():
+            consumer.cancel()
+        self._consumers.clear()
+        for feed in self.feeds.values():
+            feed.close()
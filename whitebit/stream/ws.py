@@ -2,24 +2,43 @@ import logging
 import json
 import time
 import asyncio
+import itertools
 from enum import Enum
 from random import random
 import traceback
-from typing import List
+from typing import List, Optional
 import websockets
+from whitebit.stream.book import OrderBook, OrderBookManager
+from whitebit.stream.queues import BLOCK, ChannelDispatcher, ConflatedFeed
 from whitebit.trade.account.account import TradeAccountClient
 
 
+class WsRequestError(Exception):
+    '''The error a request sent over the websocket was answered with'''
+
+    def __init__(self, error, request: dict = None):
+        super().__init__(error)
+        self.error = error
+        self.request = request
+
+
 class ConnectWebsocket:
     __TIME_REQUEST = "ping"
     __AUTHORIZE_REQUEST = "authorize"
 
     MAX_RECONNECT_NUM = 10
+    REQUEST_TIMEOUT = 10.0
 
-    def __init__(self, client, url: str, callback, token: str = ''):
+    def __init__(self, client, url: str, callback, token: str = '', queue_size: int = 1000, overflow: str = BLOCK,
+                 overflow_policies: dict = None, on_connect=None):
         self.__client = client
         self.__ws_url = url
         self.__callback = callback
+        # Awaited on every (re)connection, before the subscriptions are recovered
+        self.__on_connect = on_connect
+        # Updates are queued per channel and dispatched to the callback by consumer tasks, so that a slow
+        # callback does not hold up recv() and the keep-alive pings
+        self.__dispatcher = ChannelDispatcher(callback, queue_size, overflow, overflow_policies)
 
         self.__reconnect_num = 0
         self.__ws_conn_authed = None
@@ -30,6 +49,10 @@ class ConnectWebsocket:
         self.__socket = None
         self.__subscriptions = []
 
+        # Request ids, 0 being reserved for the keep-alive pings, and the replies awaited by id
+        self.__ids = itertools.count(1)
+        self.__pending = {}
+
         asyncio.ensure_future(
             self.__run_forever(),
             loop=asyncio.get_running_loop()
@@ -40,7 +63,27 @@ class ConnectWebsocket:
         '''Returns the active subscriptions'''
         return self.__subscriptions
 
+    def queue_stats(self) -> dict:
+        '''Returns the queue metrics of every channel: current and maximum depth, messages received, dispatched,
+        dropped and conflated'''
+        return self.__dispatcher.stats()
+
+    def feed(self, channel: str, key=None) -> ConflatedFeed:
+        '''Conflates the updates of channel into a ConflatedFeed, pulled by the consumer, instead of dispatching
+        them to the callback'''
+        return self.__dispatcher.feed(channel, key)
+
+    def remove_feed(self, channel: str) -> None:
+        self.__dispatcher.remove_feed(channel)
+
     async def __run(self, event: asyncio.Event):
+        try:
+            await self.__receive(event)
+        finally:
+            # Replies to the requests in flight are lost with the connection
+            self.__fail_pending(ConnectionError('Websocket disconnected'))
+
+    async def __receive(self, event: asyncio.Event):
         keep_alive = True
         self.__last_ping = time.time()
 
@@ -71,7 +114,9 @@ class ConnectWebsocket:
                     else:
                         if 'result' in msg and msg["id"] == 0:
                             continue
-                        await self.__callback(msg)
+                        if self.__resolve(msg):
+                            continue
+                        await self.__dispatcher.put(msg)
 
     async def __run_forever(self) -> None:
         try:
@@ -81,6 +126,7 @@ class ConnectWebsocket:
         except Exception as execption:
             self.__callback({'error': f'{execption}: {traceback.format_exc()}'})
         finally:
+            self.__dispatcher.close()
             self.__client.exception_occur = True
 
     async def __reconnect(self):
@@ -132,6 +178,9 @@ class ConnectWebsocket:
         await self.auth()
         time.sleep(1)
 
+        if self.__on_connect is not None:
+            await self.__on_connect()
+
         for sub in self.__subscriptions:
             await self.send_message(sub)
             logging.info(f'{sub} OK')
@@ -153,12 +202,66 @@ class ConnectWebsocket:
         while not self.__socket: await asyncio.sleep(.4)
         await self.__socket.send(json.dumps(msg))
 
+    def next_id(self) -> int:
+        '''Allocates a request id unique to this connection'''
+        return next(self.__ids)
+
+    async def request(self, msg: dict, timeout: float = None):
+        '''Sends a request and returns the result of its reply, raising WsRequestError when it is answered with an
+        error and asyncio.TimeoutError when it is not answered within timeout seconds. A request without an id gets
+        a unique one.'''
+        if msg.get('id') is None:
+            msg = {**msg, 'id': self.next_id()}
+        future = asyncio.get_running_loop().create_future()
+        self.__pending[msg['id']] = (future, msg)
+        try:
+            await self.send_message(msg)
+            return await asyncio.wait_for(future, timeout if timeout is not None else self.REQUEST_TIMEOUT)
+        finally:
+            self.__pending.pop(msg['id'], None)
+
+    def __resolve(self, msg: dict) -> bool:
+        if not self.__pending or ('result' not in msg and 'error' not in msg):
+            return False
+        pending = self.__pending.pop(msg.get('id'), None)
+        if pending is None:
+            return False
+        future, request = pending
+        if not future.done():
+            if msg.get('error'):
+                future.set_exception(WsRequestError(msg['error'], request))
+            else:
+                future.set_result(msg.get('result'))
+        return True
+
+    def __fail_pending(self, error: Exception) -> None:
+        pending, self.__pending = self.__pending, {}
+        for future, _ in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    @staticmethod
+    def __channel(sub_data: dict) -> str:
+        # depth_subscribe and depth_unsubscribe are both the depth channel
+        return sub_data["method"].rsplit("_", 1)[0]
+
+    def __replaces(self, sub_data: dict, previous: dict) -> bool:
+        if self.__channel(previous) != self.__channel(sub_data):
+            return False
+        params = sub_data.get("params") or []
+        # A depth subscription with multiple_sub adds its market to those already subscribed
+        if sub_data["method"].startswith("depth_") and len(params) > 3 and params[3]:
+            return (previous.get("params") or [])[:1] == params[:1]
+        return True
+
     def append_subscription(self, sub_data: dict) -> None:
-        self.remove_subscription(sub_data)  # remove from list, to avoid duplicates
+        # A subscription replaces the previous one of its channel, or of its market for multiple depth subscriptions
+        self.__subscriptions = [x for x in self.__subscriptions if not self.__replaces(sub_data, x)]
         self.__subscriptions.append(sub_data)
 
     def remove_subscription(self, sub_data: dict) -> None:
-        self.__subscriptions = [x for x in self.__subscriptions if x["method"] != sub_data["method"]]
+        channel = self.__channel(sub_data)
+        self.__subscriptions = [x for x in self.__subscriptions if self.__channel(x) != channel]
 
     def __get_reconnect_wait(self, attempts: int) -> float:
         return round(random() * min(60 * 3, (2 ** attempts) - 1) + 1)
@@ -169,7 +272,7 @@ class ConnectWebsocket:
 
     async def auth(self):
         msg = {
-            'id': int(time.time() * 1000),
+            'id': self.next_id(),
             'method': self.__AUTHORIZE_REQUEST,
             'params': [self.token, "python sdk"]
         }
@@ -207,6 +310,10 @@ class WhitebitWsClient(TradeAccountClient):
     MARKET_STAT_TODAY_UPDATE = "marketToday_update"
     __MARKET_STAT_TODAY_UNSUBSCRIBE = "marketToday_unsubscribe"
 
+    __BOOK_TICKER_SUBSCRIBE = "bookTicker_subscribe"
+    BOOK_TICKER_UPDATE = "bookTicker_update"
+    __BOOK_TICKER_UNSUBSCRIBE = "bookTicker_unsubscribe"
+
     __TRADES_REQUEST = "trades_request"
     __TRADES_SUBSCRIBE = "trades_subscribe"
     TRADES_UPDATE = "trades_update"
@@ -238,18 +345,33 @@ class WhitebitWsClient(TradeAccountClient):
     __MARGIN_BALANCE_UNSUBSCRIBE = "balanceMargin_unsubscribe"
 
     def __init__(self, key: str = '', secret: str = '',
-                 callback=None):
+                 callback=None, queue_size: int = 1000, overflow: str = BLOCK, overflow_policies: dict = None):
+        '''Updates are queued per channel, up to queue_size each, and a full queue applies its overflow policy:
+        block (the default), drop_oldest or conflate, set per channel (update method) in overflow_policies.
+        Keep depth_update on block when following order books: a dropped or conflated frame is a gap and resyncs
+        the book.'''
         super().__init__(api_key=key, api_secret=secret)
         self.__callback = callback
+        self.order_books = OrderBookManager(resync=self.__resync_order_book)
+        self.__book_intervals = {}
         token = self.get_ws_token()
         self.exception_occur = False
         self._conn = ConnectWebsocket(
             client=self,
             url=self.PROD_ENV_URL,
             token=token["websocket_token"],
-            callback=self.on_message
+            callback=self.__dispatch,
+            queue_size=queue_size,
+            overflow=overflow,
+            overflow_policies=overflow_policies,
+            on_connect=self.__reset_order_books
         )
 
+    async def __dispatch(self, msg: dict):
+        # Books are kept up to date ahead of on_message, which subclasses override
+        await self.order_books.handle(msg)
+        await self.on_message(msg)
+
     async def on_message(self, msg: dict):
         if self.__callback is not None:
             await self.__callback(msg)
@@ -258,73 +380,89 @@ class WhitebitWsClient(TradeAccountClient):
             logging.info(msg)
 
     async def __subscribe(self, subscription: dict) -> None:
+        if subscription['id'] is None:
+            subscription['id'] = self._conn.next_id()
         self._conn.append_subscription(subscription)
         await self._conn.send_message(subscription)
 
     async def __unsubscribe(self, subscription: dict) -> None:
+        if subscription['id'] is None:
+            subscription['id'] = self._conn.next_id()
         self._conn.remove_subscription(subscription)
         await self._conn.send_message(subscription)
 
-    async def get_authorize(self, token: str, com_id=int(time.time() * 1000)):
-        await self._conn.send_message(
+    async def __subscribe_conflated(self, subscription: dict, update_method: str,
+                                    conflate: bool) -> Optional[ConflatedFeed]:
+        # A subscription replaces the previous one of its channel, and so does its delivery mode
+        if conflate:
+            feed = self._conn.feed(update_method)
+        else:
+            feed = None
+            self._conn.remove_feed(update_method)
+        await self.__subscribe(subscription)
+        return feed
+
+    async def get_authorize(self, token: str, com_id: int = None, timeout: float = None):
+        return await self._conn.request(
             {'id': com_id,
              'method': self.__AUTHORIZE_REQUEST,
-             'params': [token, 'python-sdk']})
+             'params': [token, 'python-sdk']}, timeout)
 
-    async def get_spot_balance(self, assets: List[str], com_id=int(time.time() * 1000)):
+    async def get_spot_balance(self, assets: List[str], com_id: int = None, timeout: float = None):
         assets_as_interface = [i for i in assets]
-        await self._conn.send_message(
+        return await self._conn.request(
             {'id': com_id,
              'method': self.__SPOT_BALANCE_REQUEST,
-             'params': assets_as_interface})
+             'params': assets_as_interface}, timeout)
 
-    async def subscribe_spot_balance(self, assets: List[str], com_id=int(time.time() * 1000)):
+    async def subscribe_spot_balance(self, assets: List[str], com_id: int = None):
         assets_as_interface = [i for i in assets]
         await self.__subscribe(
             {'id': com_id,
              'method': self.__SPOT_BALANCE_SUBSCRIBE,
              'params': assets_as_interface})
 
-    async def unsubscribe_spot_balance(self, com_id=int(time.time() * 1000)):
+    async def unsubscribe_spot_balance(self, com_id: int = None):
         await self.__unsubscribe(
             {'id': com_id,
              'method': self.__SPOT_BALANCE_UNSUBSCRIBE,
              'params': []})
 
-    async def get_margin_balance(self, assets: List[str], com_id=int(time.time() * 1000)):
+    async def get_margin_balance(self, assets: List[str], com_id: int = None, timeout: float = None):
         assets_as_interface = [asset for asset in assets]
-        await self._conn.send_message(
+        return await self._conn.request(
             {'id': com_id,
              'method': self.__MARGIN_BALANCE_REQUEST,
-             'params': assets_as_interface})
+             'params': assets_as_interface}, timeout)
 
-    async def subscribe_margin_balance(self, assets: List[str], com_id=int(time.time() * 1000)):
+    async def subscribe_margin_balance(self, assets: List[str], com_id: int = None):
         assets_as_interface = [asset for asset in assets]
         await self.__subscribe(
             {'id': com_id,
              'method': self.__MARGIN_BALANCE_SUBSCRIBE,
              'params': assets_as_interface})
 
-    async def unsubscribe_margin_balance(self, com_id=int(time.time() * 1000)):
+    async def unsubscribe_margin_balance(self, com_id: int = None):
         await self.__unsubscribe(
             {'id': com_id,
              'method': self.__MARGIN_BALANCE_UNSUBSCRIBE,
              'params': []})
 
-    async def get_pending_orders(self, market: str, offset: int = 0, limit: int = 100, com_id=int(time.time() * 1000)):
-        await self._conn.send_message({
+    async def get_pending_orders(self, market: str, offset: int = 0, limit: int = 100, com_id: int = None,
+                                 timeout: float = None):
+        return await self._conn.request({
             'id': com_id,
             'method': self.__ORDER_PENDING_REQUEST,
-            'params': [market, offset, limit]})
+            'params': [market, offset, limit]}, timeout)
 
-    async def subscribe_pending_orders(self, markets: List[str], com_id=int(time.time() * 1000)):
+    async def subscribe_pending_orders(self, markets: List[str], com_id: int = None):
         markets_as_interface = [market for market in markets]
         await self.__subscribe(
             {'id': com_id,
              'method': self.__ORDERS_PENDING_SUBSCRIBE,
              'params': markets_as_interface})
 
-    async def unsubscribe_pending_orders(self, com_id=int(time.time() * 1000)):
+    async def unsubscribe_pending_orders(self, com_id: int = None):
         await self.__unsubscribe(
             {'id': com_id,
              'method': self.__ORDERS_PENDING_UNSUBSCRIBE,
@@ -343,7 +481,7 @@ class WhitebitWsClient(TradeAccountClient):
         MARGIN_NORMALIZATION = 14
 
     async def get_orders_executed(self, market: str, order_types: List[int], offset: int = 0, limit: int = 100,
-                                  com_id=int(time.time() * 1000)):
+                                  com_id: int = None, timeout: float = None):
         msg = {
             'id': com_id,
             'method': self.__ORDERS_EXECUTED_REQUEST,
@@ -356,7 +494,7 @@ class WhitebitWsClient(TradeAccountClient):
                 limit
             ]
         }
-        await self._conn.send_message(msg)
+        return await self._conn.request(msg, timeout)
 
     class OrdersSubscribeExecFilter(Enum):
         ALL = 0
@@ -364,7 +502,7 @@ class WhitebitWsClient(TradeAccountClient):
         MARKET = 2
 
     async def subscribe_orders_executed(self, markets: List[str], order_filter: OrdersSubscribeExecFilter,
-                                        com_id=int(time.time() * 1000)):
+                                        com_id: int = None):
         msg = {
             'id': com_id,
             'method': self.__ORDERS_EXECUTED_SUBSCRIBE,
@@ -372,7 +510,7 @@ class WhitebitWsClient(TradeAccountClient):
         }
         await self.__subscribe(msg)
 
-    async def unsubscribe_orders_executed(self, com_id=int(time.time() * 1000)):
+    async def unsubscribe_orders_executed(self, com_id: int = None):
         msg = {
             'id': com_id,
             'method': self.__ORDERS_EXECUTED_UNSUBSCRIBE,
@@ -380,15 +518,16 @@ class WhitebitWsClient(TradeAccountClient):
         }
         await self.__unsubscribe(msg)
 
-    async def get_deals(self, market: str, offset: int = 0, limit: int = 100, com_id=int(time.time() * 1000)):
+    async def get_deals(self, market: str, offset: int = 0, limit: int = 100, com_id: int = None,
+                        timeout: float = None):
         msg = {
             'id': com_id,
             'method': self.__DEALS_REQUEST,
             'params': [market, offset, limit],
         }
-        await self._conn.send_message(msg)
+        return await self._conn.request(msg, timeout)
 
-    async def subscribe_deals(self, markets: List[str], com_id=int(time.time() * 1000)):
+    async def subscribe_deals(self, markets: List[str], com_id: int = None):
         msg = {
             'id': com_id,
             'method': self.__DEALS_SUBSCRIBE,
@@ -396,7 +535,7 @@ class WhitebitWsClient(TradeAccountClient):
         }
         await self.__subscribe(msg)
 
-    async def unsubscribe_deals(self, com_id=int(time.time() * 1000)):
+    async def unsubscribe_deals(self, com_id: int = None):
         msg = {
             'id': com_id,
             'method': self.__DEALS_UNSUBSCRIBE,
@@ -404,32 +543,32 @@ class WhitebitWsClient(TradeAccountClient):
         }
         await self.__unsubscribe(msg)
 
-    async def send_ping(self, com_id=int(time.time() * 1000)):
+    async def send_ping(self, com_id: int = None, timeout: float = None):
         msg = {
             'id': com_id,
             'method': self.__PING_REQUEST,
             'params': []
         }
-        await self._conn.send_message(msg)
+        return await self._conn.request(msg, timeout)
 
-    async def get_time(self, com_id=int(time.time() * 1000)):
+    async def get_time(self, com_id: int = None, timeout: float = None):
         msg = {
             'id': com_id,
             'method': self.__TIME_REQUEST,
             'params': []
         }
-        await self._conn.send_message(msg)
+        return await self._conn.request(msg, timeout)
 
     async def get_kline(self, market: str, start_time: int, end_time: int, interval: int,
-                        com_id=int(time.time() * 1000)):
+                        com_id: int = None, timeout: float = None):
         msg = {
             'id': com_id,
             'method': self.__KLINE_REQUEST,
             'params': [market, start_time, end_time, interval]
         }
-        await self._conn.send_message(msg)
+        return await self._conn.request(msg, timeout)
 
-    async def subscribe_kline(self, market: str, interval: int, com_id=int(time.time() * 1000)):
+    async def subscribe_kline(self, market: str, interval: int, com_id: int = None):
         msg = {
             'id': com_id,
             'method': self.__KLINE_SUBSCRIBE,
@@ -437,7 +576,7 @@ class WhitebitWsClient(TradeAccountClient):
         }
         await self.__subscribe(msg)
 
-    async def unsubscribe_kline(self, com_id=int(time.time() * 1000)):
+    async def unsubscribe_kline(self, com_id: int = None):
         msg = {
             'id': com_id,
             'method': self.__KLINE_UNSUBSCRIBE,
@@ -445,88 +584,118 @@ class WhitebitWsClient(TradeAccountClient):
         }
         await self.__unsubscribe(msg)
 
-    async def get_last_price(self, market: str, com_id=int(time.time() * 1000)):
+    async def get_last_price(self, market: str, com_id: int = None, timeout: float = None):
         msg = {
             'id': com_id,
             'method': self.__LAST_PRICE_REQUEST,
             'params': [market]
         }
-        await self._conn.send_message(msg)
+        return await self._conn.request(msg, timeout)
 
-    async def subscribe_last_price(self, market: List[str], com_id=int(time.time() * 1000)):
+    async def subscribe_last_price(self, market: List[str], com_id: int = None,
+                                   conflate: bool = False) -> Optional[ConflatedFeed]:
+        """With conflate, returns a ConflatedFeed holding the latest price of every market, which the updates go
+        to instead of on_message."""
         msg = {
             'id': com_id,
             'method': self.__LAST_PRICE_SUBSCRIBE,
             'params': market
         }
-        await self.__subscribe(msg)
+        return await self.__subscribe_conflated(msg, self.LAST_PRICE_UPDATE, conflate)
 
-    async def unsubscribe_last_price(self, com_id=int(time.time() * 1000)):
+    async def unsubscribe_last_price(self, com_id: int = None):
         msg = {
             'id': com_id,
             'method': self.__LAST_PRICE_UNSUBSCRIBE,
             'params': []
         }
+        self._conn.remove_feed(self.LAST_PRICE_UPDATE)
         await self.__unsubscribe(msg)
 
-    async def get_market_stat(self, market: str, period: int, com_id=int(time.time() * 1000)):
+    async def get_market_stat(self, market: str, period: int, com_id: int = None, timeout: float = None):
         msg = {
             'id': com_id,
             'method': self.__MARKET_STAT_REQUEST,
             'params': [market, period]
         }
-        await self._conn.send_message(msg)
+        return await self._conn.request(msg, timeout)
 
-    async def subscribe_market_stat(self, market: List[str], com_id=int(time.time() * 1000)):
+    async def subscribe_market_stat(self, market: List[str], com_id: int = None,
+                                    conflate: bool = False) -> Optional[ConflatedFeed]:
+        """With conflate, the updates go to the returned ConflatedFeed instead of on_message."""
         msg = {
             'id': com_id,
             'method': self.__MARKET_STAT_SUBSCRIBE,
             'params': market
         }
-        await self.__subscribe(msg)
+        return await self.__subscribe_conflated(msg, self.MARKET_STAT_UPDATE, conflate)
 
-    async def unsubscribe_market_stat(self, com_id=int(time.time() * 1000)):
+    async def unsubscribe_market_stat(self, com_id: int = None):
         msg = {
             'id': com_id,
             'method': self.__MARKET_STAT_UNSUBSCRIBE,
             'params': []
         }
+        self._conn.remove_feed(self.MARKET_STAT_UPDATE)
         await self.__unsubscribe(msg)
 
-    async def get_market_stat_today(self, market: str, com_id=int(time.time() * 1000)):
+    async def get_market_stat_today(self, market: str, com_id: int = None, timeout: float = None):
         msg = {
             'id': com_id,
             'method': self.__MARKET_STAT_TODAY_REQUEST,
             'params': [market]
         }
-        await self._conn.send_message(msg)
+        return await self._conn.request(msg, timeout)
 
-    async def subscribe_market_stat_today(self, market: List[str], com_id=int(time.time() * 1000)):
+    async def subscribe_market_stat_today(self, market: List[str], com_id: int = None,
+                                          conflate: bool = False) -> Optional[ConflatedFeed]:
+        """See subscribe_market_stat for conflate."""
         msg = {
             'id': com_id,
             'method': self.__MARKET_STAT_TODAY_SUBSCRIBE,
             'params': market
         }
-        await self.__subscribe(msg)
+        return await self.__subscribe_conflated(msg, self.MARKET_STAT_TODAY_UPDATE, conflate)
 
-    async def unsubscribe_market_stat_today(self, com_id=int(time.time() * 1000)):
+    async def unsubscribe_market_stat_today(self, com_id: int = None):
         msg = {
             'id': com_id,
             'method': self.__MARKET_STAT_TODAY_UNSUBSCRIBE,
             'params': []
         }
+        self._conn.remove_feed(self.MARKET_STAT_TODAY_UPDATE)
+        await self.__unsubscribe(msg)
+
+    async def subscribe_book_ticker(self, market: List[str], com_id: int = None,
+                                    conflate: bool = False) -> Optional[ConflatedFeed]:
+        """Subscribes to the best bid and ask of markets. With conflate, the updates go to the returned
+        ConflatedFeed, which keeps the latest one per market until it is read, rather than to on_message."""
+        msg = {
+            'id': com_id,
+            'method': self.__BOOK_TICKER_SUBSCRIBE,
+            'params': market
+        }
+        return await self.__subscribe_conflated(msg, self.BOOK_TICKER_UPDATE, conflate)
+
+    async def unsubscribe_book_ticker(self, com_id: int = None):
+        msg = {
+            'id': com_id,
+            'method': self.__BOOK_TICKER_UNSUBSCRIBE,
+            'params': []
+        }
+        self._conn.remove_feed(self.BOOK_TICKER_UPDATE)
         await self.__unsubscribe(msg)
 
     async def get_market_trades(self, market: str, limit: int = 0, start_trade_id: int = 0,
-                                com_id=int(time.time() * 1000)):
+                                com_id: int = None, timeout: float = None):
         msg = {
             'id': com_id,
             'method': self.__TRADES_REQUEST,
             'params': [market, limit, start_trade_id]
         }
-        await self._conn.send_message(msg)
+        return await self._conn.request(msg, timeout)
 
-    async def subscribe_market_trades(self, market: List[str], com_id=int(time.time() * 1000)):
+    async def subscribe_market_trades(self, market: List[str], com_id: int = None):
         msg = {
             'id': com_id,
             'method': self.__TRADES_SUBSCRIBE,
@@ -534,7 +703,7 @@ class WhitebitWsClient(TradeAccountClient):
         }
         await self.__subscribe(msg)
 
-    async def unsubscribe_market_trades(self, com_id=int(time.time() * 1000)):
+    async def unsubscribe_market_trades(self, com_id: int = None):
         msg = {
             'id': com_id,
             'method': self.__TRADES_UNSUBSCRIBE,
@@ -543,7 +712,7 @@ class WhitebitWsClient(TradeAccountClient):
         await self.__unsubscribe(msg)
 
     async def get_market_depth(self, market: str, price_interval: str = "0", limit: int = 100,
-                               com_id=int(time.time() * 1000)):
+                               com_id: int = None, timeout: float = None):
         """Support price intervals ["0.00000001", "0.0000001", "0.000001", "0.00001", "0.0001", "0.001", "0.01",
                                         "0.1", "0"] """
         market_depth_filter_variants = ["0.00000001", "0.0000001", "0.000001", "0.00001", "0.0001", "0.001", "0.01",
@@ -556,10 +725,10 @@ class WhitebitWsClient(TradeAccountClient):
             'method': self.__DEPTH_REQUEST,
             'params': [market, limit, price_interval]
         }
-        await self._conn.send_message(msg)
+        return await self._conn.request(msg, timeout)
 
     async def subscribe_market_depth(self, market: str, price_interval: str = "0", limit: int = 100,
-                                     multiple_sub: bool = False, com_id=int(time.time() * 1000)):
+                                     multiple_sub: bool = False, com_id: int = None):
         """Support price intervals ["0.00000001", "0.0000001", "0.000001", "0.00001", "0.0001", "0.001", "0.01",
                                         "0.1", "0"] """
         market_depth_filter_variants = ["0.00000001", "0.0000001", "0.000001", "0.00001", "0.0001", "0.001", "0.01",
@@ -574,10 +743,52 @@ class WhitebitWsClient(TradeAccountClient):
         }
         await self.__subscribe(msg)
 
-    async def unsubscribe_market_depth(self, com_id=int(time.time() * 1000)):
+    async def unsubscribe_market_depth(self, com_id: int = None):
+        """Unsubscribes from the depth of every market, which stops tracking their order books."""
+        for market in list(self.order_books.books):
+            self.order_books.remove(market)
+        self.__book_intervals.clear()
+        msg = {
+            'id': com_id,
+            'method': self.__DEPTH_UNSUBSCRIBE,
+            'params': []
+        }
+        await self.__unsubscribe(msg)
+
+    async def subscribe_order_book(self, market: str, limit: int = 100, price_interval: str = "0",
+                                   com_id: int = None) -> OrderBook:
+        """Subscribes to the depth of market and returns its OrderBook, kept up to date from then on and
+        resynchronized by resubscribing whenever an update is missed."""
+        book = self.order_books.add(market, limit)
+        self.__book_intervals[market] = price_interval
+        await self.subscribe_market_depth(market, price_interval, limit, multiple_sub=True, com_id=com_id)
+        self.order_books.watch(market)
+        return book
+
+    async def unsubscribe_order_book(self, market: str, com_id: int = None):
+        """Stops tracking the order book of market. Depth can only be unsubscribed from for every market at once,
+        so the books still tracked are subscribed to again, each getting a new snapshot."""
+        self.order_books.remove(market)
+        self.__book_intervals.pop(market, None)
         msg = {
             'id': com_id,
             'method': self.__DEPTH_UNSUBSCRIBE,
             'params': []
         }
         await self.__unsubscribe(msg)
+        await self.order_books.reset()
+
+    async def __reset_order_books(self):
+        # The books missed the updates sent while disconnected: those whose depth subscription is recovered get
+        # their snapshot from it, the others are resubscribed
+        subscribed = [sub['params'][0] for sub in self._conn.subscriptions
+                      if sub['method'] == self.__DEPTH_SUBSCRIBE and sub['params']]
+        await self.order_books.reset(subscribed)
+
+    async def __resync_order_book(self, market: str):
+        book = self.order_books.get(market)
+        if book is None:
+            return
+        logging.warning(f'Order book {market} is out of sync, resubscribing')
+        await self.subscribe_market_depth(market, self.__book_intervals.get(market, "0"), book.limit,
+                                          multiple_sub=True)